@@ -3,23 +3,36 @@ import argparse
 import os.path
 import sys
 
-from PySide6.QtCore import QTranslator, QLocale, QLockFile
-from qasync import QApplication, run
+from app.builtin.startup_profile import profiler
 
-from app.builtin.gitlab_updater import GitlabUpdater
-from app.builtin.locale import detect_system_ui_language
-from app.main_window import MainWindow
-from qdarktheme import enable_hi_dpi
+# Qt, the updater and the main window are imported inside main() so that
+# --profile-startup can time them; polars/pyqtgraph/numpy are only imported
+# when the plotter is first opened (see MainWindow).
 
 
-async def task():
+async def task(translator_cache=None, single_instance=None, open_request=None):
+    from qasync import QApplication
+
     app_close_event = asyncio.Event()
     app = QApplication.instance()
     assert isinstance(app, QApplication)
     app.aboutToQuit.connect(app_close_event.set)
 
-    main_window = MainWindow()
-    main_window.show()
+    with profiler.phase("import main window"):
+        from app.main_window import MainWindow
+    with profiler.phase("create main window"):
+        main_window = MainWindow(translator_cache)
+        main_window.show()
+    # let the event loop paint the window once before reporting
+    await asyncio.sleep(0)
+    profiler.mark("main window shown")
+
+    if single_instance is not None:
+        # later launches forward their files here instead of starting
+        single_instance.request_received.connect(main_window.handle_open_request)
+    if open_request and open_request.get("files"):
+        main_window.handle_open_request(open_request)
+
     await main_window.async_init()
     await app_close_event.wait()
     
@@ -35,9 +48,33 @@ def main(enable_updater: bool = True, language: str = None):
                        type=str,
                        default=language,
                        help='Language code (e.g., zh_CN, en_US). If not specified, uses system language.')
+    parser.add_argument('--profile-startup',
+                       dest='profile_startup',
+                       action='store_true',
+                       help='Print a per-phase import and initialization timing breakdown to stderr.')
+    parser.add_argument('--layout',
+                       dest='layout',
+                       type=str,
+                       default=None,
+                       help='Session file (.json) applied to the opened data files.')
+    parser.add_argument('files',
+                       nargs='*',
+                       help='Data files (.parquet/.csv) to open in plot windows.')
     
     # 只解析已知参数，保留其他参数给 QApplication
     args, remaining = parser.parse_known_args()
+    if args.profile_startup:
+        profiler.enable()
+
+    with profiler.phase("import Qt"):
+        from PySide6.QtCore import QCoreApplication, QLockFile
+        from qasync import QApplication, run
+        from qdarktheme import enable_hi_dpi
+    with profiler.phase("import updater"):
+        from app.builtin.gitlab_updater import GitlabUpdater
+        from app.builtin.locale import detect_system_ui_language
+        from app.builtin.single_instance import SingleInstance
+        from app.builtin.translator_cache import TranslatorCache
     
     # init updater, updater will remove some arguments
     # and do update logic
@@ -48,9 +85,19 @@ def main(enable_updater: bool = True, language: str = None):
     updater.project_name = "kaoru/pyside_template"
     updater.is_enable = enable_updater
 
-    # check if the app is already running
-    lock_file = QLockFile("App.lock")
+    # paths are resolved here, the running instance may have another working directory
+    open_request = {
+        "files": [os.path.abspath(path) for path in args.files],
+        "language": args.language,
+        "layout": os.path.abspath(args.layout) if args.layout else None,
+    }
+
+    # check if the app is already running, if so hand the arguments over and exit
+    single_instance = SingleInstance("App")
+    lock_file = QLockFile(single_instance.lock_path)
     if not lock_file.lock():
+        _ = QCoreApplication(sys.argv[:1])
+        single_instance.send(open_request)
         sys.exit(0)
 
     if os.path.exists("updater.json"):
@@ -61,31 +108,21 @@ def main(enable_updater: bool = True, language: str = None):
 
     # init QApplication (使用剩余参数)
     sys.argv = [sys.argv[0]] + remaining
-    app = QApplication(sys.argv)
-
-    # i18n - 加载应用翻译
-    translator_app = QTranslator()
-    lang_code = args.language if args.language else detect_system_ui_language()
-    
-    # 加载主应用翻译文件
-    if translator_app.load(f":/i18n/{lang_code}.qm"):
-        app.installTranslator(translator_app)
-        print(f"已加载应用翻译: {lang_code}")
-    
-    # 加载 plotter 模块翻译文件（如果存在）
-    translator_plotter = QTranslator()
-    plotter_ts_path = f"app/plotter/i18n/plotter_{lang_code}.qm"
-    if os.path.exists(plotter_ts_path):
-        if translator_plotter.load(plotter_ts_path):
-            app.installTranslator(translator_plotter)
-            print(f"已加载 Plotter 翻译: {lang_code}")
-    
-    # 将语言代码保存到应用属性，供其他模块使用
-    app.setProperty("language_code", lang_code)
+    with profiler.phase("create QApplication"):
+        app = QApplication(sys.argv)
+    single_instance.listen()
+
+    with profiler.phase("load translations"):
+        # i18n - 加载应用和 plotter 模块翻译, 已加载的翻译器缓存供运行时切换语言
+        translator_cache = TranslatorCache(app)
+        lang_code = args.language if args.language else detect_system_ui_language()
+        if translator_cache.switch(lang_code):
+            # 切换成功时 switch 已将语言代码保存到应用属性 language_code, 供其他模块使用
+            print(f"已加载翻译: {lang_code}")
 
     # start event loop
     try:
-        run(task())
+        run(task(translator_cache, single_instance, open_request))
     except RuntimeError as e:
         # Suppress "Event loop stopped before Future completed" error on exit
         if "Event loop stopped before Future completed" not in str(e):
@@ -0,0 +1,219 @@
+import asyncio
+import glob
+import hashlib
+import json
+import os
+from typing import Callable, Optional
+
+from httpx import AsyncClient
+
+# (downloaded bytes, total bytes or 0 if unknown)
+ProgressCallback = Callable[[int, int], None]
+
+# assets at least this large are fetched in parallel ranges when the server allows it
+PARALLEL_THRESHOLD = 32 * 1024 * 1024
+PARALLEL_PARTS = 4
+
+
+class ChecksumError(RuntimeError):
+    """The downloaded file does not match the digest of the release manifest."""
+
+
+def parse_sha256sums(text: str, filename: str) -> Optional[str]:
+    """Find the digest of ``filename`` in a ``sha256sum`` style manifest.
+
+    Lines look like ``<hex digest>  <name>`` (``*<name>`` in binary mode); a
+    manifest holding a single bare digest applies to any file.
+    """
+    for line in text.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        if len(fields) == 1 and len(fields[0]) == 64:
+            return fields[0].lower()
+        if len(fields) >= 2 and fields[-1].lstrip("*") == filename:
+            return fields[0].lower()
+    return None
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Downloader:
+    """Resumable download of one release asset.
+
+    Data is written to ``<path>.part`` and renamed to ``path`` only after the
+    SHA-256 check passed, so an interrupted run leaves the partial file behind
+    and the next run continues it with an HTTP Range request. Large assets on
+    servers that accept ranges are split into ``parts`` ranges fetched
+    concurrently, each into its own ``<path>.part<N>`` so every range resumes
+    independently. Chunks are written as they arrive (no re-chunking), so
+    everything received before a connection drop is kept.
+
+    ``<path>.part.json`` records the URL and the ETag/Last-Modified of the
+    asset the partial data came from. Partial data of another URL (another
+    release) or of a changed asset is discarded, and resumed ranges carry
+    ``If-Range`` so a server whose asset changed since the probe sends the
+    whole file instead of a mismatching tail.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        url: str,
+        path: str,
+        sha256: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        parallel_threshold: int = PARALLEL_THRESHOLD,
+        parts: int = PARALLEL_PARTS,
+    ):
+        self.client = client
+        self.url = url
+        self.path = path
+        self.sha256 = sha256.lower() if sha256 else None
+        self.progress = progress
+        self.parallel_threshold = parallel_threshold
+        self.parts = max(1, parts)
+        self.part_path = path + ".part"
+        self.meta_path = self.part_path + ".json"
+        self.total = 0
+        self.downloaded = 0
+        # ETag or Last-Modified of the asset, None if the server sends neither
+        self.validator = None
+
+    async def run(self) -> str:
+        """Download, verify and return the final path.
+
+        Raises:
+            ChecksumError: the digest does not match; the partial data is
+                removed so the next attempt starts from scratch.
+            httpx.HTTPError: network or HTTP status errors; partial data is
+                kept for resuming.
+        """
+        total, accept_ranges = await self._probe()
+        self.total = total
+        self._check_partial()
+        if accept_ranges and total >= self.parallel_threshold and self.parts > 1 \
+                and not os.path.exists(self.part_path):
+            await self._download_parallel(total)
+        else:
+            await self._download_single(accept_ranges)
+        self._verify(self.part_path)
+        os.replace(self.part_path, self.path)
+        os.remove(self.meta_path)
+        return self.path
+
+    async def _probe(self):
+        r = await self.client.head(self.url, follow_redirects=True)
+        r.raise_for_status()
+        total = int(r.headers.get("content-length", 0))
+        accept_ranges = r.headers.get("accept-ranges", "").lower() == "bytes"
+        # If-Range only accepts a strong ETag
+        etag = r.headers.get("etag")
+        self.validator = etag if etag and not etag.startswith("W/") else r.headers.get("last-modified")
+        return total, accept_ranges
+
+    def _check_partial(self):
+        """Drop partial data left by another URL or another revision of the asset."""
+        meta = {"url": self.url, "validator": self.validator}
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta_old = json.load(f)
+        except (OSError, ValueError):
+            meta_old = None
+        if meta_old == meta:
+            return
+        self._remove_partial()
+        with open(self.meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def _remove_partial(self):
+        for part_path in [self.part_path, *glob.glob(glob.escape(self.part_path) + "[0-9]*")]:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+    def _range_headers(self, value: str) -> dict:
+        headers = {"Range": f"bytes={value}"}
+        if self.validator:
+            headers["If-Range"] = self.validator
+        return headers
+
+    def _report(self, n: int):
+        self.downloaded += n
+        if self.progress is not None:
+            self.progress(self.downloaded, self.total)
+
+    async def _download_single(self, accept_ranges: bool):
+        offset = os.path.getsize(self.part_path) if os.path.exists(self.part_path) else 0
+        if offset and self.total and offset >= self.total:
+            # finished earlier but not verified/renamed
+            self._report(offset)
+            return
+        headers = self._range_headers(f"{offset}-") if offset and accept_ranges else {}
+        async with self.client.stream("GET", self.url, headers=headers, follow_redirects=True) as r:
+            r.raise_for_status()
+            if r.status_code == 206:
+                mode = "ab"
+            else:
+                # the server ignored the range or the asset changed, start over
+                mode, offset = "wb", 0
+                if not self.total:
+                    self.total = int(r.headers.get("content-length", 0))
+            self._report(offset)
+            with open(self.part_path, mode) as f:
+                async for chunk in r.aiter_bytes():
+                    f.write(chunk)
+                    self._report(len(chunk))
+
+    async def _download_parallel(self, total: int):
+        size = -(-total // self.parts)
+        ranges = [(start, min(start + size, total) - 1) for start in range(0, total, size)]
+        part_paths = [f"{self.part_path}{idx}" for idx in range(len(ranges))]
+        await asyncio.gather(*(
+            self._download_range(part_path, start, end)
+            for part_path, (start, end) in zip(part_paths, ranges)
+        ))
+        with open(self.part_path, "wb") as f:
+            for part_path in part_paths:
+                with open(part_path, "rb") as part:
+                    while chunk := part.read(1024 * 1024):
+                        f.write(chunk)
+        for part_path in part_paths:
+            os.remove(part_path)
+
+    async def _download_range(self, part_path: str, start: int, end: int):
+        done = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        self._report(done)
+        if start + done > end:
+            return
+        headers = self._range_headers(f"{start + done}-{end}")
+        async with self.client.stream("GET", self.url, headers=headers, follow_redirects=True) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise RuntimeError(f"Server ignored range request for {self.url}")
+            with open(part_path, "ab") as f:
+                async for chunk in r.aiter_bytes():
+                    f.write(chunk)
+                    self._report(len(chunk))
+
+    def _verify(self, path: str):
+        if self.sha256 is None:
+            return
+        actual = file_sha256(path)
+        if actual != self.sha256:
+            os.remove(path)
+            os.remove(self.meta_path)
+            raise ChecksumError(
+                f"SHA-256 mismatch for {os.path.basename(self.path)}: "
+                f"expected {self.sha256}, got {actual}"
+            )
+
+
+async def download(client: AsyncClient, url: str, path: str, **kwargs) -> str:
+    """Shortcut for ``Downloader(client, url, path, **kwargs).run()``."""
+    return await Downloader(client, url, path, **kwargs).run()
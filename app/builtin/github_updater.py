@@ -70,10 +70,17 @@ class GithubUpdater(Updater):
             package_name = f"App-{sysname}-{arch}.zip"
 
             self.download_url = None
+            self.sha256 = None
+            manifest_url = None
             for assets in glom(latest_release, "assets", default={}):
                 if assets["name"] == package_name:
                     self.download_url = assets["browser_download_url"]
-                    break
+                    # GitHub publishes "sha256:<hex>" for every asset
+                    digest = assets.get("digest") or ""
+                    if digest.startswith("sha256:"):
+                        self.sha256 = digest[len("sha256:"):]
+                elif self.is_checksum_asset(assets["name"], package_name):
+                    manifest_url = assets["browser_download_url"]
 
             if self.download_url is None:
                 raise FileNotFoundError(
@@ -84,3 +91,5 @@ class GithubUpdater(Updater):
             r.raise_for_status()
 
             self.filename = package_name
+            if self.sha256 is None and manifest_url is not None:
+                await self.fetch_sha256(client, manifest_url)
@@ -85,17 +85,28 @@ class GitlabUpdater(Updater):
             package_name = f"App-{sysname}-{arch}"
 
             self.download_url = None
-            for link in glom(latest_release, "assets.links", default={}):
-                if package_name in link["name"]:
+            self.sha256 = None
+            manifest_url = None
+            links = glom(latest_release, "assets.links", default=[])
+            # package_name has no extension: skip checksum files when matching it
+            for link in links:
+                if package_name in link["name"] and not link["name"].endswith(".sha256") \
+                        and link["name"] not in self._checksum_names:
                     self.download_url = link["url"]
+                    package_file = link["name"]
                     break
             if self.download_url is None:
                 raise FileNotFoundError(
                     f"Package {package_name} not found in release assets."
                 )
+            for link in links:
+                if self.is_checksum_asset(link["name"], package_file):
+                    manifest_url = link["url"]
 
             r = await client.head(url=self.download_url)
             r.raise_for_status()
 
             path = urlparse(self.download_url).path
             self.filename = os.path.basename(path)
+            if manifest_url is not None:
+                await self.fetch_sha256(client, manifest_url)
@@ -0,0 +1,78 @@
+"""File manifest of an application directory, used to apply updates as deltas.
+
+Every release ships a ``manifest.json`` next to the executable listing each
+file with its size and SHA-256. Generate it on the packaged directory:
+
+    python -m app.builtin.manifest dist/App
+"""
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.builtin.download import file_sha256
+
+MANIFEST_NAME = "manifest.json"
+# created at runtime, never part of a release
+_EXCLUDED = {MANIFEST_NAME, "App.lock", "updater.json", "filelist.txt"}
+
+# relative posix path -> {"size": int, "sha256": str}
+Manifest = Dict[str, dict]
+
+
+def build_manifest(root) -> Manifest:
+    root = Path(root)
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            relpath = path.relative_to(root).as_posix()
+            if relpath in _EXCLUDED:
+                continue
+            files[relpath] = {"size": path.stat().st_size, "sha256": file_sha256(str(path))}
+    return files
+
+
+def load_manifest(root) -> Optional[Manifest]:
+    path = Path(root) / MANIFEST_NAME
+    if not path.is_file():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["files"]
+
+
+def write_manifest(root, files: Manifest):
+    path = Path(root) / MANIFEST_NAME
+    tmp_path = path.with_name(MANIFEST_NAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"files": files}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def diff_manifest(old: Optional[Manifest], new: Manifest, root) -> Tuple[List[str], List[str]]:
+    """Return (files to copy, files to remove) to turn ``root`` into ``new``.
+
+    With the installed manifest ``old`` the comparison needs no disk reads
+    besides an existence check. Installs from before manifests were shipped
+    have none; their files are compared by size, then by hash.
+    """
+    root = Path(root)
+    changed = []
+    for relpath, entry in new.items():
+        target = root / relpath
+        if old is not None:
+            if old.get(relpath) != entry or not target.is_file():
+                changed.append(relpath)
+        elif (not target.is_file()
+              or target.stat().st_size != entry["size"]
+              or file_sha256(str(target)) != entry["sha256"]):
+            changed.append(relpath)
+    removed = [relpath for relpath in (old or {}) if relpath not in new]
+    return changed, removed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m app.builtin.manifest <app directory>")
+    write_manifest(sys.argv[1], build_manifest(sys.argv[1]))
@@ -0,0 +1,91 @@
+import getpass
+import hashlib
+import json
+import os
+import time
+
+from PySide6.QtCore import QObject, QStandardPaths, Signal
+from PySide6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+
+def _server_name(app_id: str) -> str:
+    # one channel per user, a short hash keeps the name valid on every platform
+    key = f"{app_id}-{getpass.getuser()}".encode("utf-8")
+    return f"{app_id}-{hashlib.sha1(key).hexdigest()[:12]}"
+
+
+class SingleInstance(QObject):
+    """Local IPC channel between the running instance and later launches.
+
+    The running instance holds a ``QLockFile`` at ``lock_path``, calls
+    ``listen()`` and receives every request as ``request_received(dict)``.
+    A second launch fails to take the lock, calls ``send()`` with its
+    arguments and exits. A request is one JSON object followed by a newline.
+    """
+    request_received = Signal(dict)
+
+    def __init__(self, app_id: str = "App", parent=None):
+        super().__init__(parent)
+        self.server_name = _server_name(app_id)
+        self._server = None
+
+    @property
+    def lock_path(self) -> str:
+        # absolute and per user, so the working directory of a launch does not matter
+        temp_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.TempLocation)
+        return os.path.join(temp_dir, f"{self.server_name}.lock")
+
+    def listen(self) -> bool:
+        """Start accepting requests; call it only while holding the lock file."""
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        if self._server.listen(self.server_name):
+            return True
+        if self._server.serverError() != QAbstractSocket.SocketError.AddressInUseError:
+            return False
+        # a crashed instance leaves its socket file behind on Unix, and we
+        # hold the lock, so nobody else is listening on it
+        QLocalServer.removeServer(self.server_name)
+        return self._server.listen(self.server_name)
+
+    def send(self, request: dict, timeout_ms: int = 3000) -> bool:
+        """Deliver ``request`` to the running instance; False if none answers.
+
+        Retries until ``timeout_ms``: the running instance takes the lock file
+        before it starts listening.
+        """
+        payload = json.dumps(request).encode("utf-8") + b"\n"
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            socket = QLocalSocket()
+            socket.connectToServer(self.server_name)
+            if socket.waitForConnected(500):
+                socket.write(payload)
+                ok = socket.waitForBytesWritten(timeout_ms)
+                socket.disconnectFromServer()
+                if socket.state() != QLocalSocket.LocalSocketState.UnconnectedState:
+                    socket.waitForDisconnected(timeout_ms)
+                return ok
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            buffer = bytearray()
+
+            def on_ready_read(socket=socket, buffer=buffer):
+                buffer.extend(socket.readAll().data())
+                if buffer.endswith(b"\n"):
+                    socket.disconnectFromServer()
+                    try:
+                        request = json.loads(buffer.decode("utf-8"))
+                    except ValueError:
+                        return
+                    if isinstance(request, dict):
+                        self.request_received.emit(request)
+
+            socket.readyRead.connect(on_ready_read)
+            socket.disconnected.connect(socket.deleteLater)
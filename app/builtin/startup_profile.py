@@ -0,0 +1,59 @@
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Per-phase wall-clock timing of application startup.
+
+    Disabled by default; every call is a no-op until ``enable()`` is called
+    (``--profile-startup``). Each phase records its duration and how many
+    modules were imported while it ran.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._t0 = time.perf_counter()
+        self._phases = []  # (name, seconds, modules imported)
+        self._depth = 0
+
+    def enable(self):
+        self.enabled = True
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        n_modules = len(sys.modules)
+        t_start = time.perf_counter()
+        idx = len(self._phases)
+        self._phases.append(None)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self._phases[idx] = (
+                "  " * self._depth + name,
+                time.perf_counter() - t_start,
+                len(sys.modules) - n_modules,
+            )
+
+    def mark(self, name: str):
+        """Record a point in time relative to process start, e.g. first paint."""
+        if self.enabled:
+            self._phases.append((f"@ {name}", time.perf_counter() - self._t0, 0))
+
+    def report(self, file=None):
+        if not self.enabled:
+            return
+        file = file or sys.stderr
+        width = max((len(p[0]) for p in self._phases if p), default=10)
+        print(f"{'phase':<{width}}  {'ms':>9}  {'modules':>7}", file=file)
+        for name, seconds, n_modules in filter(None, self._phases):
+            print(f"{name:<{width}}  {seconds * 1000:9.1f}  {n_modules:7d}", file=file)
+        print(f"{'total':<{width}}  {(time.perf_counter() - self._t0) * 1000:9.1f}", file=file)
+
+
+profiler = StartupProfiler()
@@ -0,0 +1,66 @@
+import os
+
+from PySide6.QtCore import QCoreApplication, QDir, QTranslator
+
+# .qm locations, "{}" is the language code (e.g. en_US)
+APP_QM_PATTERN = ":/i18n/{}.qm"
+PLOTTER_QM_PATTERN = "app/plotter/i18n/plotter_{}.qm"
+
+
+class TranslatorCache:
+    """Keeps the loaded translators of every language for instant switching.
+
+    A language's .qm files (one per pattern) are loaded on first use and
+    kept afterwards, so switching back and forth never touches the disk:
+    ``switch()`` only removes the installed translators and installs the
+    cached ones. Qt compresses the LanguageChange events posted to each
+    widget by the install/remove calls, so every widget retranslates once.
+    """
+
+    def __init__(self, app=None, patterns=(APP_QM_PATTERN, PLOTTER_QM_PATTERN)):
+        self.app = app or QCoreApplication.instance()
+        self.patterns = tuple(patterns)
+        self.language = None
+        self._cache = {}  # language -> [QTranslator]
+        self._installed = []
+
+    def available_languages(self):
+        """Language codes that have at least one .qm file, sorted."""
+        languages = set()
+        for pattern in self.patterns:
+            directory, file_name = os.path.split(pattern)
+            prefix, suffix = file_name.split("{}")
+            for name in QDir(directory).entryList([f"{prefix}*{suffix}"], QDir.Filter.Files):
+                languages.add(name[len(prefix):len(name) - len(suffix)])
+        return sorted(languages)
+
+    def _get_translators(self, language):
+        if language not in self._cache:
+            translators = []
+            for pattern in self.patterns:
+                translator = QTranslator(self.app)
+                if translator.load(pattern.format(language)):
+                    translators.append(translator)
+            self._cache[language] = translators
+        return self._cache[language]
+
+    def switch(self, language) -> bool:
+        """Install the translators of ``language``.
+
+        Returns False, leaving the current language installed, if no .qm
+        file exists for it.
+        """
+        if language == self.language:
+            return True
+        translators = self._get_translators(language)
+        if not translators:
+            return False
+        for translator in self._installed:
+            self.app.removeTranslator(translator)
+        for translator in translators:
+            self.app.installTranslator(translator)
+        self._installed = translators
+        self.language = language
+        # read by the plotter's ColumnNameTranslator
+        self.app.setProperty("language_code", language)
+        return True
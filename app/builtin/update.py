@@ -4,12 +4,15 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
 from abc import abstractmethod, ABC
 from pathlib import Path
 from time import sleep
 
 import packaging.version as Version0
 from httpx import AsyncClient
+from app.builtin.download import parse_sha256sums
+from app.builtin.manifest import MANIFEST_NAME, build_manifest, diff_manifest, load_manifest, write_manifest
 from app.resources.version import __version__
 
 
@@ -53,6 +56,11 @@ class Updater(ABC):
     _copy_self_cmd = "--updater-copy-self"
     _updated_cmd = "--updater-updated"
     _disable_cmd = "--updater-disable"
+    _staging_dir = ".update_staging"
+    _backup_dir = ".update_backup"
+    _added_list = ".added.json"
+    # seconds the new version must survive before the update is kept
+    startup_timeout = 20
 
     current_version :Version
 
@@ -67,6 +75,8 @@ class Updater(ABC):
         self.description = ""
         self.download_url = ""
         self.filename = ""
+        # expected SHA-256 of the asset, None if the release has no manifest
+        self.sha256 = None
 
         self.is_updated = False
         self.is_enable = True
@@ -102,6 +112,22 @@ class Updater(ABC):
     async def fetch(self):
         pass
 
+    # asset names that hold the SHA-256 manifest of a release
+    _checksum_names = ("SHA256SUMS", "SHA256SUMS.txt", "sha256sums.txt")
+
+    def is_checksum_asset(self, name: str, package_name: str) -> bool:
+        return name in self._checksum_names or name == f"{package_name}.sha256"
+
+    async def fetch_sha256(self, client: AsyncClient, manifest_url: str):
+        """Read the digest of self.filename from a release manifest."""
+        r = await client.get(url=manifest_url, follow_redirects=True)
+        r.raise_for_status()
+        self.sha256 = parse_sha256sums(r.text, self.filename)
+        if self.sha256 is None:
+            raise FileNotFoundError(
+                f"{self.filename} not listed in checksum manifest {manifest_url}"
+            )
+
     @staticmethod
     def _load_current_version():
         """Get version from app"""
@@ -134,62 +160,136 @@ class Updater(ABC):
 
     @staticmethod
     def copy_self_and_exit():
-        """Copy current executable to parent directory and run it with --updated argument."""
+        """
+        Apply the new package (current directory) to the parent directory and run it.
+
+        Only files that differ from the installed manifest are copied. They are
+        staged next to the install first, then swapped in by renames while the
+        replaced files are moved to a backup directory. If applying fails, or the
+        new version exits with an error within `startup_timeout` seconds, the
+        backup is restored and the previous version is started again.
+        """
         # Wait for the last executable to exit
         sleep(3)
         parent_dir = Path(sys.executable).parent.parent
         current_dir = Path(sys.executable).parent
+
+        new_files = load_manifest(current_dir) or build_manifest(current_dir)
+        changed, removed = diff_manifest(load_manifest(parent_dir), new_files, parent_dir)
+        # ../filelist.txt lists extra paths to delete, kept for old packages
+        removed += Updater._read_filelist(parent_dir)
+        try:
+            Updater._apply_delta(current_dir, parent_dir, changed, removed, new_files)
+        except Exception:
+            Updater._rollback(parent_dir)
+            Updater._run_app(parent_dir)
+            sys.exit(1)
+
+        process = Updater._run_app(parent_dir, Updater._updated_cmd)
+        try:
+            failed = process.wait(timeout=Updater.startup_timeout) != 0
+        except subprocess.TimeoutExpired:
+            failed = False
+        if failed:
+            Updater._rollback(parent_dir)
+            Updater._run_app(parent_dir)
+        else:
+            shutil.rmtree(parent_dir / Updater._backup_dir, ignore_errors=True)
+        sys.exit(0)
+
+    @staticmethod
+    def _read_filelist(parent_dir: Path):
         filelist = parent_dir / "filelist.txt"
-        # delete files by ../filelist.txt if it exists, workdir is parent directory
-        if filelist.exists():
-            with open(filelist, "r", encoding="utf-8") as f:
-                for line in f:
-                    path = line.strip()
-                    if not path:
-                        continue
-                    abs_path = parent_dir / path
-                    try:
-                        if abs_path.is_file():
-                            abs_path.unlink()
-                        elif abs_path.is_dir():
-                            shutil.rmtree(abs_path)
-                    except Exception:
-                        continue
-
-        # Copy current directory to parent directory
-        for item in current_dir.iterdir():
-            target = parent_dir / item.name
-            try:
-                if item.is_file():
-                    shutil.copy2(item, target)
-                elif item.is_dir():
-                    if target.exists():
-                        shutil.rmtree(target)
-                    shutil.copytree(item, target)
-            except Exception:
-                continue
-
-        # Run copied executable with --updated argument
+        if not filelist.exists():
+            return []
+        with open(filelist, "r", encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip()]
+
+    @staticmethod
+    def _apply_delta(source_dir: Path, target_dir: Path, changed, removed, new_files):
+        staging_dir = target_dir / Updater._staging_dir
+        backup_dir = target_dir / Updater._backup_dir
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        shutil.rmtree(backup_dir, ignore_errors=True)
+
+        # 1. stage the changed files, the install is not touched yet
+        for path in changed:
+            staged = staging_dir / path
+            staged.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source_dir / path, staged)
+
+        # 2. move every file that is replaced or removed into the backup
+        backup_dir.mkdir()
+        added = []
+        for path in dict.fromkeys(changed + removed + [MANIFEST_NAME]):
+            target = target_dir / path
+            if target.exists():
+                backup = backup_dir / path
+                backup.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(target, backup)
+            elif path in changed:
+                added.append(path)
+        # files that did not exist before, deleted again on rollback
+        with open(backup_dir / Updater._added_list, "w", encoding="utf-8") as f:
+            json.dump(added, f)
+
+        # 3. swap the staged files in
+        for path in changed:
+            target = target_dir / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(staging_dir / path, target)
+        write_manifest(target_dir, new_files)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    @staticmethod
+    def _rollback(target_dir: Path):
+        """Restore the files moved to the backup directory by _apply_delta."""
+        backup_dir = target_dir / Updater._backup_dir
+        # files staged before the failure were never swapped in
+        shutil.rmtree(target_dir / Updater._staging_dir, ignore_errors=True)
+        if not backup_dir.exists():
+            return
+        added_list = backup_dir / Updater._added_list
+        if added_list.exists():
+            with open(added_list, "r", encoding="utf-8") as f:
+                for path in json.load(f):
+                    (target_dir / path).unlink(missing_ok=True)
+            added_list.unlink()
+        for backup in sorted(backup_dir.rglob("*")):
+            if backup.is_file():
+                target = target_dir / backup.relative_to(backup_dir)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(backup, target)
+        shutil.rmtree(backup_dir, ignore_errors=True)
+
+    @staticmethod
+    def _run_app(app_dir: Path, *args):
         if sys.platform == "win32":
-            new_executable = Path(sys.executable).parent.parent / "App.exe"
-            subprocess.Popen(
-                [new_executable, "--updated"],
+            return subprocess.Popen(
+                [app_dir / "App.exe", *args],
                 creationflags=subprocess.DETACHED_PROCESS,
                 env=os.environ.copy()
             )
-        else:
-            new_executable = Path(sys.executable).parent.parent / "App"
-            subprocess.Popen(
-                [new_executable, "--updated"],
-                preexec_fn=os.setpgrp,
-                env=os.environ.copy()
-            )
-        sys.exit(0)
+        return subprocess.Popen(
+            [app_dir / "App", *args],
+            preexec_fn=os.setpgrp,
+            env=os.environ.copy()
+        )
 
     @staticmethod
     def clean_old_package():
-        """Delete Package directory"""
-        sleep(3)
+        """
+        Delete Package directory.
+        The updater process in it keeps running until the new version has started,
+        so retry in the background until it has exited.
+        """
         package_dir = Path(sys.executable).parent / "Package"
-        if package_dir.exists() and package_dir.is_dir():
-            shutil.rmtree(package_dir, ignore_errors=True)
+
+        def clean():
+            for _ in range(Updater.startup_timeout + 10):
+                sleep(1)
+                shutil.rmtree(package_dir, ignore_errors=True)
+                if not package_dir.exists():
+                    break
+
+        threading.Thread(target=clean, daemon=True).start()
@@ -5,6 +5,7 @@ from qasync import asyncSlot
 
 from app.builtin.async_widget import AsyncWidget
 from app.builtin.asyncio import to_thread
+from app.builtin.download import download
 from app.builtin.update import Updater
 from app.resources.builtin.update_widget_ui import Ui_UpdateWidget
 
@@ -44,7 +45,14 @@ class UpdateWidget(AsyncWidget):
         self.ui.cancel_btn.setEnabled(False)
         self.ui.update_btn.setEnabled(False)
         self.ui.label.setText(self.tr("Downloading new version..."))
-        await self.download()
+        try:
+            await self.download()
+        except Exception as e:
+            # the partial file is kept, updating again resumes it
+            self.ui.label.setText(self.tr("Download failed: {}").format(e))
+            self.ui.cancel_btn.setEnabled(True)
+            self.ui.update_btn.setEnabled(True)
+            return
         self.ui.progressBar.setRange(0, 0)
 
         self.ui.label.setText(self.tr("Extracting new version..."))
@@ -53,19 +61,22 @@ class UpdateWidget(AsyncWidget):
         self.close()
 
     async def download(self):
+        # resumes an interrupted download from <filename>.part, see Downloader
         async with self.updater.create_async_client() as client:
-            async with client.stream("GET", self.updater.download_url, follow_redirects=True) as r:
-                r.raise_for_status()
-                total_size = int(r.headers.get("content-length", 0))
-                downloaded = 0
+            await download(
+                client,
+                self.updater.download_url,
+                self.updater.filename,
+                sha256=self.updater.sha256,
+                progress=self.on_progress,
+            )
 
-                with open(self.updater.filename, "wb") as f:
-                    async for chunk in r.aiter_bytes(8192):
-                        f.write(chunk)
-                        downloaded += len(chunk)
-
-                        percent = int(downloaded * 100 / total_size)
-                        self.ui.progressBar.setValue(percent)
+    def on_progress(self, downloaded: int, total: int):
+        if total <= 0:
+            self.ui.progressBar.setRange(0, 0)
+            return
+        self.ui.progressBar.setRange(0, 100)
+        self.ui.progressBar.setValue(min(100, int(downloaded * 100 / total)))
 
     def extract(self):
         if self.updater.filename.endswith(".zip"):
@@ -1,20 +1,21 @@
 import asyncio
 import os
 
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import QEvent, QLocale
+from PySide6.QtGui import QActionGroup, QIcon
 from PySide6.QtWidgets import QMessageBox, QMainWindow, QFileDialog
-from httpx import HTTPError
 from qasync import asyncSlot
 
 import app.resources.resource  # type: ignore
-from app.builtin.update_widget import UpdateWidget
+from app.builtin.startup_profile import profiler
 from app.resources.main_window_ui import Ui_MainWindow
 from qdarktheme import setup_theme
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, translator_cache=None):
         super().__init__()
+        self.translator_cache = translator_cache
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         self.ui.pushButton.clicked.connect(self.click_push_button)
@@ -27,25 +28,76 @@ class MainWindow(QMainWindow):
         self.ui.themeComboBox.setCurrentIndex(0)
         self.change_theme(0)
 
-        # 检查plotter模块是否可用
-        self._plotter_available = self._check_plotter_availability()
+        # plotter模块是否可用, 在 async_init 中于后台线程检查
+        self._plotter_available = None
         
-        # 添加打开Plotter的按钮
+        # 添加打开Plotter的按钮, 检查完成前禁用
         if hasattr(self.ui, 'btnOpenPlotter'):
             self.ui.btnOpenPlotter.clicked.connect(self.open_plotter)
-            # 如果plotter不可用，禁用按钮
-            if not self._plotter_available:
-                self.ui.btnOpenPlotter.setEnabled(False)
-                self.ui.btnOpenPlotter.setToolTip(self.tr("数据可视化模块不可用"))
+            self.ui.btnOpenPlotter.setEnabled(False)
+            self.ui.btnOpenPlotter.setToolTip(self.tr("正在检查数据可视化模块..."))
 
         self.setWindowTitle(self.tr("MainWindow"))
         self.setWindowIcon(QIcon(":/logo.png"))
         
         # 保存plotter窗口引用
         self.plotter_window = None
+        self.lst_plotter_window = []
+
+        # 运行时切换界面语言
+        self.menu_language = None
+        if self.translator_cache is not None:
+            self._init_menu_language()
+
+    def _init_menu_language(self):
+        """语言菜单, 每种有翻译文件的语言一项"""
+        self.menu_language = self.menuBar().addMenu(self.tr("Language"))
+        action_group = QActionGroup(self)
+        action_group.setExclusive(True)
+        for language in self.translator_cache.available_languages():
+            action = self.menu_language.addAction(QLocale(language).nativeLanguageName() or language)
+            action.setCheckable(True)
+            action.setChecked(language == self.translator_cache.language)
+            action.setData(language)
+            action_group.addAction(action)
+        action_group.triggered.connect(self.on_language_triggered)
+
+    def on_language_triggered(self, action):
+        language = action.data()
+        if not self.translator_cache.switch(language):
+            QMessageBox.warning(
+                self,
+                self.tr("Warning"),
+                self.tr("Failed to load translation: {}").format(language),
+            )
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.LanguageChange:
+            self.retranslate()
+        super().changeEvent(event)
+
+    def retranslate(self):
+        """切换语言后重新设置代码中设置的文字, .ui 中的文字由 retranslateUi 处理"""
+        self.ui.retranslateUi(self)
+        for index, text in enumerate((self.tr("Auto"), self.tr("Light"), self.tr("Dark"))):
+            self.ui.themeComboBox.setItemText(index, text)
+        self.setWindowTitle(self.tr("MainWindow"))
+        if self.menu_language is not None:
+            self.menu_language.setTitle(self.tr("Language"))
+            # 语言也可能由其他窗口切换(如加载会话), 按当前语言勾选
+            for action in self.menu_language.actions():
+                action.setChecked(action.data() == self.translator_cache.language)
+        if hasattr(self.ui, 'btnOpenPlotter'):
+            if self._plotter_available is None:
+                self.ui.btnOpenPlotter.setToolTip(self.tr("正在检查数据可视化模块..."))
+            elif not self._plotter_available:
+                self.ui.btnOpenPlotter.setToolTip(self.tr("数据可视化模块不可用"))
     
     def _check_plotter_availability(self) -> bool:
-        """检查plotter模块及其依赖是否可用"""
+        """检查plotter模块及其依赖是否可用
+
+        在后台线程中运行; 导入的模块留在 sys.modules 中, 首次打开plotter时不必再导入
+        """
         try:
             import polars as pl
             from app.plotter import MultiCurvePlotterWidget, ColumnNameTranslator
@@ -66,12 +118,23 @@ class MainWindow(QMainWindow):
             # Debug mode
             pass
         else:
-            # Production mode
-            await self.check_update(updater)
+            # Production mode, 更新检查在后台进行, 不阻塞后续初始化
+            asyncio.ensure_future(self.check_update(updater))
+
+        # 在后台线程中导入plotter依赖(polars/pyqtgraph/numpy), 界面保持响应
+        with profiler.phase("check plotter availability (background)"):
+            self._plotter_available = await asyncio.to_thread(self._check_plotter_availability)
+        profiler.report()
+        if hasattr(self.ui, 'btnOpenPlotter'):
+            self.ui.btnOpenPlotter.setEnabled(self._plotter_available)
+            self.ui.btnOpenPlotter.setToolTip(
+                "" if self._plotter_available else self.tr("数据可视化模块不可用"))
 
     async def check_update(self, updater):
         if not updater.is_enable:
             return
+        from httpx import HTTPError
+        from app.builtin.update_widget import UpdateWidget
         if not updater.is_updated:
             try:
                 await updater.fetch()
@@ -120,22 +183,46 @@ class MainWindow(QMainWindow):
         theme = self.ui.themeComboBox.itemData(index)
         setup_theme(theme)
 
+    def handle_open_request(self, request: dict):
+        """
+        处理命令行或后续启动转发来的打开请求
+
+        request: {"files": [数据文件], "language": 语言代码或None, "layout": 会话文件或None}
+        """
+        language = request.get("language")
+        if language and self.translator_cache is not None:
+            # 语言菜单在 LanguageChange 事件中按当前语言勾选
+            self.translator_cache.switch(language)
+        for file_path in request.get("files") or []:
+            self.open_data_file(file_path, request.get("layout"))
+        # 后续启动没有带文件时只把已运行的窗口提到前台
+        if not request.get("files"):
+            self.showNormal()
+            self.raise_()
+            self.activateWindow()
+
     def open_plotter(self):
         """打开数据可视化窗口"""
+        # 让用户选择数据文件
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            self.tr("选择数据文件"),
+            "",
+            "Parquet Files (*.parquet);;CSV Files (*.csv);;All Files (*.*)"
+        )
+        
+        if not file_path:
+            return
+        self.open_data_file(file_path)
+
+    def open_data_file(self, file_path: str, layout_path: str = None):
+        """在新的数据可视化窗口中打开数据文件, layout_path 为要应用的会话文件"""
         try:
             import polars as pl
             from app.plotter import MultiCurvePlotterWidget, ColumnNameTranslator
-            
-            # 让用户选择数据文件
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                self.tr("选择数据文件"),
-                "",
-                "Parquet Files (*.parquet);;CSV Files (*.csv);;All Files (*.*)"
-            )
-            
-            if not file_path:
-                return
+            from code_source.polars_toolkits.schema_toolkits.columncatalog import ColumnCatalog
+            from code_source.polars_toolkits.schema_toolkits.datasetdescriptor import DatasetDescriptor
+            from code_source.polars_toolkits.engine_toolkits.dataengine import DataEngineClient
             
             # 读取数据
             if file_path.endswith('.parquet'):
@@ -150,17 +237,45 @@ class MainWindow(QMainWindow):
                 )
                 return
             
+            # 数据集描述: 只解析一次schema, 之后列目录和窗口都从描述读取
+            dataset_descriptor = DatasetDescriptor.from_lazyframe(lf)
+            # 列目录: 数据文件未变化时直接读取旁边的目录文件, 否则扫描一次并保存
+            column_catalog = ColumnCatalog.load_or_build(lf, file_path, descriptor=dataset_descriptor)
+            
             # 创建列名翻译器（使用默认上下文 "ColumnNames"）
             column_translator = ColumnNameTranslator()
             
-            # 创建并显示plotter窗口
+            # 进程外数据引擎(PLOTTER_DATA_ENGINE=1 时启用): 查询在子进程中执行,
+            # 超出内存限制或崩溃时只影响子进程, 不会拖垮界面
+            data_engine = None
+            if os.getenv("PLOTTER_DATA_ENGINE", "0") == "1":
+                data_engine = DataEngineClient(
+                    lf, column_catalog.str_name_col_timestamp, dataset_descriptor.str_time_unit)
+                data_engine.start()
+            
+            # 创建并显示plotter窗口, 每个文件一个窗口
             self.plotter_window = MultiCurvePlotterWidget(
                 lf=lf,
                 str_name_col_timestamp=None,  # 自动检测第一列为时间列
-                column_translator=column_translator
+                column_translator=column_translator,
+                column_catalog=column_catalog,
+                data_engine=data_engine,
+                dataset_descriptor=dataset_descriptor,
+                translator_cache=self.translator_cache
             )
-            self.plotter_window.setWindowTitle(self.tr("数据可视化"))
+            self.plotter_window.setWindowTitle(
+                self.tr("数据可视化") + " - " + os.path.basename(file_path))
             self.plotter_window.show()
+            self.plotter_window.raise_()
+            self.plotter_window.activateWindow()
+            # 窗口没有父对象, 保留引用直到关闭
+            self.lst_plotter_window = [w for w in self.lst_plotter_window if w.isVisible()]
+            self.lst_plotter_window.append(self.plotter_window)
+            if layout_path:
+                try:
+                    self.plotter_window.load_session(layout_path)
+                except (OSError, ValueError, KeyError) as e:
+                    QMessageBox.warning(self.plotter_window, self.tr("Warning"), str(e))
             
         except ImportError as e:
             QMessageBox.warning(
@@ -3,11 +3,17 @@
 
 from .viewer import MultiCurvePlotterWidget
 from .plotaxismanager import PlotAxisManager
-from .translation import StaticTranslationMixin, ColumnNameTranslator
+from .crosshairmanager import PlotCrosshairManager
+from .requestscheduler import DataRequestScheduler, RequestHandle
+from .translation import StaticTranslationMixin, ColumnNameTranslator, ColumnNameMap
 
 __all__ = [
     'MultiCurvePlotterWidget',
     'PlotAxisManager',
+    'PlotCrosshairManager',
+    'DataRequestScheduler',
+    'RequestHandle',
     'StaticTranslationMixin',
     'ColumnNameTranslator',
+    'ColumnNameMap',
 ]
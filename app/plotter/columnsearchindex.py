@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+import re
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+class ColumnSearchIndex:
+    """
+    列名的内存搜索索引
+
+    同时索引实际列名和显示列名, 支持三种匹配, 得分依次降低:
+    - 词元精确匹配: 列名按 `_`、`{...}` 内的逗号等分隔符切分为词元,
+      `{...}` 中的每一段也整体作为一个词元, 如 `elec-output`
+    - 词元前缀匹配: 在排序后的词表上二分查找
+    - 三元组模糊匹配: 词元的字符三元组倒排, 按Jaccard相似度打分,
+      少于3个字符的查询词退化为子串匹配
+
+    查询按空格切分为多个词, 每个词都必须命中(AND), 列的总分为各词最高得分之和
+
+    Attributes:
+        lst_name_col_actual (List[str]): 实际列名, 下标即列的id
+        lst_name_col_display (List[str]): 显示列名
+        dic_postings (Dict[str, List[int]]): 词元 -> 包含该词元的列id
+        lst_token_sorted (List[str]): 排序后的词表, 用于前缀查找
+        dic_trigram (Dict[str, Set[str]]): 三元组 -> 包含该三元组的词元
+    """
+    # 词元分隔符: 非字母数字且非中日韩文字
+    _re_split = re.compile(r'[^0-9a-z\u4e00-\u9fff]+')
+    # `{...}` 段
+    _re_brace = re.compile(r'\{([^}]*)\}')
+    # 各类匹配的得分
+    flt_score_exact: float = 3.0
+    flt_score_prefix: float = 2.0
+    flt_score_fuzzy: float = 1.0
+    flt_ratio_fuzzy_min: float = 0.3
+
+    def __init__(self,
+        lst_name_col_actual: List[str],
+        func_get_display_name: Optional[Callable[[str], str]] = None
+    ):
+        """
+        Args:
+            lst_name_col_actual: 所有实际列名
+            func_get_display_name: 列名翻译函数, 为None时显示列名等于实际列名
+        """
+        func_get_display_name = func_get_display_name or (lambda x: x)
+        self.lst_name_col_actual = list(lst_name_col_actual)
+        self.lst_name_col_display = [func_get_display_name(name) for name in self.lst_name_col_actual]
+        self.dic_postings: Dict[str, List[int]] = {}
+        self.lst_token_sorted: List[str] = []
+        self.dic_trigram: Dict[str, Set[str]] = {}
+        self._build()
+        pass
+
+    @classmethod
+    def tokenize(cls,
+        str_text: str
+    ) -> Set[str]:
+        """
+        将文本切分为小写词元
+
+        `{GT,GT,elec-output,slice}` 中的每一段既整体作为词元, 也继续按分隔符切分
+        """
+        str_text = str_text.lower()
+        set_token = {token for token in cls._re_split.split(str_text) if token}
+        for str_brace in cls._re_brace.findall(str_text):
+            set_token.update(seg.strip() for seg in str_brace.split(',') if seg.strip())
+        return set_token
+
+    @staticmethod
+    def _get_trigrams(
+        str_token: str
+    ) -> Set[str]:
+        """词元的字符三元组, 两端补空格使短词和词首也有三元组"""
+        str_pad = f" {str_token} "
+        return {str_pad[idx:idx + 3] for idx in range(len(str_pad) - 2)}
+
+    def _build(self):
+        """建立倒排表、排序词表和三元组索引
+        """
+        # 1.倒排表
+        for idx_col, (str_actual, str_display) in enumerate(zip(self.lst_name_col_actual, self.lst_name_col_display)):
+            for str_token in self.tokenize(str_actual) | self.tokenize(str_display):
+                self.dic_postings.setdefault(str_token, []).append(idx_col)
+        # 2.排序词表
+        self.lst_token_sorted = sorted(self.dic_postings)
+        # 3.三元组 -> 词元
+        for str_token in self.lst_token_sorted:
+            for str_trigram in self._get_trigrams(str_token):
+                self.dic_trigram.setdefault(str_trigram, set()).add(str_token)
+        return
+
+    def _match_term(self,
+        str_term: str
+    ) -> Dict[str, float]:
+        """
+        单个查询词匹配到的词元及其得分
+        """
+        dic_score_token: Dict[str, float] = {}
+        # 1.精确匹配
+        if str_term in self.dic_postings:
+            dic_score_token[str_term] = self.flt_score_exact
+        # 2.前缀匹配
+        idx = bisect_left(self.lst_token_sorted, str_term)
+        while idx < len(self.lst_token_sorted) and self.lst_token_sorted[idx].startswith(str_term):
+            str_token = self.lst_token_sorted[idx]
+            dic_score_token.setdefault(str_token, self.flt_score_prefix)
+            idx += 1
+        # 3.模糊匹配
+        if len(str_term) < 3:
+            # 短词(如两个汉字)三元组过少, 退化为子串匹配
+            for str_token in self.lst_token_sorted:
+                if str_term in str_token:
+                    dic_score_token.setdefault(str_token, self.flt_score_fuzzy)
+            return dic_score_token
+        set_trigram_term = self._get_trigrams(str_term)
+        dic_n_shared: Dict[str, int] = {}
+        for str_trigram in set_trigram_term:
+            for str_token in self.dic_trigram.get(str_trigram, ()):
+                dic_n_shared[str_token] = dic_n_shared.get(str_token, 0) + 1
+        for str_token, n_shared in dic_n_shared.items():
+            if str_token in dic_score_token:
+                continue
+            # 补空格后长度为L的词元有L个三元组
+            flt_ratio = n_shared / (len(set_trigram_term) + len(str_token) - n_shared)
+            if flt_ratio >= self.flt_ratio_fuzzy_min:
+                dic_score_token[str_token] = self.flt_score_fuzzy * flt_ratio
+        return dic_score_token
+
+    def search(self,
+        str_query: str,
+        n_limit: Optional[int] = 200
+    ) -> List[Tuple[str, str, float]]:
+        """
+        搜索列名
+
+        Args:
+            str_query: 查询文本, 空格分隔多个词, 如 "gt elec out"
+            n_limit: 最多返回的结果数, None表示不限制
+        Returns:
+            List: [(实际列名, 显示列名, 得分)], 按得分降序, 同分时短名优先
+        """
+        lst_term = [term for term in self._re_split.split(str_query.lower()) if term]
+        if not lst_term:
+            lst_result = [
+                (str_actual, str_display, 0.0)
+                for str_actual, str_display in zip(self.lst_name_col_actual, self.lst_name_col_display)
+            ]
+            return lst_result[:n_limit] if n_limit else lst_result
+        # 每个查询词: 列id -> 该词在此列上的最高得分
+        dic_score_col: Optional[Dict[int, float]] = None
+        for str_term in lst_term:
+            dic_score_term: Dict[int, float] = {}
+            for str_token, flt_score in self._match_term(str_term).items():
+                for idx_col in self.dic_postings[str_token]:
+                    if flt_score > dic_score_term.get(idx_col, 0.0):
+                        dic_score_term[idx_col] = flt_score
+            # AND: 只保留所有词都命中的列
+            if dic_score_col is None:
+                dic_score_col = dic_score_term
+            else:
+                dic_score_col = {
+                    idx_col: flt_score + dic_score_term[idx_col]
+                    for idx_col, flt_score in dic_score_col.items()
+                    if idx_col in dic_score_term
+                }
+            if not dic_score_col:
+                return []
+        lst_idx_col = sorted(
+            dic_score_col,
+            key=lambda idx_col: (-dic_score_col[idx_col], len(self.lst_name_col_actual[idx_col]), idx_col)
+        )
+        if n_limit:
+            lst_idx_col = lst_idx_col[:n_limit]
+        return [
+            (self.lst_name_col_actual[idx_col], self.lst_name_col_display[idx_col], dic_score_col[idx_col])
+            for idx_col in lst_idx_col
+        ]
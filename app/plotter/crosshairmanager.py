@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtCore import QObject, Qt, Signal, QPointF
+
+from app.plotter.graphconfigs.curveconfig import CurveConfig
+
+class PlotCrosshairManager(QObject):
+    """
+    跨子图联动的竖直十字光标管理器
+
+    鼠标悬停时在所有子图的同一时刻显示竖线, 并对当前显示的曲线数据做二分查找取值;
+    左键单击时可选地从原始数据中精确取值
+
+    Attributes:
+        lst_plot (List[pg.PlotItem]):
+            参与联动的子图列表, 需位于同一场景中
+        lst_vline (List[pg.InfiniteLine]):
+            每个子图上的竖线
+        func_get_curves (Callable[[], List[CurveConfig]]):
+            返回当前所有曲线配置的函数
+        func_get_curveitem (Callable[[CurveConfig], Optional[pg.PlotCurveItem]]):
+            返回曲线配置对应的已绘制item, 尚未绘制时返回None
+        func_lookup_exact (Optional[Callable]):
+            原始数据精确查询函数, 参数为 (时刻, 列名列表), 返回 (命中时刻, {列名: 值})
+
+    Signals:
+        sig_readout_changed(float, list):
+            悬停读数, 参数为 (时刻, [(子图索引, 列名, 值)])
+        sig_readout_exact(float, list):
+            单击精确读数, 参数同上, 时刻为原始数据中实际命中的时间戳
+    """
+    sig_readout_changed: Signal = Signal(float, list)
+    sig_readout_exact: Signal = Signal(float, list)
+
+    def __init__(self,
+        lst_plot: List[pg.PlotItem],
+        func_get_curves: Callable[[], List[CurveConfig]],
+        func_get_curveitem: Callable[[CurveConfig], Optional[pg.PlotCurveItem]],
+        func_lookup_exact: Optional[Callable[[float, List[str]], Tuple[Optional[float], Dict[str, Optional[float]]]]] = None,
+        n_rate_limit: int = 30,
+        parent: Optional[QObject] = None
+    ):
+        super().__init__(parent)
+        self.lst_plot = lst_plot
+        self.func_get_curves = func_get_curves
+        self.func_get_curveitem = func_get_curveitem
+        self.func_lookup_exact = func_lookup_exact
+        self.flt_timestamp_cursor: Optional[float] = None
+        # 每个子图添加一条竖线
+        self.lst_vline: List[pg.InfiniteLine] = []
+        for plot in self.lst_plot:
+            vline = pg.InfiniteLine(
+                angle=90,
+                movable=False,
+                pen=pg.mkPen('w', width=1, style=Qt.PenStyle.DashLine)
+            )
+            vline.hide()
+            plot.addItem(vline, ignoreBounds=True)
+            self.lst_vline.append(vline)
+        # 鼠标移动经SignalProxy限频, 曲线较多时悬停依然流畅
+        obj_scene = self.lst_plot[0].scene()
+        self.proxy_mouse_moved = pg.SignalProxy(
+            obj_scene.sigMouseMoved,
+            rateLimit=n_rate_limit,
+            slot=self._on_mouse_moved
+        )
+        obj_scene.sigMouseClicked.connect(self._on_mouse_clicked)
+        pass
+
+    def _map_scene_to_timestamp(self,
+        pos: QPointF
+    ) -> Optional[float]:
+        """将场景坐标映射为时刻, 不在任何子图内时返回None
+        """
+        for plot in self.lst_plot:
+            if plot.sceneBoundingRect().contains(pos):
+                return plot.vb.mapSceneToView(pos).x()
+        return None
+
+    def _set_vline_pos(self,
+        flt_timestamp: float
+    ):
+        """移动所有子图的竖线
+        """
+        for vline in self.lst_vline:
+            vline.setPos(flt_timestamp)
+            vline.show()
+        return
+
+    def _get_curves_visible(self) -> List[Tuple[CurveConfig, pg.PlotCurveItem]]:
+        """获取当前已绘制且可见的曲线及其item
+        """
+        lst_curve_visible = []
+        for curve_config in self.func_get_curves():
+            curve_item = self.func_get_curveitem(curve_config)
+            if curve_config.bol_show and curve_item is not None:
+                lst_curve_visible.append((curve_config, curve_item))
+        return lst_curve_visible
+
+    @staticmethod
+    def _search_value(
+        arr_x: Optional[np.ndarray],
+        arr_y: Optional[np.ndarray],
+        flt_timestamp: float
+    ) -> Optional[float]:
+        """在升序的arr_x中二分查找不晚于flt_timestamp的最后一个点, 返回其y值
+
+        stepMode曲线的arr_x比arr_y多一个点, 按区间左端点取值
+        """
+        if arr_x is None or arr_y is None or len(arr_y) == 0:
+            return None
+        idx = int(np.searchsorted(arr_x, flt_timestamp, side='right')) - 1
+        if idx < 0 or idx >= len(arr_y):
+            return None
+        return float(arr_y[idx])
+
+    def lookup_displayed(self,
+        flt_timestamp: float
+    ) -> List[Tuple[int, str, Optional[float]]]:
+        """对当前显示的曲线数据二分查找取值
+
+        Args:
+            flt_timestamp: 查询时刻
+        Returns:
+            List: [(子图索引, 列名, 值)]
+        """
+        lst_readout = []
+        for curve_config, curve_item in self._get_curves_visible():
+            arr_x, arr_y = curve_item.getData()
+            lst_readout.append((
+                curve_config.idx_subplot,
+                curve_config.str_name_curve,
+                self._search_value(arr_x, arr_y, flt_timestamp)
+            ))
+        return lst_readout
+
+    def lookup_exact(self,
+        flt_timestamp: float
+    ) -> Tuple[Optional[float], List[Tuple[int, str, Optional[float]]]]:
+        """从原始数据中精确查询可见曲线在该时刻的值
+
+        Args:
+            flt_timestamp: 查询时刻
+        Returns:
+            Tuple: (命中时刻, [(子图索引, 列名, 值)])
+        """
+        lst_curve = [curve_config for curve_config, _ in self._get_curves_visible()]
+        if self.func_lookup_exact is None or not lst_curve:
+            return None, []
+        flt_timestamp_hit, dic_value = self.func_lookup_exact(
+            flt_timestamp,
+            [curve_config.str_name_curve for curve_config in lst_curve]
+        )
+        return flt_timestamp_hit, [
+            (curve_config.idx_subplot, curve_config.str_name_curve, dic_value.get(curve_config.str_name_curve))
+            for curve_config in lst_curve
+        ]
+
+    def _on_mouse_moved(self,
+        evt: tuple
+    ):
+        """SignalProxy回调, evt为 (场景坐标,)
+        """
+        flt_timestamp = self._map_scene_to_timestamp(evt[0])
+        if flt_timestamp is None:
+            return
+        self.flt_timestamp_cursor = flt_timestamp
+        self._set_vline_pos(flt_timestamp)
+        self.sig_readout_changed.emit(flt_timestamp, self.lookup_displayed(flt_timestamp))
+        return
+
+    def _on_mouse_clicked(self,
+        evt
+    ):
+        """左键单击时从原始数据精确取值
+        """
+        if evt.button() != Qt.MouseButton.LeftButton or self.func_lookup_exact is None:
+            return
+        flt_timestamp = self._map_scene_to_timestamp(evt.scenePos())
+        if flt_timestamp is None:
+            return
+        self._set_vline_pos(flt_timestamp)
+        flt_timestamp_hit, lst_readout = self.lookup_exact(flt_timestamp)
+        if flt_timestamp_hit is None:
+            return
+        self.sig_readout_exact.emit(float(flt_timestamp_hit), lst_readout)
+        return
@@ -2,7 +2,7 @@
 """Plotter enums package"""
 
 from .modeenum import AlignmentMode, RangeMode, SideAxis as SideAxisMode
-from .plotenum import SideAxis, IdxItemGridLayout
+from .plotenum import SideAxis, IdxItemGridLayout, ChangeKind, RequestPriority
 from .valueenum import UnitValue
 
 __all__ = [
@@ -11,5 +11,7 @@ __all__ = [
     'SideAxisMode',
     'SideAxis',
     'IdxItemGridLayout',
+    'ChangeKind',
+    'RequestPriority',
     'UnitValue',
 ]
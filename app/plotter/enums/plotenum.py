@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from enum import Enum
+from enum import Enum, Flag, IntEnum, auto
 
 class SideAxis(Enum):
     """轴侧枚举"""
@@ -14,3 +14,39 @@ class IdxItemGridLayout(Enum):
     PLOTITEM = 1
     RIGHTAXIS = 2
     
+
+
+class IdxColCurveList(Enum):
+    """曲线列表模型的列枚举"""
+    SHOW = 0
+    NAME = 1
+    AXIS = 2
+    COLOR = 3
+    WIDTH = 4
+    STYLE = 5
+
+
+class ChangeKind(Flag):
+    """子图变更类型, 可按位组合
+
+    - DATA: 需要重新取数, 如添加曲线
+    - STYLE: 只影响外观, 如颜色、线宽、可见性, 不需要取数
+    - LAYOUT: 轴的增删改或曲线换轴, 需要重新布局和计算范围
+    """
+    NONE = 0
+    DATA = auto()
+    STYLE = auto()
+    LAYOUT = auto()
+    ALL = DATA | STYLE | LAYOUT
+
+
+class RequestPriority(IntEnum):
+    """取数请求优先级, 值越小越优先
+
+    - INTERACTIVE: 用户正在看的窗口刷新, 总有保留的执行槽
+    - VISIBLE: 可见但不急的内容, 如统计
+    - BACKGROUND: 导航图、预取等后台工作
+    """
+    INTERACTIVE = 0
+    VISIBLE = 1
+    BACKGROUND = 2
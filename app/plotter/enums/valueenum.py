@@ -21,3 +21,27 @@ class UnitValue(Enum):
     KELVIN = "K"
     # 百分比
     PERCENT = "%"
+
+    def get_unit_integral(self,
+        str_unit_time: str = 'h'
+    ) -> str:
+        """
+        对时间积分后的单位
+
+        Args:
+            str_unit_time: 积分所用的时间单位, 如 'h'/'s'
+
+        Returns:
+            对小时积分时有专用单位的用专用单位, 如 MW -> MWh; 否则为 值单位·时间单位, 如 MW·s
+        """
+        unit_integral = _DIC_MAP_UNIT_INTEGRAL.get(self) if str_unit_time == 'h' else None
+        return unit_integral.value if unit_integral else f"{self.value}·{str_unit_time}"
+
+
+# 值单位对小时积分后的单位
+_DIC_MAP_UNIT_INTEGRAL = {
+    UnitValue.MW: UnitValue.MWH,
+    UnitValue.KW: UnitValue.KWH,
+    UnitValue.TON_PER_H: UnitValue.TON,
+    UnitValue.KG_PER_H: UnitValue.KG,
+}
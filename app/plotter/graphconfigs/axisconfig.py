@@ -1,23 +1,41 @@
 #!/usr/bin/env python3
 
-from typing import Optional
-from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from dataclasses import dataclass, field, fields
 from PySide6.QtGui import QColor
 
 from app.plotter.enums.modeenum import AlignmentMode, RangeMode
 from app.plotter.enums.plotenum import SideAxis
 from app.plotter.enums.valueenum import UnitValue
+from app.plotter.graphconfigs.configrecord import color_to_str, migrate_dict
 
+# 轴配置字典的格式版本
+#   1: 会话文件最初的格式, 颜色键为 'color'
+#   2: 颜色键为 'str_color'
+N_VERSION_AXISCONFIG = 2
 
-@dataclass
+
+def _migrate_axis_v1(dic_axis: Dict[str, Any]) -> Dict[str, Any]:
+    """版本1 -> 2: 'color' 改名为 'str_color'"""
+    if 'color' in dic_axis:
+        dic_axis['str_color'] = dic_axis.pop('color')
+    return dic_axis
+
+
+@dataclass(slots=True)
 class AxisConfig:
-    """单一一条Y轴配置"""
+    """
+    单一一条Y轴配置
+    
+    带 __slots__ 的设置记录, 只包含可序列化的设置; 该轴的 ViewBox/AxisItem
+    由 PlotAxisManager 的 dic_viewbox/dic_axisitem 按轴名登记
+    """
     str_name_axis: str                        # 此轴名字
     set_name_col: set[str] = field(default_factory=set)  # 绑定到此轴的列名集合
     side_axis: SideAxis = SideAxis.LEFT       # 此轴处于左侧还是右侧
     str_label: str = ""                       # 轴标签
     unit_value: UnitValue = UnitValue.MWH     # 轴数据使用的单位
-    color: QColor = field(default_factory=lambda: QColor(255, 255, 255))
+    str_color: str = '#ffffffff'              # '#AARRGGBB'
     
     # 范围设置
     mode_range: RangeMode = RangeMode.AUTO
@@ -34,5 +52,58 @@ class AxisConfig:
     
     # 内部状态
     bol_is_prim_axis: bool = False              # 是否为主轴
-    viewbox: Optional[object] = None      # PyQtGraph ViewBox
-    axisitem: Optional[object] = None    # PyQtGraph AxisItem
+    
+    @property
+    def color(self) -> QColor:
+        """轴颜色, 每次按 str_color 新建"""
+        return QColor(self.str_color)
+    
+    @color.setter
+    def color(self, color: Any):
+        self.str_color = color_to_str(color)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """导出为带版本号、可JSON序列化的字典"""
+        return {
+            'n_version': N_VERSION_AXISCONFIG,
+            'str_name_axis': self.str_name_axis,
+            'lst_name_col': sorted(self.set_name_col),
+            'side_axis': self.side_axis.value,
+            'str_label': self.str_label,
+            'unit_value': self.unit_value.value,
+            'str_color': self.str_color,
+            'mode_range': self.mode_range.value,
+            'lb_range': self.lb_range,
+            'ub_range': self.ub_range,
+            'mode_align': self.mode_align.value,
+            'str_name_axis_align': self.str_name_axis_align,
+            'flt_align_src': self.flt_align_src,
+            'flt_align_tgt': self.flt_align_tgt,
+            'flt_ratio_scale': self.flt_ratio_scale,
+            'bol_is_prim_axis': self.bol_is_prim_axis,
+        }
+    
+    @classmethod
+    def from_dict(cls,
+        dic_axis: Dict[str, Any]
+    ) -> 'AxisConfig':
+        """从字典重建, 旧版本的字典先迁移; 缺少的键取默认值"""
+        dic_axis = migrate_dict(
+            dic_axis, N_VERSION_AXISCONFIG, {1: _migrate_axis_v1}, cls.__name__)
+        return cls(
+            str_name_axis=dic_axis['str_name_axis'],
+            set_name_col=set(dic_axis.get('lst_name_col', [])),
+            side_axis=SideAxis(dic_axis.get('side_axis', SideAxis.LEFT.value)),
+            str_label=dic_axis.get('str_label', ''),
+            unit_value=UnitValue(dic_axis.get('unit_value', UnitValue.MWH.value)),
+            str_color=color_to_str(dic_axis.get('str_color', '#ffffffff')),
+            mode_range=RangeMode(dic_axis.get('mode_range', RangeMode.AUTO.value)),
+            lb_range=dic_axis.get('lb_range', 0.0),
+            ub_range=dic_axis.get('ub_range', 100.0),
+            mode_align=AlignmentMode(dic_axis.get('mode_align', AlignmentMode.NONE.value)),
+            str_name_axis_align=dic_axis.get('str_name_axis_align'),
+            flt_align_src=dic_axis.get('flt_align_src', 0.0),
+            flt_align_tgt=dic_axis.get('flt_align_tgt', 0.0),
+            flt_ratio_scale=dic_axis.get('flt_ratio_scale', 1.0),
+            bol_is_prim_axis=dic_axis.get('bol_is_prim_axis', False),
+        )
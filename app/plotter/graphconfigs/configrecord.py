@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+配置记录的序列化辅助
+
+曲线/轴配置记录只保存可序列化的设置(颜色存为 '#AARRGGBB' 字符串), 不持有
+QColor 或 pyqtgraph item; 运行时的 ViewBox/AxisItem 由 PlotAxisManager 的句柄表
+按轴名登记. 记录的字典带版本号, 读取旧版本时依次执行迁移函数升级到当前版本.
+"""
+
+from typing import Any, Callable, Dict
+from PySide6.QtGui import QColor
+
+# 迁移函数: 把版本n的字典升级为版本n+1
+FuncMigrate = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def color_to_str(color: Any) -> str:
+    """QColor 或颜色字符串 -> '#AARRGGBB'"""
+    return QColor(color).name(QColor.NameFormat.HexArgb)
+
+
+def migrate_dict(
+    dic_record: Dict[str, Any],
+    n_version_target: int,
+    dic_func_migrate: Dict[int, FuncMigrate],
+    str_name_record: str
+) -> Dict[str, Any]:
+    """
+    将配置字典逐版本迁移到 n_version_target
+
+    Args:
+        dic_record: 配置字典, 没有 n_version 键时视为版本1
+        n_version_target: 目标(当前)版本
+        dic_func_migrate: {版本n: 把版本n升级为n+1的函数}
+        str_name_record: 记录名称, 用于错误信息
+    Returns:
+        Dict: 迁移后的新字典, 原字典不变
+
+    Raises:
+        ValueError: 版本高于当前程序支持的版本
+    """
+    n_version = dic_record.get('n_version', 1)
+    if n_version > n_version_target:
+        raise ValueError(f"{str_name_record} 版本 {n_version} 高于支持的版本 {n_version_target}")
+    dic_record = dict(dic_record)
+    while n_version < n_version_target:
+        dic_record = dic_func_migrate[n_version](dic_record)
+        n_version += 1
+    dic_record['n_version'] = n_version
+    return dic_record
@@ -1,24 +1,76 @@
 #!/usr/bin/env python3
 
-from typing import Optional
-from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass, fields, asdict
 from PySide6.QtGui import QColor
 
+from app.plotter.graphconfigs.configrecord import color_to_str, migrate_dict
 
-@dataclass
+# 曲线配置字典的格式版本
+#   1: 会话文件最初的格式, 颜色键为 'color', 不含 idx_subplot
+#   2: 键与字段名一致, 颜色键为 'str_color'
+N_VERSION_CURVECONFIG = 2
+
+
+def _migrate_curve_v1(dic_curve: Dict[str, Any]) -> Dict[str, Any]:
+    """版本1 -> 2: 'color' 改名为 'str_color'"""
+    if 'color' in dic_curve:
+        dic_curve['str_color'] = dic_curve.pop('color')
+    return dic_curve
+
+
+@dataclass(frozen=True, slots=True)
 class CurveConfig:
-    """曲线配置"""
+    """
+    曲线配置
+    
+    不可变、带 __slots__ 的设置记录, 修改时用 dataclasses.replace 生成新对象并写回
+    所在的字典, 快照因此可以直接共享记录而不必复制. 只包含可序列化的设置,
+    不持有QColor和绘图item, 绘图方按 tpl_id_item 登记和查找对应的item
+    """
     str_name_curve: str                       # 曲线名称（实际列名）
     idx_subplot: int                         # 所属子图索引
     str_name_axis: str = 'main'                 # 所属Y轴ID
     
     # 显示设置
     bol_show: bool = True
-    color: QColor = field(default_factory=lambda: QColor(255, 0, 0))
+    str_color: str = '#ffff0000'            # '#AARRGGBB'
     linestyle: str = 'solid'             # 'solid', 'dash', 'dot', 'dashdot'
     linewidth: int = 2
     bol_is_step: bool = False
     
-    # 内部引用
-    curveitem: Optional[object] = None   # PyQtGraph PlotCurveItem
-    symbolitem: Optional[object] = None  # PyQtGraph ScatterPlotItem
+    @property
+    def tpl_id_item(self) -> Tuple[int, str]:
+        """绘图item的登记键 (子图索引, 实际列名)"""
+        return (self.idx_subplot, self.str_name_curve)
+    
+    @property
+    def color(self) -> QColor:
+        """曲线颜色, 每次按 str_color 新建"""
+        return QColor(self.str_color)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """导出为带版本号、可JSON序列化的字典"""
+        return {'n_version': N_VERSION_CURVECONFIG, **asdict(self)}
+    
+    @classmethod
+    def from_dict(cls,
+        dic_curve: Dict[str, Any],
+        idx_subplot: Optional[int] = None
+    ) -> 'CurveConfig':
+        """
+        从字典重建, 旧版本的字典先迁移; 未知的键被忽略
+        
+        Args:
+            dic_curve: to_dict 或旧版本会话文件中的字典
+            idx_subplot: 所属子图索引, 给定时覆盖字典中的值
+        """
+        dic_curve = migrate_dict(
+            dic_curve, N_VERSION_CURVECONFIG, {1: _migrate_curve_v1}, cls.__name__)
+        if idx_subplot is not None:
+            dic_curve['idx_subplot'] = idx_subplot
+        set_name_field = {field.name for field in fields(cls)}
+        dic_kwargs = {key: value for key, value in dic_curve.items() if key in set_name_field}
+        if 'str_color' in dic_kwargs:
+            dic_kwargs['str_color'] = color_to_str(dic_kwargs['str_color'])
+        return cls(**dic_kwargs)
@@ -184,6 +184,36 @@
         </message>
     </context>
     
+    <!-- Curve List Model -->
+    <context>
+        <name>CurveListModel</name>
+        <message>
+            <source>曲线</source>
+            <comment>f_header_curve</comment>
+            <translation>Curve</translation>
+        </message>
+        <message>
+            <source>Y轴</source>
+            <comment>f_header_yaxis</comment>
+            <translation>Y-Axis</translation>
+        </message>
+        <message>
+            <source>颜色</source>
+            <comment>f_header_color</comment>
+            <translation>Color</translation>
+        </message>
+        <message>
+            <source>线宽</source>
+            <comment>f_header_linewidth</comment>
+            <translation>Width</translation>
+        </message>
+        <message>
+            <source>线型</source>
+            <comment>f_header_linestyle</comment>
+            <translation>Style</translation>
+        </message>
+    </context>
+    
     <!-- Curve Config Panel -->
     <context>
         <name>CurveConfigPanel</name>
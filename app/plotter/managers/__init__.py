@@ -9,10 +9,13 @@ from app.plotter.managers.columnmetadatamanager import ColumnMetadataManager
 from app.plotter.managers.curvemanager import CurveManager
 from app.plotter.managers.axismanager import AxisManager
 from app.plotter.managers.subplotmanager import SubplotManager
+from app.plotter.managers.commandjournal import Command, CommandJournal
 
 __all__ = [
     'ColumnMetadataManager',
     'CurveManager',
     'AxisManager',
     'SubplotManager',
+    'Command',
+    'CommandJournal',
 ]
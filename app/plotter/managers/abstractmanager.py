@@ -8,6 +8,8 @@ from PySide6.QtWidgets import QStatusBar
 from copy import deepcopy
 import logging
 
+from app.plotter.managers.commandjournal import Command, CommandJournal
+
 
 class QABCMeta(type(QObject), ABCMeta):
     """组合元类，解决QObject和ABC的元类冲突"""
@@ -22,10 +24,12 @@ class AbstractManager(QObject, ABC, metaclass=QABCMeta):
     - 统一的信号管理
     - 统一的日志和用户消息输出
     - 子类信号注册机制
+    - 可逆命令的记录(撤销/重做)
     
     Attributes:
         dic_signals: 管理器信号字典 {str_signal_name: Signal}
         logger: 日志记录器
+        journal: 命令日志, 由持有者注入; 为None时不记录命令
         
     User Message Signals (用户可见消息):
         sig_info: 一般信息提示
@@ -58,6 +62,9 @@ class AbstractManager(QObject, ABC, metaclass=QABCMeta):
         self.dic_signals: Dict[str, Signal] = {}
         self.dic_signals_msg: Dict[str, Signal] = {}
         
+        # 命令日志 (由持有者注入, 如 SubplotManager 为子管理器注入共享日志)
+        self.journal: Optional[CommandJournal] = None
+        
         # 初始化信号
         self._init_signals()
         
@@ -134,17 +141,39 @@ class AbstractManager(QObject, ABC, metaclass=QABCMeta):
     # ============================================================
 
     @contextmanager
-    def _atomic_operation(self) -> Generator[None, None, None]:
+    def _atomic_operation(self,
+        str_label: str = "",
+        bol_snapshot: bool = False
+    ) -> Generator[None, None, None]:
         """
         通用原子操作上下文管理器
         
-        自动保存状态快照，失败时自动回滚
+        有命令日志时, 期间记录的命令合并为一条可撤销的复合命令,
+        失败时逆序撤销这些命令即可回滚, 不需要复制整个状态;
+        没有命令日志, 或期间的操作不记录命令(bol_snapshot=True)时,
+        退回到保存状态快照、失败时恢复快照
+        
+        注意: 命令日志方式只能回滚已记录命令的操作, 期间直接修改状态而不记录
+        命令的私有方法不会被撤销; 这类操作需要 bol_snapshot=True
+        
+        Args:
+            str_label: 复合命令的描述
+            bol_snapshot: 强制使用状态快照回滚
         
         Usage:
-            with self._atomic_operation():
+            with self._atomic_operation("添加曲线"):
                 # 进行一系列操作
                 # 如果抛出异常，自动回滚
         """
+        if self.journal is not None and not bol_snapshot:
+            try:
+                with self.journal.group(str_label):
+                    yield
+            except Exception as e:
+                self._error(f"操作失败，已回滚: {e}")
+                raise
+            return
+        
         # 保存状态快照（调用子类实现）
         dic_snapshot = self._get_state_snapshot()
         
@@ -158,6 +187,23 @@ class AbstractManager(QObject, ABC, metaclass=QABCMeta):
             raise  # 重新抛出异常
         return
     
+    def _record_command(self,
+        str_label: str,
+        func_redo: Callable[[], None],
+        func_undo: Callable[[], None]
+    ):
+        """
+        记录一条已执行操作的正向/逆向增量, 没有命令日志时忽略
+        
+        Args:
+            str_label: 操作描述
+            func_redo: 重新执行操作
+            func_undo: 撤销操作
+        """
+        if self.journal is not None:
+            self.journal.record(Command(str_label, func_redo, func_undo))
+        return
+    
     # ============================================================
     # 信号管理 - 公共接口
     # ============================================================
@@ -3,7 +3,8 @@
 from __future__ import annotations
 from typing import List, Dict, Set, Any, Optional, TYPE_CHECKING, override
 from PySide6.QtCore import QObject, Signal
-from copy import deepcopy
+from dataclasses import replace
+from functools import partial
 
 if TYPE_CHECKING:
     # 只在类型检查时导入,运行时不导入
@@ -113,9 +114,17 @@ class AxisManager(AbstractManager):
 
     @override
     def _get_state_snapshot(self) -> Dict[str, Any]:
-        """获取轴管理器的状态快照"""
+        """
+        获取轴管理器的状态快照
+        
+        轴配置只含可序列化的设置, ViewBox/AxisItem 登记在 PlotAxisManager 的句柄表中,
+        不属于快照; 逐个浅复制配置和其中的列名集合即可
+        """
         return {
-            'dic_axisconfig': {k: deepcopy(v) for k, v in self.dic_axisconfig.items()},
+            'dic_axisconfig': {
+                k: replace(v, set_name_col=set(v.set_name_col))
+                for k, v in self.dic_axisconfig.items()
+            },
             'set_axis_added': self.set_axis_added.copy(),
             'str_name_axis_main': self.str_name_axis_main,
         }
@@ -191,15 +200,15 @@ class AxisManager(AbstractManager):
         # 获取轴名称
         str_name_axis = axisconfig.str_name_axis
 
-        # 检查主轴
-        if self.is_axis_primary(str_name_axis):
+        # 检查主轴, 轴还未加入时按传入的配置判断
+        if axisconfig.bol_is_prim_axis or str_name_axis == self.str_name_axis_main:
             self._warning(f"警告: 主轴名称必须为 '{self.str_name_axis_main}'，无法添加")
             return False
         
         # 检查轴名称是否已存在
         if self.is_axis_initialized(str_name_axis):
             self._info(f"轴 '{str_name_axis}' 已存在，覆盖原有配置")
-            self._update_axisconfig(axisconfig)
+            self._update_axisconfig(str_name_axis, axisconfig)
         else:
             self._add_axisconfig(axisconfig)
         
@@ -279,10 +288,12 @@ class AxisManager(AbstractManager):
         """ 原子化切换主轴操作, 包含快照和异常处理
         """
         try:
-            with self._atomic_operation():
-                # 更新axisconfig主轴标识
-                axisconfig_main_old.bol_is_prim_axis = False
-                axisconfig_main_new.bol_is_prim_axis = True
+            with self._atomic_operation(bol_snapshot=True):
+                # 更新axisconfig主轴标识, 替换为新记录而不就地修改
+                self.dic_axisconfig[axisconfig_main_old.str_name_axis] = replace(
+                    axisconfig_main_old, bol_is_prim_axis=False)
+                self.dic_axisconfig[axisconfig_main_new.str_name_axis] = replace(
+                    axisconfig_main_new, bol_is_prim_axis=True)
 
                 # 从added中去除旧主轴，添加新主轴
                 self.set_axis_added.discard(axisconfig_main_old.str_name_axis)
@@ -457,6 +468,47 @@ class AxisManager(AbstractManager):
         self.sig_axis_changed.emit(str_name_axis)
         return True
 
+    def _restore_axis(self,
+        str_name_axis: str,
+        axisconfig: Optional[AxisConfig],
+        bol_added: bool
+    ) -> bool:
+        """
+        将轴恢复为给定的配置和添加状态, 用于撤销
+        
+        Args:
+            str_name_axis: 轴名称
+            axisconfig: 原配置对象, None 表示原本没有该轴的配置
+            bol_added: 原本是否在已添加集合中
+        """
+        bol_added_cur = self.is_axis_added(str_name_axis)
+        # 1.恢复配置
+        if axisconfig is None:
+            self.dic_axisconfig.pop(str_name_axis, None)
+        else:
+            self.dic_axisconfig[str_name_axis] = axisconfig
+        # 2.恢复集合
+        if bol_added:
+            self._add_axis_to_set(str_name_axis)
+        else:
+            self._remove_axis_from_set(str_name_axis)
+        # 3.发射信号
+        if bol_added and not bol_added_cur:
+            self.sig_axis_added.emit(str_name_axis)
+        elif bol_added_cur and not bol_added:
+            self.sig_axis_removed.emit(str_name_axis)
+        else:
+            self.sig_axis_changed.emit(str_name_axis)
+        return True
+
+    def _restore_axes(self,
+        lst_axisconfig: List[AxisConfig]
+    ) -> bool:
+        """将多个轴恢复为给定配置并加入已添加集合, 用于撤销批量删除"""
+        for axisconfig in lst_axisconfig:
+            self._restore_axis(axisconfig.str_name_axis, axisconfig, True)
+        return bool(lst_axisconfig)
+
     def _clear_axisconfig(self) -> bool:
         """
         清空所有轴配置
@@ -526,19 +578,19 @@ class AxisManager(AbstractManager):
             轴配置列表
         """
         return [
-            self.dic_axisconfig[name]
-            for name in self.set_axis_added
+            axisconfig for name, axisconfig in self.dic_axisconfig.items()
+            if name in self.set_axis_added
         ]
 
     ## 轴名getter
     def get_lst_name_axis_all_added(self) -> List[str]:
         """
-        获取所有轴的名称列表
+        获取所有轴的名称列表, 按配置的创建顺序
         
         Returns:
             轴名称列表
         """
-        return list(self.set_axis_added)
+        return [name for name in self.dic_axisconfig if name in self.set_axis_added]
     
     def get_lst_name_axis_all_initialized(self) -> List[str]:
         """
@@ -631,7 +683,17 @@ class AxisManager(AbstractManager):
         Returns:
             成功返回 True，如果轴名称已存在则返回 False
         """
-        return self._add_axis_by_config(axisconfig, bol_emit_signal=True)
+        str_name_axis = axisconfig.str_name_axis
+        axisconfig_old = self.dic_axisconfig.get(str_name_axis)
+        bol_added_old = self.is_axis_added(str_name_axis)
+        if not self._add_axis_by_config(axisconfig, bol_emit_signal=True):
+            return False
+        self._record_command(
+            f"添加Y轴 {str_name_axis}",
+            func_redo=partial(self._add_axis_by_config, axisconfig),
+            func_undo=partial(self._restore_axis, str_name_axis, axisconfig_old, bol_added_old)
+        )
+        return True
     
     def remove_axis(self, str_name_axis: str) -> bool:
         """
@@ -646,7 +708,37 @@ class AxisManager(AbstractManager):
         Returns:
             成功返回 True，如果是主轴或轴不存在则返回 False
         """
-        return self._remove_axis(str_name_axis, bol_remove_config=False, bol_emit_signal=True)
+        if not self._remove_axis(str_name_axis, bol_remove_config=False, bol_emit_signal=True):
+            return False
+        self._record_command(
+            f"删除Y轴 {str_name_axis}",
+            func_redo=partial(self._remove_axis, str_name_axis),
+            func_undo=partial(self._restore_axis, str_name_axis, self.dic_axisconfig[str_name_axis], True)
+        )
+        return True
+    
+    def clear_secondary_axes(self) -> bool:
+        """
+        公共API: 清除所有次轴（保留主轴和配置）
+        
+        Returns:
+            是否有次轴被删除
+        """
+        lst_axisconfig = [
+            self.dic_axisconfig[str_name_axis] for str_name_axis in self.get_lst_name_axis_secondary()
+        ]
+        if not self._clear_secondary_axes():
+            return False
+        self._record_command(
+            f"删除 {len(lst_axisconfig)} 个Y轴",
+            func_redo=partial(
+                self._remove_axes_batch,
+                [axisconfig.str_name_axis for axisconfig in lst_axisconfig],
+                bol_remove_config=False
+            ),
+            func_undo=partial(self._restore_axes, lst_axisconfig)
+        )
+        return True
     
     def get_axis_config(self, str_name_axis: str) -> Optional[AxisConfig]:
         """
@@ -721,4 +813,12 @@ class AxisManager(AbstractManager):
         
         推荐使用 _update_axisconfig
         """
-        return self._update_axisconfig(str_name_axis, axisconfig)
+        axisconfig_old = self.dic_axisconfig.get(str_name_axis)
+        if not self._update_axisconfig(str_name_axis, axisconfig):
+            return False
+        self._record_command(
+            f"修改Y轴 {str_name_axis}",
+            func_redo=partial(self._update_axisconfig, str_name_axis, axisconfig),
+            func_undo=partial(self._update_axisconfig, str_name_axis, axisconfig_old)
+        )
+        return True
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
-from typing import List, Set, Dict, Optional, Callable, override
+from typing import List, Set, Dict, Any, Optional, Callable, override
 
 from app.plotter.managers.abstractmanager import AbstractManager
+from app.plotter.columnsearchindex import ColumnSearchIndex
+from code_source.polars_toolkits.schema_toolkits.columncatalog import ColumnCatalog, ColumnStats
 
 class ColumnMetadataManager(AbstractManager ):
     """
@@ -20,12 +22,14 @@ class ColumnMetadataManager(AbstractManager ):
         lst_name_col_actual: 所有可用的实际列名列表
         func_get_display_name: 将实际列名转换为显示列名的回调函数
         func_get_actual_name: 将显示列名转换为实际列名的回调函数
+        column_catalog: 列目录, 提供每列的类型和统计信息, 可选
     """
     
     def __init__(self,
         lst_name_col_actual: List[str],
         func_get_display_name: Optional[Callable[[str], str]] = None,
-        func_get_actual_name: Optional[Callable[[str], Optional[str]]] = None
+        func_get_actual_name: Optional[Callable[[str], Optional[str]]] = None,
+        column_catalog: Optional[ColumnCatalog] = None
     ):
         """
         初始化列元数据管理器
@@ -40,20 +44,22 @@ class ColumnMetadataManager(AbstractManager ):
                 将显示列名转换为实际列名的回调函数
                 示例: "燃气轮机出力" -> "GTG_P_out"
                 如果为 None，则使用原始列名
+            column_catalog: 列目录, 为 None 时不提供列统计信息
         """
         super().__init__()
         self.lst_name_col_actual = lst_name_col_actual
         self.func_get_display_name = func_get_display_name or (lambda x: x)
         self.func_get_actual_name = func_get_actual_name or (lambda x: x)
+        self.column_catalog = column_catalog
         
         # 构建快速查找集合
         self._set_name_col_actual: Set[str] = set(lst_name_col_actual)
-        # 初始化信号
-        self._init_signal()
+        # 列名搜索索引, 首次使用时建立
+        self._search_index: Optional[ColumnSearchIndex] = None
         pass
 
     @override
-    def _init_signal(self):
+    def _init_signals(self):
         """初始化信号"""
         self.dic_signals = {
         }
@@ -64,6 +70,21 @@ class ColumnMetadataManager(AbstractManager ):
     def _connect_signals(self):
         """连接到下游的信号"""
         pass
+
+    @override
+    def _get_state_snapshot(self) -> Dict[str, Any]:
+        """获取列元数据的状态快照"""
+        return {
+            'lst_name_col_actual': self.lst_name_col_actual.copy(),
+        }
+
+    @override
+    def _restore_state_snapshot(self, dic_snapshot: Dict[str, Any]):
+        """恢复列元数据的状态快照"""
+        self.lst_name_col_actual = dic_snapshot['lst_name_col_actual']
+        self._set_name_col_actual = set(self.lst_name_col_actual)
+        self._search_index = None
+        return
     
     def get_display_name(self, str_name_col_actual: str) -> str:
         """
@@ -132,6 +153,53 @@ class ColumnMetadataManager(AbstractManager ):
         actual_name = self.get_actual_name(str_name_col_display)
         return actual_name is not None and self.is_valid_actual_name(actual_name)
     
+    def get_search_index(self) -> ColumnSearchIndex:
+        """
+        获取基于实际列名和显示列名的搜索索引
+        
+        Returns:
+            ColumnSearchIndex 实例，列名或翻译变化后需调用 invalidate_search_index
+        """
+        if self._search_index is None:
+            self._search_index = ColumnSearchIndex(
+                self.lst_name_col_actual, self.get_display_name)
+        return self._search_index
+    
+    def invalidate_search_index(self):
+        """
+        列名翻译(界面语言)或列目录改变后丢弃搜索索引，下次使用时重建
+        """
+        self._search_index = None
+        return
+    
+    def get_column_stats(self, str_name_col_actual: str) -> Optional[ColumnStats]:
+        """
+        获取列的类型和统计信息
+        
+        Args:
+            str_name_col_actual: 实际列名
+            
+        Returns:
+            列统计信息，没有列目录或列不存在时返回 None
+        """
+        if self.column_catalog is None:
+            return None
+        return self.column_catalog.get_stats(str_name_col_actual)
+    
+    def get_trivial_actual_names(self) -> List[str]:
+        """
+        获取常值或全空的实际列名
+        
+        Returns:
+            实际列名列表，没有列目录时为空
+        """
+        if self.column_catalog is None:
+            return []
+        return [
+            name for name in self.lst_name_col_actual
+            if (stats := self.column_catalog.get_stats(name)) is not None and stats.bol_trivial
+        ]
+    
     def get_column_count(self) -> int:
         """
         获取可用列的总数
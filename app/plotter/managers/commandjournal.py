@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Generator, List, Optional
+from PySide6.QtCore import QObject, Signal
+
+
+@dataclass
+class Command:
+    """
+    可逆命令, 只保存一次操作的增量
+
+    func_redo/func_undo 通过闭包持有操作涉及的列名、轴名以及新旧值,
+    不复制管理器的完整状态
+    """
+    str_label: str                          # 显示在撤销/重做菜单中的描述
+    func_redo: Callable[[], None]           # 重新执行操作
+    func_undo: Callable[[], None]           # 撤销操作
+
+
+@dataclass
+class CompoundCommand(Command):
+    """由多个命令组成的复合命令, 撤销时逆序执行"""
+    func_redo: Optional[Callable[[], None]] = None
+    func_undo: Optional[Callable[[], None]] = None
+    lst_command: List[Command] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.func_redo = self._redo_all
+        self.func_undo = self._undo_all
+        pass
+
+    def _redo_all(self):
+        for command in self.lst_command:
+            command.func_redo()
+        return
+
+    def _undo_all(self):
+        for command in reversed(self.lst_command):
+            command.func_undo()
+        return
+
+
+class CommandJournal(QObject):
+    """
+    命令日志, 提供撤销/重做和无快照的回滚
+
+    管理器的公共操作完成后记录一条 Command; group() 将多条命令合并为一条
+    复合命令, 组内出现异常时逆序撤销组内已记录的命令即可回滚.
+    撤销栈长度有上限, 超出时丢弃最早的命令.
+
+    Attributes:
+        n_max_command: 撤销栈最多保存的命令数
+        deque_undo: 撤销栈
+        lst_redo: 重做栈
+    """
+
+    # 信号定义
+    sig_journal_changed: Signal = Signal(bool, bool)  # 撤销/重做栈变化，参数为 (可撤销, 可重做)
+
+    def __init__(self,
+        n_max_command: int = 200,
+        parent: Optional[QObject] = None
+    ):
+        super().__init__(parent)
+        self.n_max_command = n_max_command
+        self.deque_undo: Deque[Command] = deque(maxlen=n_max_command)
+        self.lst_redo: List[Command] = []
+        # 当前打开的组, 嵌套的组并入最外层
+        self._lst_group: List[CompoundCommand] = []
+        # 撤销/重做执行期间不记录新命令
+        self._bol_replaying: bool = False
+        pass
+
+    def record(self,
+        command: Command
+    ):
+        """
+        记录一条已执行的命令
+
+        组内的命令先暂存在组中; 撤销/重做执行期间调用时忽略
+        """
+        if self._bol_replaying:
+            return
+        if self._lst_group:
+            self._lst_group[-1].lst_command.append(command)
+            return
+        self.deque_undo.append(command)
+        self.lst_redo.clear()
+        self._emit_changed()
+        return
+
+    @contextmanager
+    def group(self,
+        str_label: str = ""
+    ) -> Generator[CompoundCommand, None, None]:
+        """
+        将期间记录的命令合并为一条复合命令
+
+        期间抛出异常时逆序撤销组内已记录的命令, 然后重新抛出
+
+        Usage:
+            with journal.group("移动曲线"):
+                manager_curve.remove_curves(...)
+                manager_curve.add_curves(...)
+        """
+        compound = CompoundCommand(str_label=str_label)
+        self._lst_group.append(compound)
+        try:
+            yield compound
+        except Exception:
+            self._lst_group.pop()
+            self._replay(compound.func_undo)
+            raise
+        self._lst_group.pop()
+        if not compound.lst_command:
+            return
+        # 只有一条命令时不必包一层
+        command = compound if len(compound.lst_command) > 1 else compound.lst_command[0]
+        if self._lst_group:
+            self._lst_group[-1].lst_command.append(command)
+        else:
+            self.record(command)
+        return
+
+    def _replay(self,
+        func: Callable[[], None]
+    ):
+        """执行撤销或重做, 期间不记录命令"""
+        bol_replaying, self._bol_replaying = self._bol_replaying, True
+        try:
+            func()
+        finally:
+            self._bol_replaying = bol_replaying
+        return
+
+    def undo(self) -> bool:
+        """撤销最近一条命令"""
+        if not self.can_undo():
+            return False
+        command = self.deque_undo.pop()
+        self._replay(command.func_undo)
+        self.lst_redo.append(command)
+        self._emit_changed()
+        return True
+
+    def redo(self) -> bool:
+        """重做最近撤销的一条命令"""
+        if not self.can_redo():
+            return False
+        command = self.lst_redo.pop()
+        self._replay(command.func_redo)
+        self.deque_undo.append(command)
+        self._emit_changed()
+        return True
+
+    def can_undo(self) -> bool:
+        return bool(self.deque_undo) and not self._lst_group
+
+    def can_redo(self) -> bool:
+        return bool(self.lst_redo) and not self._lst_group
+
+    def get_label_undo(self) -> str:
+        return self.deque_undo[-1].str_label if self.deque_undo else ""
+
+    def get_label_redo(self) -> str:
+        return self.lst_redo[-1].str_label if self.lst_redo else ""
+
+    def clear(self):
+        """清空撤销和重做栈, 如整体加载布局后旧命令不再适用"""
+        self.deque_undo.clear()
+        self.lst_redo.clear()
+        self._emit_changed()
+        return
+
+    def _emit_changed(self):
+        self.sig_journal_changed.emit(self.can_undo(), self.can_redo())
+        return
@@ -3,9 +3,11 @@
 from __future__ import annotations
 from typing import List, Dict, Set, Optional, Any, TYPE_CHECKING, override
 from PySide6.QtCore import QObject, Signal
-from copy import deepcopy
+from dataclasses import replace
+from functools import partial
 
 from code_source.general_toolkits.fptoolkit import aggregate_info_iterable, aggregator_list
+from code_source.general_toolkits.cowcollections import CowDict, CowSet
 
 from app.plotter.managers.abstractmanager import AbstractManager
 from app.plotter.graphconfigs.curveconfig import CurveConfig
@@ -33,9 +35,11 @@ class CurveManager(AbstractManager):
         sig_curve_added: 曲线添加信号 (str_name_col_actual)
         sig_curve_removed: 曲线删除信号 (str_name_col_actual)
         sig_curve_changed: 曲线配置变更信号 (str_name_col_actual)
+        sig_curve_axis_changed: 曲线所属轴变更信号 (str_name_col_actual)
         sig_curves_batch_added: 批量曲线添加信号
         sig_curves_batch_removed: 批量曲线删除信号
         sig_curves_batch_changed: 批量曲线变更信号
+        sig_curves_batch_axis_changed: 批量曲线换轴信号
     """
     
     # 信号定义
@@ -45,6 +49,8 @@ class CurveManager(AbstractManager):
     sig_curves_batch_added = Signal(list)    # 批量曲线添加时发射，避免多次刷新
     sig_curves_batch_removed = Signal(list)  # 批量曲线删除时发射，避免多次刷新
     sig_curves_batch_changed = Signal(list)  # 批量曲线变更时发射，避免多次刷新
+    sig_curve_axis_changed = Signal(str)         # 曲线换轴时发射，参数为列名
+    sig_curves_batch_axis_changed = Signal(list) # 批量曲线换轴时发射
 
     def __init__(self,
         parent: SubplotManager,
@@ -55,8 +61,9 @@ class CurveManager(AbstractManager):
         super().__init__(parent)
 
         # 初始化属性
-        self.dic_curveconfig: Dict[str, CurveConfig] = {}
-        self.set_added_cols: Set[str] = set()
+        # 写时复制的存储, 快照和回滚都是O(1)
+        self.dic_curveconfig: CowDict[str, CurveConfig] = CowDict()
+        self.set_added_cols: CowSet[str] = CowSet()
 
         # 初始化
         self.manager_subplot: SubplotManager = parent
@@ -74,6 +81,8 @@ class CurveManager(AbstractManager):
             "sig_curves_batch_added": self.sig_curves_batch_added,
             "sig_curves_batch_removed": self.sig_curves_batch_removed,
             "sig_curves_batch_changed": self.sig_curves_batch_changed,
+            "sig_curve_axis_changed": self.sig_curve_axis_changed,
+            "sig_curves_batch_axis_changed": self.sig_curves_batch_axis_changed,
         }
         pass
 
@@ -93,17 +102,21 @@ class CurveManager(AbstractManager):
 
     @override
     def _get_state_snapshot(self) -> Dict[str, Any]:
-        """获取轴管理器的状态快照"""
+        """
+        获取曲线管理器的状态快照
+        
+        曲线配置是不可变记录, 快照只共享存储的引用, 不复制任何配置
+        """
         return {
-            'dic_curveconfig': {k: deepcopy(v) for k, v in self.dic_curveconfig.items()},
-            'set_added_cols': self.set_added_cols.copy(),
+            'dic_curveconfig': self.dic_curveconfig.snapshot(),
+            'set_added_cols': self.set_added_cols.snapshot(),
         }
     
     @override
     def _restore_state_snapshot(self, dic_snapshot: Dict[str, Any]):
-        """恢复轴管理器的状态快照"""
-        self.dic_curveconfig = dic_snapshot['dic_curveconfig']
-        self.set_added_cols = dic_snapshot['set_added_cols']
+        """恢复曲线管理器的状态快照, 只替换存储的引用"""
+        self.dic_curveconfig.restore(dic_snapshot['dic_curveconfig'])
+        self.set_added_cols.restore(dic_snapshot['set_added_cols'])
         self._warning("State restored from snapshot")
         return
 
@@ -263,13 +276,12 @@ class CurveManager(AbstractManager):
         if str_name_col_actual not in self.dic_curveconfig:
             self._warning(f"警告: 曲线配置 '{str_name_col_actual}' 不存在，无法移动")
             return False
-        # 获取曲线配置
-        curveconfig = self.dic_curveconfig[str_name_col_actual]
-        # 更新轴名称
-        curveconfig.str_name_axis = str_name_axis_new
+        # 更新轴名称, 配置不可变, 替换为新记录
+        curveconfig = replace(self.dic_curveconfig[str_name_col_actual], str_name_axis=str_name_axis_new)
+        self.dic_curveconfig[str_name_col_actual] = curveconfig
         # 发射信号
         if bol_emit_signal:
-            self.sig_curve_changed.emit(curveconfig.str_name_curve)
+            self.sig_curve_axis_changed.emit(curveconfig.str_name_curve)
         return True
 
     # 批量曲线操作
@@ -300,9 +312,9 @@ class CurveManager(AbstractManager):
                     bol_has_changes = True
                     lst_name_col_moved.append(curveconfig.str_name_curve)
         
-        # 只发射一次批量变更信号
+        # 只发射一次批量换轴信号
         if bol_has_changes:
-            self.sig_curves_batch_changed.emit(lst_name_col_moved)
+            self.sig_curves_batch_axis_changed.emit(lst_name_col_moved)
         
         return True
 
@@ -362,16 +374,56 @@ class CurveManager(AbstractManager):
             self.sig_curves_batch_removed.emit(lst_name_col_removed)
         return bol_has_changes
 
-    def remove_all_curves(self) -> bool:
+    def _restore_curves(self,
+        lst_curveconfig: List[CurveConfig]
+    ) -> bool:
         """
-        清除所有曲线, 但不删除曲线配置
+        将曲线配置对象放回字典并重新加入已添加集合, 用于撤销删除和重做添加
+        
+        使用原配置对象, 颜色、线型等设置保持不变
         """
-        lst_name_col = list(self.dic_curveconfig.keys())
-        bol_has_changes = self._remove_curves_batch(
-            lst_name_col,
-            bol_remove_config=False)
-        return bol_has_changes
-    
+        lst_name_col_added = []
+        for curveconfig in lst_curveconfig:
+            str_name_col_actual = curveconfig.str_name_curve
+            self.dic_curveconfig.setdefault(str_name_col_actual, curveconfig)
+            if str_name_col_actual not in self.set_added_cols:
+                self.set_added_cols.add(str_name_col_actual)
+                lst_name_col_added.append(str_name_col_actual)
+        if lst_name_col_added:
+            self.sig_curves_batch_added.emit(lst_name_col_added)
+        return bool(lst_name_col_added)
+
+    def _set_curve_visibility(self,
+        str_name_col_actual: str,
+        bol_visible: bool
+    ) -> bool:
+        """
+        设置曲线可见性并发射信号
+        """
+        curveconfig = self.get_curveconfig(str_name_col_actual)
+        if curveconfig is None:
+            return False
+        self.dic_curveconfig[str_name_col_actual] = replace(curveconfig, bol_show=bol_visible)
+        self.sig_curve_changed.emit(str_name_col_actual)
+        return True
+
+    def _record_remove(self,
+        str_label: str,
+        lst_curveconfig: List[CurveConfig],
+        bol_remove_config: bool
+    ):
+        """记录删除曲线的命令, 逆操作放回原配置对象"""
+        self._record_command(
+            str_label,
+            func_redo=partial(
+                self._remove_curves_batch,
+                [curveconfig.str_name_curve for curveconfig in lst_curveconfig],
+                bol_remove_config=bol_remove_config
+            ),
+            func_undo=partial(self._restore_curves, lst_curveconfig)
+        )
+        return
+
     # ============================================================
     # curveconfig 操作
     # ============================================================
@@ -390,6 +442,7 @@ class CurveManager(AbstractManager):
         # 创建曲线配置对象
         curveconfig = CurveConfig(
             str_name_curve=str_name_col_actual,
+            idx_subplot=self.idx_subplot,
             str_name_axis=str_name_axis,
             **kwargs
         )
@@ -440,9 +493,13 @@ class CurveManager(AbstractManager):
             self._warning(f"警告: 曲线 '{str_name_col_actual}' 不存在，无法更新")
             return False
         # 更新配置
+        str_name_axis_old = self.dic_curveconfig[str_name_col_actual].str_name_axis
         self.dic_curveconfig[str_name_col_actual] = curveconfig
-        # 发射信号
-        self.sig_curve_changed.emit(str_name_col_actual)
+        # 发射信号, 换轴需要重新布局, 其余只是外观变化
+        if curveconfig.str_name_axis != str_name_axis_old:
+            self.sig_curve_axis_changed.emit(str_name_col_actual)
+        else:
+            self.sig_curve_changed.emit(str_name_col_actual)
         return True
 
     # ============================================================
@@ -479,19 +536,19 @@ class CurveManager(AbstractManager):
             曲线配置列表
         """
         return [
-            self.dic_curveconfig[name]
-            for name in self.set_added_cols
+            curveconfig for name, curveconfig in self.dic_curveconfig.items()
+            if name in self.set_added_cols
         ]
 
     ## 列名getter
     def get_lst_name_col_all_added(self) -> List[str]:
         """
-        获取所有曲线的真实列名列表
+        获取所有曲线的真实列名列表, 按配置的创建顺序
         
         Returns:
             列名列表
         """
-        return list(self.set_added_cols)
+        return [name for name in self.dic_curveconfig if name in self.set_added_cols]
     
     def get_lst_name_col_all_initialized(self) -> List[str]:
         """
@@ -578,15 +635,19 @@ class CurveManager(AbstractManager):
     def add_curve(self,
         str_name_col: str,
         bol_is_display_name: bool = False,
-        str_name_axis: str = None
+        str_name_axis: str = None,
+        **kwargs
     ) -> bool:
         """
         公共API: 添加单个曲线
         
+        曲线曾被删除而保留了配置时, 沿用原配置重新添加
+        
         Args:
             str_name_col: 列名（可以是实际列名或显示列名）
             bol_is_display_name: 是否为显示列名
             str_name_axis: 指定Y轴名称，默认为主轴
+            **kwargs: 新建配置时的其他 CurveConfig 字段, 如 str_color
             
         Returns:
             是否成功添加
@@ -596,11 +657,27 @@ class CurveManager(AbstractManager):
         else:
             str_name_col_actual = str_name_col
         
-        return self._add_curve_by_col(
-            str_name_col_actual=str_name_col_actual,
-            str_name_axis=str_name_axis,
-            bol_emit_signal=True
+        if str_name_col_actual in self.set_added_cols:
+            self._warning(f"警告: 曲线 '{str_name_col_actual}' 已存在，无法添加")
+            return False
+        curveconfig = self.dic_curveconfig.get(str_name_col_actual)
+        bol_new_config = curveconfig is None
+        if bol_new_config:
+            curveconfig = self._create_curveconfig(
+                str_name_col_actual=str_name_col_actual,
+                str_name_axis=str_name_axis,
+                **kwargs
+            )
+            self._add_curve_by_config(curveconfig, bol_emit_signal=True)
+        else:
+            self._restore_curves([curveconfig])
+        # 记录命令: 撤销时新建的配置一起删除, 沿用的配置保留
+        self._record_command(
+            f"添加曲线 {str_name_col_actual}",
+            func_redo=partial(self._restore_curves, [curveconfig]),
+            func_undo=partial(self._remove_curves_batch, [str_name_col_actual], bol_remove_config=bol_new_config)
         )
+        return True
     
     def add_curves(self,
         lst_name_col: List[str],
@@ -616,10 +693,32 @@ class CurveManager(AbstractManager):
         Returns:
             是否有曲线被成功添加
         """
-        return self._add_curves_by_col_batch(
-            lst_name_col=lst_name_col,
-            bol_is_display_name=bol_is_display_name
+        if bol_is_display_name:
+            lst_name_col_actual = self.get_name_col_actual_batch(lst_name_col)
+        else:
+            lst_name_col_actual = lst_name_col
+        # 只有尚无配置的列会被添加
+        lst_name_col_new = [
+            str_name_col for str_name_col in dict.fromkeys(lst_name_col_actual)
+            if str_name_col not in self.dic_curveconfig
+        ]
+        if not self._add_curves_by_col_batch(lst_name_col=lst_name_col_actual):
+            return False
+        # 记录命令: 撤销时连同新建的配置一起删除
+        lst_curveconfig = [
+            self.dic_curveconfig[str_name_col] for str_name_col in lst_name_col_new
+            if str_name_col in self.set_added_cols
+        ]
+        self._record_command(
+            f"添加 {len(lst_curveconfig)} 条曲线",
+            func_redo=partial(self._restore_curves, lst_curveconfig),
+            func_undo=partial(
+                self._remove_curves_batch,
+                [curveconfig.str_name_curve for curveconfig in lst_curveconfig],
+                bol_remove_config=True
+            )
         )
+        return True
     
     def remove_curve(self,
         str_name_col: str,
@@ -642,11 +741,15 @@ class CurveManager(AbstractManager):
         else:
             str_name_col_actual = str_name_col
         
-        return self._remove_curve(
+        curveconfig = self.dic_curveconfig.get(str_name_col_actual)
+        if not self._remove_curve(
             str_name_col_actual=str_name_col_actual,
             bol_remove_config=bol_remove_config,
             bol_emit_signal=True
-        )
+        ):
+            return False
+        self._record_remove(f"删除曲线 {str_name_col_actual}", [curveconfig], bol_remove_config)
+        return True
     
     def remove_curves(self,
         lst_name_col: List[str],
@@ -664,11 +767,22 @@ class CurveManager(AbstractManager):
         Returns:
             是否有曲线被成功删除
         """
-        return self._remove_curves_batch(
-            lst_name_col=lst_name_col,
-            bol_is_display_name=bol_is_display_name,
+        if bol_is_display_name:
+            lst_name_col_actual = self.get_name_col_actual_batch(lst_name_col)
+        else:
+            lst_name_col_actual = lst_name_col
+        # 只有已添加的曲线会被删除, 先保存其配置对象
+        lst_curveconfig = [
+            self.dic_curveconfig[str_name_col] for str_name_col in dict.fromkeys(lst_name_col_actual)
+            if str_name_col in self.set_added_cols
+        ]
+        if not self._remove_curves_batch(
+            lst_name_col=lst_name_col_actual,
             bol_remove_config=bol_remove_config
-        )
+        ):
+            return False
+        self._record_remove(f"删除 {len(lst_curveconfig)} 条曲线", lst_curveconfig, bol_remove_config)
+        return True
     
     def clear_all_curves(self) -> bool:
         """
@@ -677,7 +791,7 @@ class CurveManager(AbstractManager):
         Returns:
             是否成功清除
         """
-        return self.remove_all_curves()
+        return self.remove_curves(list(self.set_added_cols))
     
     def move_curve_to_axis(self,
         str_name_col: str,
@@ -700,11 +814,51 @@ class CurveManager(AbstractManager):
         else:
             str_name_col_actual = str_name_col
         
-        return self._move_curve_to_axis(
+        curveconfig = self.dic_curveconfig.get(str_name_col_actual)
+        str_name_axis_old = curveconfig.str_name_axis if curveconfig else None
+        if not self._move_curve_to_axis(
             str_name_col_actual=str_name_col_actual,
             str_name_axis_new=str_name_axis_new,
             bol_emit_signal=True
+        ):
+            return False
+        self._record_command(
+            f"移动曲线 {str_name_col_actual} 到 {str_name_axis_new}",
+            func_redo=partial(self._move_curve_to_axis, str_name_col_actual, str_name_axis_new),
+            func_undo=partial(self._move_curve_to_axis, str_name_col_actual, str_name_axis_old)
+        )
+        return True
+    
+    def update_curve_config(self,
+        str_name_col: str,
+        curveconfig: CurveConfig,
+        bol_is_display_name: bool = False
+    ) -> bool:
+        """
+        公共API: 用新的配置对象替换曲线配置, 如修改颜色、线型或所在Y轴
+        
+        Args:
+            str_name_col: 列名（可以是实际列名或显示列名）
+            curveconfig: 新的曲线配置对象
+            bol_is_display_name: 是否为显示列名
+            
+        Returns:
+            是否成功更新
+        """
+        if bol_is_display_name:
+            str_name_col_actual = self.get_name_col_actual(str_name_col)
+        else:
+            str_name_col_actual = str_name_col
+        
+        curveconfig_old = self.dic_curveconfig.get(str_name_col_actual)
+        if not self._update_curveconfig(str_name_col_actual, curveconfig):
+            return False
+        self._record_command(
+            f"修改曲线 {str_name_col_actual}",
+            func_redo=partial(self._update_curveconfig, str_name_col_actual, curveconfig),
+            func_undo=partial(self._update_curveconfig, str_name_col_actual, curveconfig_old)
         )
+        return True
     
     def get_curve_config(self, str_name_col: str, bol_is_display_name: bool = False) -> Optional[CurveConfig]:
         """
@@ -824,8 +978,13 @@ class CurveManager(AbstractManager):
         if curveconfig is None:
             return False
         
-        curveconfig.bol_show = bol_visible
-        self.sig_curve_changed.emit(str_name_col_actual)
+        bol_visible_old = curveconfig.bol_show
+        self._set_curve_visibility(str_name_col_actual, bol_visible)
+        self._record_command(
+            f"{'显示' if bol_visible else '隐藏'}曲线 {str_name_col_actual}",
+            func_redo=partial(self._set_curve_visibility, str_name_col_actual, bol_visible),
+            func_undo=partial(self._set_curve_visibility, str_name_col_actual, bol_visible_old)
+        )
         return True
     
     def get_visible_curve_list(self) -> List[str]:
@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 
 from __future__ import annotations
-from typing import List, Dict, Optional, Union, Any, Callable, Iterable, TYPE_CHECKING, override
+from typing import List, Dict, Set, Tuple, Optional, Union, Any, Callable, Iterable, Generator, TYPE_CHECKING, override
+from contextlib import contextmanager
+from dataclasses import replace
 from functools import partial, reduce
 from operator import add
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QTimer
 
 from code_source.general_toolkits.fptoolkit import aggregate_info_iterable, aggregator_list
 
 from app.plotter.managers.curvemanager import CurveManager
 from app.plotter.managers.axismanager import AxisManager
 from app.plotter.managers.abstractmanager import AbstractManager
+from app.plotter.managers.commandjournal import CommandJournal
+from app.plotter.enums.plotenum import ChangeKind
+from app.plotter.graphconfigs.axisconfig import AxisConfig
+from app.plotter.graphconfigs.curveconfig import CurveConfig
 
 if TYPE_CHECKING:
     # 只在类型检查时导入,运行时不导入
@@ -40,23 +46,51 @@ class SubplotManager(AbstractManager):
         dic_curvemanager: 曲线管理器字典 {idx_subplot: CurveManager}
         dic_axismanager: 轴管理器字典 {idx_subplot: AxisManager}
         str_name_axis_main: 主Y轴的名称（所有子图共享）
+        dic_kind_dirty: 本轮事件循环中待通知的变更 {idx_subplot: ChangeKind}
+        journal: 所有子图共享的命令日志, 提供撤销/重做
         
     Signals:
-        sig_subplot_config_changed: 子图配置变更信号 (idx_subplot)
+        sig_subplot_config_changed: 子图配置变更信号 (idx_subplot), -1 表示多个或所有子图
+        sig_subplot_changes: 合并后的变更信号 ({idx_subplot: ChangeKind})
+    
+    子管理器的信号不直接转发, 而是记录脏子图和变更类型, 由零间隔定时器
+    在本轮事件循环结束时合并发射一次
     """
     
     # 信号定义
     sig_subplot_config_changed = Signal(int)  # 子图配置变更，参数为子图索引
+    # dict 参数会被转为只允许字符串键的 QVariantMap, 整数键的字典需按 object 传递
+    sig_subplot_changes = Signal(object)      # 合并后的变更，参数为 {子图索引: ChangeKind}
+    
+    # 子管理器信号 -> 变更类型, 未列出的信号按 ChangeKind.ALL 处理
+    dic_kind_signal: Dict[str, ChangeKind] = {
+        "sig_curve_added": ChangeKind.DATA | ChangeKind.LAYOUT,
+        "sig_curves_batch_added": ChangeKind.DATA | ChangeKind.LAYOUT,
+        "sig_curve_removed": ChangeKind.LAYOUT,
+        "sig_curves_batch_removed": ChangeKind.LAYOUT,
+        "sig_curve_changed": ChangeKind.STYLE,
+        "sig_curves_batch_changed": ChangeKind.STYLE,
+        "sig_curve_axis_changed": ChangeKind.LAYOUT,
+        "sig_curves_batch_axis_changed": ChangeKind.LAYOUT,
+        "sig_axis_added": ChangeKind.LAYOUT,
+        "sig_axis_removed": ChangeKind.LAYOUT,
+        "sig_axis_changed": ChangeKind.LAYOUT,
+        "sig_axes_batch_added": ChangeKind.LAYOUT,
+        "sig_axes_batch_removed": ChangeKind.LAYOUT,
+        "sig_axes_batch_changed": ChangeKind.LAYOUT,
+    }
     
     def __init__(self, 
         n_subplot: int = 3, 
-        manager_columnmetadata: Optional["ColumnMetadataManager"] = None
+        manager_columnmetadata: Optional["ColumnMetadataManager"] = None,
+        str_name_axis_main: str = 'main'
     ):
         """
         初始化子图管理器
         
         Args:
             n_subplot: 子图数量
+            manager_columnmetadata: 列元数据管理器
             str_name_axis_main: 主Y轴的名称，默认为 'main'
         """
         super().__init__()
@@ -67,8 +101,17 @@ class SubplotManager(AbstractManager):
         # 初始化属性
         self.n_subplot = n_subplot
         self.manager_columnmetadata = manager_columnmetadata
+        self.str_name_axis_main = str_name_axis_main
 
-        # 初始化信号连接
+        # 变更合并: 零间隔单次定时器在本轮事件循环结束时发射
+        self.dic_kind_dirty: Dict[int, ChangeKind] = {}
+        self.timer_flush = QTimer(self)
+        self.timer_flush.setSingleShot(True)
+        self.timer_flush.setInterval(0)
+        self.timer_flush.timeout.connect(self.flush_changes)
+        
+        # 所有子图共享一个命令日志, 撤销顺序与用户操作顺序一致
+        self.journal = CommandJournal(parent=self)
         
         # 初始化子图管理器
         self._init_subplot_managers()
@@ -91,6 +134,10 @@ class SubplotManager(AbstractManager):
                 idx_subplot=idx_subplot,
                 str_name_axis_main=self.str_name_axis_main
             )
+            
+            # 3.注入共享的命令日志
+            self.dic_curvemanager[idx_subplot].journal = self.journal
+            self.dic_axismanager[idx_subplot].journal = self.journal
         return
     
     @override
@@ -98,6 +145,7 @@ class SubplotManager(AbstractManager):
         """初始化信号"""
         self.dic_signals = {
             "sig_subplot_config_changed": self.sig_subplot_config_changed,
+            "sig_subplot_changes": self.sig_subplot_changes,
         }
         pass
 
@@ -106,31 +154,237 @@ class SubplotManager(AbstractManager):
     def _connect_signals(self):
         """
         连接到下游的信号
+        
+        每个信号按其变更类型标记脏子图, 不直接触发刷新
         """
         # 定义槽函数模板
-        def slot_template(signal_arg, idx_subplot):
-            self.sig_subplot_config_changed.emit(idx_subplot)
+        def slot_template(signal_arg, idx_subplot, kind):
+            self._mark_dirty(idx_subplot, kind)
+        
+        def connect_manager(manager: AbstractManager, idx_subplot: int):
+            for str_name_signal, signal in manager.get_signal_all().items():
+                # 使用 partial 填入具体的 idx_subplot 值和变更类型
+                signal.connect(partial(
+                    slot_template,
+                    idx_subplot=idx_subplot,
+                    kind=self.dic_kind_signal.get(str_name_signal, ChangeKind.ALL)
+                ))
+            return
         # 1.连接 columnmetadata manager 的信号
-        slot = partial(slot_template, idx_subplot=-1)
-        self.manager_columnmetadata._connect_signals_to_slot(
-            slot=slot
-        )
+        if self.manager_columnmetadata:
+            connect_manager(self.manager_columnmetadata, -1)
         
         for idx_subplot in range(self.n_subplot):
-            # 使用 partial 填入具体的 idx_subplot 值
-            slot = partial(slot_template, idx_subplot=idx_subplot)
             # 2.curve manager
-            curve_manager = self.dic_curvemanager[idx_subplot]
-            curve_manager._connect_signals_to_slot(
-                slot=slot
-            )
+            connect_manager(self.dic_curvemanager[idx_subplot], idx_subplot)
             # 3.axis manager
-            axis_manager = self.dic_axismanager[idx_subplot]
-            axis_manager._connect_signals_to_slot(
-                slot=slot
-            )
+            connect_manager(self.dic_axismanager[idx_subplot], idx_subplot)
         return
     
+    # 变更合并
+    def _mark_dirty(self,
+        idx_subplot: int,
+        kind: ChangeKind
+    ):
+        """
+        记录子图的变更, 并安排在本轮事件循环结束时发射
+        
+        Args:
+            idx_subplot: 子图索引, -1 表示所有子图
+            kind: 变更类型
+        """
+        lst_idx_subplot = range(self.n_subplot) if idx_subplot < 0 else [idx_subplot]
+        for idx in lst_idx_subplot:
+            self.dic_kind_dirty[idx] = self.dic_kind_dirty.get(idx, ChangeKind.NONE) | kind
+        if not self.timer_flush.isActive():
+            self.timer_flush.start()
+        return
+    
+    def flush_changes(self) -> Dict[int, ChangeKind]:
+        """
+        立即发射所有待通知的变更
+        
+        sig_subplot_changes 携带每个子图的变更类型; 为兼容旧的接收方,
+        sig_subplot_config_changed 只发射一次, 多个子图变更时参数为 -1
+        
+        Returns:
+            本次发射的 {idx_subplot: ChangeKind}, 没有待通知的变更时为空
+        """
+        self.timer_flush.stop()
+        dic_kind_dirty, self.dic_kind_dirty = self.dic_kind_dirty, {}
+        if not dic_kind_dirty:
+            return dic_kind_dirty
+        self.sig_subplot_changes.emit(dict(dic_kind_dirty))
+        self.sig_subplot_config_changed.emit(
+            next(iter(dic_kind_dirty)) if len(dic_kind_dirty) == 1 else -1)
+        return dic_kind_dirty
+    
+    def has_pending_changes(self) -> bool:
+        """是否有尚未发射的变更"""
+        return bool(self.dic_kind_dirty)
+    
+    # 原子操作管理器
+    @override
+    def _get_state_snapshot(self) -> Dict[str, Any]:
+        """获取所有子图管理器的状态快照"""
+        return {
+            'dic_snapshot_curve': {
+                idx_subplot: mgr._get_state_snapshot()
+                for idx_subplot, mgr in self.dic_curvemanager.items()
+            },
+            'dic_snapshot_axis': {
+                idx_subplot: mgr._get_state_snapshot()
+                for idx_subplot, mgr in self.dic_axismanager.items()
+            },
+        }
+    
+    @override
+    def _restore_state_snapshot(self, dic_snapshot: Dict[str, Any]):
+        """恢复所有子图管理器的状态快照"""
+        for idx_subplot, dic_snapshot_curve in dic_snapshot['dic_snapshot_curve'].items():
+            self.dic_curvemanager[idx_subplot]._restore_state_snapshot(dic_snapshot_curve)
+        for idx_subplot, dic_snapshot_axis in dic_snapshot['dic_snapshot_axis'].items():
+            self.dic_axismanager[idx_subplot]._restore_state_snapshot(dic_snapshot_axis)
+        return
+
+    @contextmanager
+    def _batch_update(self) -> Generator[None, None, None]:
+        """
+        批量更新上下文管理器
+        
+        期间子管理器的信号被屏蔽, 结束后所有子图按 ChangeKind.ALL 标记并立即合并发射,
+        视图只需刷新一次
+        """
+        lst_manager = [*self.dic_curvemanager.values(), *self.dic_axismanager.values()]
+        lst_bol_blocked = [mgr.blockSignals(True) for mgr in lst_manager]
+        try:
+            yield
+        finally:
+            for mgr, bol_blocked in zip(lst_manager, lst_bol_blocked):
+                mgr.blockSignals(bol_blocked)
+        self._mark_dirty(-1, ChangeKind.ALL)
+        self.flush_changes()
+        return
+
+    # 布局的导出和重建
+    def get_subplot_layout(self,
+        idx_subplot: int
+    ) -> Tuple[List[AxisConfig], List[CurveConfig], Set[str]]:
+        """
+        获取子图的完整布局
+        
+        已删除的轴不在布局中, 否则加载会话时会重新出现; 曲线配置则全部保留,
+        以便重新添加时沿用之前的样式
+
+        Returns:
+            (已添加的轴配置, 所有曲线配置, 已添加显示的列名集合)
+        """
+        axis_manager = self.get_axis_manager(idx_subplot)
+        curve_manager = self.get_curve_manager(idx_subplot)
+        return (
+            axis_manager.get_lst_axisconfig_all_added(),
+            curve_manager.get_lst_curveconfig_all_initialized(),
+            set(curve_manager.set_added_cols),
+        )
+
+    def load_subplot_layout(self,
+        dic_layout_subplot: Dict[int, Tuple[List[AxisConfig], List[CurveConfig], Set[str]]]
+    ) -> bool:
+        """
+        用给定布局替换子图的全部轴和曲线
+        
+        通过批量接口重建, 失败时回滚到加载前的状态; 整个过程只发射一次
+        sig_subplot_config_changed(-1). 重建不记录命令, 成功后清空命令日志
+        
+        Args:
+            dic_layout_subplot: {idx_subplot: (轴配置列表, 曲线配置列表, 已添加显示的列名集合)}
+        """
+        try:
+            with self._batch_update(), self._atomic_operation(bol_snapshot=True):
+                for idx_subplot, (lst_axisconfig, lst_curveconfig, set_name_col_added) in dic_layout_subplot.items():
+                    if not self.is_valid_subplot_index(idx_subplot):
+                        self._warning(f"警告: 子图索引 {idx_subplot} 无效，已跳过")
+                        continue
+                    self._load_layout_axis(idx_subplot, lst_axisconfig)
+                    self._load_layout_curve(idx_subplot, lst_curveconfig, set_name_col_added)
+        except Exception as e:
+            self._error(f"错误: 加载子图布局失败: {e}")
+            return False
+        self.journal.clear()
+        return True
+    
+    # 撤销/重做
+    @contextmanager
+    def compound_operation(self,
+        str_label: str
+    ) -> Generator[None, None, None]:
+        """
+        将期间的多个公共操作合并为一次撤销; 任一步失败时逆序撤销已完成的步骤
+        
+        Usage:
+            with manager_subplot.compound_operation("移动曲线到子图2"):
+                manager_subplot.get_curve_manager(0).remove_curve(...)
+                manager_subplot.get_curve_manager(1).add_curve(...)
+        """
+        with self._atomic_operation(str_label):
+            yield
+        return
+    
+    def undo(self) -> bool:
+        """撤销最近一次操作"""
+        return self.journal.undo()
+    
+    def redo(self) -> bool:
+        """重做最近一次撤销的操作"""
+        return self.journal.redo()
+
+    def _load_layout_axis(self,
+        idx_subplot: int,
+        lst_axisconfig: List[AxisConfig]
+    ):
+        """
+        重建子图的轴: 主轴就地替换配置, 次轴全部删除后批量添加
+        """
+        axis_manager = self.get_axis_manager(idx_subplot)
+        # 1.删除所有次轴及其配置
+        lst_name_axis_del = [
+            str_name_axis for str_name_axis in axis_manager.get_lst_name_axis_all_initialized()
+            if str_name_axis != axis_manager.str_name_axis_main
+        ]
+        for str_name_axis in lst_name_axis_del:
+            axis_manager._remove_axisconfig(str_name_axis)
+            axis_manager._remove_axis_from_set(str_name_axis)
+        # 2.主轴替换配置, 次轴逐个添加
+        for axisconfig in lst_axisconfig:
+            if axisconfig.bol_is_prim_axis:
+                axisconfig = replace(axisconfig, str_name_axis=axis_manager.str_name_axis_main)
+                axis_manager._update_axisconfig(axisconfig.str_name_axis, axisconfig)
+            else:
+                axis_manager._add_axis_by_config(axisconfig, bol_emit_signal=False)
+        return
+
+    def _load_layout_curve(self,
+        idx_subplot: int,
+        lst_curveconfig: List[CurveConfig],
+        set_name_col_added: Set[str]
+    ):
+        """
+        重建子图的曲线: 清空所有曲线配置后批量添加
+        """
+        curve_manager = self.get_curve_manager(idx_subplot)
+        # 1.清空所有曲线及其配置
+        for str_name_col in curve_manager.get_lst_name_col_all_initialized():
+            curve_manager._remove_curveconfig(str_name_col)
+        curve_manager.set_added_cols.clear()
+        # 2.已添加显示的曲线进入集合, 其余只保留配置
+        for curveconfig in lst_curveconfig:
+            curveconfig = replace(curveconfig, idx_subplot=idx_subplot)
+            if curveconfig.str_name_curve in set_name_col_added:
+                curve_manager._add_curve_by_config(curveconfig, bol_emit_signal=False)
+            else:
+                curve_manager._add_curveconfig(curveconfig)
+        return
+
     # 列名便捷转换
     def get_name_col_actual(self,
         str_name_col_display: str
@@ -157,9 +411,9 @@ class SubplotManager(AbstractManager):
     # Subplot的操作
     def clear_subplot(self, idx_subplot: int) -> bool:
         """
-        清空指定子图的所有内容, 但不删除曲线配置
+        清空指定子图的所有曲线和次轴, 保留主轴, 不删除配置
         
-        TODO:清除该子图的所有曲线和次轴，保留主轴
+        经各管理器的公共API删除, 整体记为一次可撤销的操作
         
         Args:
             idx_subplot: 子图索引
@@ -168,15 +422,16 @@ class SubplotManager(AbstractManager):
             self._warning(f"警告: 子图索引 {idx_subplot} 无效")
             return False
         bol_success = True
-        # 清空曲线管理器
-        curve_manager = self.get_curve_manager(idx_subplot)
-        if curve_manager:
-            bol_success &= curve_manager.remove_all_curves()
-        
-        # 清空轴管理器
-        axis_manager = self.get_axis_manager(idx_subplot)
-        if axis_manager:
-            bol_success &= axis_manager.clear_secondary_axes()
+        with self.compound_operation(f"清空子图 {idx_subplot + 1}"):
+            # 清空曲线管理器
+            curve_manager = self.get_curve_manager(idx_subplot)
+            if curve_manager:
+                bol_success &= curve_manager.clear_all_curves()
+            
+            # 清空轴管理器
+            axis_manager = self.get_axis_manager(idx_subplot)
+            if axis_manager:
+                bol_success &= axis_manager.clear_secondary_axes()
         return bol_success
     
     def clear_all_subplots(self):
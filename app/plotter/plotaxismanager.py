@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
-from typing import Tuple, Dict, Optional
+import math
+from typing import Tuple, Dict, List, Optional
+import numpy as np
 import pyqtgraph as pg
 
 from app.plotter.enums.modeenum import AlignmentMode, RangeMode
@@ -19,6 +21,13 @@ class PlotAxisManager:
             本图的axis配置字典, key为每个axis的str_name_axis, value为AxisConfig对象
         dic_viewbox (Dict[str, pg.ViewBox]):
             axis对应的ViewBox字典, key为每个axis的str_name_axis, value为对应的ViewBox对象
+        dic_axisitem (Dict[str, pg.AxisItem]):
+            右侧axis对应的AxisItem字典; 与dic_viewbox一起构成运行时句柄表,
+            AxisConfig本身只保存可序列化的设置
+        lst_name_axis_right (List[str]):
+            右侧轴名称列表, 顺序与layout中右轴列的顺序一致
+        lst_pool_yaxis (List[Tuple[pg.ViewBox, pg.AxisItem]]):
+            已移除轴留下的ViewBox/AxisItem池, 新增轴时优先复用
 
     * QGraphicsGridLayout布局说明:
         行\列      0          1              2            3
@@ -34,29 +43,23 @@ class PlotAxisManager:
         self.obj_plot : pg.PlotItem = obj_plot
         self.dic_axisconfig: Dict[str, AxisConfig] = {}
         self.dic_viewbox: Dict[str, pg.ViewBox] = {}
-        # 初始化func_alignment
-        self._init_dic_method_alignment()
+        self.dic_axisitem: Dict[str, pg.AxisItem] = {}
         # 主轴使用plot自带的ViewBox
         self.viewbox_main = obj_plot.getViewBox()
-        # 右侧y轴计数
+        # PlotItem自带的右轴占据第一个右轴列, 从layout中移除, 右轴列由本类管理
+        self._detach_builtin_yaxis_right()
+        # 右侧y轴, 按layout列顺序排列
+        self.lst_name_axis_right: List[str] = []
         self.n_yaxis_right = 0
+        # 已移除轴的ViewBox/AxisItem池, 供新轴复用
+        self.lst_pool_yaxis: List[Tuple[pg.ViewBox, pg.AxisItem]] = []
+        self.n_pool_yaxis_max = 4
         # 添加默认主轴, 左侧
         self._init_yaxis_left(self.str_name_axis_left)
         # 连接主轴大小变化信号（只连接一次）
         self.viewbox_main.sigResized.connect(self._sync_viewbox_geometry)
         pass
         
-    def _init_dic_method_alignment(self):
-        """
-        初始化对齐方法字典
-        """
-        self.dic_method_alignment = {
-            AlignmentMode.ZERO: self._align_yaxis_at_zero,
-            AlignmentMode.VALUE: self._align_yaxis_at_value,
-            AlignmentMode.VALUESCALE: self._align_yaxis_at_value_w_scale,
-        }
-        pass
-
     def _init_yaxis_left(self,
         str_name_axis: str = 'main'
     ):
@@ -68,193 +71,20 @@ class PlotAxisManager:
             str_name_axis=str_name_axis,
             side_axis=SideAxis.LEFT,
             str_label='左Y轴',
-            bol_is_prim_axis=True,
-            viewbox=self.viewbox_main
+            bol_is_prim_axis=True
         )
         # 加入字典
         self.dic_axisconfig[str_name_axis] = axisconfig_main
         self.dic_viewbox[str_name_axis] = self.viewbox_main
         pass
 
-    # 对齐yaxis的方法
-    def _calc_yaxis_range_align(
-        flt_lb_range_tgt : float,
-        flt_ub_range_tgt: float,
-        flt_lb_range_src: Optional[float] = None,
-        flt_ub_range_src: Optional[float] = None,
-        flt_align_src: Optional[float] = None,
-        flt_align_tgt: Optional[float] = None,
-        flt_ratio_scale: Optional[float] = None,
-        str_name_axis_src: Optional[str] = None,
-        str_name_axis_tgt: Optional[str] = None,
-        bol_raise_nonexist: bool = False,
-    ) -> Tuple[float, float]:
-        """
-        计算对齐后的Y轴范围
-
-        Args:
-            flt_lb_range_tgt: 目标轴下限
-            flt_ub_range_tgt: 目标轴上限
-            flt_lb_range_src: 源轴下限
-            flt_ub_range_src: 源轴上限
-            flt_align_src: 源轴对齐值
-            flt_align_tgt: 目标轴对齐值
-            flt_ratio_scale: 源轴与目标轴的比例缩放
-                即 源轴新span = 目标轴span * flt_ratio_scale
-
-        """
-        # 计算目标轴的span
-        flt_span_range_tgt = flt_ub_range_tgt - flt_lb_range_tgt
-        # 计算目标对齐值在tgt的span范围的相对位置
-        flt_percentile_align_tgt = (flt_align_tgt - flt_lb_range_tgt) / flt_span_range_tgt
-        # 计算源轴的span
-        flt_span_range_src = flt_ub_range_src - flt_lb_range_src
-        # 验证是否目标范围有问题
-        if flt_span_range_tgt <= 0:
-            if bol_raise_nonexist:
-                raise ValueError(
-                    f"Axis {str_name_axis_tgt} 目标轴范围无效"+\
-                    f"(LB: {flt_lb_range_tgt}, UB: {flt_ub_range_tgt})"
-                )  
-            return None, None
-        # 如果flt_ratio_scale有值, 则调整源轴span
-        if flt_ratio_scale is not None:
-            flt_span_range_src = flt_span_range_tgt * flt_ratio_scale
-        # 按对齐位置, 计算源轴新范围
-        flt_lb_range_new = flt_align_src - flt_percentile_align_tgt * flt_span_range_src
-        flt_ub_range_new = flt_align_src + (1 - flt_percentile_align_tgt) * flt_span_range_src
-        return flt_lb_range_new, flt_ub_range_new
-
-    def _align_yaxis_at_zero(self,
-        str_name_axis_src:str,
-        str_name_axis_tgt:str,
-        bol_raise_nonexist: bool = False,
-        **kwargs
-    ):
-        """
-        零点对齐: 当前y轴 和 目标轴在0的数值位置对齐
-
-        """
-        viewbox_tgt = self._get_axis_viewbox(
-            str_name_axis_tgt,
-            bol_raise_nonexist=bol_raise_nonexist)
-        viewbox_src = self._get_axis_viewbox(
-            str_name_axis_src,
-            bol_raise_nonexist=bol_raise_nonexist)
-        # 获取目标轴的Y范围
-        lst_range_yaxis_tgt = viewbox_tgt.viewRange()[1]
-        flt_lb_range_tgt, flt_ub_range_tgt = lst_range_yaxis_tgt
-        # 获取源轴的Y范围
-        lst_range_yaxis_src = viewbox_src.viewRange()[1]
-        flt_lb_range_src, flt_ub_range_src = lst_range_yaxis_src
-
-        # 对齐计算
-        flt_lb_range_new, flt_ub_range_new = PlotAxisManager._calc_yaxis_range_align(
-            flt_lb_range_tgt =flt_lb_range_tgt,
-            flt_ub_range_tgt=flt_ub_range_tgt,
-            flt_lb_range_src=flt_lb_range_src,
-            flt_ub_range_src=flt_ub_range_src,
-            flt_align_src=0.0,
-            flt_align_tgt=0.0,
-            flt_ratio_scale=None,
-            str_name_axis_src=str_name_axis_src,
-            str_name_axis_tgt=str_name_axis_tgt,
-            bol_raise_nonexist=bol_raise_nonexist
-        )
-        # 应用调整
-        viewbox_src.setYRange(flt_lb_range_new, flt_ub_range_new, padding=0)
-        return
-    
-    def _align_yaxis_at_value(self,
-        str_name_axis_src:str,
-        str_name_axis_tgt:str,
-        flt_align_src: float,
-        flt_align_tgt: float,
-        bol_raise_nonexist: bool = False,
-        **kwargs
-    ):
-        """
-        源和目标轴按config指定的值对齐
-
-        源轴的span保持不变, 仅调整对齐位置
-        """
-        viewbox_tgt = self._get_axis_viewbox(
-            str_name_axis_tgt,
-            bol_raise_nonexist=bol_raise_nonexist)
-        viewbox_src = self._get_axis_viewbox(
-            str_name_axis_src,
-            bol_raise_nonexist=bol_raise_nonexist)
-        # 获取目标轴的Y范围
-        lst_range_yaxis_tgt = viewbox_tgt.viewRange()[1]
-        flt_lb_range_tgt, flt_ub_range_tgt = lst_range_yaxis_tgt
-        # 获取源轴的Y范围
-        lst_range_yaxis_src = viewbox_src.viewRange()[1]
-        flt_lb_range_src, flt_ub_range_src = lst_range_yaxis_src
-
-        # 对齐计算
-        flt_lb_range_new, flt_ub_range_new = PlotAxisManager._calc_yaxis_range_align(
-            flt_lb_range_tgt =flt_lb_range_tgt,
-            flt_ub_range_tgt=flt_ub_range_tgt,
-            flt_lb_range_src=flt_lb_range_src,
-            flt_ub_range_src=flt_ub_range_src,
-            flt_align_src=flt_align_src,
-            flt_align_tgt=flt_align_tgt,
-            flt_ratio_scale=None,
-            str_name_axis_src=str_name_axis_src,
-            str_name_axis_tgt=str_name_axis_tgt,
-            bol_raise_nonexist=bol_raise_nonexist
-        )
-        # 应用调整
-        viewbox_src.setYRange(flt_lb_range_new, flt_ub_range_new, padding=0)
-        return True
-    
-    def _align_yaxis_at_value_w_scale(self,
-        str_name_axis_src:str,
-        str_name_axis_tgt:str,
-        flt_align_src: float,
-        flt_align_tgt: float,
-        flt_ratio_scale: float=1.0,
-        bol_raise_nonexist: bool = False,
-        **kwargs
-    ):
-        """
-        源和目标轴按config指定的值对齐, span按比例对比target的span调整
-
-        """
-        viewbox_tgt = self._get_axis_viewbox(
-            str_name_axis_tgt,
-            bol_raise_nonexist=bol_raise_nonexist)
-        viewbox_src = self._get_axis_viewbox(
-            str_name_axis_src,
-            bol_raise_nonexist=bol_raise_nonexist)
-        # 获取目标轴的Y范围
-        lst_range_yaxis_tgt = viewbox_tgt.viewRange()[1]
-        flt_lb_range_tgt, flt_ub_range_tgt = lst_range_yaxis_tgt
-        # 获取源轴的Y范围
-        lst_range_yaxis_src = viewbox_src.viewRange()[1]
-        flt_lb_range_src, flt_ub_range_src = lst_range_yaxis_src
-
-        # 对齐计算
-        flt_lb_range_new, flt_ub_range_new = PlotAxisManager._calc_yaxis_range_align(
-            flt_lb_range_tgt =flt_lb_range_tgt,
-            flt_ub_range_tgt=flt_ub_range_tgt,
-            flt_lb_range_src=flt_lb_range_src,
-            flt_ub_range_src=flt_ub_range_src,
-            flt_align_src=flt_align_src,
-            flt_align_tgt=flt_align_tgt,
-            flt_ratio_scale=flt_ratio_scale,
-            str_name_axis_src=str_name_axis_src,
-            str_name_axis_tgt=str_name_axis_tgt,
-            bol_raise_nonexist=bol_raise_nonexist
-        )
-        # 应用调整
-        viewbox_src.setYRange(flt_lb_range_new, flt_ub_range_new, padding=0)
-        return
-    
     def _add_yaxis_right(self,
         axisconfig: AxisConfig
     ) -> pg.ViewBox:
         """添加新的Y轴
+
+        只在布局末尾追加一列, 已有右轴的位置不变;
+        ViewBox/AxisItem优先从池中复用, 避免反复创建
         """
         # 检查是否已存在
         if axisconfig.str_name_axis in self.dic_axisconfig:
@@ -263,89 +93,150 @@ class PlotAxisManager:
         if axisconfig.side_axis == SideAxis.LEFT and not axisconfig.bol_is_prim_axis:
             raise ValueError("不支持多个左侧Y轴, 因为左轴为主轴")
         
-        # 1.创建新的ViewBox
-        viewbox_yaxis = self._add_viewbox(self.obj_plot)
-        # 2.创建轴对象
-        axisitem_yaxis = self._add_item_axis(
-            axisconfig=axisconfig,
-            viewbox=viewbox_yaxis
-        )
-        # 3.添加到Layout（右侧轴位置）
+        # 1.从池中获取(或新建)ViewBox与AxisItem
+        viewbox_yaxis, axisitem_yaxis = self._acquire_yaxis_pair()
+        # 2.设置轴标签和颜色
+        self._set_item_yaxis_label(axisitem_yaxis, axisconfig)
+        # 3.追加到Layout末尾的右轴列
         self._add_yaxis_to_layout(
             obj_plot=self.obj_plot,
-            axis_item=axisitem_yaxis
+            axisitem=axisitem_yaxis,
+            idx_yaxis_right=len(self.lst_name_axis_right)
         )
+        self.lst_name_axis_right.append(axisconfig.str_name_axis)
+        self.n_yaxis_right = len(self.lst_name_axis_right)
         # 4.把y轴链接到X轴
         viewbox_yaxis.setXLink(self.viewbox_main)
-        # 5.保存入配置
-        axisconfig.viewbox = viewbox_yaxis
-        axisconfig.axisitem = axisitem_yaxis
-        # 6.加入manager的字典
+        # 5.加入manager的配置字典和句柄表
         self.dic_axisconfig[axisconfig.str_name_axis] = axisconfig
         self.dic_viewbox[axisconfig.str_name_axis] = viewbox_yaxis
+        self.dic_axisitem[axisconfig.str_name_axis] = axisitem_yaxis
+        # 6.只同步新ViewBox的几何形状
+        self._sync_viewbox_geometry(lst_name_axis=[axisconfig.str_name_axis])
         return viewbox_yaxis
     
-    @staticmethod
+    def _acquire_yaxis_pair(self) -> Tuple[pg.ViewBox, pg.AxisItem]:
+        """从池中取出一对ViewBox/AxisItem, 池为空时新建
+
+        新建的ViewBox加入PlotItem的场景, AxisItem已链接到该ViewBox
+        """
+        if self.lst_pool_yaxis:
+            viewbox, axisitem = self.lst_pool_yaxis.pop()
+        else:
+            viewbox = self._add_viewbox()
+            axisitem = self._add_item_yaxis(viewbox)
+        viewbox.show()
+        axisitem.show()
+        return viewbox, axisitem
+    
+    def _release_yaxis_pair(self,
+        viewbox: pg.ViewBox,
+        axisitem: pg.AxisItem
+    ):
+        """归还一对ViewBox/AxisItem到池中
+
+        清空其上的曲线并断开X轴链接后隐藏; 池满时直接从场景中移除
+        """
+        viewbox.clear()
+        viewbox.setXLink(None)
+        if len(self.lst_pool_yaxis) < self.n_pool_yaxis_max:
+            viewbox.hide()
+            axisitem.hide()
+            self.lst_pool_yaxis.append((viewbox, axisitem))
+            return
+        obj_scene = self.obj_plot.scene()
+        if obj_scene:
+            obj_scene.removeItem(viewbox)
+            obj_scene.removeItem(axisitem)
+        return
+    
     def _add_viewbox(self) -> pg.ViewBox:
         """创建并添加新的ViewBox
         """
         obj_plot = self.obj_plot
         viewbox_axis = pg.ViewBox()
         ## 将ViewBox添加到PlotItem的场景中
-        if obj_plot:
+        if obj_plot and obj_plot.scene():
             obj_plot.scene().addItem(viewbox_axis)
         return viewbox_axis
     
     @staticmethod
-    def _add_item_yaxis(self,
-        axisconfig: AxisConfig,
+    def _add_item_yaxis(
+        viewbox: pg.ViewBox
     ) -> pg.AxisItem:
         """
-        创建并添加新的AxisItem
+        创建新的右侧AxisItem并链接到viewbox
         """
-        viewbox = self.viewbox_main
         # 创建AxisItem
         axis_item = pg.AxisItem(
             orientation=SideAxis.RIGHT.value)
-        # 设置标签和颜色
-        axis_item.setLabel(
+        if viewbox:
+            axis_item.linkToView(viewbox)
+        return axis_item
+    
+    @staticmethod
+    def _set_item_yaxis_label(
+        axisitem: pg.AxisItem,
+        axisconfig: AxisConfig
+    ):
+        """设置AxisItem的标签和颜色
+        """
+        axisitem.setLabel(
             text=axisconfig.str_label,
             units=axisconfig.unit_value.value,
             color=axisconfig.color
         )
-        # 将AxisItem添加到布局
-        if viewbox:
-            axis_item.linkToView(viewbox)
-        return axis_item
+        return
     
+    def _detach_builtin_yaxis_right(self):
+        """
+        从layout中移除PlotItem自带的右侧AxisItem
+
+        自带右轴默认隐藏但仍占据(2, RIGHTAXIS)单元格, 不移除时第一个右轴会与其重叠
+        """
+        axisitem_builtin = self.obj_plot.getAxis('right')
+        axisitem_builtin.hide()
+        self.obj_plot.layout.removeItem(axisitem_builtin)
+        return
+
     def _add_yaxis_to_layout(self,
         obj_plot: pg.PlotItem,
         axisitem: pg.AxisItem,
+        idx_yaxis_right: int,
         idx_row_viewbox: int = 2
     ):
-        """将AxisItem添加到PlotItem的布局中
+        """将AxisItem添加到PlotItem的布局中第idx_yaxis_right个右轴列
 
         layout列: 0=左轴, 1=绘图区, 2=第一个右轴, 3=第二个右轴...
         layout行: 0=标题区, 1=顶部X轴, 2=ViewBox所在行, 3=底部X轴
         """
         # 计算添加yaxis在layout布局的位置
-        idx_item_layout = IdxItemGridLayout.PLOTITEM.value + self.n_yaxis_right
+        idx_item_layout = IdxItemGridLayout.RIGHTAXIS.value + idx_yaxis_right
         obj_plot.layout.addItem(
             axisitem, idx_row_viewbox, idx_item_layout)
-        # 更新右轴计数
-        self.n_yaxis_right += 1
         return
 
-    def _sync_viewbox_geometry(self):
+    def _sync_viewbox_geometry(self,
+        *args,
+        lst_name_axis: Optional[List[str]] = None
+    ):
         """
-        同步所有ViewBox的几何形状
-        以匹配主ViewBox的几何形状
+        同步ViewBox的几何形状以匹配主ViewBox的几何形状
+
+        Args:
+            *args: sigResized信号附带的参数, 忽略
+            lst_name_axis: 需要同步的轴名列表, 为None时同步所有副轴
         """
         # 获取主ViewBox的边界矩形
         geometry = self.viewbox_main.sceneBoundingRect()
-        # 更新其他ViewBox的几何形状, 主轴在信号源中已更新
-        for str_name_axis, viewbox in self.dic_viewbox.items():
-            if str_name_axis != self.str_name_axis_left:
+        if lst_name_axis is None:
+            lst_name_axis = self.lst_name_axis_right
+        # 只更新几何形状有变化的ViewBox, 主轴在信号源中已更新
+        for str_name_axis in lst_name_axis:
+            viewbox = self.dic_viewbox.get(str_name_axis)
+            if viewbox is None or viewbox is self.viewbox_main:
+                continue
+            if viewbox.geometry() != geometry:
                 viewbox.setGeometry(geometry)
         return
     
@@ -354,6 +245,8 @@ class PlotAxisManager:
         bol_raise_nonexist: bool = False
     ):
         """移除Y轴
+
+        只移除该轴所在的一列, 其后的右轴依次左移一列, 其前的右轴不动
         """
         # 不能删除主轴
         if str_name_axis == self.str_name_axis_left:
@@ -363,58 +256,93 @@ class PlotAxisManager:
             if bol_raise_nonexist:
                 raise ValueError(f"Axis {str_name_axis} 不存在")
             return
-        # 1.获取axisconfig    
-        axisconfig_del = self.dic_axisconfig[str_name_axis]
-        # 2.移除ViewBox和AxisItem
-        if axisconfig_del.viewbox:
-            self.obj_plot.scene().removeItem(axisconfig_del.viewbox)
-        if axisconfig_del.axis_item:
-            self.obj_plot.layout.removeItem(axisconfig_del.axisitem)
-        # 3.从manager中删除配置
+        # 1.获取句柄及其列序号
+        viewbox_del = self.dic_viewbox.get(str_name_axis)
+        axisitem_del = self.dic_axisitem.get(str_name_axis)
+        idx_yaxis_del = self.lst_name_axis_right.index(str_name_axis)
+        # 2.从layout中移除该列
+        if axisitem_del:
+            self.obj_plot.layout.removeItem(axisitem_del)
+        # 3.其后的右轴左移一列
+        for idx_yaxis in range(idx_yaxis_del + 1, len(self.lst_name_axis_right)):
+            axisitem = self.dic_axisitem.get(self.lst_name_axis_right[idx_yaxis])
+            if axisitem:
+                self.obj_plot.layout.removeItem(axisitem)
+                self._add_yaxis_to_layout(
+                    obj_plot=self.obj_plot,
+                    axisitem=axisitem,
+                    idx_yaxis_right=idx_yaxis - 1
+                )
+        # 4.归还ViewBox和AxisItem到池中
+        if viewbox_del and axisitem_del:
+            self._release_yaxis_pair(viewbox_del, axisitem_del)
+        # 5.从manager中删除配置和句柄
+        del self.lst_name_axis_right[idx_yaxis_del]
+        self.n_yaxis_right = len(self.lst_name_axis_right)
         del self.dic_axisconfig[str_name_axis]
         del self.dic_viewbox[str_name_axis]
-        # 4.重建右轴布局
-        self._reset_layout_yaxis()
+        self.dic_axisitem.pop(str_name_axis, None)
         return
     
-    def _reset_layout_yaxis(self):
-        """
-        重建在layout中的右侧轴布局
+    @staticmethod
+    def _calc_yaxis_range_data(
+        lst_tpl_range_col: List[Tuple[Optional[float], Optional[float]]],
+        flt_ratio_padding: float = 0.02
+    ) -> Tuple[Optional[float], Optional[float]]:
         """
-        # 从layout中清除所有右轴item
-        for str_name_axis, axisconfig in list(self.dic_axisconfig.items()):
-            if axisconfig.side_axis == SideAxis.RIGHT and axisconfig.axisitem:
-                self.obj_plot.layout.removeItem(axisconfig.axisitem)
-        
-        # 向layout中重新添加所有右轴
-        self.n_yaxis_right = 0
-        for str_name_axis, axisconfig in list(self.dic_axisconfig.items()):
-            if axisconfig.side_axis == SideAxis.RIGHT and axisconfig.axisitem:
-                # 添加axis到布局
-                self._add_yaxis_to_layout(
-                    obj_plot=self.obj_plot,
-                    axis_item=axisconfig.axisitem
-                )
-        return
+        由轴上各列的窗口最小/最大值计算该轴的Y范围
+
+        Args:
+            lst_tpl_range_col: 轴上每一列的 (最小值, 最大值)
+            flt_ratio_padding: 上下留白占span的比例
+
+        Returns:
+            (下限, 上限), 无有效数据时返回 (None, None)
+        """
+        # 过滤无效值(空窗口/全NaN列)
+        lst_lb = [
+            lb for lb, ub in lst_tpl_range_col
+            if lb is not None and math.isfinite(lb)
+        ]
+        lst_ub = [
+            ub for lb, ub in lst_tpl_range_col
+            if ub is not None and math.isfinite(ub)
+        ]
+        if not lst_lb or not lst_ub:
+            return None, None
+        flt_lb_range, flt_ub_range = min(lst_lb), max(lst_ub)
+        # 常值曲线: 以数值本身为中心给一个单位的span
+        flt_span_range = flt_ub_range - flt_lb_range
+        if flt_span_range <= 0:
+            flt_span_range = abs(flt_lb_range) or 1.0
+            flt_lb_range -= flt_span_range / 2
+            flt_ub_range += flt_span_range / 2
+        # 留白
+        flt_padding = flt_span_range * flt_ratio_padding
+        return flt_lb_range - flt_padding, flt_ub_range + flt_padding
 
     def _apply_yaxis_range(self,
         str_name_axis: str,
+        tpl_range_data: Optional[Tuple[Optional[float], Optional[float]]] = None,
         bol_raise_nonexist: bool = False
     ):
         """
         应用y轴的范围设定
+
+        自动模式下, 若给出由窗口原始数据算得的范围 tpl_range_data,
+        则直接 setYRange 一次; 否则退回 pyqtgraph 的 enableAutoRange
         """
         # 获取轴配置
         axisconfig : AxisConfig = self._get_axisconfig(
             str_name_axis=str_name_axis,
             bol_raise_nonexist=bol_raise_nonexist
         )
-        if not axisconfig.viewbox:
+        viewbox_axis : Optional[pg.ViewBox] = self.dic_viewbox.get(str_name_axis)
+        if not viewbox_axis:
             if bol_raise_nonexist:
                 raise ValueError(f"Axis {str_name_axis} 无ViewBox")
             return
         # 应用范围设置
-        viewbox_axis : pg.ViewBox = axisconfig.viewbox
         if axisconfig.mode_range == RangeMode.MANUAL:
             ## 手动范围
             viewbox_axis.setYRange(
@@ -422,64 +350,204 @@ class PlotAxisManager:
                 max=axisconfig.ub_range,
                 padding=0
             )
+        elif tpl_range_data is not None and tpl_range_data[0] is not None:
+            ## 自动范围, 使用窗口数据的精确范围
+            viewbox_axis.disableAutoRange(axis=pg.ViewBox.YAxis)
+            viewbox_axis.setYRange(
+                min=tpl_range_data[0],
+                max=tpl_range_data[1],
+                padding=0
+            )
         else:
-            # 自动范围
+            ## 自动范围, 无窗口数据时由pyqtgraph计算
             viewbox_axis.enableAutoRange(axis=pg.ViewBox.YAxis)
         return
-    
-    def _apply_yaxis_alignment(self,
-        str_name_axis: str,
+
+    def apply_yaxis_range_all(self,
+        dic_lst_range_col_axis: Dict[str, List[Tuple[Optional[float], Optional[float]]]],
         bol_raise_nonexist: bool = False
     ):
         """
-        应用y轴对齐设定
-        """
-        # 获取轴配置
-        axisconfig_src : AxisConfig = self._get_axisconfig(
-            str_name_axis=str_name_axis,
-            bol_raise_nonexist=bol_raise_nonexist
-        )
-        # 跳过alignment mode为NONE的情况
-        if axisconfig_src.mode_align == AlignmentMode.NONE:
-            return
-        # 检查对齐目标轴是否存在
-        str_name_axis_align = axisconfig_src.str_name_axis_align
-        if not str_name_axis_align or str_name_axis_align not in self.dic_axisconfig:
-            if bol_raise_nonexist:
-                raise ValueError(f"Axis {str_name_axis} 对齐目标轴不存在")
-            return
+        一次刷新中为所有轴应用Y范围和对齐, 每个轴只调用一次 setYRange
+
+        1. 手动轴取配置范围, 自动轴取窗口数据范围
+        2. 对齐求解器一次性算出所有轴的最终范围
+        3. 阻塞信号批量应用, 避免 sigYRangeChanged 级联触发重排
+
+        Args:
+            dic_lst_range_col_axis: {str_name_axis: [轴上每列的(最小值, 最大值)]}
+                未出现在字典中的轴按无数据处理
+        """
+        dic_range_axis: Dict[str, Tuple[float, float]] = {}
+        lst_name_axis_no_data: List[str] = []
+        for str_name_axis, axisconfig in self.dic_axisconfig.items():
+            # 手动范围
+            if axisconfig.mode_range == RangeMode.MANUAL:
+                dic_range_axis[str_name_axis] = (axisconfig.lb_range, axisconfig.ub_range)
+                continue
+            # 自动范围, 使用窗口数据
+            tpl_range_data = self._calc_yaxis_range_data(
+                dic_lst_range_col_axis.get(str_name_axis, [])
+            )
+            if tpl_range_data[0] is not None:
+                dic_range_axis[str_name_axis] = tpl_range_data
+                continue
+            # 无数据: 以当前视图范围参与对齐
+            lst_name_axis_no_data.append(str_name_axis)
+            viewbox = self.dic_viewbox.get(str_name_axis)
+            if viewbox:
+                dic_range_axis[str_name_axis] = tuple(viewbox.viewRange()[1])
         
-        # 获取源轴和目标轴的ViewBox
-        str_name_axis_src = str_name_axis
-        str_name_axis_tgt = str_name_axis_align
-        method_align = self._get_method_align(
-            axisconfig_src.mode_align,
+        # 求解对齐
+        dic_name_axis_tgt = self._get_dic_name_axis_align_tgt(
+            bol_raise_nonexist=bol_raise_nonexist)
+        dic_range_final = self._solve_yaxis_alignment(
+            dic_range_axis=dic_range_axis,
+            dic_name_axis_tgt=dic_name_axis_tgt,
             bol_raise_nonexist=bol_raise_nonexist
         )
-        # 调用对齐方法调整源轴
-        if method_align:
-            method_align(
-                str_name_axis_src=str_name_axis_src,
-                str_name_axis_tgt=str_name_axis_tgt,
-                flt_align_src=axisconfig_src.flt_align_src,
-                flt_align_tgt=axisconfig_src.flt_align_tgt,
-                flt_ratio_align=axisconfig_src.flt_ratio_scale
-            )
+        # 无数据且不被对齐的轴交给pyqtgraph自动范围
+        for str_name_axis in lst_name_axis_no_data:
+            if str_name_axis not in dic_name_axis_tgt:
+                dic_range_final.pop(str_name_axis, None)
+                self._apply_yaxis_range(str_name_axis)
+        # 批量应用
+        self._apply_yaxis_range_batch(dic_range_final)
         return
- 
-    # 内部getter
-    def _get_method_align(self,
-        mode_align: AlignmentMode,
+
+    def _get_dic_name_axis_align_tgt(self,
         bol_raise_nonexist: bool = False
-    ):
+    ) -> Dict[str, str]:
         """
-        获取对齐方法
+        收集所有有效的对齐约束
+
+        Returns:
+            {源轴名: 目标轴名}, 不含对齐模式为NONE或目标轴不存在的轴
+        """
+        dic_name_axis_tgt = {}
+        for str_name_axis, axisconfig in self.dic_axisconfig.items():
+            if axisconfig.mode_align == AlignmentMode.NONE:
+                continue
+            str_name_axis_align = axisconfig.str_name_axis_align
+            if (not str_name_axis_align
+                or str_name_axis_align == str_name_axis
+                or str_name_axis_align not in self.dic_axisconfig):
+                if bol_raise_nonexist:
+                    raise ValueError(f"Axis {str_name_axis} 对齐目标轴不存在")
+                continue
+            dic_name_axis_tgt[str_name_axis] = str_name_axis_align
+        return dic_name_axis_tgt
+
+    def _solve_yaxis_alignment(self,
+        dic_range_axis: Dict[str, Tuple[float, float]],
+        dic_name_axis_tgt: Dict[str, str],
+        bol_raise_nonexist: bool = False
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        对齐求解器: 按依赖顺序一次性计算所有轴的最终范围
+
+        源轴依赖其目标轴的最终范围, 因此按拓扑层级求解:
+        同一层级的所有源轴之间互不依赖, 用numpy向量化一次算完。
+        对齐公式: 记目标轴对齐值在其范围内的相对位置为 p = (对齐值_tgt - 下限_tgt) / span_tgt,
+        源轴新范围为 [对齐值_src - p * span_src, 对齐值_src + (1 - p) * span_src],
+        其中 VALUESCALE 模式下 span_src = span_tgt * flt_ratio_scale。
+        形成循环依赖的轴保持原范围不对齐。
+
+        Args:
+            dic_range_axis: 各轴对齐前的范围 {str_name_axis: (下限, 上限)}
+            dic_name_axis_tgt: 对齐约束 {源轴名: 目标轴名}
+
+        Returns:
+            各轴对齐后的最终范围
+        """
+        dic_range_final = dict(dic_range_axis)
+        # 只处理源轴和目标轴都有范围的约束
+        set_name_axis_pending = {
+            str_name_axis_src
+            for str_name_axis_src, str_name_axis_tgt in dic_name_axis_tgt.items()
+            if str_name_axis_src in dic_range_axis and str_name_axis_tgt in dic_range_axis
+        }
+        while set_name_axis_pending:
+            # 当前层级: 目标轴已经是最终范围的源轴
+            lst_name_axis_level = sorted(
+                str_name_axis_src
+                for str_name_axis_src in set_name_axis_pending
+                if dic_name_axis_tgt[str_name_axis_src] not in set_name_axis_pending
+            )
+            if not lst_name_axis_level:
+                if bol_raise_nonexist:
+                    raise ValueError(
+                        f"Axis {sorted(set_name_axis_pending)} 对齐存在循环依赖")
+                break
+            # 组装本层级的向量
+            lst_axisconfig = [self.dic_axisconfig[name] for name in lst_name_axis_level]
+            arr_range_tgt = np.array([
+                dic_range_final[dic_name_axis_tgt[name]] for name in lst_name_axis_level
+            ], dtype=float)
+            arr_range_src = np.array([
+                dic_range_final[name] for name in lst_name_axis_level
+            ], dtype=float)
+            arr_bol_zero = np.array([
+                axisconfig.mode_align == AlignmentMode.ZERO for axisconfig in lst_axisconfig
+            ])
+            arr_align_src = np.where(arr_bol_zero, 0.0, [
+                axisconfig.flt_align_src for axisconfig in lst_axisconfig])
+            arr_align_tgt = np.where(arr_bol_zero, 0.0, [
+                axisconfig.flt_align_tgt for axisconfig in lst_axisconfig])
+            arr_ratio_scale = np.array([
+                axisconfig.flt_ratio_scale
+                if axisconfig.mode_align == AlignmentMode.VALUESCALE else np.nan
+                for axisconfig in lst_axisconfig
+            ], dtype=float)
+            # 向量化对齐计算
+            arr_span_tgt = arr_range_tgt[:, 1] - arr_range_tgt[:, 0]
+            arr_bol_valid = arr_span_tgt > 0
+            arr_span_tgt_safe = np.where(arr_bol_valid, arr_span_tgt, 1.0)
+            arr_percentile_align_tgt = (arr_align_tgt - arr_range_tgt[:, 0]) / arr_span_tgt_safe
+            arr_span_src = np.where(
+                np.isnan(arr_ratio_scale),
+                arr_range_src[:, 1] - arr_range_src[:, 0],
+                arr_span_tgt * arr_ratio_scale
+            )
+            arr_lb_new = arr_align_src - arr_percentile_align_tgt * arr_span_src
+            arr_ub_new = arr_align_src + (1 - arr_percentile_align_tgt) * arr_span_src
+            # 写回结果, 目标范围无效的轴保持原范围
+            for idx, str_name_axis in enumerate(lst_name_axis_level):
+                if arr_bol_valid[idx]:
+                    dic_range_final[str_name_axis] = (
+                        float(arr_lb_new[idx]), float(arr_ub_new[idx]))
+                elif bol_raise_nonexist:
+                    raise ValueError(
+                        f"Axis {dic_name_axis_tgt[str_name_axis]} 目标轴范围无效")
+            set_name_axis_pending.difference_update(lst_name_axis_level)
+        return dic_range_final
+
+    def _apply_yaxis_range_batch(self,
+        dic_range_final: Dict[str, Tuple[float, float]]
+    ):
         """
-        method_align = self.dic_method_alignment.get(mode_align)
-        if not method_align and bol_raise_nonexist:
-            raise ValueError(f"对齐模式 {mode_align} 不存在对应的方法")
-        return method_align
+        阻塞信号批量应用Y范围
 
+        所有ViewBox设定完成后, 每个ViewBox只发射一次 sigYRangeChanged,
+        使关联的AxisItem刷新刻度, 不会产生级联的重复计算
+        """
+        lst_viewbox_changed = []
+        for str_name_axis, (flt_lb_range, flt_ub_range) in dic_range_final.items():
+            viewbox = self.dic_viewbox.get(str_name_axis)
+            if viewbox is None:
+                continue
+            bol_blocked_old = viewbox.blockSignals(True)
+            try:
+                viewbox.setYRange(flt_lb_range, flt_ub_range, padding=0)
+            finally:
+                viewbox.blockSignals(bol_blocked_old)
+            lst_viewbox_changed.append(viewbox)
+        # 统一通知
+        for viewbox in lst_viewbox_changed:
+            viewbox.sigYRangeChanged.emit(viewbox, tuple(viewbox.viewRange()[1]))
+        return
+ 
+    # 内部getter
     def _get_axisconfig(self,
         str_name_axis: str,
         bol_raise_nonexist: bool = False
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+数据请求调度器
+
+所有耗时的取数(Polars collect、数据引擎请求)经调度器在线程池中执行, 结果在
+界面线程中回调. Polars 内部已经是多线程的, 因此同时运行的请求数很少(默认2);
+交互请求总有一个保留的执行槽, 后台请求不会挡住窗口刷新.
+"""
+
+import asyncio
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from PySide6.QtCore import QObject, Signal
+
+from app.plotter.enums.plotenum import RequestPriority
+
+# 回调参数为 (结果, 异常), 二者必有一个为None
+FuncCallbackRequest = Callable[[Any, Optional[BaseException]], None]
+
+
+class DataRequest:
+    """
+    调度器中的一条请求, 相同键的请求共用一个对象
+
+    Attributes:
+        key: 去重键, 为None时不去重
+        func: 在工作线程中执行的无参函数
+        priority (RequestPriority): 当前优先级, 有更高优先级的订阅者加入时提升
+        lst_callback (List[FuncCallbackRequest]): 订阅者的回调
+        bol_started (bool): 是否已开始执行
+    """
+    __slots__ = ('key', 'func', 'priority', 'lst_callback', 'bol_started')
+
+    def __init__(self,
+        key: Optional[Hashable],
+        func: Callable[[], Any],
+        priority: RequestPriority
+    ):
+        self.key = key
+        self.func = func
+        self.priority = priority
+        self.lst_callback: List[FuncCallbackRequest] = []
+        self.bol_started = False
+        pass
+
+    @property
+    def bol_cancelled(self) -> bool:
+        """所有订阅者都已取消"""
+        return not self.lst_callback
+
+
+class RequestHandle:
+    """
+    一个订阅者对请求的句柄, 用作取消令牌
+
+    取消只移除本订阅者的回调; 所有订阅者都取消后, 尚未开始的请求不再执行,
+    已在执行的请求结果被丢弃
+    """
+    __slots__ = ('_request', '_callback')
+
+    def __init__(self,
+        request: DataRequest,
+        callback: FuncCallbackRequest
+    ):
+        self._request = request
+        self._callback = callback
+        pass
+
+    def cancel(self):
+        if self._callback in self._request.lst_callback:
+            self._request.lst_callback.remove(self._callback)
+        return
+
+    @property
+    def bol_cancelled(self) -> bool:
+        return self._callback not in self._request.lst_callback
+
+
+class DataRequestScheduler(QObject):
+    """
+    带优先级、取消和去重的取数调度器
+
+    * 按 RequestPriority 从高到低、同优先级先到先得的顺序开始执行
+    * 同时执行的请求不超过 n_max_running; 其中保留一个槽给交互请求
+    * 键相同且尚未完成的请求合并为一次执行, 结果分发给所有订阅者
+    * 回调总在界面线程(也即 qasync 事件循环线程)中执行
+
+    Usage:
+        scheduler = DataRequestScheduler(n_max_running=2)
+        handle = scheduler.submit(
+            ('window', 0, 100.0, 200.0),
+            lambda: fetch(...),
+            RequestPriority.INTERACTIVE,
+            lambda result, error: ...
+        )
+        handle.cancel()
+        result = await scheduler.fetch(key, func, RequestPriority.BACKGROUND)
+
+    Attributes:
+        n_max_running (int): 同时执行的请求数上限
+        dic_request_pending (Dict[Hashable, DataRequest]): 尚未完成的可去重请求
+    """
+    # 工作线程完成, 参数为 (DataRequest, 结果, 异常); 跨线程排队到界面线程
+    _sig_request_done: Signal = Signal(object, object, object)
+
+    def __init__(self,
+        n_max_running: int = 2,
+        parent: Optional[QObject] = None
+    ):
+        super().__init__(parent)
+        self.n_max_running = max(2, n_max_running)
+        self.executor = ThreadPoolExecutor(max_workers=self.n_max_running, thread_name_prefix="DataRequest")
+        self.dic_request_pending: Dict[Hashable, DataRequest] = {}
+        # 优先队列 (优先级, 序号, 请求); 提升优先级时重复入队, 出队时跳过过期项
+        self._heap: List[Tuple[int, int, DataRequest]] = []
+        self._iter_seq = itertools.count()
+        self._n_running = 0
+        self._n_running_background = 0
+        self._bol_shutdown = False
+        self._sig_request_done.connect(self._on_request_done)
+        pass
+
+    def submit(self,
+        key: Optional[Hashable],
+        func: Callable[[], Any],
+        priority: RequestPriority,
+        callback: FuncCallbackRequest
+    ) -> RequestHandle:
+        """
+        提交一条请求
+
+        Args:
+            key: 去重键, 相同键且尚未完成的请求只执行一次; 为None时不去重
+            func: 在工作线程中执行的无参函数, 不得访问界面
+            priority: 优先级
+            callback: 完成后在界面线程调用, 参数为 (结果, 异常)
+
+        Returns:
+            RequestHandle: 可用于取消本次订阅
+        """
+        request = self.dic_request_pending.get(key) if key is not None else None
+        if request is None:
+            request = DataRequest(key, func, priority)
+            if key is not None:
+                self.dic_request_pending[key] = request
+            self._push(request)
+        elif priority < request.priority and not request.bol_started:
+            # 已在队列中, 以更高优先级重新入队
+            request.priority = priority
+            self._push(request)
+        request.lst_callback.append(callback)
+        self._dispatch()
+        return RequestHandle(request, callback)
+
+    async def fetch(self,
+        key: Optional[Hashable],
+        func: Callable[[], Any],
+        priority: RequestPriority
+    ) -> Any:
+        """
+        submit 的协程形式, 需在 qasync 事件循环中调用; 协程被取消时同时取消订阅
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        def callback(result: Any, error: Optional[BaseException]):
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        handle = self.submit(key, func, priority, callback)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            handle.cancel()
+            raise
+
+    def shutdown(self):
+        """放弃所有未开始的请求, 已在执行的请求结果被丢弃"""
+        self._bol_shutdown = True
+        for _, _, request in self._heap:
+            request.lst_callback.clear()
+        self._heap.clear()
+        self.dic_request_pending.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        return
+
+    def _push(self, request: DataRequest):
+        heapq.heappush(self._heap, (int(request.priority), next(self._iter_seq), request))
+        return
+
+    def _dispatch(self):
+        """在空闲的执行槽中开始队首请求"""
+        while self._heap and self._n_running < self.n_max_running and not self._bol_shutdown:
+            n_priority, _, request = self._heap[0]
+            # 1.跳过已开始、已提升优先级或已取消的项
+            if request.bol_started or n_priority != request.priority:
+                heapq.heappop(self._heap)
+                continue
+            if request.bol_cancelled:
+                heapq.heappop(self._heap)
+                self._forget(request)
+                continue
+            # 2.非交互请求不占用最后一个执行槽; 队首已是最高优先级, 其后也不会有交互请求
+            bol_background = request.priority != RequestPriority.INTERACTIVE
+            if bol_background and self._n_running_background >= self.n_max_running - 1:
+                break
+            # 3.开始执行
+            heapq.heappop(self._heap)
+            request.bol_started = True
+            self._n_running += 1
+            self._n_running_background += bol_background
+            self.executor.submit(self._run, request)
+        return
+
+    def _run(self, request: DataRequest):
+        """工作线程: 执行请求并把结果交回界面线程"""
+        result, error = None, None
+        # 排队期间被取消的请求不再执行
+        if not request.bol_cancelled:
+            try:
+                result = request.func()
+            except Exception as e:
+                error = e
+        self._sig_request_done.emit(request, result, error)
+
+    def _on_request_done(self,
+        request: DataRequest,
+        result: Any,
+        error: Optional[BaseException]
+    ):
+        """界面线程: 分发结果并开始下一条请求"""
+        self._n_running -= 1
+        self._n_running_background -= request.priority != RequestPriority.INTERACTIVE
+        self._forget(request)
+        if not self._bol_shutdown:
+            for callback in list(request.lst_callback):
+                callback(result, error)
+            request.lst_callback.clear()
+        self._dispatch()
+        return
+
+    def _forget(self, request: DataRequest):
+        """从去重表中移除请求, 之后相同键的提交会重新执行"""
+        if request.key is not None and self.dic_request_pending.get(request.key) is request:
+            del self.dic_request_pending[request.key]
+        return
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+会话的保存与恢复
+
+将 SubplotManager 中所有子图的轴、曲线配置以及X轴范围和界面语言
+序列化为带版本号的JSON文件, 并可从文件重建
+"""
+
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from app.plotter.graphconfigs.axisconfig import AxisConfig
+from app.plotter.graphconfigs.curveconfig import CurveConfig
+from app.plotter.managers.subplotmanager import SubplotManager
+
+# 会话文件格式版本, 格式不兼容地变化时递增
+N_VERSION_SESSION = 1
+
+
+def dump_session(
+    manager_subplot: SubplotManager,
+    tpl_range_x: Optional[Tuple[float, float]] = None,
+    str_language: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    导出当前会话为字典
+
+    Args:
+        manager_subplot: 子图管理器
+        tpl_range_x: 当前X轴(时间)范围
+        str_language: 当前界面语言代码, 如 'zh_CN'
+    Returns:
+        Dict: 可直接写入JSON的会话字典
+    """
+    lst_subplot = []
+    for idx_subplot in range(manager_subplot.count_subplot()):
+        lst_axisconfig, lst_curveconfig, set_name_col_added = manager_subplot.get_subplot_layout(idx_subplot)
+        lst_dic_curve = []
+        for curveconfig in lst_curveconfig:
+            # 子图索引由所在子图给出, 不重复保存
+            dic_curve = curveconfig.to_dict()
+            del dic_curve['idx_subplot']
+            dic_curve['bol_added'] = curveconfig.str_name_curve in set_name_col_added
+            lst_dic_curve.append(dic_curve)
+        lst_subplot.append({
+            'idx_subplot': idx_subplot,
+            'lst_axis': [axisconfig.to_dict() for axisconfig in lst_axisconfig],
+            'lst_curve': lst_dic_curve,
+        })
+    return {
+        'n_version': N_VERSION_SESSION,
+        'str_language': str_language,
+        'lst_range_x': list(tpl_range_x) if tpl_range_x else None,
+        'lst_subplot': lst_subplot,
+    }
+
+
+def write_session(
+    path_file: Union[str, Path],
+    dic_session: Dict[str, Any]
+):
+    """将会话字典写入JSON文件"""
+    with open(path_file, 'w', encoding='utf-8') as file:
+        json.dump(dic_session, file, ensure_ascii=False, indent=2)
+    return
+
+
+def read_session(
+    path_file: Union[str, Path]
+) -> Dict[str, Any]:
+    """
+    读取JSON会话文件
+
+    Raises:
+        ValueError: 文件不是会话文件, 或版本比当前程序支持的更新
+    """
+    with open(path_file, 'r', encoding='utf-8') as file:
+        dic_session = json.load(file)
+    if not isinstance(dic_session, dict) or 'n_version' not in dic_session:
+        raise ValueError(f"{path_file} 不是有效的会话文件")
+    if dic_session['n_version'] > N_VERSION_SESSION:
+        raise ValueError(
+            f"会话文件版本 {dic_session['n_version']} 高于支持的版本 {N_VERSION_SESSION}")
+    return dic_session
+
+
+def restore_session(
+    manager_subplot: SubplotManager,
+    dic_session: Dict[str, Any],
+    set_name_col_avail: Optional[Set[str]] = None
+) -> Tuple[Optional[Tuple[float, float]], Optional[str], List[str]]:
+    """
+    通过子图管理器的批量接口重建会话
+
+    数据集中不存在的列不会导致加载失败, 对应曲线被跳过并在返回值中报告;
+    所有子图重建完成后只触发一次刷新
+
+    Args:
+        manager_subplot: 子图管理器
+        dic_session: read_session 返回的会话字典
+        set_name_col_avail: 当前数据集中可用的列名, 为None时使用 manager_columnmetadata 判断
+    Returns:
+        Tuple: (X轴范围, 界面语言, 缺失的列名列表)
+    """
+    # 1.确定列是否可用的判断函数
+    if set_name_col_avail is not None:
+        func_is_avail = set_name_col_avail.__contains__
+    elif manager_subplot.manager_columnmetadata:
+        func_is_avail = manager_subplot.manager_columnmetadata.is_valid_actual_name
+    else:
+        func_is_avail = lambda str_name_col: True
+
+    # 2.构建每个子图的布局, 跳过缺失的列
+    lst_name_col_missing: List[str] = []
+    dic_layout_subplot = {}
+    for dic_subplot in dic_session.get('lst_subplot', []):
+        idx_subplot = dic_subplot['idx_subplot']
+        lst_curveconfig = []
+        set_name_col_added = set()
+        for dic_curve in dic_subplot.get('lst_curve', []):
+            str_name_curve = dic_curve['str_name_curve']
+            if not func_is_avail(str_name_curve):
+                lst_name_col_missing.append(str_name_curve)
+                continue
+            # 旧版本的记录由 from_dict 迁移
+            lst_curveconfig.append(CurveConfig.from_dict(dic_curve, idx_subplot=idx_subplot))
+            if dic_curve.get('bol_added', True):
+                set_name_col_added.add(str_name_curve)
+        lst_axisconfig = []
+        for dic_axis in dic_subplot.get('lst_axis', []):
+            axisconfig = AxisConfig.from_dict(dic_axis)
+            lst_axisconfig.append(replace(axisconfig, set_name_col={
+                str_name_col for str_name_col in axisconfig.set_name_col
+                if func_is_avail(str_name_col)
+            }))
+        dic_layout_subplot[idx_subplot] = (lst_axisconfig, lst_curveconfig, set_name_col_added)
+
+    # 3.批量重建
+    manager_subplot.load_subplot_layout(dic_layout_subplot)
+
+    lst_range_x = dic_session.get('lst_range_x')
+    tpl_range_x = tuple(lst_range_x) if lst_range_x else None
+    return tpl_range_x, dic_session.get('str_language'), list(dict.fromkeys(lst_name_col_missing))
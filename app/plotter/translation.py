@@ -2,20 +2,22 @@
 """
 静态翻译基类
 
-使用 Qt 的标准翻译机制，在应用启动时加载翻译文件
-不支持运行时动态切换语言
+使用 Qt 的标准翻译机制, 翻译文件由 TranslatorCache 加载并缓存.
+运行时切换语言时更换已安装的翻译器, 控件在 LanguageChange 事件中重新翻译,
+列名的双向映射按语言分别建立
 """
 
-from typing import Optional, List
-from PySide6.QtCore import QObject
+import os
+from typing import Callable, Dict, Iterable, List, Optional
+from PySide6.QtCore import QObject, QCoreApplication, QLocale, QTranslator
 
 
 class StaticTranslationMixin:
     """
     静态翻译 Mixin 类
     
-    使用 Qt 的 .tr() 方法进行翻译，翻译文件在应用启动时加载
-    不提供运行时语言切换功能
+    使用 Qt 的 .tr() 方法进行翻译，翻译文件由 TranslatorCache 加载
+    切换语言后 tr() 返回新语言的文本, 控件需在 LanguageChange 事件中重新设置文字
     
     使用方法：
     
@@ -71,20 +73,125 @@ class StaticTranslationMixin:
             return text
 
 
+class ColumnNameMap:
+    """
+    单一语言下实际列名与显示列名的双向映射
+
+    按数据集的列名和该语言的翻译一次建立, 两个方向都是字典查找.
+    反向映射同时登记显示列名和实际列名本身, 因此用实际列名查找也能命中.
+    同一个名称对应多个实际列(两列翻译相同, 或某列的翻译恰为另一列的实际列名)
+    时视为冲突, 记录在 dic_collision 中: 实际列名唯一, 与之同名的冲突仍指向该列;
+    两列翻译相同的名称不登记反向映射, 反向查找原样返回
+
+    Attributes:
+        str_language: 语言代码, 如 'en_US'
+        dic_actual_to_display: 实际列名 -> 显示列名
+        dic_display_to_actual: 显示列名或实际列名 -> 实际列名, 不含无法确定的名称
+        dic_collision: 冲突的名称 -> 对应的实际列名列表
+    """
+    __slots__ = ('str_language', 'dic_actual_to_display', 'dic_display_to_actual', 'dic_collision')
+
+    def __init__(self,
+        str_language: str,
+        lst_name_col_actual: Iterable[str],
+        func_translate: Callable[[str], str]
+    ):
+        """
+        Args:
+            str_language: 语言代码
+            lst_name_col_actual: 数据集的实际列名
+            func_translate: 该语言下 实际列名 -> 显示列名, 无翻译时返回原列名
+        """
+        self.str_language = str_language
+        self.dic_actual_to_display: Dict[str, str] = {}
+        self.dic_display_to_actual: Dict[str, str] = {}
+        self.dic_collision: Dict[str, List[str]] = {}
+        # 1.正向映射
+        for str_name_actual in dict.fromkeys(lst_name_col_actual):
+            self.dic_actual_to_display[str_name_actual] = func_translate(str_name_actual) or str_name_actual
+        # 2.反向映射, 先登记实际列名, 实际列名唯一且优先
+        for str_name_actual in self.dic_actual_to_display:
+            self.dic_display_to_actual[str_name_actual] = str_name_actual
+        # 3.再登记显示列名, 同名指向不同列即冲突
+        for str_name_actual, str_name_display in self.dic_actual_to_display.items():
+            self._register_reverse(str_name_display, str_name_actual)
+        pass
+
+    def _register_reverse(self,
+        str_name: str,
+        str_name_actual: str
+    ):
+        """
+        登记一条反向映射, 与已有的不同列冲突时记入 dic_collision
+
+        名称本身是实际列名时保留指向该列的映射, 否则删除该名称的反向映射
+        """
+        if str_name in self.dic_collision:
+            if str_name_actual not in self.dic_collision[str_name]:
+                self.dic_collision[str_name].append(str_name_actual)
+            return
+        str_name_actual_old = self.dic_display_to_actual.get(str_name)
+        if str_name_actual_old is None:
+            self.dic_display_to_actual[str_name] = str_name_actual
+        elif str_name_actual_old != str_name_actual:
+            if str_name not in self.dic_actual_to_display:
+                del self.dic_display_to_actual[str_name]
+            self.dic_collision[str_name] = [str_name_actual_old, str_name_actual]
+        return
+
+    def get_display_name(self, str_name_actual: str) -> Optional[str]:
+        """实际列名 -> 显示列名, 不是数据集的列时返回 None"""
+        return self.dic_actual_to_display.get(str_name_actual)
+
+    def get_actual_name(self, str_name_display: str) -> str:
+        """显示列名(或实际列名) -> 实际列名, 找不到或无法确定时原样返回"""
+        return self.dic_display_to_actual.get(str_name_display, str_name_display)
+
+
 class ColumnNameTranslator:
     """
     列名翻译器（静态版本）
     
     使用 Qt 的翻译机制翻译数据列名
     列名翻译也写在 .ts/.qm 文件中
+    
+    调用 set_columns 登记数据集的列名后, 每种语言第一次使用时建立一个
+    ColumnNameMap, 之后两个方向的查找都是字典查找. 当前语言使用已安装的
+    翻译器, 其他语言从 str_pattern_qm 指定的翻译文件加载
     """
     
-    def __init__(self, context: str = "ColumnNames"):
+    def __init__(self,
+        context: str = "ColumnNames",
+        str_pattern_qm: str = "app/plotter/i18n/colname_{}.qm"
+    ):
         """
         Args:
             context: 翻译上下文，用于在 .ts 文件中组织列名翻译
+            str_pattern_qm: 各语言列名翻译文件的路径模板, {} 处为语言代码
         """
         self.context = context
+        self.str_pattern_qm = str_pattern_qm
+        # 数据集的实际列名
+        self.lst_name_col_actual: List[str] = []
+        # 语言代码 -> 双向映射, 按需建立
+        self.dic_namemap_language: Dict[str, ColumnNameMap] = {}
+    
+    def set_columns(self, lst_name_col_actual: Iterable[str]):
+        """
+        登记数据集的实际列名, 丢弃已建立的映射
+        
+        Args:
+            lst_name_col_actual: 实际列名
+        """
+        self.lst_name_col_actual = list(lst_name_col_actual)
+        self.dic_namemap_language.clear()
+    
+    @staticmethod
+    def get_language_current() -> str:
+        """当前界面语言代码, 取自启动时保存的应用属性"""
+        app = QCoreApplication.instance()
+        str_language = app.property("language_code") if app is not None else None
+        return str_language or QLocale().name()
     
     def translate(self, column_name: str) -> str:
         """
@@ -97,35 +204,78 @@ class ColumnNameTranslator:
             翻译后的列名（如果找不到翻译则返回原列名）
         """
         # 使用 QCoreApplication.translate 进行翻译
-        from PySide6.QtCore import QCoreApplication
         translated = QCoreApplication.translate(self.context, column_name)
         return translated if translated != column_name else column_name
     
-    def get_display_name(self, actual_name: str) -> str:
+    def _get_func_translate(self, str_language: str) -> Callable[[str], str]:
+        """指定语言的翻译函数, 找不到该语言的翻译文件时不翻译"""
+        if str_language == self.get_language_current():
+            return self.translate
+        translator = QTranslator()
+        str_path_qm = self.str_pattern_qm.format(str_language)
+        if not (os.path.exists(str_path_qm) and translator.load(str_path_qm)):
+            print(f"未找到列名翻译文件: {str_path_qm}")
+            return lambda column_name: column_name
+        return lambda column_name: translator.translate(self.context, column_name) or column_name
+    
+    def get_name_map(self, str_language: Optional[str] = None) -> ColumnNameMap:
+        """
+        获取某种语言的双向映射, 第一次使用时建立并报告冲突
+        
+        Args:
+            str_language: 语言代码, 为None时使用当前语言
+        """
+        str_language = str_language or self.get_language_current()
+        namemap = self.dic_namemap_language.get(str_language)
+        if namemap is None:
+            namemap = ColumnNameMap(
+                str_language,
+                self.lst_name_col_actual,
+                self._get_func_translate(str_language)
+            )
+            for str_name, lst_name_actual in namemap.dic_collision.items():
+                print(f"警告: 列名 '{str_name}' 在语言 {str_language} 下对应多列 {lst_name_actual}")
+            self.dic_namemap_language[str_language] = namemap
+        return namemap
+    
+    def get_collisions(self, str_language: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        获取某种语言下有冲突的名称
+        
+        Returns:
+            名称 -> 对应的实际列名列表
+        """
+        return dict(self.get_name_map(str_language).dic_collision)
+    
+    def get_display_name(self, actual_name: str, str_language: Optional[str] = None) -> str:
         """
         获取列名的显示名称（翻译后的名称）
         
         Args:
             actual_name: 实际列名
+            str_language: 语言代码, 为None时使用当前语言
             
         Returns:
             显示名称
         """
-        return self.translate(actual_name)
+        str_name_display = self.get_name_map(str_language).get_display_name(actual_name)
+        if str_name_display is not None:
+            return str_name_display
+        # 不是已登记的列名, 直接翻译
+        return self.translate(actual_name) if str_language is None else actual_name
     
-    def get_actual_name(self, display_name: str) -> Optional[str]:
+    def get_actual_name(self, display_name: str, str_language: Optional[str] = None) -> str:
         """
         从显示名称获取实际列名
         
-        注意：这是反向查找，在静态翻译模式下较难实现
-        建议始终使用实际列名作为内部标识
+        实际列名本身也能查到; 用于拖放、搜索结果、其他语言保存的会话等
+        只拿到显示名称的场合
         
         Args:
             display_name: 显示名称
+            str_language: 显示名称所用的语言代码, 为None时使用当前语言
             
         Returns:
-            实际列名（如果找不到返回 display_name 本身）
+            实际列名（找不到或名称无法确定时返回 display_name 本身）
         """
-        # 简化实现：直接返回 display_name
-        # 如果需要反向查找，需要维护一个映射表
-        return display_name
+        return self.get_name_map(str_language).get_actual_name(display_name)
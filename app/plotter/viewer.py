@@ -1,57 +1,117 @@
 #!/usr/bin/env python3
 
+import numpy as np
 import polars as pl
 
-from typing import List, Dict, Optional, Callable
+from functools import partial
+from typing import List, Dict, Set, Tuple, Optional, Callable
 from PySide6.QtWidgets import (
     QWidget, QFormLayout, QHBoxLayout, QVBoxLayout,
     QLineEdit, QPushButton, QDoubleSpinBox, QComboBox,
     QGroupBox, QRadioButton, QCheckBox, QColorDialog
 )
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtWidgets import QMainWindow, QSplitter
+from PySide6.QtCore import Qt, Signal, Slot, QEvent, QCoreApplication
+from PySide6.QtGui import QKeySequence
+from PySide6.QtWidgets import QMainWindow, QSplitter, QFileDialog, QMessageBox
 import pyqtgraph as pg
 
 from code_source.polars_toolkits.datetime_toolkits.utilpolarsdatetime import get_timestamp_min_max
+from code_source.polars_toolkits.window_toolkits.utilpolarswindow import get_window_min_max, get_value_asof, get_window_data
+from code_source.polars_toolkits.engine_toolkits.dataengine import DataEngineClient, DataEngineError
+from code_source.polars_toolkits.window_toolkits.prefixsumindex import WindowStatsIndex
+from code_source.polars_toolkits.schema_toolkits.columncatalog import ColumnCatalog
+from code_source.polars_toolkits.schema_toolkits.datasetdescriptor import DatasetDescriptor
 from app.plotter.plotaxismanager import PlotAxisManager
+from app.plotter.crosshairmanager import PlotCrosshairManager
 from app.plotter.graphconfigs.axisconfig import AxisConfig
 from app.plotter.graphconfigs.curveconfig import CurveConfig
+from app.plotter.enums.plotenum import ChangeKind, RequestPriority
+from app.plotter.requestscheduler import DataRequestScheduler, RequestHandle
 from app.plotter.widgets.sidepanel import SidePanel
+from app.plotter.widgets.crosshairreadoutpanel import CrosshairReadoutPanel
 from app.plotter.translation import ColumnNameTranslator
+from app.plotter.managers import ColumnMetadataManager, SubplotManager
+from app.plotter.session import dump_session, write_session, read_session, restore_session
+from app.builtin.translator_cache import TranslatorCache
     
 
 class MultiCurvePlotterWidget(QMainWindow):
     """
     主窗口, 多Y轴时序数据可视化
+    
+    大窗口渐进绘制: 窗口内的估计行数超过绘制点数时, 先用分块极值包络立即画出
+    概略曲线, 再经请求调度器以交互优先级取降采样数据替换; 每次重绘子图都会递增
+    其代数并取消上一次的细化请求, 回来的结果代数不符(区域已移动)时丢弃.
+    时间轴导航图以后台优先级取数, 不会挡住窗口刷新
     """
     
+    # 每条曲线最多绘制的点数
+    n_max_point_plot: int = 10000
+    # 概略包络的桶数, 每桶两个点
+    n_bucket_coarse: int = 2000
+    # 统计表中积分和超阈时长按小时显示
+    flt_second_per_hour: float = 3600.0
+    
     def __init__(self,
         lf: pl.LazyFrame,
         str_name_col_timestamp: str = None,
-        column_translator: Optional[ColumnNameTranslator] = None
+        column_translator: Optional[ColumnNameTranslator] = None,
+        column_catalog: Optional[ColumnCatalog] = None,
+        data_engine: Optional[DataEngineClient] = None,
+        dataset_descriptor: Optional[DatasetDescriptor] = None,
+        translator_cache: Optional[TranslatorCache] = None
     ):
         """
         Args:
             lf: Polars LazyFrame数据源
             str_name_col_timestamp: 时间列名称
             column_translator: 列名翻译器，如果为None则使用默认翻译器
+            column_catalog: 列目录，如果为None则扫描一次lf建立(不写入目录文件)
+            data_engine: 进程外数据引擎，给定时取数和统计都在子进程中执行，
+                窗口关闭时一并结束；为None时在本进程中查询lf
+            dataset_descriptor: 数据集描述(列名、类型、时间戳列)，如果为None则解析一次lf的schema
+            translator_cache: 应用的翻译器缓存，加载会话时用于切换到会话的界面语言；
+                为None时不切换
         """
         # 父类初始化
-        super(QMainWindow, self).__init__()
+        super().__init__()
         # 初始化数据
         self.lf = lf
         
         # 初始化列名翻译器
         self.column_translator = column_translator or ColumnNameTranslator()
         
-        # 时间列名称
-        self._init_name_col_timestamp(lf, str_name_col_timestamp)
+        # 数据集描述和时间列名称, schema只在这里解析一次
+        self._init_dataset_descriptor(lf, str_name_col_timestamp, column_catalog, dataset_descriptor)
+        # 列目录, 之后的列名和列信息都从目录读取, 不再访问数据
+        self.column_catalog = column_catalog or ColumnCatalog.build(lf, descriptor=self.dataset_descriptor)
+        # 列名双向映射按数据集的列名建立
+        self.column_translator.set_columns(self.column_catalog.get_names_data())
         
         # 计算时间范围（需要collect一小部分）
         self._init_time_range_data()
         
+        # 窗口统计的前缀和索引（按列首次使用时建立）
+        self.stats_index = WindowStatsIndex(
+            self.lf, self.str_name_col_timestamp, self.dataset_descriptor.str_time_unit)
+        # 进程外数据引擎
+        self.data_engine = data_engine
+        # 应用的翻译器缓存
+        self.translator_cache = translator_cache
+        # 取数请求调度器; 每个子图的当前代数和未完成的取数/细化请求, 统计表的当前代数和未完成的请求
+        self.scheduler_request = DataRequestScheduler(n_max_running=2, parent=self)
+        self.dic_n_generation_subplot: Dict[int, int] = {}
+        self.dic_handle_data_subplot: Dict[int, RequestHandle] = {}
+        self.n_generation_stats = 0
+        self.handle_stats: Optional[RequestHandle] = None
+        
+        # 已绘制的曲线item, 按 CurveConfig.tpl_id_item 登记; 配置本身不持有item
+        self.dic_curveitem: Dict[Tuple[int, str], pg.PlotCurveItem] = {}
+        
         # 轴管理器
         self._init_axismanager_subplot()
+        # 子图布局状态管理器
+        self._init_manager_subplot()
         # 初始化主界面
         self._init_layout_main()
         self.setup_plots()
@@ -61,19 +121,57 @@ class MultiCurvePlotterWidget(QMainWindow):
         self.update_all_plots()
         pass
 
-    def _init_name_col_timestamp(self,
+    def _init_dataset_descriptor(self,
         lf : pl.LazyFrame,
-        str_name_col_timestamp: Optional[str]
-    ) -> str:
+        str_name_col_timestamp: Optional[str],
+        column_catalog: Optional[ColumnCatalog] = None,
+        dataset_descriptor: Optional[DatasetDescriptor] = None
+    ):
         """
-        初始化lf的时间列名称
+        初始化数据集描述和lf的时间列名称
         """
-        # 确定时间列
-        if str_name_col_timestamp is None:
-            # 假设第一列是时间
-            self.str_name_col_timestamp = lf.collect_schema.columns[0]
-        else:
-            self.str_name_col_timestamp = str_name_col_timestamp
+        # 确定时间列, 未指定时沿用列目录的时间列, 都没有时假设第一列是时间
+        if str_name_col_timestamp is None and column_catalog is not None:
+            str_name_col_timestamp = column_catalog.str_name_col_timestamp
+        if dataset_descriptor is None:
+            dataset_descriptor = DatasetDescriptor.from_lazyframe(lf, str_name_col_timestamp)
+        self.dataset_descriptor = dataset_descriptor
+        self.str_name_col_timestamp = dataset_descriptor.str_name_col_timestamp
+        return
+    
+    def set_lazyframe(self, lf: pl.LazyFrame):
+        """
+        替换数据源(如数据文件追加了新行), 使所有基于旧数据的缓存失效并重绘
+        
+        重新解析一次schema, 重建列目录、统计索引和时间范围, 数据引擎以新数据重启
+        
+        Raises:
+            ValueError: 新数据的列集合或时间列与当前不同, 需要重新打开窗口
+        """
+        # 1.先解析新数据的描述, 列不兼容时不修改任何状态
+        dataset_descriptor = self.dataset_descriptor.rebuild(lf)
+        if dataset_descriptor.tpl_name_col != self.dataset_descriptor.tpl_name_col:
+            raise ValueError(self.tr("新数据的列与当前不同，请重新打开窗口", "f_dataset_columns_changed"))
+        # 2.替换数据源和描述, 使缓存失效
+        self.lf = lf
+        self.dataset_descriptor = dataset_descriptor
+        self.column_catalog = ColumnCatalog.build(lf, descriptor=dataset_descriptor)
+        self.manager_columnmetadata.column_catalog = self.column_catalog
+        self.manager_columnmetadata.invalidate_search_index()
+        self.side_panel.column_catalog = self.column_catalog
+        self.side_panel.set_search_index(self.manager_columnmetadata.get_search_index())
+        self.stats_index = WindowStatsIndex(
+            self.lf, self.str_name_col_timestamp, dataset_descriptor.str_time_unit)
+        self._init_time_range_data()
+        if self.data_engine is not None:
+            self.data_engine.lf = lf
+            self.data_engine.str_time_unit = dataset_descriptor.str_time_unit
+            self.data_engine.restart()
+        # 3.重绘导航图和子图
+        self.time_plot.clear()
+        self.time_plot.addItem(self.region)
+        self._plot_time_navigator()
+        self.update_all_plots()
         return
 
     def _init_time_range_data(self):
@@ -97,6 +195,22 @@ class MultiCurvePlotterWidget(QMainWindow):
         self.axis_managers = {}
         pass
 
+    def _init_manager_subplot(self):
+        """初始化列元数据管理器和子图管理器
+        """
+        lst_name_col_data = self.column_catalog.get_names_data()
+        self.manager_columnmetadata = ColumnMetadataManager(
+            lst_name_col_actual=lst_name_col_data,
+            func_get_display_name=self.get_display_name,
+            func_get_actual_name=self.get_actual_name,
+            column_catalog=self.column_catalog
+        )
+        self.manager_subplot = SubplotManager(
+            n_subplot=3,
+            manager_columnmetadata=self.manager_columnmetadata
+        )
+        pass
+
     def get_display_name(self, actual_name: str) -> str:
         """
         获取列名的显示名称（翻译后的名称）
@@ -125,8 +239,7 @@ class MultiCurvePlotterWidget(QMainWindow):
         """
         初始化 窗口的主界面
         """
-        # 窗口标题和尺寸（使用 tr() 进行翻译）
-        self.setWindowTitle(self.tr("时序数据可视化 - 多Y轴支持", "f_title_window_main"))
+        # 窗口尺寸, 标题和菜单文字由 _set_texts_window 按当前语言设置
         self.setGeometry(100, 100, 1600, 1000)
         
         # 主布局
@@ -138,14 +251,16 @@ class MultiCurvePlotterWidget(QMainWindow):
         splitter_window = QSplitter(Qt.Orientation.Horizontal)
         
         # 获取所有数据列名（排除时间列）
-        lst_name_col_data = [col for col in self.lf.collect_schema.names if col != self.str_name_col_timestamp]
+        lst_name_col_data = self.manager_columnmetadata.get_all_actual_names()
         
-        # 侧边栏（传递列名翻译回调函数）
+        # 侧边栏（子图管理器的视图, 传递列名翻译回调函数）
         self.side_panel = SidePanel(
+            manager_subplot=self.manager_subplot,
             lst_name_col=lst_name_col_data,
-            n_subplot=3,
             func_get_display_name=self.get_display_name,
-            func_get_actual_name=self.get_actual_name
+            func_get_actual_name=self.get_actual_name,
+            search_index=self.manager_columnmetadata.get_search_index(),
+            column_catalog=self.column_catalog
         )
         self.side_panel.setMaximumWidth(500)
         self.side_panel.setMinimumWidth(300)
@@ -160,10 +275,132 @@ class MultiCurvePlotterWidget(QMainWindow):
         self.graphics_layout = pg.GraphicsLayoutWidget()
         plot_layout.addWidget(self.graphics_layout)
         
+        # 十字光标读数表
+        self.readout_panel = CrosshairReadoutPanel(
+            func_get_display_name=self.get_display_name
+        )
+        self.readout_panel.setMaximumHeight(200)
+        plot_layout.addWidget(self.readout_panel)
+        
         splitter_window.addWidget(plot_widget)
         splitter_window.setStretchFactor(1, 1)
         
         boxlayout_central.addWidget(splitter_window)
+        
+        # 会话菜单
+        self._init_menu_session()
+        # 编辑菜单
+        self._init_menu_edit()
+        # 数据引擎菜单
+        self.menu_data = None
+        if self.data_engine is not None:
+            self._init_menu_data_engine()
+        self._set_texts_window()
+    
+    def _set_texts_window(self):
+        """按当前语言设置窗口标题和菜单文字"""
+        self.setWindowTitle(self.tr("时序数据可视化 - 多Y轴支持", "f_title_window_main"))
+        self.menu_session.setTitle(self.tr("会话", "f_menu_session"))
+        self.action_save.setText(self.tr("保存会话...", "f_session_save"))
+        self.action_load.setText(self.tr("加载会话...", "f_session_load"))
+        self.menu_edit.setTitle(self.tr("编辑", "f_menu_edit"))
+        self.action_undo.setText(self.tr("撤销", "f_undo"))
+        self.action_redo.setText(self.tr("重做", "f_redo"))
+        if self.menu_data is not None:
+            self.menu_data.setTitle(self.tr("数据", "f_menu_data"))
+            self.action_restart.setText(self.tr("重启数据引擎", "f_data_engine_restart"))
+    
+    def _init_menu_session(self):
+        """
+        初始化 会话的保存/加载菜单
+        """
+        self.menu_session = self.menuBar().addMenu("")
+        self.action_save = self.menu_session.addAction("")
+        self.action_save.triggered.connect(self.on_save_session)
+        self.action_load = self.menu_session.addAction("")
+        self.action_load.triggered.connect(self.on_load_session)
+    
+    def _init_menu_edit(self):
+        """
+        初始化 撤销/重做菜单, 随命令日志的状态启用/禁用
+        """
+        self.menu_edit = self.menuBar().addMenu("")
+        self.action_undo = self.menu_edit.addAction("")
+        self.action_undo.setShortcut(QKeySequence.StandardKey.Undo)
+        self.action_undo.triggered.connect(self.manager_subplot.undo)
+        self.action_redo = self.menu_edit.addAction("")
+        self.action_redo.setShortcuts([QKeySequence.StandardKey.Redo, QKeySequence("Ctrl+Y")])
+        self.action_redo.triggered.connect(self.manager_subplot.redo)
+        self.manager_subplot.journal.sig_journal_changed.connect(self.on_journal_changed)
+        self.on_journal_changed(False, False)
+    
+    def _init_menu_data_engine(self):
+        """
+        初始化 数据引擎菜单, 可在不关闭窗口的情况下重启引擎子进程
+        """
+        self.menu_data = self.menuBar().addMenu("")
+        self.action_restart = self.menu_data.addAction("")
+        self.action_restart.triggered.connect(self.on_restart_data_engine)
+    
+    @Slot()
+    def on_restart_data_engine(self):
+        """重启数据引擎子进程并重新绘制"""
+        self.data_engine.restart()
+        self.statusBar().showMessage(self.tr("数据引擎已重启", "f_data_engine_restarted"), 3000)
+        self.update_all_plots()
+    
+    def _on_data_engine_error(self, error: DataEngineError):
+        """数据引擎请求失败时在状态栏提示最后一行非空的错误信息, 下一次请求会自动重启引擎"""
+        lst_line = [str_line for str_line in str(error).splitlines() if str_line.strip()]
+        self.statusBar().showMessage(
+            self.tr("数据查询失败: {}", "f_data_engine_error").format(lst_line[-1] if lst_line else ""), 8000)
+    
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.LanguageChange:
+            self.retranslate()
+        super().changeEvent(event)
+    
+    def retranslate(self):
+        """
+        切换语言后重新翻译窗口文字, 并按新的显示列名更新界面
+        
+        重建搜索索引推送到侧边栏各子图的候选列, 重设曲线名(图例)、轴标签和统计表中的曲线名;
+        侧边栏、曲线列表和读数表自行处理 LanguageChange
+        """
+        self._set_texts_window()
+        self.manager_columnmetadata.invalidate_search_index()
+        self.side_panel.set_search_index(self.manager_columnmetadata.get_search_index())
+        for plot_idx, plot in enumerate(self.plots):
+            self._relabel_curves(plot_idx, plot)
+            self._update_axes(plot_idx, self.get_plot_axes(plot_idx))
+        self.update_stats()
+    
+    def _relabel_curves(self, plot_idx: int, plot: pg.PlotItem):
+        """按当前语言的显示列名重设子图曲线的名称, 曲线在图例中时同步图例文字"""
+        for (idx_subplot, str_name_curve), curve_item in self.dic_curveitem.items():
+            if idx_subplot != plot_idx:
+                continue
+            str_curve_name_display = self.get_display_name(str_name_curve)
+            curve_item.opts['name'] = str_curve_name_display
+            label = plot.legend.getLabel(curve_item) if plot.legend is not None else None
+            if label is not None:
+                label.setText(str_curve_name_display)
+    
+    def closeEvent(self, event):
+        """关闭窗口时放弃未完成的细化并结束数据引擎子进程"""
+        self.scheduler_request.shutdown()
+        if self.data_engine is not None:
+            self.data_engine.close()
+        super().closeEvent(event)
+    
+    @Slot(bool, bool)
+    def on_journal_changed(self, bol_can_undo: bool, bol_can_redo: bool):
+        """撤销/重做栈变化时更新菜单项"""
+        journal = self.manager_subplot.journal
+        self.action_undo.setEnabled(bol_can_undo)
+        self.action_undo.setToolTip(journal.get_label_undo())
+        self.action_redo.setEnabled(bol_can_redo)
+        self.action_redo.setToolTip(journal.get_label_redo())
     
     def setup_plots(self):
         """设置图表"""
@@ -206,44 +443,189 @@ class MultiCurvePlotterWidget(QMainWindow):
         # 链接主图X轴
         for i in range(1, 3):
             self.plots[i].setXLink(self.plots[0])
+        
+        # 跨子图联动的十字光标
+        self.crosshair_manager = PlotCrosshairManager(
+            lst_plot=self.plots,
+            func_get_curves=self._get_curves_all,
+            func_get_curveitem=self.get_curveitem,
+            func_lookup_exact=self._lookup_value_exact,
+            parent=self
+        )
+    
+    def get_curveitem(self, curve_config: CurveConfig) -> Optional[pg.PlotCurveItem]:
+        """获取曲线配置对应的已绘制item, 尚未绘制时返回None"""
+        return self.dic_curveitem.get(curve_config.tpl_id_item)
+    
+    def get_plot_axes(self, idx_subplot: int) -> Dict[str, AxisConfig]:
+        """获取子图中已添加的轴配置 {轴名: AxisConfig}"""
+        return {
+            axisconfig.str_name_axis: axisconfig
+            for axisconfig in self.manager_subplot.get_axis_manager(idx_subplot).get_lst_axisconfig_all_added()
+        }
+    
+    def get_plot_curves(self, idx_subplot: int) -> List[CurveConfig]:
+        """获取子图中已添加且可见的曲线配置"""
+        return [
+            curve_config
+            for curve_config in self.manager_subplot.get_curve_manager(idx_subplot).get_lst_curveconfig_all_added()
+            if curve_config.bol_show
+        ]
+    
+    def _get_curves_all(self) -> List[CurveConfig]:
+        """获取所有子图的曲线配置"""
+        return [
+            curve_config
+            for idx_subplot in range(len(self.plots))
+            for curve_config in self.get_plot_curves(idx_subplot)
+        ]
+    
+    def _query_window_data(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        n_max_point: Optional[int] = None,
+        bol_background: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """
+        获取时间窗口内多列的数据, 有数据引擎时在子进程中查询; 不访问界面, 可在后台线程调用
+        
+        Args:
+            bol_background: 后台请求, 在数据引擎的后台子进程中执行, 不挡住交互查询
+        
+        Returns:
+            {列名: 数组}, 包含时间戳列
+        
+        Raises:
+            DataEngineError: 数据引擎请求失败
+        """
+        if self.data_engine is not None:
+            return self.data_engine.fetch_window(lst_name_col, flt_start, flt_end, n_max_point, bol_background)
+        df_window = get_window_data(
+            self.lf, self.str_name_col_timestamp, lst_name_col, flt_start, flt_end, n_max_point)
+        return {str_name_col: df_window[str_name_col].to_numpy() for str_name_col in df_window.columns}
+    
+    def _query_window_envelope(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float
+    ) -> Dict[str, np.ndarray]:
+        """
+        获取时间窗口内多列的概略包络(分块极值), 见 WindowStatsIndex.get_envelope; 不访问界面, 可在后台线程调用
+        
+        Returns:
+            {列名: 数组}, 包含时间戳列
+        
+        Raises:
+            DataEngineError: 数据引擎请求失败
+        """
+        if self.data_engine is not None:
+            return self.data_engine.get_window_envelope(lst_name_col, flt_start, flt_end, self.n_bucket_coarse)
+        return self.stats_index.get_envelope(lst_name_col, flt_start, flt_end, self.n_bucket_coarse)
+    
+    def _prepare_stats_index(self, lst_name_col: List[str]):
+        """在后台为各列建立窗口统计索引, 建立之前的包络按窗口查询"""
+        self.scheduler_request.submit(
+            ('prepare', id(self.stats_index), tuple(lst_name_col)),
+            partial(self.stats_index.prepare, lst_name_col),
+            RequestPriority.BACKGROUND,
+            self._on_stats_index_prepared
+        )
+    
+    def _on_stats_index_prepared(self,
+        result: None,
+        error: Optional[BaseException]
+    ):
+        """后台建立索引完成, 失败时抛出错误"""
+        if error is not None:
+            raise error
+    
+    def _check_request_error(self, error: Optional[BaseException]) -> bool:
+        """
+        检查后台请求的错误, 数据引擎请求失败时在状态栏提示
+        
+        Returns:
+            请求是否失败
+        
+        Raises:
+            数据引擎以外的错误原样抛出
+        """
+        if error is None:
+            return False
+        if isinstance(error, DataEngineError):
+            self._on_data_engine_error(error)
+            return True
+        raise error
+    
+    def _is_window_large(self,
+        flt_start: float,
+        flt_end: float
+    ) -> bool:
+        """按行数和时间跨度估计窗口内的行数, 超过绘制点数时需要渐进绘制"""
+        if self.time_range <= 0:
+            return False
+        n_row = self.column_catalog.get_stats(self.str_name_col_timestamp).n_row
+        return n_row * (flt_end - flt_start) / self.time_range > self.n_max_point_plot
+    
+    def _lookup_value_exact(self,
+        flt_timestamp: float,
+        lst_name_col: List[str]
+    ) -> Tuple[Optional[float], Dict[str, Optional[float]]]:
+        """从原始数据中查询不晚于flt_timestamp的最后一行"""
+        if self.data_engine is not None:
+            try:
+                return self.data_engine.get_value_asof(lst_name_col, flt_timestamp)
+            except DataEngineError as e:
+                self._on_data_engine_error(e)
+                return None, {str_name_col: None for str_name_col in lst_name_col}
+        return get_value_asof(
+            self.lf,
+            self.str_name_col_timestamp,
+            lst_name_col,
+            flt_timestamp
+        )
     
     def _plot_time_navigator(self):
         """绘制时间轴导航图"""
         # 获取数据列
-        lst_name_col_data = [col for col in self.lf.collect_schema.names if col != self.str_name_col_timestamp]
+        lst_name_col_data = self.manager_columnmetadata.get_all_actual_names()
         
         if len(lst_name_col_data) == 0:
             return
         
-        # 降采样到5000点
-        n_total = self.lf.select(pl.count()).collect()[0, 0]
-        step = max(1, n_total // 5000)
-        
-        # 获取降采样数据
-        nav_data = (self.lf
-                   .select([
-                       pl.col(self.str_name_col_timestamp),
-                       pl.col(lst_name_col_data[0])
-                   ])
-                   .collect()
-                   .gather_every(step))
+        # 后台获取全时段降采样到5000点的数据
+        lst_name_col = [lst_name_col_data[0]]
+        tpl_args = (lst_name_col, self.ts_timestamp_data_min, self.ts_timestamp_data_max, 5000)
+        self.scheduler_request.submit(
+            ('window', tuple(lst_name_col), *tpl_args[1:]),
+            partial(self._query_window_data, *tpl_args, bol_background=True),
+            RequestPriority.BACKGROUND,
+            partial(self._on_time_navigator_data, lst_name_col[0])
+        )
+    
+    def _on_time_navigator_data(self,
+        str_name_col: str,
+        dic_array: Optional[Dict[str, np.ndarray]],
+        error: Optional[BaseException]
+    ):
+        """导航图数据取回后绘制"""
+        if self._check_request_error(error):
+            return
         
-        time_data = nav_data[self.str_name_col_timestamp].to_numpy()
-        value_data = nav_data[lst_name_col_data[0]].to_numpy()
+        time_data = dic_array[self.str_name_col_timestamp]
+        value_data = dic_array[str_name_col]
         
         self.time_plot.plot(time_data, value_data, pen=pg.mkPen('w', width=1))
     
     def setup_connections(self):
         """设置信号连接"""
-        self.side_panel.configChanged.connect(self.on_config_changed)
-        self.side_panel.timeRangeChanged.connect(self.on_sidebar_time_change)
+        self.side_panel.sig_xaxis_time_changed.connect(self.on_sidebar_time_change)
         self.region.sigRegionChanged.connect(self.on_region_changed)
-    
-    @Slot()
-    def on_config_changed(self):
-        """配置改变"""
-        # 更新所有子图
-        self.update_all_plots()
+        self.crosshair_manager.sig_readout_changed.connect(self.readout_panel.set_readout)
+        self.crosshair_manager.sig_readout_exact.connect(self.readout_panel.set_readout_exact)
+        self.side_panel.sig_stats_threshold_changed.connect(self.update_stats)
+        self.manager_subplot.sig_subplot_changes.connect(self.on_subplot_changes)
+        self.manager_subplot.connect_to_statusbar(self.statusBar())
     
     @Slot()
     def on_region_changed(self):
@@ -260,6 +642,96 @@ class MultiCurvePlotterWidget(QMainWindow):
         # 更新数据
         self.update_all_plots()
     
+    @Slot(object)
+    def on_subplot_changes(self, dic_kind_subplot: Dict[int, ChangeKind]):
+        """
+        子图管理器合并后的变更, 每轮事件循环最多一次
+        
+        只有外观变化的子图就地更新画笔, 不重新取数; 其余子图重绘,
+        它们的窗口min/max在一次lazy聚合中计算
+        """
+        lst_idx_subplot_replot = []
+        for idx_subplot, kind in dic_kind_subplot.items():
+            if kind & (ChangeKind.DATA | ChangeKind.LAYOUT) or not self.restyle_plot(idx_subplot):
+                lst_idx_subplot_replot.append(idx_subplot)
+        if not lst_idx_subplot_replot:
+            return
+        self._update_plots(lst_idx_subplot_replot)
+        self.update_stats()
+    
+    @Slot()
+    def on_save_session(self):
+        """保存会话到JSON文件"""
+        str_path, _ = QFileDialog.getSaveFileName(
+            self,
+            self.tr("保存会话", "f_session_save_title"),
+            "",
+            "Session (*.json)"
+        )
+        if not str_path:
+            return
+        self.save_session(str_path)
+    
+    @Slot()
+    def on_load_session(self):
+        """从JSON文件加载会话"""
+        str_path, _ = QFileDialog.getOpenFileName(
+            self,
+            self.tr("加载会话", "f_session_load_title"),
+            "",
+            "Session (*.json)"
+        )
+        if not str_path:
+            return
+        try:
+            lst_name_col_missing = self.load_session(str_path)
+        except (OSError, ValueError, KeyError) as e:
+            QMessageBox.warning(self, self.tr("加载会话", "f_session_load_title"), str(e))
+            return
+        if lst_name_col_missing:
+            QMessageBox.information(
+                self,
+                self.tr("加载会话", "f_session_load_title"),
+                self.tr("以下列在当前数据中不存在，已跳过:\n{}", "f_session_missing_cols").format(
+                    "\n".join(lst_name_col_missing))
+            )
+    
+    def save_session(self, str_path: str):
+        """将当前布局、X轴范围和语言写入会话文件"""
+        dic_session = dump_session(
+            self.manager_subplot,
+            tpl_range_x=tuple(self.region.getRegion()),
+            str_language=QCoreApplication.instance().property("language_code")
+        )
+        write_session(str_path, dic_session)
+    
+    def load_session(self, str_path: str) -> List[str]:
+        """
+        从会话文件重建布局
+        
+        先静默设置X轴范围, 再由子图管理器批量重建, 最后统一刷新一次
+        
+        Returns:
+            当前数据中缺失而被跳过的列名
+        """
+        dic_session = read_session(str_path)
+        lst_range_x = dic_session.get('lst_range_x')
+        if lst_range_x:
+            self.region.blockSignals(True)
+            self.region.setRegion(lst_range_x)
+            self.region.blockSignals(False)
+            for plot in self.plots:
+                plot.setXRange(*lst_range_x, padding=0)
+            self.side_panel.update_time_range(*lst_range_x)
+        # 重建完成后子图管理器合并发射一次变更触发刷新
+        _, str_language, lst_name_col_missing = restore_session(self.manager_subplot, dic_session)
+        # 切换到会话的界面语言, 各窗口在 LanguageChange 事件中重新翻译
+        if str_language and str_language != QCoreApplication.instance().property("language_code"):
+            if self.translator_cache is None or not self.translator_cache.switch(str_language):
+                self.statusBar().showMessage(
+                    self.tr("会话语言 {} 的翻译不可用", "f_session_language_unavailable").format(str_language), 5000)
+        return lst_name_col_missing
+    
     @Slot(float, float)
     def on_sidebar_time_change(self, start: float, end: float):
         """侧边栏时间改变"""
@@ -267,119 +739,362 @@ class MultiCurvePlotterWidget(QMainWindow):
     
     def update_all_plots(self):
         """更新所有子图"""
-        for plot_idx in range(3):
-            self.update_plot(plot_idx)
+        self._update_plots(list(range(3)))
+        self.update_stats()
     
-    def update_plot(self, plot_idx: int):
-        """更新单个子图"""
-        plot = self.plots[plot_idx]
-        axis_manager = self.axis_managers[plot_idx]
+    def _update_plots(self, lst_idx_subplot: List[int]):
+        """重绘多个子图, 它们的可见列在一次lazy聚合中计算窗口min/max"""
+        for idx_subplot in lst_idx_subplot:
+            self.update_plot(idx_subplot, bol_request_range=False)
+        self._request_window_range(lst_idx_subplot)
+    
+    @Slot()
+    def update_stats(self):
+        """刷新侧边栏中当前时间窗口内可见曲线的统计, 统计作为交互请求在后台计算"""
+        min_x, max_x = self.region.getRegion()
+        flt_threshold = self.side_panel.get_stats_threshold()
+        lst_name_col = list(dict.fromkeys(curve_config.str_name_curve for curve_config in self._get_curves_all()))
+        self.n_generation_stats += 1
+        if self.handle_stats is not None:
+            self.handle_stats.cancel()
+        self.handle_stats = self.scheduler_request.submit(
+            ('stats', tuple(lst_name_col), min_x, max_x, flt_threshold),
+            partial(self._calc_window_stats_cols, lst_name_col, min_x, max_x, flt_threshold),
+            RequestPriority.INTERACTIVE,
+            partial(self._on_stats_ready, self.n_generation_stats)
+        )
+    
+    def _on_stats_ready(self,
+        n_generation: int,
+        result: Optional[Dict[str, Dict[str, float]]],
+        error: Optional[BaseException]
+    ):
+        """统计完成后按当前的曲线填表, 代数不符时丢弃; 数据引擎请求失败时清空表格"""
+        if n_generation != self.n_generation_stats:
+            return
+        self.handle_stats = None
+        dic_stats_col = {} if self._check_request_error(error) else result
+        
+        lst_row = []
+        for curve_config in self._get_curves_all():
+            dic_stats = dic_stats_col.get(curve_config.str_name_curve)
+            if dic_stats is None:
+                continue
+            # 积分和时长以秒计, 按小时显示; 积分单位跟随所属轴的单位, 如 MW -> MWh
+            axisconfig = self.manager_subplot.get_axis_manager(curve_config.idx_subplot).get_axisconfig(curve_config.str_name_axis)
+            str_unit_integral = axisconfig.unit_value.get_unit_integral('h') if axisconfig else ''
+            lst_row.append((
+                str(curve_config.idx_subplot + 1),
+                self.get_display_name(curve_config.str_name_curve),
+                *(f"{dic_stats[key]:.6g}" for key in ('min', 'max', 'mean', 'std')),
+                f"{dic_stats['integral'] / self.flt_second_per_hour:.6g} {str_unit_integral}".rstrip(),
+                f"{dic_stats['time_above'] / self.flt_second_per_hour:.3f} h",
+            ))
+        self.side_panel.update_stats(lst_row)
+    
+    def _calc_window_stats_cols(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        flt_threshold: Optional[float]
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        计算多列在时间窗口内的统计量, 有数据引擎时在子进程中计算; 不访问界面, 可在后台线程调用
+        
+        Returns:
+            {列名: 统计量字典}
+        
+        Raises:
+            DataEngineError: 数据引擎请求失败
+        """
+        if self.data_engine is not None:
+            return self.data_engine.get_window_stats(lst_name_col, flt_start, flt_end, flt_threshold)
+        # 新出现的列一次性建立索引
+        self.stats_index.prepare(lst_name_col)
+        return {
+            str_name_col: self.stats_index.get_stats(str_name_col, flt_start, flt_end, flt_threshold)
+            for str_name_col in dict.fromkeys(lst_name_col)
+        }
+    
+    def _query_window_range_cols(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float
+    ) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """
+        计算多列在时间窗口内的原始数据min/max; 不访问界面, 可在后台线程调用
+
+        Returns:
+            {列名: (最小值, 最大值)}
+
+        Raises:
+            DataEngineError: 数据引擎请求失败
+        """
+        if self.data_engine is not None:
+            return self.data_engine.get_window_min_max(lst_name_col, flt_start, flt_end)
+        return get_window_min_max(
+            self.lf,
+            self.str_name_col_timestamp,
+            lst_name_col,
+            flt_start,
+            flt_end
+        )
+    
+    def _request_window_range(self, lst_idx_subplot: List[int]):
+        """
+        请求指定子图中所有可见曲线在当前时间窗口内的原始数据min/max, 取回后应用各轴范围
+
+        Args:
+            lst_idx_subplot: 子图索引列表, 按各子图当前的代数丢弃过时的结果
+        """
+        min_x, max_x = self.region.getRegion()
+        lst_name_col = [
+            curve_config.str_name_curve
+            for idx_subplot in lst_idx_subplot
+            for curve_config in self.get_plot_curves(idx_subplot)
+        ]
+        dic_n_generation = {
+            idx_subplot: self.dic_n_generation_subplot.get(idx_subplot, 0)
+            for idx_subplot in lst_idx_subplot
+        }
+        self.scheduler_request.submit(
+            ('range', tuple(lst_name_col), min_x, max_x),
+            partial(self._query_window_range_cols, lst_name_col, min_x, max_x),
+            RequestPriority.INTERACTIVE,
+            partial(self._on_window_range_ready, dic_n_generation)
+        )
+    
+    def _on_window_range_ready(self,
+        dic_n_generation: Dict[int, int],
+        result: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]],
+        error: Optional[BaseException]
+    ):
+        """窗口min/max取回后应用到代数仍然相符的子图"""
+        if self._check_request_error(error):
+            return
+        for idx_subplot, n_generation in dic_n_generation.items():
+            if self.dic_n_generation_subplot.get(idx_subplot, 0) == n_generation:
+                self._apply_window_range(idx_subplot, result)
+    
+    def _apply_window_range(self,
+        plot_idx: int,
+        dic_range_col: Dict[str, Tuple[Optional[float], Optional[float]]]
+    ):
+        """由窗口原始数据的min/max得到每个轴的范围, 对齐求解后每轴一次setYRange"""
+        dic_lst_range_col_axis: Dict[str, List[Tuple[Optional[float], Optional[float]]]] = {}
+        for curve_config in self.get_plot_curves(plot_idx):
+            dic_lst_range_col_axis.setdefault(curve_config.str_name_axis, []).append(
+                dic_range_col.get(curve_config.str_name_curve, (None, None)))
+        self.axis_managers[plot_idx].apply_yaxis_range_all(dic_lst_range_col_axis)
+
+    def update_plot(self,
+        plot_idx: int,
+        bol_request_range: bool = True
+    ):
+        """
+        更新单个子图
+        
+        轴和不再显示的曲线立即更新; 数据和窗口min/max作为交互请求在后台获取,
+        取回后替换曲线并应用范围. 大窗口先画概略包络, 再后台细化
         
+        Args:
+            bol_request_range: 是否请求本子图的窗口min/max, 批量重绘时由调用方统一请求
+        """
         # 获取时间范围
         min_x, max_x = self.region.getRegion()
         
-        # 获取配置
-        axis_configs = self.side_panel.get_plot_axes(plot_idx)
-        curve_configs = self.side_panel.get_plot_curves(plot_idx)
-        
-        # 更新轴配置
-        self._update_axes(plot_idx, axis_configs)
-        
-        # 按轴分组曲线
-        curves_by_axis = {}
-        for curve_config in curve_configs:
-            axis_id = curve_config.axis_id
-            if axis_id not in curves_by_axis:
-                curves_by_axis[axis_id] = []
-            curves_by_axis[axis_id].append(curve_config)
-        
-        # 清除旧曲线
-        for axis_id, vb in axis_manager.viewboxes.items():
-            for item in vb.allChildren():
-                if isinstance(item, pg.PlotCurveItem):
-                    vb.removeItem(item)
-        
-        # 获取数据并绘制
-        for axis_id, curves in curves_by_axis.items():
-            vb = axis_manager.get_viewbox(axis_id)
-            if not vb:
+        # 获取配置并更新轴
+        curve_configs = self.get_plot_curves(plot_idx)
+        self._update_axes(plot_idx, self.get_plot_axes(plot_idx))
+        
+        # 删除或隐藏的曲线立即移除, 其余曲线保留到新数据取回
+        set_id_item = {curve_config.tpl_id_item for curve_config in curve_configs}
+        self._remove_curveitems(plot_idx, set_id_item)
+        
+        # 新的一代: 放弃未完成的取数和细化
+        n_generation = self.dic_n_generation_subplot.get(plot_idx, 0) + 1
+        self.dic_n_generation_subplot[plot_idx] = n_generation
+        handle_old = self.dic_handle_data_subplot.pop(plot_idx, None)
+        if handle_old is not None:
+            handle_old.cancel()
+        self._set_refine_pending(plot_idx, False)
+        if bol_request_range:
+            self._request_window_range([plot_idx])
+        if not curve_configs:
+            return
+        
+        # 子图所有曲线的数据一次取回; 大窗口先取概略包络, 绘制后再请求细化
+        lst_name_col = [curve_config.str_name_curve for curve_config in curve_configs]
+        tpl_args_window = (lst_name_col, min_x, max_x, self.n_max_point_plot)
+        if self._is_window_large(min_x, max_x):
+            if self.data_engine is None and not self.stats_index.is_prepared(lst_name_col):
+                self._prepare_stats_index(lst_name_col)
+            key = ('envelope', tuple(lst_name_col), min_x, max_x)
+            func = partial(self._query_window_envelope, lst_name_col, min_x, max_x)
+            tpl_args_refine = tpl_args_window
+        else:
+            key = ('window', tuple(lst_name_col), *tpl_args_window[1:])
+            func = partial(self._query_window_data, *tpl_args_window)
+            tpl_args_refine = None
+        self.dic_handle_data_subplot[plot_idx] = self.scheduler_request.submit(
+            key, func, RequestPriority.INTERACTIVE,
+            partial(self.on_window_data_ready, plot_idx, n_generation, tpl_args_refine)
+        )
+    
+    def _remove_curveitems(self,
+        plot_idx: int,
+        set_id_item_keep: Set[Tuple[int, str]]
+    ):
+        """移除子图中不在 set_id_item_keep 中的已绘制曲线"""
+        axis_manager = self.axis_managers[plot_idx]
+        for tpl_id_item in [tpl_id for tpl_id in self.dic_curveitem if tpl_id[0] == plot_idx]:
+            if tpl_id_item in set_id_item_keep:
                 continue
-            
-            for curve_config in curves:
-                self._plot_curve(vb, curve_config, min_x, max_x)
+            curve_item = self.dic_curveitem.pop(tpl_id_item)
+            for vb in axis_manager.dic_viewbox.values():
+                if curve_item in vb.addedItems:
+                    vb.removeItem(curve_item)
+    
+    def on_window_data_ready(self,
+        plot_idx: int,
+        n_generation: int,
+        tpl_args_refine: Optional[Tuple],
+        result: Optional[Dict[str, np.ndarray]],
+        error: Optional[BaseException]
+    ):
+        """
+        取数完成: 用取回的数据替换子图的曲线, 代数不符时丢弃
         
-        # 应用范围和对齐
-        for axis_id in axis_configs.keys():
-            axis_manager.apply_axis_range(axis_id)
+        Args:
+            tpl_args_refine: 取回的是概略包络时, 细化请求的 _query_window_data 参数; 否则为None
+        """
+        if self.dic_n_generation_subplot.get(plot_idx) != n_generation:
+            return
+        self.dic_handle_data_subplot.pop(plot_idx, None)
+        if self._check_request_error(error):
+            return
+        # 清除旧曲线, 按所属轴绘制
+        axis_manager = self.axis_managers[plot_idx]
+        self._remove_curveitems(plot_idx, set())
+        for curve_config in self.get_plot_curves(plot_idx):
+            vb = axis_manager.get_viewbox(curve_config.str_name_axis)
+            if not vb or curve_config.str_name_curve not in result:
+                continue
+            self._plot_curve(
+                vb, curve_config,
+                result[self.str_name_col_timestamp],
+                result[curve_config.str_name_curve]
+            )
+        if tpl_args_refine is None:
+            return
+        # 概略图已显示, 后台细化
+        self._set_refine_pending(plot_idx, True)
+        lst_name_col = tpl_args_refine[0]
+        self.dic_handle_data_subplot[plot_idx] = self.scheduler_request.submit(
+            ('window', tuple(lst_name_col), *tpl_args_refine[1:]),
+            partial(self._query_window_data, *tpl_args_refine),
+            RequestPriority.INTERACTIVE,
+            partial(self.on_refine_ready, plot_idx, n_generation)
+        )
+    
+    def on_refine_ready(self,
+        plot_idx: int,
+        n_generation: int,
+        result: Optional[Dict[str, np.ndarray]],
+        error: Optional[BaseException]
+    ):
+        """细化请求完成: 用降采样数据替换子图中的概略曲线, 代数不符时丢弃"""
+        if self.dic_n_generation_subplot.get(plot_idx) != n_generation:
+            return
+        self.dic_handle_data_subplot.pop(plot_idx, None)
+        self._set_refine_pending(plot_idx, False)
+        if self._check_request_error(error):
+            return
+        arr_time = result.get(self.str_name_col_timestamp)
+        for curve_config in self.get_plot_curves(plot_idx):
+            curve_item = self.get_curveitem(curve_config)
+            if curve_item is None or curve_config.str_name_curve not in result:
+                continue
+            curve_item.setData(arr_time, result[curve_config.str_name_curve])
+    
+    def _set_refine_pending(self,
+        plot_idx: int,
+        bol_pending: bool
+    ):
+        """在子图标题处显示/隐藏细化中的提示"""
+        if bol_pending:
+            self.plots[plot_idx].setTitle(
+                self.tr("细化中…", "f_plot_refining"), size='8pt', color='#888888')
+        else:
+            self.plots[plot_idx].setTitle(None)
+    
+    def restyle_plot(self, plot_idx: int) -> bool:
+        """
+        只更新子图中已绘制曲线的画笔和可见性, 不取数
         
-        for axis_id in axis_configs.keys():
-            axis_manager.apply_alignment(axis_id)
+        Returns:
+            是否完成; 有需要显示但尚未绘制的曲线时返回 False, 由调用方重绘
+        """
+        # 隐藏的曲线也要处理, 以便隐藏其已绘制的item
+        lst_curve = self.manager_subplot.get_curve_manager(plot_idx).get_lst_curveconfig_all_added()
+        if any(curve_config.bol_show and self.get_curveitem(curve_config) is None for curve_config in lst_curve):
+            return False
+        for curve_config in lst_curve:
+            curve_item = self.get_curveitem(curve_config)
+            if curve_item is None:
+                continue
+            curve_item.setPen(self._create_pen(curve_config))
+            curve_item.setVisible(curve_config.bol_show)
+        return True
     
     def _update_axes(self, plot_idx: int, axis_configs: Dict[str, AxisConfig]):
         """更新子图的轴"""
         axis_manager = self.axis_managers[plot_idx]
         
         # 获取现有轴
-        existing_axes = set(axis_manager.axes.keys())
+        existing_axes = set(axis_manager.dic_axisconfig.keys())
         new_axes = set(axis_configs.keys())
         
-        # 删除不再需要的轴
+        # 删除不再需要的轴, 只移除对应的一列
         for axis_id in existing_axes - new_axes:
-            if axis_id != 'main':
-                axis_manager.remove_axis(axis_id)
+            if axis_id != axis_manager.str_name_axis_left:
+                axis_manager._del_yaxis(axis_id)
         
-        # 添加新轴
+        # 添加新轴, 追加到右轴末尾
         for axis_id in new_axes - existing_axes:
-            if axis_id != 'main':
-                axis_manager.add_axis(axis_configs[axis_id])
+            if axis_id != axis_manager.str_name_axis_left:
+                axis_manager._add_yaxis_right(axis_configs[axis_id])
         
         # 更新现有轴的配置
         for axis_id, config in axis_configs.items():
-            if axis_id in axis_manager.axes:
-                axis_manager.axes[axis_id] = config
-                # 更新轴标签（使用翻译后的名称）
-                if config.axis_item:
-                    str_label_display = self.get_display_name(config.label)
-                    config.axis_item.setLabel(
-                        str_label_display,
-                        units=config.unit,
-                        color=config.color
-                    )
+            axisconfig_cur = axis_manager.dic_axisconfig.get(axis_id)
+            if axisconfig_cur is None:
+                continue
+            if axisconfig_cur is not config:
+                axis_manager.dic_axisconfig[axis_id] = config
+            # 更新轴标签（使用翻译后的名称）
+            axisitem = axis_manager.dic_axisitem.get(axis_id)
+            if axisitem:
+                str_label_display = self.get_display_name(config.str_label)
+                axisitem.setLabel(
+                    str_label_display,
+                    units=config.unit_value.value,
+                    color=config.color
+                )
     
     def _plot_curve(
         self,
         viewbox: pg.ViewBox,
         curve_config: CurveConfig,
-        min_x: float,
-        max_x: float
+        time_data: np.ndarray,
+        value_data: np.ndarray
     ):
-        """绘制单条曲线"""
-        # 从LazyFrame获取数据（延迟计算）
-        curve_data = (self.lf
-                     .filter(
-                         (pl.col(self.str_name_col_timestamp) >= min_x) &
-                         (pl.col(self.str_name_col_timestamp) <= max_x)
-                     )
-                     .select([
-                         pl.col(self.str_name_col_timestamp),
-                         pl.col(curve_config.curve_name)
-                     ])
-                     .collect())
-        
-        # 降采样
-        max_points = 10000
-        if len(curve_data) > max_points:
-            step = len(curve_data) // max_points
-            curve_data = curve_data.gather_every(step)
-        
-        time_data = curve_data[self.str_name_col_timestamp].to_numpy()
-        value_data = curve_data[curve_config.curve_name].to_numpy()
-        
+        """用已取回(已降采样)的数据绘制单条曲线"""
         # 创建pen
         pen = self._create_pen(curve_config)
         
         # 获取显示名称用于图例
-        str_curve_name_display = self.get_display_name(curve_config.curve_name)
+        str_curve_name_display = self.get_display_name(curve_config.str_name_curve)
         
         # 绘制（使用翻译后的显示名称）
         curve_item = pg.PlotCurveItem(
@@ -387,11 +1102,12 @@ class MultiCurvePlotterWidget(QMainWindow):
             value_data,
             pen=pen,
             name=str_curve_name_display,
-            stepMode=curve_config.is_step
+            # 阶梯线: 每个采样值保持到下一个采样点, x与y等长
+            stepMode="left" if curve_config.bol_is_step else None
         )
         
         viewbox.addItem(curve_item)
-        curve_config.curve_item = curve_item
+        self.dic_curveitem[curve_config.tpl_id_item] = curve_item
     
     def _create_pen(self, curve_config: CurveConfig):
         """创建pen"""
@@ -404,6 +1120,6 @@ class MultiCurvePlotterWidget(QMainWindow):
         
         return pg.mkPen(
             color=curve_config.color,
-            width=curve_config.line_width,
-            style=style_map.get(curve_config.line_style, Qt.PenStyle.SolidLine)
+            width=curve_config.linewidth,
+            style=style_map.get(curve_config.linestyle, Qt.PenStyle.SolidLine)
         )
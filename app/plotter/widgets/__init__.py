@@ -4,8 +4,16 @@ Plotter Widgets Module
 
 from app.plotter.widgets.axisconfigpanel import AxisConfigPanel
 from app.plotter.widgets.curveconfigpanel import CurveConfigPanel
+from app.plotter.widgets.crosshairreadoutpanel import CrosshairReadoutPanel
+from app.plotter.widgets.columnpickerwidget import ColumnPickerWidget
+from app.plotter.widgets.curvelistmodel import CurveListModel
+from app.plotter.widgets.curveitemdelegate import CurveItemDelegate
 
 __all__ = [
     'AxisConfigPanel',
     'CurveConfigPanel',
+    'CrosshairReadoutPanel',
+    'ColumnPickerWidget',
+    'CurveListModel',
+    'CurveItemDelegate',
 ]
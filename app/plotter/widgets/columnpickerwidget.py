@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+列选择器模块
+
+输入即过滤的列名选择器, 基于 ColumnSearchIndex
+"""
+
+from typing import Callable, Optional
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem
+)
+from PySide6.QtCore import Qt, Signal, QTimer
+
+from app.plotter.columnsearchindex import ColumnSearchIndex
+
+
+class ColumnPickerWidget(QWidget):
+    """
+    输入即过滤的列选择器
+
+    输入停止一小段时间后才查询索引(防抖), 列表中显示显示列名,
+    实际列名保存在 UserRole 中; 双击或回车选中列
+    """
+
+    # 信号定义
+    sig_column_picked: Signal = Signal(str)  # 选中列时发射，参数为实际列名
+
+    def __init__(self,
+        search_index: ColumnSearchIndex,
+        n_limit: int = 200,
+        n_ms_debounce: int = 120,
+        func_get_tooltip: Optional[Callable[[str], str]] = None,
+        parent: Optional[QWidget] = None
+    ):
+        """
+        Args:
+            search_index: 列名搜索索引
+            n_limit: 列表中最多显示的结果数
+            n_ms_debounce: 防抖间隔(毫秒)
+            func_get_tooltip: 实际列名 -> 提示文字, 为None时提示实际列名
+            parent: 父widget, 可选
+        """
+        super().__init__(parent)
+        self.search_index = search_index
+        self.n_limit = n_limit
+        self.func_get_tooltip = func_get_tooltip or (lambda x: x)
+        # 防抖定时器
+        self.timer_debounce = QTimer(self)
+        self.timer_debounce.setSingleShot(True)
+        self.timer_debounce.setInterval(n_ms_debounce)
+        self.timer_debounce.timeout.connect(self.refresh)
+        self._init_layout_main()
+        self.refresh()
+        pass
+
+    def _init_layout_main(self):
+        """
+        初始化 列选择器UI
+        """
+        boxlayout_main = QVBoxLayout(self)
+        boxlayout_main.setContentsMargins(0, 0, 0, 0)
+        # 过滤输入框
+        self.lineedit_filter = QLineEdit()
+        self.lineedit_filter.setPlaceholderText(self.tr("搜索列名, 如 gt elec out", "f_column_search"))
+        self.lineedit_filter.setClearButtonEnabled(True)
+        self.lineedit_filter.textChanged.connect(self.timer_debounce.start)
+        self.lineedit_filter.returnPressed.connect(self._on_return_pressed)
+        boxlayout_main.addWidget(self.lineedit_filter)
+        # 结果列表
+        self.list_result = QListWidget()
+        self.list_result.setUniformItemSizes(True)
+        self.list_result.itemDoubleClicked.connect(self._on_item_activated)
+        boxlayout_main.addWidget(self.list_result)
+        return
+
+    def set_search_index(self,
+        search_index: ColumnSearchIndex
+    ):
+        """更换搜索索引(如切换语言后), 并按当前输入刷新
+        """
+        self.search_index = search_index
+        self.refresh()
+        return
+
+    def refresh(self):
+        """按当前输入重新查询并填充列表
+        """
+        lst_result = self.search_index.search(self.lineedit_filter.text(), n_limit=self.n_limit)
+        self.list_result.setUpdatesEnabled(False)
+        self.list_result.clear()
+        for str_name_col_actual, str_name_col_display, _ in lst_result:
+            item = QListWidgetItem(str_name_col_display)
+            item.setData(Qt.ItemDataRole.UserRole, str_name_col_actual)
+            item.setToolTip(self.func_get_tooltip(str_name_col_actual))
+            self.list_result.addItem(item)
+        self.list_result.setUpdatesEnabled(True)
+        return
+
+    def _on_item_activated(self,
+        item: QListWidgetItem
+    ):
+        """双击列表项"""
+        self.sig_column_picked.emit(item.data(Qt.ItemDataRole.UserRole))
+        return
+
+    def _on_return_pressed(self):
+        """回车选中当前项, 没有当前项时选中第一项"""
+        # 防抖尚未触发时先刷新, 保证结果与输入一致
+        if self.timer_debounce.isActive():
+            self.timer_debounce.stop()
+            self.refresh()
+        item = self.list_result.currentItem() or self.list_result.item(0)
+        if item:
+            self._on_item_activated(item)
+        return
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+十字光标读数面板模块
+"""
+
+from typing import Callable, List, Optional, Tuple
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView
+)
+from PySide6.QtCore import Qt, Slot, QEvent
+
+
+class CrosshairReadoutPanel(QWidget):
+    """
+    十字光标读数表
+
+    每行对应一条可见曲线, 显示所属子图、曲线名和光标时刻的值。
+    行数不变时只更新单元格文本, 不重建表格, 悬停时开销与曲线数成线性
+    """
+
+    def __init__(self,
+        func_get_display_name: Optional[Callable[[str], str]] = None,
+        parent: Optional[QWidget] = None
+    ):
+        """
+        Args:
+            func_get_display_name: 列名翻译函数, 为None时直接显示列名
+            parent: 父widget, 可选
+        """
+        super().__init__(parent)
+        self.func_get_display_name = func_get_display_name or (lambda str_name: str_name)
+        self._init_layout_main()
+        pass
+
+    def _init_layout_main(self):
+        """
+        初始化 读数面板UI
+        """
+        boxlayout_main = QVBoxLayout(self)
+        boxlayout_main.setContentsMargins(0, 0, 0, 0)
+        # 光标时刻
+        self.label_timestamp = QLabel(self.tr("时间: -", "f_crosshair_time_empty"))
+        boxlayout_main.addWidget(self.label_timestamp)
+        # 读数表
+        self.table_readout = QTableWidget(0, 3)
+        self.table_readout.setHorizontalHeaderLabels(self._get_lst_str_header())
+        self.table_readout.verticalHeader().setVisible(False)
+        self.table_readout.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_readout.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_readout.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        boxlayout_main.addWidget(self.table_readout)
+        return
+
+    def _get_lst_str_header(self) -> List[str]:
+        """按当前语言生成读数表的表头"""
+        return [
+            self.tr("子图", "f_crosshair_subplot"),
+            self.tr("曲线", "f_crosshair_curve"),
+            self.tr("值", "f_crosshair_value"),
+        ]
+
+    def changeEvent(self, event):
+        """语言切换后重新翻译表头, 时间标签在下一次读数时更新"""
+        if event.type() == QEvent.Type.LanguageChange:
+            self.table_readout.setHorizontalHeaderLabels(self._get_lst_str_header())
+        super().changeEvent(event)
+
+    def _set_text_cell(self,
+        idx_row: int,
+        idx_col: int,
+        str_text: str
+    ):
+        """设置单元格文本, 复用已有的item
+        """
+        item = self.table_readout.item(idx_row, idx_col)
+        if item is None:
+            item = QTableWidgetItem()
+            # 数值列右对齐
+            align_h = Qt.AlignmentFlag.AlignRight if idx_col == 2 else Qt.AlignmentFlag.AlignLeft
+            item.setTextAlignment(align_h | Qt.AlignmentFlag.AlignVCenter)
+            self.table_readout.setItem(idx_row, idx_col, item)
+        if item.text() != str_text:
+            item.setText(str_text)
+        return
+
+    def _set_rows(self,
+        lst_readout: List[Tuple[int, str, Optional[float]]]
+    ):
+        """按读数列表刷新表格
+        """
+        if self.table_readout.rowCount() != len(lst_readout):
+            self.table_readout.setRowCount(len(lst_readout))
+        for idx_row, (idx_subplot, str_name_curve, flt_value) in enumerate(lst_readout):
+            self._set_text_cell(idx_row, 0, str(idx_subplot + 1))
+            self._set_text_cell(idx_row, 1, self.func_get_display_name(str_name_curve))
+            self._set_text_cell(idx_row, 2, "-" if flt_value is None else f"{flt_value:.6g}")
+        return
+
+    @Slot(float, list)
+    def set_readout(self,
+        flt_timestamp: float,
+        lst_readout: list
+    ):
+        """显示悬停读数(来自当前显示数据)
+        """
+        self.label_timestamp.setText(self.tr("时间: {0:.3f}", "f_crosshair_time").format(flt_timestamp))
+        self._set_rows(lst_readout)
+        return
+
+    @Slot(float, list)
+    def set_readout_exact(self,
+        flt_timestamp: float,
+        lst_readout: list
+    ):
+        """显示单击读数(来自原始数据)
+        """
+        self.label_timestamp.setText(self.tr("时间: {0:.3f} (原始数据)", "f_crosshair_time_exact").format(flt_timestamp))
+        self._set_rows(lst_readout)
+        return
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+from dataclasses import replace
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QPushButton, QComboBox, QColorDialog, QFrame
@@ -10,6 +11,7 @@ from PySide6.QtGui import QColor
 
 from app.plotter.graphconfigs.curveconfig import CurveConfig
 from app.plotter.graphconfigs.axisconfig import AxisConfig
+from app.plotter.graphconfigs.configrecord import color_to_str
 
 
 class CurveConfigPanel(QWidget):
@@ -24,17 +26,20 @@ class CurveConfigPanel(QWidget):
     def __init__(self, 
         curve_config: CurveConfig,
         dic_axisconfig: Dict[str, AxisConfig],
-        parent: Optional[QWidget] = None
+        parent: Optional[QWidget] = None,
+        dic_curveconfig: Optional[Dict[str, CurveConfig]] = None
     ):
         """
         Args:
             curve_config: 曲线配置对象
             dic_axisconfig: Y轴配置字典的引用 (动态获取可用轴列表)
             parent: 父组件
+            dic_curveconfig: 曲线配置字典的引用, 修改后的配置写回其中
         """
         super().__init__(parent)
         self.curve_config = curve_config
         self.dic_axisconfig = dic_axisconfig  # 保存字典引用
+        self.dic_curveconfig = dic_curveconfig
         
         self._init_ui()
     
@@ -118,14 +123,20 @@ class CurveConfigPanel(QWidget):
         
         self.setLayout(layout)
     
+    def _update_config(self, **kwargs: Any):
+        """曲线配置不可变, 生成新配置并写回曲线配置字典"""
+        self.curve_config = replace(self.curve_config, **kwargs)
+        if self.dic_curveconfig is not None:
+            self.dic_curveconfig[self.curve_config.str_name_curve] = self.curve_config
+    
     def _on_axis_changed(self, str_name_axis: str):
         """Y轴改变时的回调"""
-        self.curve_config.str_name_axis = str_name_axis
+        self._update_config(str_name_axis=str_name_axis)
         self.sig_config_changed.emit()
     
     def _on_linestyle_changed(self, linestyle: str):
         """线型改变时的回调"""
-        self.curve_config.linestyle = linestyle
+        self._update_config(linestyle=linestyle)
         self.sig_config_changed.emit()
     
     def _select_color(self):
@@ -136,7 +147,7 @@ class CurveConfigPanel(QWidget):
             "选择曲线颜色"
         )
         if color.isValid():
-            self.curve_config.color = color
+            self._update_config(str_color=color_to_str(color))
             self.btn_color.setStyleSheet(
                 f"background-color: {color.name()}; "
                 f"border: 1px solid #888;"
@@ -165,6 +176,6 @@ class CurveConfigPanel(QWidget):
             # 如果之前的轴被删除了，默认选择主轴（第一个）
             if lst_name_axis_available:
                 self.combo_axis.setCurrentIndex(0)
-                self.curve_config.str_name_axis = lst_name_axis_available[0]
+                self._update_config(str_name_axis=lst_name_axis_available[0])
         
         self.combo_axis.blockSignals(False)
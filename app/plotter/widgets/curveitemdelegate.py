@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+曲线列表的编辑委托
+
+只在用户开始编辑某个单元格时创建一个编辑器, 编辑结束即销毁
+"""
+
+from typing import Optional
+from PySide6.QtWidgets import (
+    QWidget, QStyledItemDelegate, QStyleOptionViewItem,
+    QComboBox, QSpinBox, QColorDialog
+)
+from PySide6.QtCore import Qt, QModelIndex, QAbstractItemModel, QEvent
+
+from app.plotter.enums.plotenum import IdxColCurveList
+from app.plotter.widgets.curvelistmodel import CurveListModel
+
+
+class CurveItemDelegate(QStyledItemDelegate):
+    """
+    CurveListModel 的编辑委托
+
+    - Y轴: 下拉框, 选项来自模型当前的轴配置
+    - 线宽: 数字框
+    - 线型: 下拉框
+    - 颜色: 双击直接弹出颜色对话框, 不创建内嵌编辑器
+    - 显示: 使用视图自带的复选框
+    """
+
+    def createEditor(self,
+        parent: QWidget,
+        option: QStyleOptionViewItem,
+        index: QModelIndex
+    ) -> Optional[QWidget]:
+        model: CurveListModel = index.model()
+        idx_col = IdxColCurveList(index.column())
+        if idx_col == IdxColCurveList.AXIS:
+            combo_axis = QComboBox(parent)
+            combo_axis.addItems(model.get_lst_name_axis())
+            return combo_axis
+        if idx_col == IdxColCurveList.WIDTH:
+            spin_width = QSpinBox(parent)
+            spin_width.setRange(1, 10)
+            return spin_width
+        if idx_col == IdxColCurveList.STYLE:
+            combo_style = QComboBox(parent)
+            for str_linestyle, str_display in model.dic_map_linestyle.items():
+                combo_style.addItem(str_display, str_linestyle)
+            return combo_style
+        return None
+
+    def setEditorData(self,
+        editor: QWidget,
+        index: QModelIndex
+    ):
+        value = index.data(Qt.ItemDataRole.EditRole)
+        if isinstance(editor, QSpinBox):
+            editor.setValue(int(value))
+        elif isinstance(editor, QComboBox):
+            # 线型下拉框的取值在itemData中, 轴下拉框在文本中
+            idx_item = editor.findData(value)
+            if idx_item < 0:
+                idx_item = editor.findText(value)
+            editor.setCurrentIndex(max(idx_item, 0))
+        return
+
+    def setModelData(self,
+        editor: QWidget,
+        model: QAbstractItemModel,
+        index: QModelIndex
+    ):
+        if isinstance(editor, QSpinBox):
+            model.setData(index, editor.value(), Qt.ItemDataRole.EditRole)
+        elif isinstance(editor, QComboBox):
+            value = editor.currentData()
+            model.setData(index, value if value is not None else editor.currentText(), Qt.ItemDataRole.EditRole)
+        return
+
+    def editorEvent(self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex
+    ) -> bool:
+        # 颜色列双击弹出颜色对话框
+        if (index.column() == IdxColCurveList.COLOR.value
+                and event.type() == QEvent.Type.MouseButtonDblClick):
+            color = QColorDialog.getColor(index.data(Qt.ItemDataRole.EditRole), option.widget)
+            if color.isValid():
+                model.setData(index, color, Qt.ItemDataRole.EditRole)
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+曲线列表模型模块
+
+以 model/view 方式展示一个子图中已添加的曲线, 替代每条曲线一个 CurveConfigPanel 的做法:
+视图只绘制可见行, 编辑器由 CurveItemDelegate 按需创建
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from dataclasses import replace
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QModelIndex, QObject, QEvent, QCoreApplication
+)
+from PySide6.QtGui import QColor
+
+from app.plotter.enums.plotenum import IdxColCurveList
+from app.plotter.graphconfigs.curveconfig import CurveConfig
+from app.plotter.graphconfigs.configrecord import color_to_str
+
+if TYPE_CHECKING:
+    # 只在类型检查时导入,运行时不导入
+    from app.plotter.managers.axismanager import AxisManager
+    from app.plotter.managers.curvemanager import CurveManager
+
+
+class CurveListModel(QAbstractTableModel):
+    """
+    子图曲线配置的表格模型
+
+    每行一条已添加的曲线, 列见 IdxColCurveList; 模型不保存配置,
+    从曲线管理器读取, 编辑时将新的 CurveConfig 交给曲线管理器更新
+
+    Attributes:
+        manager_curve: 子图的曲线管理器
+        manager_axis: 子图的轴管理器, 用于提供可选的Y轴
+        lst_name_curve: 已添加曲线的实际列名, 顺序即行序
+    """
+
+    # 信号定义
+    sig_config_changed: Signal = Signal(str)  # 曲线配置经编辑改变，参数为实际列名
+
+    # 线型取值与显示文本
+    dic_map_linestyle: Dict[str, str] = {
+        'solid': '——',
+        'dash': '– –',
+        'dot': '···',
+        'dashdot': '–·–',
+    }
+
+    def __init__(self,
+        manager_curve: CurveManager,
+        manager_axis: AxisManager,
+        func_get_display_name: Optional[callable] = None,
+        parent: Optional[QObject] = None
+    ):
+        super().__init__(parent)
+        self.manager_curve = manager_curve
+        self.manager_axis = manager_axis
+        self.func_get_display_name = func_get_display_name or (lambda x: x)
+        self.lst_name_curve: List[str] = []
+        self.lst_str_header: List[str] = self._get_lst_str_header()
+        # 模型不是widget, 收不到LanguageChange, 通过应用对象的事件过滤器得知语言切换
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.installEventFilter(self)
+        pass
+
+    def _get_lst_str_header(self) -> List[str]:
+        """按当前语言生成表头, 顺序与 IdxColCurveList 一致"""
+        return [
+            "",
+            self.tr("曲线", 'f_header_curve'),
+            self.tr("Y轴", 'f_header_yaxis'),
+            self.tr("颜色", 'f_header_color'),
+            self.tr("线宽", 'f_header_linewidth'),
+            self.tr("线型", 'f_header_linestyle'),
+        ]
+
+    def eventFilter(self,
+        watched: QObject,
+        event: QEvent
+    ) -> bool:
+        """语言切换后重新翻译表头, 并按新的显示列名重绘曲线名一列"""
+        if event.type() == QEvent.Type.LanguageChange and watched is QCoreApplication.instance():
+            self.lst_str_header = self._get_lst_str_header()
+            self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.lst_str_header) - 1)
+            if self.lst_name_curve:
+                idx_col_name = IdxColCurveList.NAME.value
+                self.dataChanged.emit(
+                    self.index(0, idx_col_name), self.index(len(self.lst_name_curve) - 1, idx_col_name))
+        return super().eventFilter(watched, event)
+
+    # ============================================================
+    # QAbstractTableModel 接口
+    # ============================================================
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.lst_name_curve)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(IdxColCurveList)
+
+    def headerData(self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.lst_str_header[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        idx_col = IdxColCurveList(index.column())
+        if idx_col == IdxColCurveList.SHOW:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        elif idx_col != IdxColCurveList.NAME:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self,
+        index: QModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        curveconfig = self.get_curveconfig(index)
+        if curveconfig is None:
+            return None
+        idx_col = IdxColCurveList(index.column())
+        # 显示开关
+        if idx_col == IdxColCurveList.SHOW:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if curveconfig.bol_show else Qt.CheckState.Unchecked
+            return None
+        # 颜色只显示色块
+        if idx_col == IdxColCurveList.COLOR:
+            if role in (Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.EditRole):
+                return curveconfig.color
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return curveconfig.color.name()
+            return None
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+        if idx_col == IdxColCurveList.NAME:
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return curveconfig.str_name_curve
+            return self.func_get_display_name(curveconfig.str_name_curve)
+        if idx_col == IdxColCurveList.AXIS:
+            return curveconfig.str_name_axis
+        if idx_col == IdxColCurveList.WIDTH:
+            return curveconfig.linewidth
+        if idx_col == IdxColCurveList.STYLE:
+            if role == Qt.ItemDataRole.EditRole:
+                return curveconfig.linestyle
+            return self.dic_map_linestyle.get(curveconfig.linestyle, curveconfig.linestyle)
+        return None
+
+    def setData(self,
+        index: QModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole
+    ) -> bool:
+        curveconfig = self.get_curveconfig(index)
+        if curveconfig is None:
+            return False
+        idx_col = IdxColCurveList(index.column())
+        # 1.按列生成新配置
+        if idx_col == IdxColCurveList.SHOW and role == Qt.ItemDataRole.CheckStateRole:
+            curveconfig = replace(curveconfig, bol_show=Qt.CheckState(value) == Qt.CheckState.Checked)
+        elif role != Qt.ItemDataRole.EditRole:
+            return False
+        elif idx_col == IdxColCurveList.AXIS:
+            if value not in self.get_lst_name_axis():
+                return False
+            curveconfig = replace(curveconfig, str_name_axis=value)
+        elif idx_col == IdxColCurveList.COLOR:
+            color = QColor(value)
+            if not color.isValid():
+                return False
+            curveconfig = replace(curveconfig, str_color=color_to_str(color))
+        elif idx_col == IdxColCurveList.WIDTH:
+            curveconfig = replace(curveconfig, linewidth=int(value))
+        elif idx_col == IdxColCurveList.STYLE:
+            if value not in self.dic_map_linestyle:
+                return False
+            curveconfig = replace(curveconfig, linestyle=value)
+        else:
+            return False
+        # 2.交给曲线管理器更新, 由其通知绘图
+        if not self.manager_curve.update_curve_config(curveconfig.str_name_curve, curveconfig):
+            return False
+        # 3.通知视图和外部
+        self.dataChanged.emit(index, index, [role])
+        self.sig_config_changed.emit(curveconfig.str_name_curve)
+        return True
+
+    # ============================================================
+    # 曲线增删
+    # ============================================================
+
+    def get_curveconfig(self, index: QModelIndex) -> Optional[CurveConfig]:
+        """获取某行对应的曲线配置"""
+        if not index.isValid() or not 0 <= index.row() < len(self.lst_name_curve):
+            return None
+        return self.manager_curve.get_curveconfig(self.lst_name_curve[index.row()])
+
+    def get_lst_name_axis(self) -> List[str]:
+        """当前可选的Y轴名称"""
+        return self.manager_axis.get_lst_name_axis_all_added()
+
+    def add_curve(self, str_name_curve: str) -> bool:
+        """在末尾添加一行, 配置需已在曲线管理器中"""
+        if str_name_curve in self.lst_name_curve or not self.manager_curve.is_curve_initialized(str_name_curve):
+            return False
+        idx_row = len(self.lst_name_curve)
+        self.beginInsertRows(QModelIndex(), idx_row, idx_row)
+        self.lst_name_curve.append(str_name_curve)
+        self.endInsertRows()
+        return True
+
+    def remove_curve(self, str_name_curve: str) -> bool:
+        """删除曲线所在的行"""
+        if str_name_curve not in self.lst_name_curve:
+            return False
+        idx_row = self.lst_name_curve.index(str_name_curve)
+        self.beginRemoveRows(QModelIndex(), idx_row, idx_row)
+        del self.lst_name_curve[idx_row]
+        self.endRemoveRows()
+        return True
+
+    def set_curves(self, lst_name_curve: List[str]):
+        """整体替换所有行"""
+        self.beginResetModel()
+        self.lst_name_curve = [
+            str_name_curve for str_name_curve in dict.fromkeys(lst_name_curve)
+            if self.manager_curve.is_curve_initialized(str_name_curve)
+        ]
+        self.endResetModel()
+        return
+
+    def sync_curves(self, lst_name_curve: List[str]):
+        """
+        与曲线管理器同步: 行不变时只刷新所有单元格, 否则整体替换所有行
+        
+        撤销、加载会话等不经过本模型的修改之后调用
+        """
+        if list(dict.fromkeys(lst_name_curve)) != self.lst_name_curve:
+            self.set_curves(lst_name_curve)
+        elif self.lst_name_curve:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.lst_name_curve) - 1, len(IdxColCurveList) - 1)
+            )
+        return
+
+    def refresh_axes(self):
+        """Y轴增删后刷新轴列, 不重建行"""
+        if self.lst_name_curve:
+            idx_col = IdxColCurveList.AXIS.value
+            self.dataChanged.emit(
+                self.index(0, idx_col),
+                self.index(len(self.lst_name_curve) - 1, idx_col)
+            )
+        return
+
+    def refresh_names(self):
+        """列名翻译改变后刷新名称列"""
+        if self.lst_name_curve:
+            idx_col = IdxColCurveList.NAME.value
+            self.dataChanged.emit(
+                self.index(0, idx_col),
+                self.index(len(self.lst_name_curve) - 1, idx_col)
+            )
+        return
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
-from typing import Tuple, List, Set, Dict, Optional
+from typing import Tuple, List, Dict, Optional, Callable
+from dataclasses import replace
+from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QSplitter, QGroupBox, QCheckBox, QComboBox, QPushButton, QLabel, 
@@ -8,102 +10,77 @@ from PySide6.QtWidgets import (
     QListWidget, QListWidgetItem, QRadioButton, QButtonGroup,
     QLineEdit, QSpinBox, QFrame, QTabWidget, QDateTimeEdit
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QDateTime
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QDateTime, QEvent
 from PySide6.QtGui import QColor
 
 from app.plotter.widgets.axisconfigpanel import AxisConfigPanel
 from app.plotter.graphconfigs.axisconfig import AxisConfig
-from app.plotter.graphconfigs.curveconfig import CurveConfig
-from app.plotter.widgets.curveconfigpanel import CurveConfigPanel
+from app.plotter.graphconfigs.configrecord import color_to_str
+from app.plotter.enums.plotenum import SideAxis, ChangeKind
+from app.plotter.managers.subplotmanager import SubplotManager
+from app.plotter.columnsearchindex import ColumnSearchIndex
+from code_source.polars_toolkits.schema_toolkits.columncatalog import ColumnCatalog
 from app.plotter.widgets.ui_components import (
-    SubplotUIComponents, XAxisUIComponents
+    SubplotUIComponents, XAxisUIComponents, StatsUIComponents
 )
 
 
 class SidePanel(QWidget):
     """
     侧边栏配置面板
+    
+    子图的轴和曲线只保存在子图管理器中, 面板是它的视图: 编辑经管理器的公共接口
+    完成(带变更类型通知绘图, 并记录撤销命令), 界面在管理器合并后的变更信号中
+    按管理器的状态刷新, 撤销和加载会话因此同样反映到界面上
     """
     # 信号
-    sig_config_changed = Signal()
     sig_xaxis_time_changed = Signal(float, float)
+    sig_stats_threshold_changed = Signal(float)
     
     def __init__(self,
+        manager_subplot: SubplotManager,
         lst_name_col: List[str],
-        n_subplot: int = 3,
         parent: Optional[QWidget] = None,
+        func_get_display_name: Optional[Callable[[str], str]] = None,
+        func_get_actual_name: Optional[Callable[[str], Optional[str]]] = None,
+        search_index: Optional[ColumnSearchIndex] = None,
+        column_catalog: Optional[ColumnCatalog] = None
     ):
         """
         Args:
+            manager_subplot: 子图管理器, 保存所有子图的轴和曲线
             lst_name_col: 数据列名列表（实际列名）
-            n_subplot: 子图数量
             parent: 父组件
+            func_get_display_name: 实际列名 -> 显示列名
+            func_get_actual_name: 显示列名 -> 实际列名
+            search_index: 列名搜索索引, 为None时由列名和翻译函数建立
+            column_catalog: 列目录, 用于显示列信息、隐藏常值/全空列和选择默认绘图方式
         """
         super().__init__(parent=parent)
         self._str_name = "SidePanel"
+        self.manager_subplot = manager_subplot
         self.lst_name_col = lst_name_col
-        self.n_subplot = n_subplot
-        # 常值
-        self.str_name_axis_left = 'main'  # 主轴名称
+        self.n_subplot = manager_subplot.count_subplot()
+        self.func_get_display_name = func_get_display_name or (lambda x: x)
+        self.func_get_actual_name = func_get_actual_name or (lambda x: x)
+        # 全部列的搜索索引, 及按是否隐藏常值和全空列过滤后所有子图共享的索引
+        self.search_index_all = search_index or ColumnSearchIndex(lst_name_col, self.func_get_display_name)
+        self.search_index = self.search_index_all
+        # 列目录, 及是否在候选列中隐藏常值和全空列
+        self.column_catalog = column_catalog
+        self.bol_hide_trivial = False
+        # 按管理器同步界面期间, 忽略面板发出的修改
+        self.bol_syncing_ui = False
+        # 标签页和列目录概况, 语言切换时重新翻译
+        self.widget_tab: Optional[QTabWidget] = None
+        self.label_catalog: Optional[QLabel] = None
         
-        # 初始化轴配置管理器
-        self._init_axisconfig_subplot()
-        # 初始化曲线配置管理器
-        self._init_curveconfig_subplot()
-        # 初始化子图的已显示列存储
-        self._init_added_cols_subplot()
         # 初始化UI组件容器
         self._init_ui_components()
         # 初始化侧边栏的标签页
         self.init_all_tabs()
-
-    def _init_axisconfig_subplot(self):
-        """初始化轴配置存储
-        
-        dic_axisconfig_subplot 结构:
-            {
-                idx_subplot : {
-                    str_name_axis : AxisConfig,
-                    ...
-                },
-                ...
-            }
-        """
-        self.dic_axisconfig_subplot: Dict[int, Dict[str, AxisConfig]] = {
-            idx_subplot : {}
-            for idx_subplot in range(self.n_subplot)
-        }
-    
-    def _init_curveconfig_subplot(self):
-        """初始化曲线存储
-
-        dic_curveconfig_subplot 结构:
-            {
-                idx_subplot : {
-                    str_name_col_actual : CurveConfig,
-                    ...
-                },
-                ...
-            }
-        """
-        # 初始化空字典
-        self.dic_curveconfig_subplot: Dict[int, Dict[str, CurveConfig]] = {
-            idx_subplot : {}
-            for idx_subplot in range(self.n_subplot)
-        }
-
-    def _init_added_cols_subplot(self):
-        """初始化子图的已显示列存储
-        dic_added_cols_subplot 结构:
-            {
-                idx_subplot : Set[str_name_col_actual],
-                ...
-            }
-        """
-        self.dic_added_cols_subplot : Dict[int, Set[str]] = {
-            idx_subplot : set()
-            for idx_subplot in range(self.n_subplot)
-        }
+        # 管理器的变更(包括撤销/重做和加载会话)刷新界面
+        self.manager_subplot.sig_subplot_changes.connect(self.on_subplot_changes)
 
     def _init_ui_components(self):
         """初始化UI组件容器
@@ -113,12 +90,18 @@ class SidePanel(QWidget):
         """
         # 子图UI组件
         self.dic_ui_subplot: Dict[int, SubplotUIComponents] = {
-            idx_subplot: SubplotUIComponents(idx_subplot=idx_subplot)
+            idx_subplot: SubplotUIComponents(
+                idx_subplot=idx_subplot,
+                manager_curve=self.manager_subplot.get_curve_manager(idx_subplot),
+                manager_axis=self.manager_subplot.get_axis_manager(idx_subplot)
+            )
             for idx_subplot in range(self.n_subplot)
         }
         
         # 时间轴UI组件（全局共享）
         self.xaxis_ui = XAxisUIComponents()
+        # 窗口统计UI组件（全局共享）
+        self.stats_ui = StatsUIComponents()
 
     def init_all_tabs(self):
         """初始化子图的设置标签页
@@ -131,25 +114,110 @@ class SidePanel(QWidget):
         self.widget_tab.setObjectName(str_name_widget_tab)
         
         # 1.通用设置
-        tab_general = QWidget()
-        self.widget_tab.addTab(tab_general,
-            self.tr("通用设置", 'f_config_general'))
+        tab_general = self._create_general_tab()
+        self.widget_tab.addTab(tab_general, "")
 
         # 2.时间设置标签页
         tab_time = self._create_xaxis_tab()
-        self.widget_tab.addTab(tab_time,
-            self.tr("时间设置", 'f_setting_time'))
+        self.widget_tab.addTab(tab_time, "")
         
         # 3.为每个子图创建单独的plot标签页
         for idx_subplot in range(self.n_subplot):
             tab_plot = self._create_plot_tab(idx_subplot)
-            self.widget_tab.addTab(tab_plot,
-                self.tr("子图{}", 'f_subplot').format(idx_subplot + 1))
+            self.widget_tab.addTab(tab_plot, "")
+        
+        # 4.窗口统计标签页
+        tab_stats = self._create_stats_tab()
+        self.widget_tab.addTab(tab_stats, "")
+        self._set_tab_titles()
         
         # 组织主布局
         layout_main.addWidget(self.widget_tab)
         self.setLayout(layout_main)
     
+    def _set_tab_titles(self):
+        """按当前语言设置标签页标题, 顺序与 init_all_tabs 添加的顺序一致"""
+        lst_str_title = [
+            self.tr("通用设置", 'f_config_general'),
+            self.tr("时间设置", 'f_setting_time'),
+            *(self.tr("子图{}", 'f_subplot').format(idx_subplot + 1) for idx_subplot in range(self.n_subplot)),
+            self.tr("统计", 'f_stats'),
+        ]
+        for idx_tab, str_title in enumerate(lst_str_title):
+            self.widget_tab.setTabText(idx_tab, str_title)
+    
+    def _get_str_catalog_summary(self) -> str:
+        """列目录概况的文字"""
+        return self.tr("共 {} 列, 其中常值或全空 {} 列", 'f_catalog_summary').format(
+            len(self.lst_name_col), len(self.column_catalog.get_names_trivial()))
+    
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.LanguageChange:
+            self.retranslate()
+        super().changeEvent(event)
+    
+    def retranslate(self):
+        """语言切换后重新翻译标签页标题、通用设置和统计表头"""
+        if self.widget_tab is None:
+            return
+        self._set_tab_titles()
+        self.checkbox_hide_trivial.setText(self.tr("隐藏常值和全空列", 'f_hide_trivial_columns'))
+        if self.label_catalog is not None:
+            self.label_catalog.setText(self._get_str_catalog_summary())
+        self.stats_ui.retranslate(self.tr)
+    
+    def _create_general_tab(self) -> QWidget:
+        """创建通用设置标签页"""
+        tab_general = QWidget()
+        layout_general = QVBoxLayout(tab_general)
+        # 隐藏常值和全空列
+        self.checkbox_hide_trivial = QCheckBox(self.tr("隐藏常值和全空列", 'f_hide_trivial_columns'))
+        self.checkbox_hide_trivial.setObjectName(f"{self._str_name}_checkbox_hide_trivial")
+        self.checkbox_hide_trivial.setChecked(self.bol_hide_trivial)
+        self.checkbox_hide_trivial.setEnabled(self.column_catalog is not None)
+        self.checkbox_hide_trivial.toggled.connect(self.set_hide_trivial_columns)
+        layout_general.addWidget(self.checkbox_hide_trivial)
+        # 列目录概况
+        if self.column_catalog is not None:
+            self.label_catalog = QLabel(self._get_str_catalog_summary())
+            layout_general.addWidget(self.label_catalog)
+        layout_general.addStretch()
+        return tab_general
+    
+    def set_hide_trivial_columns(self, bol_hide: bool):
+        """候选列中是否隐藏常值和全空列, 按列目录过滤后重建各子图的搜索索引"""
+        if self.column_catalog is None or bol_hide == self.bol_hide_trivial:
+            return
+        self.bol_hide_trivial = bol_hide
+        self._apply_search_index()
+    
+    def set_search_index(self, search_index: ColumnSearchIndex):
+        """
+        更换全部列的搜索索引(如切换语言或更换数据源后), 推送到各子图的候选列
+        
+        隐藏常值和全空列时按当前列目录和显示名称重新过滤
+        """
+        self.search_index_all = search_index
+        self._apply_search_index()
+    
+    def _apply_search_index(self):
+        """按是否隐藏常值和全空列确定共享的搜索索引, 并推送到各子图的候选列"""
+        if self.bol_hide_trivial and self.column_catalog is not None:
+            set_name_trivial = set(self.column_catalog.get_names_trivial())
+            lst_name_col = [name for name in self.lst_name_col if name not in set_name_trivial]
+            self.search_index = ColumnSearchIndex(lst_name_col, self.func_get_display_name)
+        else:
+            self.search_index = self.search_index_all
+        for subplot_ui in self.dic_ui_subplot.values():
+            if subplot_ui.curve_ui.selector_candidate:
+                subplot_ui.curve_ui.selector_candidate.set_search_index(self.search_index)
+    
+    def get_tooltip_col(self, str_name_col_actual: str) -> str:
+        """候选列的提示文字, 有列目录时附带列的类型和统计信息"""
+        if self.column_catalog is None:
+            return str_name_col_actual
+        return self.column_catalog.describe(str_name_col_actual)
+    
     def _create_xaxis_tab(self) -> QWidget:
         """创建xaxis用的时间设置标签页"""
         self.xaxis_ui.create_widgets(
@@ -162,6 +230,18 @@ class SidePanel(QWidget):
         )
         
         return self.xaxis_ui.get_main_widget()
+    
+    def _create_stats_tab(self) -> QWidget:
+        """创建当前时间窗口的统计标签页"""
+        self.stats_ui.create_widgets(
+            parent=self,
+            str_prefix_name=f"{self._str_name}_stats",
+            func_tr=self.tr
+        ).connect_signals(
+            on_threshold_changed=self.sig_stats_threshold_changed.emit
+        )
+        
+        return self.stats_ui.get_main_widget()
     def _create_plot_tab(self, idx_subplot: int) -> QWidget:
         """创建子图配置标签页"""
         subplot_ui = self.dic_ui_subplot[idx_subplot]
@@ -171,150 +251,148 @@ class SidePanel(QWidget):
             parent=self,
             name_prefix=f"{self._str_name}_subplot_{idx_subplot}",
             tr_func=self.tr,
-            lst_name_col=self.lst_name_col
+            lst_name_col=self.lst_name_col,
+            search_index=self.search_index,
+            func_get_display_name=self.func_get_display_name,
+            func_get_tooltip=self.get_tooltip_col
         ).connect_signals(
             on_add_axis=lambda: self.add_axis(idx_subplot),
-            on_curve_double_clicked=lambda name: self.add_curve(idx_subplot, name)
+            on_curve_double_clicked=lambda name: self.add_curve(idx_subplot, name),
+            on_curve_delete_requested=lambda name: self.remove_curve(idx_subplot, name)
         )
         
-        # 添加默认左侧主轴配置面板
-        self._add_axis_config_panel(
-            idx_subplot=idx_subplot,
-            str_name_axis=self.str_name_axis_left
-        )
+        # 按管理器的当前状态建立轴配置面板(至少有主轴)和曲线列表
+        self._sync_subplot_ui(idx_subplot)
         
         return subplot_ui.get_main_widget()
     
-    # 轴和曲线管理方法
+    # 轴和曲线管理方法, 修改都经过子图管理器的公共接口
     def add_axis(self, idx_subplot: int):
         """添加新轴"""
-        # 生成轴ID
-        lst_name_axis = list(self.dic_axisconfig_subplot[idx_subplot].keys())
-        str_name_axis = f"axis_{len(lst_name_axis)}"
+        axis_manager = self.manager_subplot.get_axis_manager(idx_subplot)
+        # 生成轴ID, 删除的轴保留配置, 按已初始化的轴计数不会重名
+        n_axis = axis_manager.count_axis_initialized()
+        while axis_manager.is_axis_initialized(f"axis_{n_axis}"):
+            n_axis += 1
+        str_name_axis = f"axis_{n_axis}"
         
         # 创建轴配置
         axisconfig = AxisConfig(
             str_name_axis=str_name_axis,
-            side_axis='right',
-            label=f"轴 {len(lst_name_axis)}",
-            color=QColor(100 + len(lst_name_axis) * 40, 100, 200)
+            side_axis=SideAxis.RIGHT,
+            str_label=f"轴 {n_axis}",
+            str_color=color_to_str(QColor(100 + n_axis * 40, 100, 200))
         )
-        
-        self.dic_axisconfig_subplot[idx_subplot][str_name_axis] = axisconfig
-        self._add_axis_config_panel(idx_subplot, str_name_axis)
-        
-        # 更新所有曲线的可用轴列表
-        self._update_all_available_axes(idx_subplot)
-        
-        self.sig_config_changed.emit()
+        axis_manager.add_axis(axisconfig)
     
-    def _add_axis_config_panel(self, idx_subplot: int, str_name_axis: str):
-        """添加轴配置面板"""
-        axisconfig = self.dic_axisconfig_subplot[idx_subplot][str_name_axis]
-        
+    def _add_axis_config_panel(self,
+        idx_subplot: int,
+        axisconfig: AxisConfig,
+        lst_name_axis_avail: List[str]
+    ):
+        """添加轴配置面板, 面板编辑的是配置的副本, 修改经轴管理器生效"""
+        str_name_axis = axisconfig.str_name_axis
         panel = AxisConfigPanel(
-            axis_config=axisconfig,
-            dic_axisconfig=self.dic_axisconfig_subplot[idx_subplot]
+            axisconfig=replace(axisconfig, set_name_col=set(axisconfig.set_name_col)),
+            lst_name_axis_avail=lst_name_axis_avail
         )
-        panel.sig_config_changed.connect(self.sig_config_changed.emit)
+        panel.sig_config_changed.connect(lambda: self.on_axis_config_changed(idx_subplot, str_name_axis))
         panel.sig_delete_requested.connect(lambda aid: self.remove_axis(idx_subplot, aid))
         
         # 使用yaxis_ui添加面板
         subplot_ui = self.dic_ui_subplot[idx_subplot]
-        add_separator = (str_name_axis != 'main')
-        subplot_ui.yaxis_ui.add_axis_panel(str_name_axis, panel, add_separator)
-        
-        # 保存引用
-        setattr(panel, '_axis_id', str_name_axis)
-        setattr(panel, '_plot_idx', idx_subplot)
+        subplot_ui.yaxis_ui.add_axis_panel(str_name_axis, panel, not axisconfig.bol_is_prim_axis)
+    
+    def on_axis_config_changed(self, idx_subplot: int, str_name_axis: str):
+        """轴配置面板编辑后, 将面板中的配置交给轴管理器"""
+        if self.bol_syncing_ui:
+            return
+        panel = self.dic_ui_subplot[idx_subplot].yaxis_ui.get_axis_panel(str_name_axis)
+        if panel is None:
+            return
+        # 面板会继续就地修改它的配置, 管理器中保存一份副本
+        axisconfig = replace(panel.axisconfig, set_name_col=set(panel.axisconfig.set_name_col))
+        self.manager_subplot.get_axis_manager(idx_subplot).update_axis_config(str_name_axis, axisconfig)
     
     def remove_axis(self, idx_subplot: int, str_name_axis: str):
-        """移除轴"""
-        if str_name_axis == 'main':
+        """移除轴, 该轴上的曲线移到主轴, 两步合并为一次撤销"""
+        axis_manager = self.manager_subplot.get_axis_manager(idx_subplot)
+        curve_manager = self.manager_subplot.get_curve_manager(idx_subplot)
+        if axis_manager.is_axis_primary(str_name_axis):
             return
         
-        # 删除配置
-        if str_name_axis in self.dic_axisconfig_subplot[idx_subplot]:
-            del self.dic_axisconfig_subplot[idx_subplot][str_name_axis]
-        
-        # 使用yaxis_ui删除面板
-        subplot_ui = self.dic_ui_subplot[idx_subplot]
-        subplot_ui.yaxis_ui.remove_axis_panel(str_name_axis)
-        
-        # 更新曲线的轴选择（将使用被删除轴的曲线改为主轴）
-        for str_name_col, curve_config in self.dic_curveconfig_subplot[idx_subplot].items():
-            if curve_config.str_name_axis == str_name_axis:
-                curve_config.str_name_axis = 'main'
-        
-        self._update_all_available_axes(idx_subplot)
-        self.sig_config_changed.emit()
+        with self.manager_subplot.compound_operation(f"删除Y轴 {str_name_axis}"):
+            for str_name_col in curve_manager.get_lst_name_col_by_axis(str_name_axis):
+                curve_manager.move_curve_to_axis(str_name_col, axis_manager.get_name_axis_main())
+            axis_manager.remove_axis(str_name_axis)
     
     def add_curve(self, idx_subplot: int, str_name_col_actual: str):
         """添加曲线"""
         if not str_name_col_actual:
             return
+        curve_manager = self.manager_subplot.get_curve_manager(idx_subplot)
         
         # 检查是否已添加
-        if str_name_col_actual in self.dic_added_cols_subplot[idx_subplot]:
-            print(f"子图{idx_subplot}已包含列 {str_name_col_actual}，无法重复添加")
+        if curve_manager.is_curve_added(str_name_col_actual):
             return
         
-        # 创建曲线配置
-        if str_name_col_actual not in self.dic_curveconfig_subplot[idx_subplot]:
-            colors = [
-                QColor(255, 0, 0), QColor(0, 255, 0), QColor(0, 0, 255),
-                QColor(255, 255, 0), QColor(255, 0, 255), QColor(0, 255, 255)
-            ]
-            color_idx = len(self.dic_curveconfig_subplot[idx_subplot]) % len(colors)
-            
-            curve_config = CurveConfig(
-                str_name_curve=str_name_col_actual,
-                idx_subplot=idx_subplot,
-                color=colors[color_idx]
-            )
-            self.dic_curveconfig_subplot[idx_subplot][str_name_col_actual] = curve_config
-        else:
-            curve_config = self.dic_curveconfig_subplot[idx_subplot][str_name_col_actual]
-        
-        # 记录入子图正在显示的列集合
-        self.dic_added_cols_subplot[idx_subplot].add(str_name_col_actual)
+        # 新曲线的默认外观, 已有配置(曾删除)时由管理器沿用原配置
+        colors = [
+            QColor(255, 0, 0), QColor(0, 255, 0), QColor(0, 0, 255),
+            QColor(255, 255, 0), QColor(255, 0, 255), QColor(0, 255, 255)
+        ]
+        color_idx = curve_manager.count_curve_initialized() % len(colors)
         
-        # 创建UI组件
-        widget = CurveConfigPanel(
-            curve_config=curve_config,
-            dic_axisconfig=self.dic_axisconfig_subplot[idx_subplot]
+        # 布尔/开关量默认按阶梯线绘制
+        stats = self.column_catalog.get_stats(str_name_col_actual) if self.column_catalog else None
+        curve_manager.add_curve(
+            str_name_col_actual,
+            str_color=color_to_str(colors[color_idx]),
+            bol_is_step=stats is not None and stats.bol_boolean
         )
-        widget.sig_config_changed.connect(self.sig_config_changed.emit)
-        widget.sig_delete_requested.connect(lambda name: self.remove_curve(idx_subplot, name))
-        
-        # 使用curve_ui添加面板
-        subplot_ui = self.dic_ui_subplot[idx_subplot]
-        subplot_ui.curve_ui.add_curve_panel(widget)
-        
-        self.sig_config_changed.emit()
     
     def remove_curve(self, idx_subplot: int, str_name_col_actual: str):
-        """移除曲线"""
-        # 从集合中删除
-        self.dic_added_cols_subplot[idx_subplot].discard(str_name_col_actual)
+        """移除曲线, 配置保留以便重新添加时沿用"""
+        self.manager_subplot.get_curve_manager(idx_subplot).remove_curve(str_name_col_actual)
+    
+    @Slot(object)
+    def on_subplot_changes(self, dic_kind_subplot: Dict[int, ChangeKind]):
+        """子图管理器合并后的变更(含撤销、加载会话), 按管理器的状态刷新对应子图的界面"""
+        for idx_subplot in dic_kind_subplot:
+            if idx_subplot in self.dic_ui_subplot:
+                self._sync_subplot_ui(idx_subplot)
+    
+    def _sync_subplot_ui(self, idx_subplot: int):
+        """
+        按管理器的状态同步子图的轴配置面板和曲线列表
         
-        # 使用curve_ui从UI删除
+        同步期间面板发出的修改信号被忽略, 不会再写回管理器
+        """
+        axis_manager = self.manager_subplot.get_axis_manager(idx_subplot)
+        curve_manager = self.manager_subplot.get_curve_manager(idx_subplot)
         subplot_ui = self.dic_ui_subplot[idx_subplot]
-        subplot_ui.curve_ui.remove_curve_panel(str_name_col_actual)
+        yaxis_ui = subplot_ui.yaxis_ui
+        lst_name_axis = axis_manager.get_lst_name_axis_all_added()
         
-        self.sig_config_changed.emit()
-    
-    def _update_all_available_axes(self, idx_subplot: int):
-        """更新所有组件的可用轴列表"""
-        subplot_ui = self.dic_ui_subplot[idx_subplot]
-        if not subplot_ui.curve_ui.layout_existing:
-            return
-            
-        # 遍历所有曲线面板
-        for i in range(subplot_ui.curve_ui.layout_existing.count()):
-            widget = subplot_ui.curve_ui.layout_existing.itemAt(i).widget()
-            if isinstance(widget, CurveConfigPanel):
-                widget.refresh_available_axes()
+        self.bol_syncing_ui = True
+        try:
+            # 1.删除已不存在的轴的面板
+            for str_name_axis in [name for name in yaxis_ui.dic_axis_panels if name not in lst_name_axis]:
+                yaxis_ui.remove_axis_panel(str_name_axis)
+            # 2.新增的轴添加面板, 已有面板的配置或可选轴变化时重新加载
+            for str_name_axis in lst_name_axis:
+                axisconfig = axis_manager.get_axisconfig(str_name_axis)
+                panel = yaxis_ui.get_axis_panel(str_name_axis)
+                if panel is None:
+                    self._add_axis_config_panel(idx_subplot, axisconfig, lst_name_axis)
+                elif panel.axisconfig != axisconfig or panel.lst_name_axis_avail != lst_name_axis:
+                    panel.axisconfig = replace(axisconfig, set_name_col=set(axisconfig.set_name_col))
+                    panel.lst_name_axis_avail = lst_name_axis
+                    panel.load_config_to_ui()
+            # 3.曲线列表
+            subplot_ui.curve_ui.sync_curves(curve_manager.get_lst_name_col_all_added())
+        finally:
+            self.bol_syncing_ui = False
     
     def _on_span_unit_changed(self, index: int):
         """时间段单位改变时的回调"""
@@ -334,16 +412,13 @@ class SidePanel(QWidget):
         self.sig_xaxis_time_changed.emit(flt_start, flt_start + flt_duration)
     
     def update_time_range(self, start: float, end: float):
-        """从外部更新时间范围"""
-        self.xaxis_ui.set_time_range(start, end)
+        """从外部更新时间范围, 与 sig_xaxis_time_changed 一致按秒时间戳换算为日期时间"""
+        self.xaxis_ui.set_time_range(datetime.fromtimestamp(start), datetime.fromtimestamp(end))
     
-    def get_plot_axes(self, idx_subplot: int) -> Dict[str, AxisConfig]:
-        """获取子图的轴配置"""
-        return self.dic_axisconfig_subplot[idx_subplot]
+    def get_stats_threshold(self) -> float:
+        """获取统计用的阈值"""
+        return self.stats_ui.get_threshold()
     
-    def get_plot_curves(self, idx_subplot: int) -> List[CurveConfig]:
-        """获取子图的曲线配置"""
-        return [
-            c for c in self.dic_curveconfig_subplot[idx_subplot].values() 
-            if hasattr(c, 'enabled') and c.enabled
-        ]
+    def update_stats(self, lst_row: List[Tuple[str, ...]]):
+        """从外部刷新统计表格"""
+        self.stats_ui.set_rows(lst_row)
@@ -6,6 +6,7 @@ from .subplot_ui import SubplotUIComponents
 from .curve_ui import CurveUIComponents
 from .yaxis_ui import YAxisUIComponents
 from .xaxis_ui import XAxisUIComponents
+from .stats_ui import StatsUIComponents
 
 __all__ = [
     'BaseUIComponents',
@@ -13,4 +14,5 @@ __all__ = [
     'CurveUIComponents', 
     'YAxisUIComponents',
     'XAxisUIComponents',
+    'StatsUIComponents',
 ]
\ No newline at end of file
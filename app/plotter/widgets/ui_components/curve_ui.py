@@ -1,38 +1,44 @@
 #!/usr/bin/env python3
 
 """曲线管理 UI 组件"""
-from typing import Optional, List, Callable, TYPE_CHECKING
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QListWidget, QGroupBox, QLabel
+from typing import Optional, List, Callable
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QGroupBox, QLabel, QTreeView, QMenu,
+    QAbstractItemView, QHeaderView
+)
+from PySide6.QtCore import Qt, QPoint
+from PySide6.QtGui import QKeySequence, QShortcut
 
 from .base import BaseUIComponents
-
-if TYPE_CHECKING:
-    from app.plotter.widgets.curveconfigpanel import CurveConfigPanel
-
-from app.plotter.widgets.curveconfigpanel import CurveConfigPanel
+from app.plotter.enums.plotenum import IdxColCurveList
+from app.plotter.columnsearchindex import ColumnSearchIndex
+from app.plotter.widgets.columnpickerwidget import ColumnPickerWidget
+from app.plotter.widgets.curvelistmodel import CurveListModel
+from app.plotter.widgets.curveitemdelegate import CurveItemDelegate
 
 
 class CurveUIComponents(BaseUIComponents):
     """
     曲线管理相关的 UI 组件容器
     
-    管理曲线配置面板的布局和交互组件：
+    管理曲线列表的布局和交互组件：
     - 候选曲线选择器
-    - 已有曲线容器
-    - 曲线配置面板的添加/移除
+    - 已有曲线列表(model/view, 只绘制可见行, 编辑器按需创建)
     
     Attributes:
-        container_existing: 已有曲线的容器 Widget
-        layout_existing: 已有曲线容器的布局
-        selector_candidate: 候选曲线的列表选择器
+        selector_candidate: 候选曲线的选择器, 输入即过滤
+        model_curve: 已有曲线的列表模型
+        view_curve: 已有曲线的列表视图
         groupbox: 曲线管理的分组框
     """
     
     def __init__(self):
-        self.container: Optional[QWidget] = None
-        self.layout: Optional[QVBoxLayout] = None
-        self.selector_candidate: Optional[QListWidget] = None
+        self.selector_candidate: Optional[ColumnPickerWidget] = None
+        self.model_curve: Optional[CurveListModel] = None
+        self.view_curve: Optional[QTreeView] = None
         self.groupbox: Optional[QGroupBox] = None
+        # 删除曲线的回调, 参数为实际列名
+        self._func_on_delete: Optional[Callable[[str], None]] = None
         pass
     
     def create_widgets(self,
@@ -50,12 +56,18 @@ class CurveUIComponents(BaseUIComponents):
             tr_func: 翻译函数
             **kwargs: 支持以下参数:
                 - lst_name_col: 可用的列名列表
+                - search_index: 共享的列名搜索索引, 为None时由lst_name_col建立
+                - manager_curve: 子图的曲线管理器
+                - manager_axis: 子图的轴管理器
+                - func_get_display_name: 实际列名 -> 显示列名
+                - func_get_tooltip: 实际列名 -> 候选列的提示文字
             
         Returns:
             self，支持链式调用
         """
         func_tr = func_tr or (lambda text, ctx='': text)
         lst_name_col = kwargs.get('lst_name_col', [])
+        search_index = kwargs.get('search_index') or ColumnSearchIndex(lst_name_col)
         
         # 创建分组框
         self.groupbox = QGroupBox(func_tr("曲线管理", 'f_curve_manager'), parent)
@@ -64,46 +76,87 @@ class CurveUIComponents(BaseUIComponents):
         
         # 1. 创建候选曲线选择器
         label_candidate = QLabel(func_tr("-- 可添加曲线 --", 'f_add_curve_candidate'))
-        self.selector_candidate = QListWidget()
-        self.selector_candidate.setMaximumHeight(150)
+        self.selector_candidate = ColumnPickerWidget(
+            search_index, func_get_tooltip=kwargs.get('func_get_tooltip'))
+        self.selector_candidate.setMaximumHeight(200)
         self.selector_candidate.setObjectName(f"{str_prefix_name}_selector")
         
-        # 添加列名
-        for str_name_col in lst_name_col:
-            self.selector_candidate.addItem(str_name_col)
-        
         boxlayout_manager.addWidget(label_candidate)
         boxlayout_manager.addWidget(self.selector_candidate)
         
-        # 2. 创建已有曲线容器
+        # 2. 创建已有曲线列表
         label = QLabel(func_tr("-- 已有曲线 --", 'f_curves_existing'))
-        self.container = QWidget()
-        self.layout = QVBoxLayout()
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.container.setLayout(self.layout)
+        self.model_curve = CurveListModel(
+            manager_curve=kwargs['manager_curve'],
+            manager_axis=kwargs['manager_axis'],
+            func_get_display_name=kwargs.get('func_get_display_name'),
+            parent=self.groupbox
+        )
+        self.view_curve = self._create_view_curve(str_prefix_name, func_tr)
         
         boxlayout_manager.addWidget(label)
-        boxlayout_manager.addWidget(self.container)
+        boxlayout_manager.addWidget(self.view_curve)
         
         self.groupbox.setLayout(boxlayout_manager)
         return self
     
+    def _create_view_curve(self,
+        str_prefix_name: str,
+        func_tr: Callable[[str, str], str]
+    ) -> QTreeView:
+        """
+        创建已有曲线的列表视图
+        
+        QTreeView 在行高一致时只布局可见行, 作为多列列表使用
+        """
+        view_curve = QTreeView()
+        view_curve.setObjectName(f"{str_prefix_name}_view")
+        view_curve.setModel(self.model_curve)
+        view_curve.setItemDelegate(CurveItemDelegate(view_curve))
+        view_curve.setRootIsDecorated(False)
+        view_curve.setUniformRowHeights(True)
+        view_curve.setAlternatingRowColors(True)
+        view_curve.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        view_curve.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.SelectedClicked
+        )
+        header = view_curve.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(IdxColCurveList.NAME.value, QHeaderView.ResizeMode.Stretch)
+        # 右键菜单与Delete键删除曲线
+        view_curve.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        view_curve.customContextMenuRequested.connect(
+            lambda point: self._on_context_menu(point, func_tr))
+        shortcut_delete = QShortcut(QKeySequence.StandardKey.Delete, view_curve)
+        shortcut_delete.setContext(Qt.ShortcutContext.WidgetShortcut)
+        shortcut_delete.activated.connect(self._on_delete_selected)
+        return view_curve
+    
     def connect_signals(self, **callbacks) -> 'CurveUIComponents':
         """
         连接信号到回调函数
         
         Args:
             **callbacks: 支持以下回调:
-                - on_curve_double_clicked: 双击候选曲线时的回调，参数为曲线名称
+                - on_curve_double_clicked: 双击或回车选中候选曲线时的回调，参数为实际列名
+                - on_curve_config_changed: 列表中编辑曲线配置后的回调，参数为实际列名
+                - on_curve_delete_requested: 请求删除曲线时的回调，参数为实际列名
                 
         Returns:
             self, 支持链式调用
         """
         if on_double_clicked := callbacks.get('on_curve_double_clicked'):
             if self.selector_candidate:
-                self.selector_candidate.itemDoubleClicked.connect(
-                    lambda item: on_double_clicked(item.text())
-                )
+                self.selector_candidate.sig_column_picked.connect(on_double_clicked)
+        
+        if on_config_changed := callbacks.get('on_curve_config_changed'):
+            if self.model_curve:
+                self.model_curve.sig_config_changed.connect(on_config_changed)
+        
+        if on_delete_requested := callbacks.get('on_curve_delete_requested'):
+            self._func_on_delete = on_delete_requested
         
         return self
     
@@ -111,24 +164,23 @@ class CurveUIComponents(BaseUIComponents):
         """获取主widget（分组框）"""
         return self.groupbox
     
-    def add_curve_to_panel(self, panel: 'CurveConfigPanel') -> bool:
+    def add_curve(self, str_name_col: str) -> bool:
         """
-        添加曲线配置面板到容器
+        在列表中添加曲线, 配置需已在子图曲线配置字典中
         
         Args:
-            panel: 曲线配置面板实例
+            str_name_col: 曲线名称（实际列名）
             
         Returns:
             是否成功添加
         """
-        if not self.layout:
+        if not self.model_curve:
             return False
-        self.layout.addWidget(panel)
-        return True
+        return self.model_curve.add_curve(str_name_col)
     
-    def remove_curve_in_panel(self, str_name_col: str) -> bool:
+    def remove_curve(self, str_name_col: str) -> bool:
         """
-        移除指定曲线的配置面板
+        从列表中移除指定曲线
         
         Args:
             str_name_col: 曲线名称（实际列名）
@@ -136,52 +188,62 @@ class CurveUIComponents(BaseUIComponents):
         Returns:
             是否成功移除
         """
-        if not self.layout:
+        if not self.model_curve:
             return False
-            
-        for i in range(self.layout.count()):
-            widget = self.layout.itemAt(i).widget()
-            if self._is_target_panel(widget, str_name_col):
-                self.layout.removeWidget(widget)
-                widget.deleteLater()
-                return True
-        return False
-    
-    def find_curve_in_panel(self, str_name_col: str) -> Optional['CurveConfigPanel']:
+        return self.model_curve.remove_curve(str_name_col)
+    
+    def sync_curves(self, lst_name_col: List[str]):
         """
-        查找指定曲线的配置面板
+        按曲线管理器中已添加的曲线同步列表
         
         Args:
-            str_name_col: 曲线名称
-            
-        Returns:
-            找到的面板实例，未找到返回 None
+            lst_name_col: 已添加曲线的实际列名, 顺序即行序
         """
-        if not self.layout:
+        if self.model_curve:
+            self.model_curve.sync_curves(lst_name_col)
+        return
+    
+    def has_curve(self, str_name_col: str) -> bool:
+        """列表中是否已有指定曲线"""
+        return bool(self.model_curve) and str_name_col in self.model_curve.lst_name_curve
+    
+    def refresh_axes(self):
+        """Y轴增删后刷新曲线的轴列"""
+        if self.model_curve:
+            self.model_curve.refresh_axes()
+        return
+    
+    def clear_all_panels(self):
+        """清空曲线列表"""
+        if self.model_curve:
+            self.model_curve.set_curves([])
+        return
+    
+    def _get_name_curve_selected(self) -> Optional[str]:
+        """当前选中行的实际列名"""
+        if not self.view_curve:
             return None
-            
-        for i in range(self.layout.count()):
-            widget = self.layout.itemAt(i).widget()
-            if self._is_panel_for_curve(widget, str_name_col):
-                return widget
-        return None
-    
-    def clear_curves_in_panel(self):
-        """清空所有曲线配置面板"""
-        if not self.layout:
-            return
-            
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if widget := item.widget():
-                widget.deleteLater()
+        curveconfig = self.model_curve.get_curveconfig(self.view_curve.currentIndex())
+        return curveconfig.str_name_curve if curveconfig else None
+    
+    def _on_delete_selected(self):
+        """删除当前选中的曲线"""
+        str_name_col = self._get_name_curve_selected()
+        if str_name_col and self._func_on_delete:
+            self._func_on_delete(str_name_col)
         return
     
-    @staticmethod
-    def _is_panel_for_curve(widget, str_name_col: str) -> bool:
-        """
-        检查 widget 是否是目标曲线面板
-        """
-        return (
-            isinstance(widget, CurveConfigPanel) and 
-                widget.curve_config.str_name_curve == str_name_col)
+    def _on_context_menu(self,
+        point: QPoint,
+        func_tr: Callable[[str, str], str]
+    ):
+        """已有曲线列表的右键菜单"""
+        index = self.view_curve.indexAt(point)
+        if not index.isValid():
+            return
+        self.view_curve.setCurrentIndex(index)
+        menu = QMenu(self.view_curve)
+        action_delete = menu.addAction(func_tr("删除曲线", 'f_delete_curve'))
+        action_delete.triggered.connect(self._on_delete_selected)
+        menu.exec(self.view_curve.viewport().mapToGlobal(point))
+        return
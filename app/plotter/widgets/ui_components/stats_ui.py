@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+"""窗口统计 UI 组件"""
+from typing import Optional, Callable, List, Tuple, override
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QFormLayout, QDoubleSpinBox, QLabel,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PySide6.QtCore import Qt
+
+from .base import BaseUIComponents
+
+
+class StatsUIComponents(BaseUIComponents):
+    """
+    当前时间窗口内曲线统计的 UI 组件容器
+
+    管理统计标签页的UI组件：
+    - 阈值输入框, 用于计算超过阈值的时长(对所有曲线使用同一阈值)
+    - 统计表格, 每行一条可见曲线
+
+    Attributes:
+        widget_tab: 统计标签页 Widget
+        spin_threshold: 阈值输入框
+        label_threshold: 阈值标签
+        table_stats: 统计表格
+    """
+
+    def __init__(self):
+        # UI组件引用
+        self.widget_tab: Optional[QWidget] = None
+        self.spin_threshold: Optional[QDoubleSpinBox] = None
+        self.label_threshold: Optional[QLabel] = None
+        self.table_stats: Optional[QTableWidget] = None
+        pass
+
+    @override
+    def create_widgets(self,
+        parent: Optional[QWidget] = None,
+        str_prefix_name: str = "stats",
+        func_tr: Optional[Callable[[str, str], str]] = None,
+        **kwargs
+    ) -> 'StatsUIComponents':
+        """
+        创建统计UI组件
+
+        Args:
+            parent: 父widget
+            str_prefix_name: 组件名称前缀
+            func_tr: 翻译函数
+
+        Returns:
+            self，支持链式调用
+        """
+        func_tr = func_tr or (lambda text, ctx='': text)
+
+        # 创建主widget
+        self.widget_tab = QWidget(parent)
+        self.widget_tab.setObjectName(f"{str_prefix_name}_tab")
+        layout = QVBoxLayout(self.widget_tab)
+
+        # 阈值输入框
+        self.spin_threshold = QDoubleSpinBox()
+        self.spin_threshold.setObjectName(f"{str_prefix_name}_spin_threshold")
+        self.spin_threshold.setRange(-1e12, 1e12)
+        self.spin_threshold.setDecimals(3)
+        self.spin_threshold.setKeyboardTracking(False)
+        layout_form = QFormLayout()
+        self.label_threshold = QLabel(func_tr("阈值: ", 'f_stats_threshold'))
+        layout_form.addRow(self.label_threshold, self.spin_threshold)
+        layout.addLayout(layout_form)
+
+        # 统计表格
+        lst_str_header = self._get_lst_str_header(func_tr)
+        self.table_stats = QTableWidget(0, len(lst_str_header))
+        self.table_stats.setObjectName(f"{str_prefix_name}_table")
+        self.table_stats.setHorizontalHeaderLabels(lst_str_header)
+        self.table_stats.verticalHeader().setVisible(False)
+        self.table_stats.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table_stats.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table_stats)
+        return self
+
+    @staticmethod
+    def _get_lst_str_header(func_tr: Callable[[str, str], str]) -> List[str]:
+        """按当前语言生成表头, 顺序与 set_rows 的单元格一致"""
+        return [
+            func_tr("子图", 'f_stats_subplot'),
+            func_tr("曲线", 'f_stats_curve'),
+            func_tr("最小值", 'f_stats_min'),
+            func_tr("最大值", 'f_stats_max'),
+            func_tr("均值", 'f_stats_mean'),
+            func_tr("标准差", 'f_stats_std'),
+            func_tr("积分", 'f_stats_integral'),
+            func_tr("超阈时长", 'f_stats_time_above'),
+        ]
+
+    def retranslate(self, func_tr: Callable[[str, str], str]):
+        """语言切换后重新翻译阈值标签和表头"""
+        if not self.table_stats:
+            return
+        self.label_threshold.setText(func_tr("阈值: ", 'f_stats_threshold'))
+        self.table_stats.setHorizontalHeaderLabels(self._get_lst_str_header(func_tr))
+
+    @override
+    def connect_signals(self, **callbacks) -> 'StatsUIComponents':
+        """
+        连接信号
+
+        Args:
+            **callbacks: 回调函数字典
+                - on_threshold_changed: 阈值改变时的回调, 参数为新阈值
+
+        Returns:
+            self，支持链式调用
+        """
+        if on_threshold_changed := callbacks.get('on_threshold_changed'):
+            if self.spin_threshold:
+                self.spin_threshold.valueChanged.connect(on_threshold_changed)
+        return self
+
+    @override
+    def get_main_widget(self) -> Optional[QWidget]:
+        """获取统计标签页"""
+        return self.widget_tab
+
+    def get_threshold(self) -> float:
+        """获取当前阈值"""
+        return self.spin_threshold.value() if self.spin_threshold else 0.0
+
+    def set_rows(self,
+        lst_row: List[Tuple[str, ...]]
+    ):
+        """
+        刷新统计表格
+
+        Args:
+            lst_row: 每行为已格式化的单元格文本元组, 顺序与表头一致
+        """
+        if not self.table_stats:
+            return
+        if self.table_stats.rowCount() != len(lst_row):
+            self.table_stats.setRowCount(len(lst_row))
+        for idx_row, tpl_text in enumerate(lst_row):
+            for idx_col, str_text in enumerate(tpl_text):
+                item = self.table_stats.item(idx_row, idx_col)
+                if item is None:
+                    item = QTableWidgetItem()
+                    # 数值列右对齐
+                    align_h = Qt.AlignmentFlag.AlignRight if idx_col >= 2 else Qt.AlignmentFlag.AlignLeft
+                    item.setTextAlignment(align_h | Qt.AlignmentFlag.AlignVCenter)
+                    self.table_stats.setItem(idx_row, idx_col, item)
+                if item.text() != str_text:
+                    item.setText(str_text)
+        return
@@ -4,6 +4,9 @@
 from typing import Optional, Callable
 from PySide6.QtWidgets import QWidget, QScrollArea, QGroupBox, QVBoxLayout
 
+from app.plotter.managers.axismanager import AxisManager
+from app.plotter.managers.curvemanager import CurveManager
+
 from .base import BaseUIComponents
 from .curve_ui import CurveUIComponents
 from .yaxis_ui import YAxisUIComponents
@@ -20,6 +23,8 @@ class SubplotUIComponents(BaseUIComponents):
     
     Attributes:
         idx_subplot: 子图索引
+        manager_curve: 子图的曲线管理器
+        manager_axis: 子图的轴管理器
         curve_ui: 曲线管理 UI 组件
         yaxis_ui: Y轴管理 UI 组件
         tab_widget: 标签页 Widget
@@ -28,12 +33,18 @@ class SubplotUIComponents(BaseUIComponents):
         groupbox_curve: 曲线管理分组框
     """
     
-    def __init__(self, idx_subplot: int):
+    def __init__(self,
+        idx_subplot: int,
+        manager_curve: CurveManager,
+        manager_axis: AxisManager
+    ):
         self.idx_subplot = idx_subplot
+        self.manager_curve = manager_curve
+        self.manager_axis = manager_axis
         
         # 组件级别的 UI 管理
         self.curve_ui = CurveUIComponents()
-        self.yaxis_ui = YAxisUIComponents()
+        self.yaxis_ui = YAxisUIComponents(parent=None, manager_axis=manager_axis)
         
         # 子图级别的容器
         self.tab_widget: Optional[QWidget] = None
@@ -55,12 +66,16 @@ class SubplotUIComponents(BaseUIComponents):
             tr_func: 翻译函数
             **kwargs: 支持以下参数:
                 - lst_name_col: 可用的列名列表
+                - search_index: 共享的列名搜索索引
+                - func_get_display_name: 实际列名 -> 显示列名
+                - func_get_tooltip: 实际列名 -> 候选列的提示文字
                 
         Returns:
             self，支持链式调用
         """
         tr = tr_func or (lambda text, ctx='': text)
         lst_name_col = kwargs.get('lst_name_col', [])
+        search_index = kwargs.get('search_index')
         
         # 创建主标签页widget
         self.tab_widget = QWidget(parent)
@@ -85,9 +100,14 @@ class SubplotUIComponents(BaseUIComponents):
         # 创建曲线管理UI
         self.curve_ui.create_widgets(
             parent=widget_scroll,
-            name_prefix=f"{name_prefix}_curve",
-            tr_func=tr,
-            lst_name_col=lst_name_col
+            str_prefix_name=f"{name_prefix}_curve",
+            func_tr=tr,
+            lst_name_col=lst_name_col,
+            search_index=search_index,
+            manager_curve=self.manager_curve,
+            manager_axis=self.manager_axis,
+            func_get_display_name=kwargs.get('func_get_display_name'),
+            func_get_tooltip=kwargs.get('func_get_tooltip')
         )
         self.groupbox_curve = self.curve_ui.groupbox
         layout_scroll.addWidget(self.curve_ui.get_main_widget())
@@ -111,6 +131,8 @@ class SubplotUIComponents(BaseUIComponents):
             **callbacks: 支持以下回调:
                 - on_add_axis: 添加Y轴时的回调
                 - on_curve_double_clicked: 双击曲线时的回调
+                - on_curve_config_changed: 曲线配置改变时的回调
+                - on_curve_delete_requested: 请求删除曲线时的回调
                 
         Returns:
             self，支持链式调用
@@ -120,8 +142,12 @@ class SubplotUIComponents(BaseUIComponents):
             self.yaxis_ui.connect_signals(on_add_axis=on_add_axis)
         
         # 连接曲线相关信号
-        if on_curve_double_clicked := callbacks.get('on_curve_double_clicked'):
-            self.curve_ui.connect_signals(on_curve_double_clicked=on_curve_double_clicked)
+        self.curve_ui.connect_signals(**{
+            str_name_callback: callbacks[str_name_callback]
+            for str_name_callback in (
+                'on_curve_double_clicked', 'on_curve_config_changed', 'on_curve_delete_requested')
+            if callbacks.get(str_name_callback)
+        })
         
         return self
     
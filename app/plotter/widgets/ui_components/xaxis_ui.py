@@ -421,7 +421,7 @@ class XAxisUIComponents(BaseUIComponents):
         )
         
         # 根据当前单位计算跨度值
-        str_unit_datetime = self.get_timedelta_unit_span()
+        str_unit_datetime = self.get_unit_span_timedelta()
         
         # 使用relativedelta计算时间差
         delta = relativedelta(ts_timestamp_end, ts_timestamp_start)
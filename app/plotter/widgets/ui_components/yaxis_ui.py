@@ -124,7 +124,7 @@ class YAxisUIComponents(BaseUIComponents):
             return False
         
         # 添加分隔线（非主轴）
-        if bol_add_separator and self.manager_axis.is_axis_primary(str_name_axis):
+        if bol_add_separator and not self.manager_axis.is_axis_primary(str_name_axis):
             separator = self._create_separator()
             self.layout.addWidget(separator)
         
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+基准: 以每批10条的方式向 CurveManager 添加1000条曲线
+
+每批在一个带快照的原子操作中完成, 对比写时复制快照与逐条深复制快照的耗时
+
+    python -m app.test.bench_curvemanager
+"""
+
+import time
+from copy import deepcopy
+
+from PySide6.QtCore import QCoreApplication
+
+from app.plotter.managers import SubplotManager
+
+N_CURVE = 1000
+N_SIZE_BATCH = 10
+
+
+def bench_add_curves(
+    bol_deepcopy: bool
+) -> float:
+    """
+    添加 N_CURVE 条曲线, 返回总耗时(秒)
+
+    Args:
+        bol_deepcopy: 是否改用逐条深复制配置的快照(旧实现)
+    """
+    manager_subplot = SubplotManager(n_subplot=1)
+    curve_manager = manager_subplot.get_curve_manager(0)
+    if bol_deepcopy:
+        curve_manager._get_state_snapshot = lambda: {
+            'dic_curveconfig': {k: deepcopy(v) for k, v in curve_manager.dic_curveconfig.items()},
+            'set_added_cols': curve_manager.set_added_cols.copy(),
+        }
+    lst_name_col = [f"col_{idx:04d}" for idx in range(N_CURVE)]
+    flt_time_start = time.perf_counter()
+    for idx_start in range(0, N_CURVE, N_SIZE_BATCH):
+        with curve_manager._atomic_operation(bol_snapshot=True):
+            curve_manager.add_curves(lst_name_col[idx_start:idx_start + N_SIZE_BATCH])
+    flt_time_used = time.perf_counter() - flt_time_start
+    assert curve_manager.count_curve_added() == N_CURVE
+    return flt_time_used
+
+
+def main():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    print(f"添加 {N_CURVE} 条曲线, 每批 {N_SIZE_BATCH} 条")
+    print("写时复制快照: {:.4f}s".format(bench_add_curves(bol_deepcopy=False)))
+    print("深复制快照:   {:.4f}s".format(bench_add_curves(bol_deepcopy=True)))
+    return
+
+
+if __name__ == '__main__':
+    main()
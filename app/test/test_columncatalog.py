@@ -0,0 +1,123 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from code_source.polars_toolkits.schema_toolkits.columncatalog import ColumnCatalog
+from code_source.polars_toolkits.schema_toolkits.datasetdescriptor import DatasetDescriptor
+
+T0 = datetime(2024, 1, 1)
+
+
+def make_lf():
+    return pl.DataFrame({
+        "time": [T0 + timedelta(seconds=n) for n in range(6)],
+        "value": [1.0, 2.0, None, 4.0, 5.0, 6.0],
+        "switch": [0, 1, 1, 0, None, 1],
+        "flag": [True, False, True, True, False, None],
+        "constant": [3.0] * 6,
+        "empty": pl.Series([None] * 6, dtype=pl.Float64),
+        "label": ["a", "b", "a", None, "c", "a"],
+    }).lazy()
+
+
+def test_descriptor_reads_schema():
+    descriptor = DatasetDescriptor.from_lazyframe(make_lf())
+    assert descriptor.str_name_col_timestamp == "time"
+    assert descriptor.lst_name_col_data == ["value", "switch", "flag", "constant", "empty", "label"]
+    assert descriptor.str_time_unit == "us"
+    assert descriptor.str_time_zone is None
+    assert descriptor.bol_timestamp_temporal
+    assert descriptor.is_numeric("value") and descriptor.is_numeric("flag")
+    assert not descriptor.is_numeric("label") and not descriptor.is_numeric("missing")
+    assert descriptor.get_dtype("label") == pl.String
+
+
+def test_descriptor_numeric_timestamp_and_rebuild():
+    lf = pl.DataFrame({"value": [1.0], "hours": [0.5]}).lazy()
+    descriptor = DatasetDescriptor.from_lazyframe(lf, "hours")
+    assert descriptor.lst_name_col_data == ["value"]
+    assert descriptor.str_time_unit is None and not descriptor.bol_timestamp_temporal
+
+    rebuilt = descriptor.rebuild(lf.with_columns(pl.lit(2).alias("extra")))
+    assert rebuilt.n_version == 1
+    assert rebuilt.str_name_col_timestamp == "hours"
+    assert rebuilt.lst_name_col_data == ["value", "extra"]
+
+    with pytest.raises(KeyError):
+        DatasetDescriptor.from_lazyframe(lf, "missing")
+
+
+def test_catalog_stats():
+    catalog = ColumnCatalog.build(make_lf())
+    value = catalog.get_stats("value")
+    assert (value.n_row, value.n_null) == (6, 1)
+    assert (value.flt_min, value.flt_max, value.flt_mean) == (1.0, 6.0, 3.6)
+    assert value.ts_first_valid == T0
+    assert value.ts_last_valid == T0 + timedelta(seconds=5)
+    assert not value.bol_boolean and not value.bol_trivial
+
+    assert catalog.get_stats("switch").bol_boolean
+    assert catalog.get_stats("flag").bol_boolean
+    assert catalog.get_stats("label").flt_min is None
+    assert catalog.get_stats("label").n_distinct_est == 3
+    assert catalog.get_stats("empty").bol_all_null
+    # the last valid value of a column, not of the data
+    assert catalog.get_stats("flag").ts_last_valid == T0 + timedelta(seconds=4)
+    assert catalog.get_stats("missing") is None
+
+
+def test_catalog_hides_trivial_columns():
+    catalog = ColumnCatalog.build(make_lf())
+    assert catalog.get_names_trivial() == ["constant", "empty"]
+    assert catalog.get_names_data(bol_hide_trivial=True) == ["value", "switch", "flag", "label"]
+    assert "time" not in catalog.get_names_data()
+    assert "常值" in catalog.describe("constant")
+    assert "全部为空" in catalog.describe("empty")
+
+
+def test_catalog_dict_round_trip():
+    catalog = ColumnCatalog.build(make_lf())
+    restored = ColumnCatalog.from_dict(json.loads(json.dumps(catalog.to_dict())))
+    assert restored.lst_name_col == catalog.lst_name_col
+    assert restored.dic_stats == catalog.dic_stats
+    assert restored.str_dtype_timestamp == catalog.str_dtype_timestamp
+
+    dic_catalog = catalog.to_dict()
+    dic_catalog["n_version"] += 1
+    with pytest.raises(ValueError):
+        ColumnCatalog.from_dict(dic_catalog)
+
+
+def test_load_or_build_uses_file_until_source_changes(tmp_path, monkeypatch):
+    path_source = tmp_path / "data.parquet"
+    make_lf().collect().write_parquet(path_source)
+    lf = pl.scan_parquet(path_source)
+
+    catalog = ColumnCatalog.load_or_build(lf, path_source)
+    path_catalog = ColumnCatalog.get_path_catalog(path_source)
+    assert path_catalog.name == "data.parquet.colcatalog.json"
+    assert path_catalog.exists()
+
+    lst_built = []
+    build = ColumnCatalog.build.__func__
+    monkeypatch.setattr(ColumnCatalog, "build", classmethod(
+        lambda cls, *args, **kwargs: lst_built.append(1) or build(cls, *args, **kwargs)))
+    cached = ColumnCatalog.load_or_build(lf, path_source)
+    assert not lst_built
+    assert cached.dic_stats == catalog.dic_stats
+
+    # a rewritten data file invalidates the catalog
+    stat_source = path_source.stat()
+    os.utime(path_source, ns=(stat_source.st_atime_ns, stat_source.st_mtime_ns + 10**9))
+    ColumnCatalog.load_or_build(lf, path_source)
+    assert lst_built == [1]
+
+    # so does a damaged catalog file
+    path_catalog.write_text("{", encoding="utf-8")
+    ColumnCatalog.load_or_build(lf, path_source)
+    assert lst_built == [1, 1]
+    assert ColumnCatalog.read(path_catalog).dic_stats == catalog.dic_stats
@@ -0,0 +1,116 @@
+import pytest
+
+pytest.importorskip("PySide6")
+# the plotter needs Python 3.12+ (typing.override)
+commandjournal = pytest.importorskip("app.plotter.managers.commandjournal", exc_type=ImportError)
+
+Command = commandjournal.Command
+CommandJournal = commandjournal.CommandJournal
+
+
+def make_setter(state, key, old, new, label=None):
+    """Apply ``state[key] = new`` and return the Command that reverts it."""
+    state[key] = new
+    return Command(
+        str_label=label or f"set {key}",
+        func_redo=lambda: state.__setitem__(key, new),
+        func_undo=lambda: state.__setitem__(key, old),
+    )
+
+
+def test_undo_redo_order():
+    journal = CommandJournal()
+    state = {"a": 0}
+    journal.record(make_setter(state, "a", 0, 1))
+    journal.record(make_setter(state, "a", 1, 2, "second"))
+    assert journal.get_label_undo() == "second"
+
+    assert journal.undo() and state["a"] == 1
+    assert journal.undo() and state["a"] == 0
+    assert not journal.undo()
+    assert journal.redo() and state["a"] == 1
+    assert journal.get_label_redo() == "second"
+
+
+def test_record_clears_redo():
+    journal = CommandJournal()
+    state = {"a": 0}
+    journal.record(make_setter(state, "a", 0, 1))
+    journal.undo()
+    journal.record(make_setter(state, "a", 0, 5))
+    assert not journal.can_redo()
+
+
+def test_group_is_one_step_undone_in_reverse():
+    journal = CommandJournal()
+    state = {"lst": []}
+    with journal.group("both"):
+        journal.record(make_setter(state, "lst", [], ["x"]))
+        journal.record(make_setter(state, "lst", ["x"], ["x", "y"]))
+        # undo is unavailable while a group is open
+        assert not journal.can_undo()
+    assert journal.get_label_undo() == "both"
+    assert journal.undo() and state["lst"] == []
+    assert not journal.can_undo()
+    assert journal.redo() and state["lst"] == ["x", "y"]
+
+
+def test_single_command_group_is_not_wrapped():
+    journal = CommandJournal()
+    state = {"a": 0}
+    with journal.group("outer"):
+        journal.record(make_setter(state, "a", 0, 1, "inner"))
+    assert journal.get_label_undo() == "inner"
+
+
+def test_group_rolls_back_on_error():
+    journal = CommandJournal()
+    state = {"a": 0, "b": 0}
+    with pytest.raises(RuntimeError):
+        with journal.group():
+            journal.record(make_setter(state, "a", 0, 1))
+            journal.record(make_setter(state, "b", 0, 1))
+            raise RuntimeError("failed halfway")
+    assert state == {"a": 0, "b": 0}
+    assert not journal.can_undo()
+
+
+def test_replay_does_not_record():
+    journal = CommandJournal()
+    state = {"a": 0}
+
+    def redo():
+        # a manager API called during undo/redo must not add commands
+        journal.record(Command("nested", lambda: None, lambda: None))
+        state["a"] = 1
+
+    journal.record(Command("set a", redo, lambda: state.__setitem__("a", 0)))
+    journal.undo()
+    journal.redo()
+    assert state["a"] == 1
+    assert journal.get_label_undo() == "set a"
+    journal.undo()
+    assert not journal.can_undo()
+
+
+def test_undo_stack_is_bounded():
+    journal = CommandJournal(n_max_command=3)
+    state = {"a": 0}
+    for n in range(5):
+        journal.record(make_setter(state, "a", n, n + 1))
+    steps = 0
+    while journal.undo():
+        steps += 1
+    assert steps == 3
+    assert state["a"] == 2
+
+
+def test_signal_reports_availability():
+    journal = CommandJournal()
+    lst_emitted = []
+    journal.sig_journal_changed.connect(lambda can_undo, can_redo: lst_emitted.append((can_undo, can_redo)))
+    state = {"a": 0}
+    journal.record(make_setter(state, "a", 0, 1))
+    journal.undo()
+    journal.clear()
+    assert lst_emitted == [(True, False), (False, True), (False, False)]
@@ -0,0 +1,86 @@
+from code_source.general_toolkits.cowcollections import CowDict, CowSet
+
+
+def test_dict_snapshot_shares_until_write():
+    dic = CowDict({"a": 1})
+    snapshot = dic.snapshot()
+    assert snapshot._data is dic._dic
+    dic["b"] = 2
+    assert snapshot._data is not dic._dic
+    assert dict(snapshot._data) == {"a": 1}
+    assert dict(dic) == {"a": 1, "b": 2}
+
+
+def test_dict_writes_after_snapshot_copy_once():
+    dic = CowDict({"a": 1})
+    dic.snapshot()
+    dic["b"] = 2
+    data = dic._dic
+    dic["c"] = 3
+    del dic["a"]
+    assert dic._dic is data
+    assert dict(dic) == {"b": 2, "c": 3}
+
+
+def test_dict_restore_can_be_repeated():
+    dic = CowDict({"a": 1})
+    snapshot = dic.snapshot()
+    dic["a"] = 2
+    dic.restore(snapshot)
+    assert dict(dic) == {"a": 1}
+    # writing after a restore must not change the snapshot
+    dic["a"] = 3
+    dic.restore(snapshot)
+    assert dict(dic) == {"a": 1}
+    assert len(snapshot) == 1 and "a" in snapshot and snapshot["a"] == 1
+
+
+def test_dict_clear_keeps_snapshot():
+    dic = CowDict({"a": 1})
+    snapshot = dic.snapshot()
+    dic.clear()
+    assert len(dic) == 0
+    assert list(snapshot) == ["a"]
+
+
+def test_dict_mapping_interface():
+    dic = CowDict([("a", 1), ("b", 2)])
+    assert dic.get("c", 0) == 0
+    assert list(dic.keys()) == ["a", "b"]
+    assert list(dic.values()) == [1, 2]
+    assert dic.pop("a") == 1
+    dic.update(c=3)
+    assert dict(dic.items()) == {"b": 2, "c": 3}
+    assert dic == {"b": 2, "c": 3}
+
+
+def test_set_snapshot_and_restore():
+    set_item = CowSet(["a"])
+    snapshot = set_item.snapshot()
+    set_item.add("b")
+    set_item.discard("a")
+    assert set(snapshot) == {"a"}
+    assert set(set_item) == {"b"}
+    set_item.restore(snapshot)
+    assert set(set_item) == {"a"}
+    set_item.add("c")
+    assert set(snapshot) == {"a"}
+
+
+def test_set_noop_writes_do_not_copy():
+    set_item = CowSet(["a"])
+    snapshot = set_item.snapshot()
+    set_item.add("a")
+    set_item.discard("missing")
+    assert set_item._set is snapshot._data
+
+
+def test_set_interface():
+    set_item = CowSet(["a", "b"])
+    copy = set_item.copy()
+    copy.add("c")
+    assert "c" not in set_item
+    assert set_item == {"a", "b"}
+    assert set_item & {"b", "c"} == {"b"}
+    set_item.clear()
+    assert len(set_item) == 0
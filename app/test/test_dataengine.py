@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pl = pytest.importorskip("polars")
+
+from multiprocessing.shared_memory import SharedMemory
+
+from code_source.polars_toolkits.engine_toolkits.dataengine import (
+    DataEngineClient, DataEngineError, _pack_arrays, _unlink_shm
+)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    lf = pl.DataFrame({"t": np.arange(1000.0), "v": np.arange(1000.0) * 2}).lazy()
+    engine = DataEngineClient(lf, "t", flt_timeout=30.0)
+    yield engine
+    engine.close()
+
+
+def segment_exists(str_name_shm):
+    try:
+        shm = SharedMemory(name=str_name_shm)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    return True
+
+
+def test_fetch_window_round_trip(engine):
+    dic_array = engine.fetch_window(["v"], 10.0, 19.0)
+    assert list(dic_array["t"]) == list(np.arange(10.0, 20.0))
+    assert list(dic_array["v"]) == list(np.arange(10.0, 20.0) * 2)
+    assert engine.fetch_window(["v"], 10.0, 19.0, bol_background=True).keys() == dic_array.keys()
+
+
+def test_interactive_request_does_not_wait_for_background(engine):
+    engine.start()
+    # a long background query holds its channel; interactive requests use their own
+    with engine._channel_background._lock_request:
+        thread = threading.Thread(target=lambda: engine.ping(bol_background=True))
+        thread.start()
+        assert engine.ping()
+        assert thread.is_alive()
+    thread.join(30)
+
+
+def test_query_error_is_raised(engine):
+    with pytest.raises(DataEngineError):
+        engine.get_window_stats(["missing"], 0.0, 10.0)
+    # the engine keeps serving after a failed query
+    assert engine.ping()
+
+
+def test_segment_is_owned_by_the_client():
+    str_name_shm, lst_spec = _pack_arrays({"a": np.arange(4.0)}, None, "de_test_owned")
+    assert str_name_shm == "de_test_owned" and lst_spec == [("a", "<f8", (4,), 0)]
+    assert segment_exists(str_name_shm)
+    # what a killed request leaves behind is released by name
+    _unlink_shm(str_name_shm)
+    assert not segment_exists(str_name_shm)
+    _unlink_shm(str_name_shm)
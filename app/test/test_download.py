@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+import os
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from app.builtin.download import ChecksumError, Downloader, parse_sha256sums
+
+URL = "https://example.com/App-linux-x64.zip"
+DATA = os.urandom(300_000)
+SHA256 = hashlib.sha256(DATA).hexdigest()
+
+
+def make_transport(data=DATA, fail_after=None, ranges=True, etag=None):
+    """Serve ``data``; with ``fail_after`` the first full GET breaks after that many bytes."""
+    state = {"failed": False, "requests": [], "if_range": []}
+
+    def handler(request):
+        if request.method == "HEAD":
+            headers = {"content-length": str(len(data))}
+            if ranges:
+                headers["accept-ranges"] = "bytes"
+            if etag:
+                headers["etag"] = etag
+            return httpx.Response(200, headers=headers)
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        state["requests"].append(range_header)
+        state["if_range"].append(if_range)
+        if range_header and ranges and if_range in (None, etag):
+            start, _, end = range_header[len("bytes="):].partition("-")
+            end = int(end) if end else len(data) - 1
+            body = data[int(start):end + 1]
+            return httpx.Response(206, content=body)
+        if fail_after is not None and not state["failed"]:
+            state["failed"] = True
+
+            async def broken():
+                yield data[:fail_after]
+                raise httpx.ReadError("connection reset")
+
+            return httpx.Response(200, content=broken())
+        return httpx.Response(200, content=data)
+
+    return httpx.MockTransport(handler), state
+
+
+def run(transport, path, **kwargs):
+    async def main():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await Downloader(client, URL, str(path), **kwargs).run()
+
+    return asyncio.run(main())
+
+
+def test_download_verified(tmp_path):
+    transport, _ = make_transport()
+    progress = []
+    path = run(transport, tmp_path / "app.zip", sha256=SHA256,
+               progress=lambda done, total: progress.append((done, total)))
+    assert open(path, "rb").read() == DATA
+    assert progress[-1] == (len(DATA), len(DATA))
+    assert not os.path.exists(path + ".part")
+
+
+def test_download_resumes_part_file(tmp_path):
+    transport, state = make_transport(fail_after=100_000)
+    target = tmp_path / "app.zip"
+    with pytest.raises(httpx.ReadError):
+        run(transport, target, sha256=SHA256)
+    assert os.path.getsize(str(target) + ".part") == 100_000
+
+    run(transport, target, sha256=SHA256)
+    assert target.read_bytes() == DATA
+    assert state["requests"][-1] == "bytes=100000-"
+
+
+def test_download_resume_sends_if_range(tmp_path):
+    transport, state = make_transport(fail_after=100_000, etag='"v1"')
+    target = tmp_path / "app.zip"
+    with pytest.raises(httpx.ReadError):
+        run(transport, target, sha256=SHA256)
+    run(transport, target, sha256=SHA256)
+    assert target.read_bytes() == DATA
+    assert state["requests"][-1] == "bytes=100000-"
+    assert state["if_range"][-1] == '"v1"'
+    assert not os.path.exists(str(target) + ".part.json")
+
+
+def test_download_discards_part_of_changed_asset(tmp_path):
+    transport, _ = make_transport(data=os.urandom(300_000), fail_after=100_000, etag='"v1"')
+    target = tmp_path / "app.zip"
+    with pytest.raises(httpx.ReadError):
+        run(transport, target)
+    assert os.path.getsize(str(target) + ".part") == 100_000
+
+    # a new release at the same path: the old partial data must not be continued
+    transport, state = make_transport(etag='"v2"')
+    run(transport, target, sha256=SHA256)
+    assert target.read_bytes() == DATA
+    assert state["requests"] == [None]
+
+
+def test_download_restarts_without_range_support(tmp_path):
+    transport, _ = make_transport(ranges=False)
+    target = tmp_path / "app.zip"
+    (tmp_path / "app.zip.part").write_bytes(b"stale")
+    run(transport, target, sha256=SHA256)
+    assert target.read_bytes() == DATA
+
+
+def test_download_parallel_ranges(tmp_path):
+    transport, state = make_transport()
+    target = tmp_path / "app.zip"
+    run(transport, target, sha256=SHA256, parallel_threshold=1, parts=3)
+    assert target.read_bytes() == DATA
+    assert len(state["requests"]) == 3
+
+
+def test_download_checksum_mismatch(tmp_path):
+    transport, _ = make_transport()
+    target = tmp_path / "app.zip"
+    with pytest.raises(ChecksumError):
+        run(transport, target, sha256="0" * 64)
+    assert not target.exists()
+    assert not os.path.exists(str(target) + ".part")
+
+
+def test_parse_sha256sums():
+    text = f"{'a' * 64}  other.zip\n{SHA256} *App-linux-x64.zip\n"
+    assert parse_sha256sums(text, "App-linux-x64.zip") == SHA256
+    assert parse_sha256sums(text, "missing.zip") is None
+    assert parse_sha256sums(SHA256.upper(), "any.zip") == SHA256
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("glom")
+pytest.importorskip("singleton_decorator")
+# app.resources is generated by the build
+gitlab_updater = pytest.importorskip("app.builtin.gitlab_updater", exc_type=ImportError)
+
+SHA256 = "ab" * 32
+BASE = "https://gitlab.example.com"
+
+
+def make_transport(link_names):
+    def handler(request):
+        path = request.url.path
+        if path == "/api/v4/projects":
+            return httpx.Response(200, json=[{"id": 7}])
+        if path == "/api/v4/projects/7/releases":
+            return httpx.Response(200, json=[{
+                "tag_name": "9.0.0",
+                "description": "",
+                "assets": {"links": [{"name": name, "url": f"{BASE}/files/{name}"} for name in link_names]},
+            }])
+        if path == "/files/SHA256SUMS":
+            return httpx.Response(200, text=f"{'0' * 64}  other.zip\n{SHA256}  App-linux-x64.zip\n")
+        if path.endswith(".sha256"):
+            return httpx.Response(200, text=SHA256)
+        return httpx.Response(200)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def updater(monkeypatch):
+    monkeypatch.setattr(gitlab_updater.platform, "machine", lambda: "x86_64")
+    monkeypatch.setattr(gitlab_updater.platform, "system", lambda: "Linux")
+    updater = gitlab_updater.GitlabUpdater()
+    monkeypatch.setattr(updater, "base_url", BASE)
+    return updater
+
+
+def fetch(updater, monkeypatch, link_names):
+    transport = make_transport(link_names)
+    monkeypatch.setattr(updater, "create_async_client", lambda: httpx.AsyncClient(transport=transport))
+    asyncio.run(updater.fetch())
+
+
+@pytest.mark.parametrize("link_names", [
+    ["App-linux-x64.zip.sha256", "App-linux-x64.zip"],
+    ["App-linux-x64.zip", "App-linux-x64.zip.sha256"],
+    ["SHA256SUMS", "App-linux-x64.zip"],
+])
+def test_checksum_file_is_never_the_package(updater, monkeypatch, link_names):
+    fetch(updater, monkeypatch, link_names)
+    assert updater.download_url == f"{BASE}/files/App-linux-x64.zip"
+    assert updater.filename == "App-linux-x64.zip"
+    assert updater.sha256 == SHA256
+
+
+def test_checksum_of_another_package_is_ignored(updater, monkeypatch):
+    fetch(updater, monkeypatch, ["App-linux-x64.sha256", "App-linux-x64.zip"])
+    assert updater.download_url == f"{BASE}/files/App-linux-x64.zip"
+    assert updater.sha256 is None
+
+
+def test_only_checksum_files_means_no_package(updater, monkeypatch):
+    with pytest.raises(FileNotFoundError):
+        fetch(updater, monkeypatch, ["App-linux-x64.zip.sha256"])
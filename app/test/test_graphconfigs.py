@@ -0,0 +1,119 @@
+import json
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+pytest.importorskip("PySide6")
+# the plotter needs Python 3.12+ (typing.override)
+graphconfigs = pytest.importorskip("app.plotter.graphconfigs", exc_type=ImportError)
+
+from app.plotter.enums.modeenum import AlignmentMode, RangeMode
+from app.plotter.enums.plotenum import SideAxis
+from app.plotter.enums.valueenum import UnitValue
+from app.plotter.graphconfigs.axisconfig import N_VERSION_AXISCONFIG
+from app.plotter.graphconfigs.configrecord import migrate_dict
+from app.plotter.graphconfigs.curveconfig import N_VERSION_CURVECONFIG
+
+AxisConfig = graphconfigs.AxisConfig
+CurveConfig = graphconfigs.CurveConfig
+
+
+def json_round_trip(dic_record):
+    return json.loads(json.dumps(dic_record))
+
+
+def test_axis_round_trip():
+    axisconfig = AxisConfig(
+        str_name_axis="axis_1",
+        set_name_col={"b", "a"},
+        side_axis=SideAxis.RIGHT,
+        str_label="Pressure",
+        unit_value=UnitValue.KG,
+        str_color="#ff102030",
+        mode_range=RangeMode.MANUAL,
+        lb_range=-1.0,
+        ub_range=5.0,
+        mode_align=AlignmentMode.VALUESCALE,
+        str_name_axis_align="main",
+        flt_align_src=1.0,
+        flt_align_tgt=2.0,
+        flt_ratio_scale=0.5,
+    )
+    dic_axis = json_round_trip(axisconfig.to_dict())
+    assert dic_axis["n_version"] == N_VERSION_AXISCONFIG
+    assert dic_axis["lst_name_col"] == ["a", "b"]
+    assert AxisConfig.from_dict(dic_axis) == axisconfig
+
+
+def test_axis_from_dict_defaults():
+    axisconfig = AxisConfig.from_dict({"n_version": N_VERSION_AXISCONFIG, "str_name_axis": "main"})
+    assert axisconfig == AxisConfig(str_name_axis="main")
+
+
+def test_axis_migrates_v1_color():
+    dic_v1 = {"str_name_axis": "axis_1", "color": "#00ff00", "side_axis": "right"}
+    axisconfig = AxisConfig.from_dict(dic_v1)
+    assert axisconfig.str_color == "#ff00ff00"
+    assert axisconfig.side_axis == SideAxis.RIGHT
+    # the input is left untouched
+    assert "color" in dic_v1 and "n_version" not in dic_v1
+
+
+def test_axis_color_property_stores_string():
+    axisconfig = AxisConfig(str_name_axis="main")
+    axisconfig.color = "red"
+    assert axisconfig.str_color == "#ffff0000"
+    assert axisconfig.color.red() == 255
+
+
+def test_curve_round_trip():
+    curveconfig = CurveConfig(
+        str_name_curve="T_in",
+        idx_subplot=1,
+        str_name_axis="axis_1",
+        bol_show=False,
+        str_color="#80112233",
+        linestyle="dash",
+        linewidth=3,
+        bol_is_step=True,
+    )
+    dic_curve = json_round_trip(curveconfig.to_dict())
+    assert dic_curve["n_version"] == N_VERSION_CURVECONFIG
+    assert CurveConfig.from_dict(dic_curve) == curveconfig
+    assert CurveConfig.from_dict(dic_curve, idx_subplot=2) == replace(curveconfig, idx_subplot=2)
+
+
+def test_curve_migrates_v1():
+    # version 1 session records had 'color' and no idx_subplot
+    dic_v1 = {"str_name_curve": "T_in", "str_name_axis": "main", "color": "#0000ff", "bol_added": True}
+    curveconfig = CurveConfig.from_dict(dic_v1, idx_subplot=0)
+    assert curveconfig == CurveConfig(str_name_curve="T_in", idx_subplot=0, str_color="#ff0000ff")
+
+
+def test_curve_is_frozen():
+    curveconfig = CurveConfig(str_name_curve="T_in", idx_subplot=0)
+    with pytest.raises(FrozenInstanceError):
+        curveconfig.linewidth = 5
+    assert curveconfig.tpl_id_item == (0, "T_in")
+
+
+def test_newer_version_is_rejected():
+    with pytest.raises(ValueError):
+        AxisConfig.from_dict({"n_version": N_VERSION_AXISCONFIG + 1, "str_name_axis": "main"})
+    with pytest.raises(ValueError):
+        CurveConfig.from_dict({"n_version": N_VERSION_CURVECONFIG + 1, "str_name_curve": "T_in"}, 0)
+
+
+def test_migrate_dict_runs_each_step_in_order():
+    lst_step = []
+
+    def step(n):
+        def migrate(dic_record):
+            lst_step.append(n)
+            return {**dic_record, f"v{n + 1}": True}
+        return migrate
+
+    dic_record = migrate_dict({"a": 1}, 3, {1: step(1), 2: step(2)}, "Record")
+    assert lst_step == [1, 2]
+    assert dic_record == {"a": 1, "v2": True, "v3": True, "n_version": 3}
+    assert migrate_dict({"n_version": 3}, 3, {}, "Record") == {"n_version": 3}
@@ -0,0 +1,147 @@
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pl = pytest.importorskip("polars")
+
+from code_source.polars_toolkits.window_toolkits.prefixsumindex import ColumnPrefixSum, WindowStatsIndex
+
+N_ROW = 5000  # several index blocks
+
+
+def make_data(seed=0):
+    rng = np.random.default_rng(seed)
+    # irregular sampling and a large offset, to catch precision loss
+    arr_ts = np.cumsum(rng.uniform(0.5, 1.5, N_ROW))
+    arr_value = 1e6 + rng.normal(0, 10, N_ROW)
+    arr_value[rng.random(N_ROW) < 0.05] = np.nan
+    arr_value[1000:1100] = np.nan
+    return arr_ts, arr_value
+
+
+def brute_stats(arr_ts, arr_value, flt_start, flt_end, flt_threshold, flt_second_per_unit=1.0):
+    arr_in = (arr_ts >= flt_start) & (arr_ts <= flt_end)
+    arr_ts_win, arr_value_win = arr_ts[arr_in], arr_value[arr_in]
+    arr_valid = np.isfinite(arr_value_win)
+    arr_dt = np.diff(arr_ts_win) * flt_second_per_unit
+    arr_seg = arr_valid[1:] & arr_valid[:-1]
+    dic_stats = {
+        "integral": float(np.sum((0.5 * (arr_value_win[1:] + arr_value_win[:-1]) * arr_dt)[arr_seg])),
+        "time_above": float(np.sum(arr_dt[arr_value_win[:-1] > flt_threshold])),
+    }
+    if not arr_in.any():
+        # no sample in the window at all
+        dic_stats.update(min=np.nan, max=np.nan, mean=np.nan, std=np.nan, integral=np.nan)
+    elif arr_valid.any():
+        arr_finite = arr_value_win[arr_valid]
+        dic_stats.update(min=arr_finite.min(), max=arr_finite.max(), mean=arr_finite.mean(), std=arr_finite.std())
+    else:
+        dic_stats.update(min=np.nan, max=np.nan, mean=np.nan, std=np.nan)
+    return dic_stats
+
+
+def assert_stats_close(dic_stats, dic_expected):
+    for key, flt_expected in dic_expected.items():
+        if np.isnan(flt_expected):
+            assert np.isnan(dic_stats[key]), key
+        else:
+            assert dic_stats[key] == pytest.approx(flt_expected, rel=1e-9, abs=1e-6), key
+
+
+def make_index(arr_ts, arr_value):
+    lf = pl.DataFrame({"t": arr_ts, "v": arr_value}).lazy().with_columns(pl.col("v").fill_nan(None))
+    return WindowStatsIndex(lf, "t")
+
+
+def test_stats_match_brute_force():
+    arr_ts, arr_value = make_data()
+    index = make_index(arr_ts, arr_value)
+    rng = np.random.default_rng(1)
+    lst_window = [
+        (arr_ts[0], arr_ts[-1]),                  # everything
+        (arr_ts[1010], arr_ts[1090]),             # only nulls
+        (arr_ts[10] + 0.1, arr_ts[10] + 0.2),     # between two samples
+        (arr_ts[-1] + 1, arr_ts[-1] + 2),         # after the data
+        (arr_ts[1023], arr_ts[2048]),             # block boundaries
+    ] + [tuple(sorted(rng.uniform(arr_ts[0] - 10, arr_ts[-1] + 10, 2))) for _ in range(50)]
+    for flt_start, flt_end in lst_window:
+        flt_threshold = 1e6 + rng.normal(0, 10)
+        dic_stats = index.get_stats("v", flt_start, flt_end, flt_threshold)
+        assert_stats_close(dic_stats, brute_stats(arr_ts, arr_value, flt_start, flt_end, flt_threshold))
+
+
+def test_datetime_timestamps_integrate_in_seconds():
+    arr_second = np.arange(0.0, 600.0, 2.0)
+    arr_value = np.sin(arr_second / 60.0) + 2
+    lf = pl.DataFrame({
+        "t": pl.Series([datetime(2024, 1, 1)] * len(arr_second)).dt.cast_time_unit("ms")
+        + pl.Series((arr_second * 1000).astype(np.int64)).cast(pl.Duration("ms")),
+        "v": arr_value,
+    }).lazy()
+    index = WindowStatsIndex(lf, "t", "ms")
+    arr_ts = index._get_arr_ts()
+    dic_stats = index.get_stats("v", arr_ts[10], arr_ts[200], flt_threshold=2.5)
+    dic_expected = brute_stats(arr_second, arr_value, arr_second[10], arr_second[200], 2.5)
+    assert_stats_close(dic_stats, dic_expected)
+    assert dic_stats["time_above"] > 0
+
+
+def assert_same(flt_value, flt_expected):
+    assert flt_value == flt_expected or (np.isnan(flt_value) and np.isnan(flt_expected))
+
+
+@pytest.mark.parametrize("bol_prepared", [True, False])
+def test_envelope_bounds_every_bucket(bol_prepared):
+    arr_ts, arr_value = make_data(2)
+    index = make_index(arr_ts, arr_value)
+    if bol_prepared:
+        index.prepare(["v"])
+    for flt_start, flt_end, n_bucket in [
+        (arr_ts[0], arr_ts[-1], 2),
+        (arr_ts[500], arr_ts[4100], 3),
+        (arr_ts[0], arr_ts[2600], 2),
+        (arr_ts[0], arr_ts[-1], 2000),
+    ]:
+        dic_envelope = index.get_envelope(["v"], flt_start, flt_end, n_bucket)
+        arr_ts_env, arr_value_env = dic_envelope["t"], dic_envelope["v"]
+        assert len(arr_ts_env) == len(arr_value_env) <= 2 * n_bucket
+        # each bucket spans rows [first, last]; together they cover exactly the window
+        arr_idx_first = np.searchsorted(arr_ts, arr_ts_env[0::2])
+        arr_idx_last = np.searchsorted(arr_ts, arr_ts_env[1::2])
+        idx_start = np.searchsorted(arr_ts, flt_start)
+        idx_end = np.searchsorted(arr_ts, flt_end, side="right")
+        assert arr_idx_first[0] == idx_start and arr_idx_last[-1] == idx_end - 1
+        assert np.all(arr_idx_first[1:] == arr_idx_last[:-1] + 1)
+        for n, (idx_first, idx_last) in enumerate(zip(arr_idx_first, arr_idx_last)):
+            arr_part = arr_value[idx_first:idx_last + 1]
+            assert_same(arr_value_env[2 * n], np.fmin.reduce(arr_part))
+            assert_same(arr_value_env[2 * n + 1], np.fmax.reduce(arr_part))
+    # the fallback only reads the window and leaves building the index to prepare
+    assert index.is_prepared(["v"]) == bol_prepared
+
+
+@pytest.mark.parametrize("bol_prepared", [True, False])
+def test_envelope_of_empty_window(bol_prepared):
+    arr_ts, arr_value = make_data()
+    index = make_index(arr_ts, arr_value)
+    if bol_prepared:
+        index.prepare(["v"])
+    dic_envelope = index.get_envelope(["v"], arr_ts[-1] + 1, arr_ts[-1] + 2)
+    assert len(dic_envelope["t"]) == len(dic_envelope["v"]) == 0
+
+
+def test_invalidate():
+    arr_ts, arr_value = make_data()
+    index = make_index(arr_ts, arr_value)
+    index.get_stats("v", arr_ts[0], arr_ts[-1])
+    assert "v" in index.dic_prefixsum
+    index.invalidate()
+    assert index.arr_ts is None and not index.dic_prefixsum
+
+
+def test_column_prefix_sum_single_point():
+    prefixsum = ColumnPrefixSum(np.array([0.0]), np.array([3.0]))
+    dic_stats = prefixsum.query(0, 1)
+    assert (dic_stats["min"], dic_stats["max"], dic_stats["mean"], dic_stats["std"]) == (3.0, 3.0, 3.0, 0.0)
+    assert dic_stats["integral"] == 0.0
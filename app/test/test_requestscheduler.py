@@ -0,0 +1,159 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+# the plotter needs Python 3.12+ (typing.override)
+requestscheduler = pytest.importorskip("app.plotter.requestscheduler", exc_type=ImportError)
+
+from PySide6.QtWidgets import QApplication
+
+from app.plotter.enums.plotenum import RequestPriority
+
+DataRequestScheduler = requestscheduler.DataRequestScheduler
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def scheduler(qapp):
+    scheduler = DataRequestScheduler(n_max_running=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def wait_until(qapp, predicate, timeout=5.0):
+    """Process events until ``predicate()`` holds; results arrive through queued signals."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+class Jobs:
+    """Worker functions that log when they run and optionally block until released."""
+
+    def __init__(self):
+        self.lst_started = []
+        self.dic_gate = {}
+        self.dic_result = {}
+
+    def func(self, name, bol_block=False):
+        if bol_block:
+            self.dic_gate[name] = threading.Event()
+
+        def run():
+            self.lst_started.append(name)
+            if bol_block:
+                self.dic_gate[name].wait(5)
+            return name.upper()
+        return run
+
+    def callback(self, name):
+        def on_done(result, error):
+            self.dic_result.setdefault(name, []).append((result, error))
+        return on_done
+
+
+def fill_slots(scheduler, jobs):
+    """Occupy both slots: one interactive and one background request, both blocked."""
+    scheduler.submit(None, jobs.func("busy_i", True), RequestPriority.INTERACTIVE, jobs.callback("busy_i"))
+    scheduler.submit(None, jobs.func("busy_b", True), RequestPriority.BACKGROUND, jobs.callback("busy_b"))
+    # both start at once, in either order
+    deadline = time.monotonic() + 5
+    while len(jobs.lst_started) < 2:
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_same_key_runs_once(qapp, scheduler):
+    jobs = Jobs()
+    scheduler.submit("k", jobs.func("a", True), RequestPriority.INTERACTIVE, jobs.callback("first"))
+    scheduler.submit("k", jobs.func("b"), RequestPriority.INTERACTIVE, jobs.callback("second"))
+    jobs.dic_gate["a"].set()
+    wait_until(qapp, lambda: len(jobs.dic_result) == 2)
+    assert jobs.lst_started == ["a"]
+    assert jobs.dic_result == {"first": [("A", None)], "second": [("A", None)]}
+    # a finished key is forgotten and runs again
+    assert "k" not in scheduler.dic_request_pending
+    scheduler.submit("k", jobs.func("c"), RequestPriority.INTERACTIVE, jobs.callback("third"))
+    wait_until(qapp, lambda: "third" in jobs.dic_result)
+    assert jobs.dic_result["third"] == [("C", None)]
+
+
+def test_priority_order_and_reserved_slot(qapp, scheduler):
+    jobs = Jobs()
+    fill_slots(scheduler, jobs)
+    for name, priority in [
+        ("background", RequestPriority.BACKGROUND),
+        ("visible", RequestPriority.VISIBLE),
+        ("interactive", RequestPriority.INTERACTIVE),
+    ]:
+        scheduler.submit(None, jobs.func(name), priority, jobs.callback(name))
+
+    # the interactive slot frees: only the interactive request may take it
+    jobs.dic_gate["busy_i"].set()
+    wait_until(qapp, lambda: "interactive" in jobs.dic_result)
+    assert jobs.lst_started[2:] == ["interactive"]
+
+    jobs.dic_gate["busy_b"].set()
+    wait_until(qapp, lambda: "background" in jobs.dic_result)
+    assert jobs.lst_started[3:] == ["visible", "background"]
+
+
+def test_duplicate_with_higher_priority_is_promoted(qapp, scheduler):
+    jobs = Jobs()
+    fill_slots(scheduler, jobs)
+    scheduler.submit(None, jobs.func("visible"), RequestPriority.VISIBLE, jobs.callback("visible"))
+    scheduler.submit("k", jobs.func("prefetch"), RequestPriority.BACKGROUND, jobs.callback("prefetch"))
+    scheduler.submit("k", jobs.func("unused"), RequestPriority.INTERACTIVE, jobs.callback("window"))
+
+    jobs.dic_gate["busy_i"].set()
+    wait_until(qapp, lambda: "window" in jobs.dic_result)
+    assert jobs.lst_started[2:] == ["prefetch"]
+    assert jobs.dic_result["prefetch"] == jobs.dic_result["window"] == [("PREFETCH", None)]
+    jobs.dic_gate["busy_b"].set()
+    wait_until(qapp, lambda: "visible" in jobs.dic_result)
+
+
+def test_cancelled_request_does_not_run(qapp, scheduler):
+    jobs = Jobs()
+    fill_slots(scheduler, jobs)
+    handle = scheduler.submit("k", jobs.func("cancelled"), RequestPriority.INTERACTIVE, jobs.callback("cancelled"))
+    handle_kept = scheduler.submit("k2", jobs.func("kept"), RequestPriority.INTERACTIVE, jobs.callback("kept"))
+    handle.cancel()
+    assert handle.bol_cancelled and not handle_kept.bol_cancelled
+
+    jobs.dic_gate["busy_i"].set()
+    jobs.dic_gate["busy_b"].set()
+    wait_until(qapp, lambda: "kept" in jobs.dic_result and "busy_b" in jobs.dic_result)
+    assert "cancelled" not in jobs.lst_started
+    assert "cancelled" not in jobs.dic_result
+    assert "k" not in scheduler.dic_request_pending
+
+
+def test_one_subscriber_cancelling_keeps_the_other(qapp, scheduler):
+    jobs = Jobs()
+    handle = scheduler.submit("k", jobs.func("a", True), RequestPriority.INTERACTIVE, jobs.callback("first"))
+    scheduler.submit("k", jobs.func("b"), RequestPriority.INTERACTIVE, jobs.callback("second"))
+    handle.cancel()
+    jobs.dic_gate["a"].set()
+    wait_until(qapp, lambda: "second" in jobs.dic_result)
+    assert "first" not in jobs.dic_result
+
+
+def test_error_reaches_callback(qapp, scheduler):
+    lst_done = []
+
+    def fail():
+        raise ValueError("bad window")
+
+    scheduler.submit(None, fail, RequestPriority.VISIBLE, lambda result, error: lst_done.append((result, error)))
+    wait_until(qapp, lambda: lst_done)
+    result, error = lst_done[0]
+    assert result is None and isinstance(error, ValueError)
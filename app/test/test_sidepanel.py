@@ -0,0 +1,280 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+np = pytest.importorskip("numpy")
+pl = pytest.importorskip("polars")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# the plotter needs Python 3.12+ (typing.override)
+viewer = pytest.importorskip("app.plotter.viewer", exc_type=ImportError)
+
+from PySide6.QtCore import QTranslator
+from PySide6.QtWidgets import QApplication
+
+from app.builtin.translator_cache import TranslatorCache
+from app.plotter.enums.plotenum import IdxColCurveList
+
+N_ROW = 1000
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def lf():
+    # timestamps in hours, as the plotter expects
+    return pl.DataFrame({
+        "时间": np.linspace(0, 100, N_ROW),
+        "温度": np.sin(np.arange(N_ROW) / 50.0),
+        "压力": np.arange(N_ROW) * 1.0,
+        "流量": np.cos(np.arange(N_ROW) / 30.0),
+    }).lazy()
+
+
+class ColumnTranslator(QTranslator):
+    """English column names and a few UI texts without a .qm file."""
+
+    NAMES = {"温度": "Temperature", "压力": "Pressure"}
+    TEXTS = {"统计": "Statistics", "会话": "Session"}
+
+    def translate(self, context, source_text, disambiguation=None, n=-1):
+        return (self.NAMES if context == "ColumnNames" else self.TEXTS).get(source_text, "")
+
+    def isEmpty(self):
+        return False
+
+
+@pytest.fixture
+def english(qapp):
+    """Switch to en_US the way TranslatorCache.switch does and back afterwards."""
+    translator = ColumnTranslator()
+
+    def switch():
+        qapp.installTranslator(translator)
+        qapp.setProperty("language_code", "en_US")
+        qapp.processEvents()
+
+    yield switch
+    qapp.removeTranslator(translator)
+    qapp.setProperty("language_code", None)
+    qapp.processEvents()
+
+
+def make_widget(qapp, lf):
+    widget = viewer.MultiCurvePlotterWidget(lf)
+    widget.manager_subplot.flush_changes()
+    return widget
+
+
+def wait_until(qapp, predicate, timeout=5.0):
+    """Process events until ``predicate()`` holds; plotting fetches data in the background."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        qapp.processEvents()
+        time.sleep(0.01)
+    return True
+
+
+def panel_state(widget, idx_subplot=0):
+    subplot_ui = widget.side_panel.dic_ui_subplot[idx_subplot]
+    return (
+        sorted(subplot_ui.yaxis_ui.dic_axis_panels),
+        list(subplot_ui.curve_ui.model_curve.lst_name_curve),
+    )
+
+
+def edit_in_panel(widget):
+    """Build a layout through the side panel the way a user would."""
+    side_panel = widget.side_panel
+    side_panel.add_curve(0, "温度")
+    side_panel.add_curve(0, "压力")
+    side_panel.add_axis(0)
+    side_panel.add_axis(0)
+    side_panel.remove_axis(0, "axis_2")
+    # the panel follows the managers once their changes are flushed
+    widget.manager_subplot.flush_changes()
+    # move 压力 to the right axis through the curve list
+    model = side_panel.dic_ui_subplot[0].curve_ui.model_curve
+    row = model.lst_name_curve.index("压力")
+    assert model.setData(model.index(row, IdxColCurveList.AXIS.value), "axis_1")
+    widget.manager_subplot.flush_changes()
+
+
+def test_panel_edits_reach_plot(qapp, lf):
+    widget = make_widget(qapp, lf)
+    edit_in_panel(widget)
+    assert panel_state(widget) == (["axis_1", "main"], ["温度", "压力"])
+    assert sorted(widget.get_plot_axes(0)) == ["axis_1", "main"]
+    assert widget.get_plot_curves(0)[1].str_name_axis == "axis_1"
+    assert wait_until(qapp, lambda: set(widget.dic_curveitem) == {(0, "温度"), (0, "压力")})
+
+
+def test_session_round_trip_through_panel(qapp, lf, tmp_path):
+    widget = make_widget(qapp, lf)
+    edit_in_panel(widget)
+    path = tmp_path / "session.json"
+    widget.save_session(str(path))
+
+    restored = make_widget(qapp, lf)
+    assert restored.load_session(str(path)) == []
+    # the removed axis stays removed, panel and plot follow the loaded layout
+    assert panel_state(restored) == panel_state(widget)
+    assert widget.get_plot_axes(0) == restored.get_plot_axes(0)
+    assert [
+        (curveconfig.str_name_curve, curveconfig.str_name_axis, curveconfig.str_color)
+        for curveconfig in restored.get_plot_curves(0)
+    ] == [
+        (curveconfig.str_name_curve, curveconfig.str_name_axis, curveconfig.str_color)
+        for curveconfig in widget.get_plot_curves(0)
+    ]
+    assert wait_until(qapp, lambda: set(restored.dic_curveitem) == {(0, "温度"), (0, "压力")})
+
+
+def test_panel_edits_undo_and_redo(qapp, lf):
+    widget = make_widget(qapp, lf)
+    manager_subplot = widget.manager_subplot
+    edit_in_panel(widget)
+    model = widget.side_panel.dic_ui_subplot[0].curve_ui.model_curve
+    str_color = widget.get_plot_curves(0)[0].str_color
+    assert model.setData(model.index(0, IdxColCurveList.COLOR.value), "#123456")
+    manager_subplot.flush_changes()
+    assert widget.get_plot_curves(0)[0].str_color != str_color
+
+    # color, axis move, removed axis: every panel edit is one undo step
+    assert manager_subplot.undo()
+    manager_subplot.flush_changes()
+    assert widget.get_plot_curves(0)[0].str_color == str_color
+    assert manager_subplot.undo()
+    manager_subplot.flush_changes()
+    assert widget.get_plot_curves(0)[1].str_name_axis == "main"
+    assert manager_subplot.undo()
+    manager_subplot.flush_changes()
+    assert panel_state(widget) == (["axis_1", "axis_2", "main"], ["温度", "压力"])
+
+    assert manager_subplot.redo()
+    manager_subplot.flush_changes()
+    assert panel_state(widget) == (["axis_1", "main"], ["温度", "压力"])
+
+
+def test_undo_added_curve_clears_panel_and_plot(qapp, lf):
+    widget = make_widget(qapp, lf)
+    widget.side_panel.add_curve(0, "温度")
+    widget.manager_subplot.flush_changes()
+    assert wait_until(qapp, lambda: (0, "温度") in widget.dic_curveitem)
+
+    assert widget.manager_subplot.undo()
+    widget.manager_subplot.flush_changes()
+    assert panel_state(widget) == (["main"], [])
+    assert widget.get_plot_curves(0) == []
+    assert (0, "温度") not in widget.dic_curveitem
+
+
+def test_window_queries_run_off_the_gui_thread(qapp, lf):
+    widget = make_widget(qapp, lf)
+    lst_on_gui_thread = []
+    for str_name in ("_query_window_data", "_query_window_range_cols", "_calc_window_stats_cols"):
+        func = getattr(widget, str_name)
+
+        def record(*args, func=func, **kwargs):
+            lst_on_gui_thread.append(threading.current_thread() is threading.main_thread())
+            return func(*args, **kwargs)
+        setattr(widget, str_name, record)
+
+    widget.side_panel.add_curve(0, "温度")
+    widget.manager_subplot.flush_changes()
+    # nothing is queried while the change is applied; results arrive later
+    assert (0, "温度") not in widget.dic_curveitem
+    table_stats = widget.side_panel.stats_ui.table_stats
+    assert wait_until(qapp, lambda: (0, "温度") in widget.dic_curveitem and table_stats.rowCount() == 1)
+    assert len(lst_on_gui_thread) >= 3 and not any(lst_on_gui_thread)
+
+
+def test_clear_subplot_is_one_undo_step(qapp, lf):
+    widget = make_widget(qapp, lf)
+    manager_subplot = widget.manager_subplot
+    edit_in_panel(widget)
+    assert manager_subplot.clear_subplot(0)
+    manager_subplot.flush_changes()
+    assert panel_state(widget) == (["main"], [])
+
+    assert manager_subplot.undo()
+    manager_subplot.flush_changes()
+    assert panel_state(widget) == (["axis_1", "main"], ["温度", "压力"])
+    assert widget.get_plot_curves(0)[1].str_name_axis == "axis_1"
+
+
+def search_candidates(widget, str_query, idx_subplot=0):
+    picker = widget.side_panel.dic_ui_subplot[idx_subplot].curve_ui.selector_candidate
+    picker.lineedit_filter.setText(str_query)
+    picker.refresh()
+    return [picker.list_result.item(n).text() for n in range(picker.list_result.count())]
+
+
+def test_language_change_rebuilds_search_index(qapp, lf, english):
+    widget = make_widget(qapp, lf)
+    assert search_candidates(widget, "Temperature") == []
+    english()
+    assert search_candidates(widget, "Temperature") == ["Temperature"]
+    # the actual name still finds the column
+    assert search_candidates(widget, "压力") == ["Pressure"]
+
+
+def test_language_change_relabels_plot(qapp, lf, english):
+    widget = make_widget(qapp, lf)
+    edit_in_panel(widget)
+    assert wait_until(qapp, lambda: set(widget.dic_curveitem) == {(0, "温度"), (0, "压力")})
+    english()
+    assert widget.dic_curveitem[(0, "温度")].name() == "Temperature"
+    model = widget.side_panel.dic_ui_subplot[0].curve_ui.model_curve
+    assert model.data(model.index(0, IdxColCurveList.NAME.value)) == "Temperature"
+    table_stats = widget.side_panel.stats_ui.table_stats
+    assert wait_until(qapp, lambda: table_stats.rowCount() == 2 and table_stats.item(0, 1).text() == "Temperature")
+    widget_tab = widget.side_panel.widget_tab
+    assert widget_tab.tabText(widget_tab.count() - 1) == "Statistics"
+    assert widget.menu_session.title() == "Session"
+
+
+@pytest.fixture
+def translator_cache(qapp):
+    """A TranslatorCache with in-memory zh_CN and en_US translators."""
+    translator_cache = TranslatorCache(qapp, patterns=())
+    translator_cache._cache.update(zh_CN=[QTranslator()], en_US=[ColumnTranslator()])
+    yield translator_cache
+    for translator in translator_cache._installed:
+        qapp.removeTranslator(translator)
+    qapp.setProperty("language_code", None)
+    qapp.processEvents()
+
+
+def test_session_restores_language(qapp, lf, tmp_path, translator_cache):
+    widget = viewer.MultiCurvePlotterWidget(lf, translator_cache=translator_cache)
+    assert translator_cache.switch("en_US")
+    path = tmp_path / "session.json"
+    widget.save_session(str(path))
+    assert json.loads(path.read_text(encoding="utf-8"))["str_language"] == "en_US"
+
+    assert translator_cache.switch("zh_CN")
+    qapp.processEvents()
+    widget.load_session(str(path))
+    qapp.processEvents()
+    assert translator_cache.language == qapp.property("language_code") == "en_US"
+    assert search_candidates(widget, "Temperature") == ["Temperature"]
+
+
+def test_session_with_unavailable_language(qapp, lf, tmp_path, translator_cache):
+    widget = viewer.MultiCurvePlotterWidget(lf, translator_cache=translator_cache)
+    path = tmp_path / "session.json"
+    widget.save_session(str(path))
+    dic_session = json.loads(path.read_text(encoding="utf-8"))
+    path.write_text(json.dumps({**dic_session, "str_language": "fr_FR"}), encoding="utf-8")
+    widget.load_session(str(path))
+    assert translator_cache.language is None
+    assert "fr_FR" in widget.statusBar().currentMessage()
@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("PySide6")
+# the plotter needs Python 3.12+ (typing.override)
+ColumnNameMap = pytest.importorskip("app.plotter.translation", exc_type=ImportError).ColumnNameMap
+
+TRANSLATIONS = {
+    "T_in": "Temperature",
+    "T_out": "Temperature",
+    "P_in": "T_in",
+    "Flow": "Flow rate",
+}
+
+
+def make_map():
+    return ColumnNameMap("en_US", list(TRANSLATIONS), lambda name: TRANSLATIONS.get(name, name))
+
+
+def test_unique_translation_maps_both_ways():
+    namemap = make_map()
+    assert namemap.get_display_name("Flow") == "Flow rate"
+    assert namemap.get_actual_name("Flow rate") == "Flow"
+    assert namemap.get_actual_name("Flow") == "Flow"
+
+
+def test_same_translation_is_ambiguous():
+    namemap = make_map()
+    assert sorted(namemap.dic_collision["Temperature"]) == ["T_in", "T_out"]
+    # neither column wins, the name is passed through unchanged
+    assert namemap.get_actual_name("Temperature") == "Temperature"
+    assert namemap.get_display_name("T_in") == "Temperature"
+    assert namemap.get_display_name("T_out") == "Temperature"
+
+
+def test_translation_equal_to_other_actual_name():
+    namemap = make_map()
+    assert sorted(namemap.dic_collision["T_in"]) == ["P_in", "T_in"]
+    # actual names are unique and take precedence over display names
+    assert namemap.get_actual_name("T_in") == "T_in"
+    assert namemap.get_actual_name("P_in") == "P_in"
+    assert namemap.get_display_name("P_in") == "T_in"
+
+
+def test_unknown_name_passes_through():
+    namemap = make_map()
+    assert namemap.get_actual_name("missing") == "missing"
+    assert namemap.get_display_name("missing") is None
@@ -0,0 +1,105 @@
+import os
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("packaging")
+# app.resources is generated by the build
+update = pytest.importorskip("app.builtin.update", exc_type=ImportError)
+
+from app.builtin.manifest import MANIFEST_NAME, build_manifest, diff_manifest, load_manifest, write_manifest
+
+Updater = update.Updater
+
+OLD = {"App": b"old exe", "lib/core.so": b"core", "lib/legacy.so": b"legacy", "data/a.txt": b"a"}
+NEW = {"App": b"new exe", "lib/core.so": b"core", "lib/extra.so": b"extra", "data/a.txt": b"a"}
+
+
+def make_tree(root, files):
+    for relpath, content in files.items():
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    write_manifest(root, build_manifest(root))
+
+
+def snapshot(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*") if path.is_file()
+    }
+
+
+@pytest.fixture
+def trees(tmp_path):
+    target, source = tmp_path / "install", tmp_path / "install" / "Package"
+    make_tree(target, OLD)
+    make_tree(source, NEW)
+    new_files = load_manifest(source)
+    changed, removed = diff_manifest(load_manifest(target), new_files, target)
+    return source, target, changed, removed, new_files
+
+
+def installed(root):
+    # the new package is unpacked inside the install
+    return {k: v for k, v in snapshot(root).items() if not k.startswith("Package/")}
+
+
+def test_diff_lists_changed_added_and_removed(trees):
+    _, _, changed, removed, _ = trees
+    assert sorted(changed) == ["App", "lib/extra.so"]
+    assert removed == ["lib/legacy.so"]
+
+
+def test_apply_delta(trees):
+    source, target, changed, removed, new_files = trees
+    Updater._apply_delta(source, target, changed, removed, new_files)
+    files = installed(target)
+    assert {k: v for k, v in files.items() if not k.startswith(".update_") and k != MANIFEST_NAME} == NEW
+    assert load_manifest(target) == new_files
+    assert not (target / Updater._staging_dir).exists()
+    # replaced and removed files are kept for a rollback
+    assert (target / Updater._backup_dir / "App").read_bytes() == OLD["App"]
+    assert (target / Updater._backup_dir / "lib/legacy.so").read_bytes() == OLD["lib/legacy.so"]
+
+
+def test_rollback_restores_old_tree(trees):
+    source, target, changed, removed, new_files = trees
+    before = installed(target)
+    Updater._apply_delta(source, target, changed, removed, new_files)
+    Updater._rollback(target)
+    assert installed(target) == before
+    assert not (target / Updater._backup_dir).exists()
+
+
+def test_failure_partway_through_swap(trees, monkeypatch):
+    source, target, changed, removed, new_files = trees
+    before = installed(target)
+    real_replace = os.replace
+    staging = str(target / Updater._staging_dir)
+
+    def replace(src, dst):
+        # the second staged file fails to move in
+        if str(src).startswith(staging) and replace.swapped:
+            raise OSError("disk full")
+        if str(src).startswith(staging):
+            replace.swapped = True
+        real_replace(src, dst)
+
+    replace.swapped = False
+    monkeypatch.setattr(update.os, "replace", replace)
+    with pytest.raises(OSError):
+        Updater._apply_delta(source, target, changed, removed, new_files)
+    monkeypatch.undo()
+    # the install is half updated: one new file in, the other still staged
+    assert installed(target) != before
+    Updater._rollback(target)
+    assert installed(target) == before
+
+
+def test_rollback_without_backup_cleans_staging(tmp_path):
+    staged = tmp_path / Updater._staging_dir / "App"
+    staged.parent.mkdir()
+    staged.write_bytes(b"new exe")
+    Updater._rollback(tmp_path)
+    assert not (tmp_path / Updater._staging_dir).exists()
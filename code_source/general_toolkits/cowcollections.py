@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+写时复制(copy-on-write)的字典和集合
+
+快照只记录当前底层容器的引用并标记为共享, 复杂度O(1); 之后第一次写入时才复制
+一次底层容器, 同一批写入共用这一次复制. 恢复快照只是替换引用, 同样是O(1).
+存放的值应为不可变对象(如 frozen dataclass), 快照与当前状态才能安全地共享它们.
+"""
+
+from collections.abc import MutableMapping, MutableSet
+from typing import Any, Dict, Generic, Hashable, Iterable, Iterator, Optional, Set, TypeVar, Union
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class CowSnapshot:
+    """
+    CowDict/CowSet 的快照
+
+    只读, 与创建时的底层容器共享存储; 只能交还给创建它的容器类型恢复
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self,
+        data: Union[Dict[Any, Any], Set[Any]]
+    ):
+        self._data = data
+        pass
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+
+
+class CowDict(MutableMapping, Generic[K, V]):
+    """
+    写时复制的字典
+
+    Usage:
+        dic = CowDict()
+        dic['a'] = 1
+        snapshot = dic.snapshot()   # O(1)
+        dic['b'] = 2                # 复制一次底层字典后写入
+        dic.restore(snapshot)       # O(1), dic 回到 {'a': 1}
+    """
+    __slots__ = ('_dic', '_bol_shared')
+
+    def __init__(self,
+        iter_items: Optional[Iterable[Any]] = None
+    ):
+        self._dic: Dict[K, V] = dict(iter_items) if iter_items is not None else {}
+        # 底层字典是否被快照共享, 共享时写入前需先复制
+        self._bol_shared: bool = False
+        pass
+
+    def _get_dic_writable(self) -> Dict[K, V]:
+        """写入前调用, 底层字典被共享时先复制一份"""
+        if self._bol_shared:
+            self._dic = self._dic.copy()
+            self._bol_shared = False
+        return self._dic
+
+    # 快照
+    def snapshot(self) -> CowSnapshot:
+        """只读快照, 与当前状态共享底层字典直到下一次写入"""
+        self._bol_shared = True
+        return CowSnapshot(self._dic)
+
+    def restore(self,
+        snapshot: CowSnapshot
+    ):
+        """恢复到 snapshot() 返回的快照, 只替换引用"""
+        self._dic = snapshot._data
+        self._bol_shared = True
+        return
+
+    # MutableMapping 接口
+    def __getitem__(self, key: K) -> V:
+        return self._dic[key]
+
+    def __setitem__(self, key: K, value: V):
+        self._get_dic_writable()[key] = value
+
+    def __delitem__(self, key: K):
+        del self._get_dic_writable()[key]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._dic)
+
+    def __len__(self) -> int:
+        return len(self._dic)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._dic
+
+    def get(self, key: K, default: Any = None) -> Any:
+        return self._dic.get(key, default)
+
+    def keys(self):
+        return self._dic.keys()
+
+    def values(self):
+        return self._dic.values()
+
+    def items(self):
+        return self._dic.items()
+
+    def clear(self):
+        self._dic = {}
+        self._bol_shared = False
+        return
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._dic!r})"
+
+
+class CowSet(MutableSet, Generic[K]):
+    """
+    写时复制的集合, 语义同 CowDict
+    """
+    __slots__ = ('_set', '_bol_shared')
+
+    def __init__(self,
+        iter_items: Optional[Iterable[K]] = None
+    ):
+        self._set: Set[K] = set(iter_items) if iter_items is not None else set()
+        # 底层集合是否被快照共享, 共享时写入前需先复制
+        self._bol_shared: bool = False
+        pass
+
+    def _get_set_writable(self) -> Set[K]:
+        """写入前调用, 底层集合被共享时先复制一份"""
+        if self._bol_shared:
+            self._set = self._set.copy()
+            self._bol_shared = False
+        return self._set
+
+    # 快照
+    def snapshot(self) -> CowSnapshot:
+        """只读快照, 与当前状态共享底层集合直到下一次写入"""
+        self._bol_shared = True
+        return CowSnapshot(self._set)
+
+    def restore(self,
+        snapshot: CowSnapshot
+    ):
+        """恢复到 snapshot() 返回的快照, 只替换引用"""
+        self._set = snapshot._data
+        self._bol_shared = True
+        return
+
+    # MutableSet 接口
+    def __contains__(self, item: object) -> bool:
+        return item in self._set
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._set)
+
+    def __len__(self) -> int:
+        return len(self._set)
+
+    def add(self, item: K):
+        if item not in self._set:
+            self._get_set_writable().add(item)
+
+    def discard(self, item: K):
+        if item in self._set:
+            self._get_set_writable().discard(item)
+
+    def clear(self):
+        self._set = set()
+        self._bol_shared = False
+        return
+
+    def copy(self) -> Set[K]:
+        return self._set.copy()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._set!r})"
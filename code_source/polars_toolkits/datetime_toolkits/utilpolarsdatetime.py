@@ -30,7 +30,8 @@ def get_timestamp_min_max(
     # 计算时间范围
     td_timedelta_data : timedelta = ts_timestamp_data_max - ts_timestamp_data_min
     range_time_data = td_timedelta_data
-    if bol_return_hour:
+    # 数值型时间戳(如小时数)相减已是数值, 无需转换
+    if bol_return_hour and isinstance(td_timedelta_data, timedelta):
         range_time_data = convert_timedelta_to_hour(td_timedelta_data)
     return ts_timestamp_data_min, ts_timestamp_data_max, range_time_data
 
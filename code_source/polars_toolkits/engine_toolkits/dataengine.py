@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+进程外的数据引擎
+
+子进程持有 LazyFrame, 通过管道接收窗口取数和统计请求, 大数组经
+multiprocessing.shared_memory 传回, 小结果直接经管道传回. 查询在子进程中
+执行, 不与界面进程争用GIL; 失控的查询(超时、超出内存上限而被系统终止)
+只会结束子进程, 客户端在下一次请求时自动重启它.
+
+交互请求和后台请求各用一个子进程和管道, 界面的查询不会排在后台的长查询之后.
+共享内存的名称由客户端生成并随请求发出, 子进程只负责创建和写入, 由客户端
+读取后释放; 子进程超时被结束时客户端按名称清理可能残留的共享内存.
+
+* POSIX 下通过 RLIMIT_AS 限制子进程的地址空间; Windows 下没有该限制,
+  只检查单次结果的大小
+"""
+
+import multiprocessing as mp
+import os
+import secrets
+import threading
+import traceback
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import polars as pl
+
+from code_source.polars_toolkits.window_toolkits.utilpolarswindow import (
+    get_window_min_max, get_value_asof, get_window_data
+)
+from code_source.polars_toolkits.window_toolkits.prefixsumindex import WindowStatsIndex
+
+# 数组描述: (键, dtype字符串, 形状, 在共享内存中的偏移)
+TplArraySpec = Tuple[str, str, Tuple[int, ...], int]
+
+
+class DataEngineError(RuntimeError):
+    """数据引擎请求失败: 查询出错、超时、结果过大或子进程退出"""
+    pass
+
+
+# ============================================================
+# 子进程
+# ============================================================
+
+def _set_memory_limit(
+    n_bytes_memory_limit: Optional[int]
+):
+    """限制子进程的地址空间, 平台不支持时忽略"""
+    if not n_bytes_memory_limit:
+        return
+    try:
+        import resource
+        resource.setrlimit(resource.RLIMIT_AS, (n_bytes_memory_limit, n_bytes_memory_limit))
+    except (ImportError, ValueError, OSError):
+        # 平台不支持(如Windows)或上限低于当前用量, 不限制
+        pass
+    return
+
+
+def _pack_arrays(
+    dic_array: Dict[str, np.ndarray],
+    n_bytes_result_limit: Optional[int],
+    str_name_shm: str
+) -> Tuple[Optional[str], List[TplArraySpec]]:
+    """
+    将数组依次写入以 str_name_shm 为名新建的共享内存
+
+    共享内存归客户端所有: 子进程创建后立即从 resource_tracker 注销,
+    避免与客户端重复登记; 客户端复制后释放
+
+    Returns:
+        Tuple: (共享内存名称, 数组描述列表); 没有数组时不创建, 名称为None
+    """
+    n_bytes_total = sum(arr.nbytes for arr in dic_array.values())
+    if n_bytes_result_limit and n_bytes_total > n_bytes_result_limit:
+        raise MemoryError(f"结果 {n_bytes_total / 2**20:.1f} MB 超过上限 {n_bytes_result_limit / 2**20:.1f} MB")
+    if not dic_array:
+        return None, []
+    shm = SharedMemory(name=str_name_shm, create=True, size=max(n_bytes_total, 1))
+    if os.name == 'posix':
+        resource_tracker.unregister(shm._name, "shared_memory")
+    lst_spec: List[TplArraySpec] = []
+    n_offset = 0
+    for str_key, arr in dic_array.items():
+        arr = np.ascontiguousarray(arr)
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf, offset=n_offset)[...] = arr
+        lst_spec.append((str_key, arr.dtype.str, arr.shape, n_offset))
+        n_offset += arr.nbytes
+    shm.close()
+    return str_name_shm, lst_spec
+
+
+def _unlink_shm(
+    str_name_shm: str
+):
+    """释放可能残留的共享内存, 不存在时忽略"""
+    try:
+        shm = SharedMemory(name=str_name_shm)
+    except (FileNotFoundError, OSError):
+        return
+    shm.close()
+    shm.unlink()
+    return
+
+
+class _DataEngineServer:
+    """子进程中执行请求的对象, 每个 _op_* 方法对应一种请求"""
+
+    def __init__(self,
+        lf: pl.LazyFrame,
+        str_name_col_timestamp: str,
+        str_time_unit: Optional[str],
+        n_bytes_result_limit: Optional[int]
+    ):
+        self.lf = lf
+        self.str_name_col_timestamp = str_name_col_timestamp
+        self.n_bytes_result_limit = n_bytes_result_limit
+        self.stats_index = WindowStatsIndex(lf, str_name_col_timestamp, str_time_unit)
+        pass
+
+    def _op_ping(self) -> Tuple[Any, Dict[str, np.ndarray]]:
+        return True, {}
+
+    def _op_fetch_window(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        n_max_point: Optional[int] = None
+    ) -> Tuple[Any, Dict[str, np.ndarray]]:
+        df_window = get_window_data(
+            self.lf, self.str_name_col_timestamp, lst_name_col, flt_start, flt_end, n_max_point)
+        # 对象类型(如字符串)的列不能放入共享内存, 随结果一起序列化
+        dic_array: Dict[str, np.ndarray] = {}
+        dic_object: Dict[str, np.ndarray] = {}
+        for str_name_col in df_window.columns:
+            arr = df_window[str_name_col].to_numpy()
+            (dic_object if arr.dtype.hasobject else dic_array)[str_name_col] = arr
+        return dic_object, dic_array
+
+    def _op_window_min_max(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float
+    ) -> Tuple[Any, Dict[str, np.ndarray]]:
+        return get_window_min_max(
+            self.lf, self.str_name_col_timestamp, lst_name_col, flt_start, flt_end), {}
+
+    def _op_value_asof(self,
+        lst_name_col: List[str],
+        flt_timestamp: float
+    ) -> Tuple[Any, Dict[str, np.ndarray]]:
+        return get_value_asof(
+            self.lf, self.str_name_col_timestamp, lst_name_col, flt_timestamp), {}
+
+    def _op_window_stats(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        flt_threshold: Optional[float] = None
+    ) -> Tuple[Any, Dict[str, np.ndarray]]:
+        self.stats_index.prepare(lst_name_col)
+        return {
+            str_name_col: self.stats_index.get_stats(str_name_col, flt_start, flt_end, flt_threshold)
+            for str_name_col in dict.fromkeys(lst_name_col)
+        }, {}
+
+    def _op_window_envelope(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        n_bucket: int = 2000
+    ) -> Tuple[Any, Dict[str, np.ndarray]]:
+        return None, self.stats_index.get_envelope(lst_name_col, flt_start, flt_end, n_bucket)
+
+    def handle(self,
+        str_op: str,
+        dic_kwargs: Dict[str, Any],
+        str_name_shm: str
+    ) -> Tuple[str, Any]:
+        """
+        执行一条请求, 大数组写入客户端指定名称的共享内存
+
+        Returns:
+            Tuple: ('ok', (结果, 共享内存名称, 数组描述)) 或 ('error', 错误信息)
+        """
+        func_op = getattr(self, f"_op_{str_op}", None)
+        if func_op is None:
+            return 'error', f"未知的请求: {str_op}"
+        try:
+            result, dic_array = func_op(**dic_kwargs)
+            str_name_shm, lst_spec = _pack_arrays(dic_array, self.n_bytes_result_limit, str_name_shm)
+        except MemoryError as e:
+            return 'error', f"内存不足: {e}"
+        except Exception:
+            return 'error', traceback.format_exc(limit=3)
+        return 'ok', (result, str_name_shm, lst_spec)
+
+
+def _run_engine(
+    conn: Connection,
+    lf: pl.LazyFrame,
+    str_name_col_timestamp: str,
+    str_time_unit: Optional[str],
+    n_bytes_memory_limit: Optional[int],
+    n_bytes_result_limit: Optional[int]
+):
+    """子进程入口: 循环处理请求, 收到 None 或管道关闭时退出"""
+    _set_memory_limit(n_bytes_memory_limit)
+    server = _DataEngineServer(lf, str_name_col_timestamp, str_time_unit, n_bytes_result_limit)
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+        str_op, dic_kwargs, str_name_shm = request
+        conn.send(server.handle(str_op, dic_kwargs, str_name_shm))
+    conn.close()
+    return
+
+
+# ============================================================
+# 客户端
+# ============================================================
+
+class _EngineChannel:
+    """
+    客户端的一条请求通道: 一个子进程和一条管道, 通道上的请求按到达顺序串行执行
+
+    子进程的启动参数(数据源、内存上限等)从所属客户端读取, 重启后使用客户端的当前值
+    """
+
+    def __init__(self,
+        client: "DataEngineClient",
+        str_name: str
+    ):
+        self.client = client
+        self.str_name = str_name
+        self._process: Optional[mp.process.BaseProcess] = None
+        self._conn: Optional[Connection] = None
+        # 管道上同时只能有一条请求
+        self._lock_request = threading.RLock()
+        pass
+
+    def start(self):
+        """启动子进程, 已在运行时不做任何事"""
+        if self.is_alive():
+            return
+        client = self.client
+        conn_parent, conn_child = client._ctx.Pipe()
+        self._process = client._ctx.Process(
+            target=_run_engine,
+            args=(conn_child, client.lf, client.str_name_col_timestamp, client.str_time_unit,
+                  client.n_bytes_memory_limit, client.n_bytes_result_limit),
+            name=f"DataEngine-{self.str_name}",
+            daemon=True
+        )
+        self._process.start()
+        conn_child.close()
+        self._conn = conn_parent
+        return
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def close(self,
+        flt_timeout: float = 2.0
+    ):
+        """结束子进程, 先请求退出, 超时后强制终止"""
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (OSError, ValueError):
+                pass
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            self._process.join(flt_timeout)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
+            self._process = None
+        return
+
+    def restart(self):
+        """等待通道上的请求结束后重启子进程"""
+        with self._lock_request:
+            self.close()
+            self.start()
+        return
+
+    def request(self,
+        str_op: str,
+        dic_kwargs: Dict[str, Any]
+    ) -> Tuple[Any, Dict[str, np.ndarray]]:
+        """
+        发送一条请求并等待结果
+
+        Returns:
+            Tuple: (结果, {键: 经共享内存传回的数组})
+
+        Raises:
+            DataEngineError: 查询出错、超时或子进程退出; 后两种情况下子进程已被结束,
+                其间可能已创建的共享内存按名称释放
+        """
+        # 名称由客户端生成, 子进程中途被结束时也能找到并释放
+        str_name_shm = f"de{os.getpid()}_{secrets.token_hex(6)}"
+        with self._lock_request:
+            self.start()
+            try:
+                self._conn.send((str_op, dic_kwargs, str_name_shm))
+                if not self._conn.poll(self.client.flt_timeout):
+                    self.close(flt_timeout=0.0)
+                    _unlink_shm(str_name_shm)
+                    raise DataEngineError(
+                        f"数据引擎请求 {str_op} 超时({self.client.flt_timeout:.0f}s), 已重置")
+                str_status, payload = self._conn.recv()
+            except (EOFError, OSError) as e:
+                n_exitcode = self._process.exitcode if self._process is not None else None
+                self.close(flt_timeout=0.0)
+                _unlink_shm(str_name_shm)
+                raise DataEngineError(f"数据引擎进程已退出(exitcode={n_exitcode}): {e}") from e
+        if str_status != 'ok':
+            _unlink_shm(str_name_shm)
+            raise DataEngineError(payload)
+        result, str_name_shm, lst_spec = payload
+        return result, self._unpack_arrays(str_name_shm, lst_spec)
+
+    @staticmethod
+    def _unpack_arrays(
+        str_name_shm: Optional[str],
+        lst_spec: List[TplArraySpec]
+    ) -> Dict[str, np.ndarray]:
+        """从共享内存复制出数组并释放共享内存"""
+        if str_name_shm is None:
+            return {}
+        shm = SharedMemory(name=str_name_shm)
+        try:
+            return {
+                str_key: np.ndarray(tpl_shape, dtype=np.dtype(str_dtype), buffer=shm.buf, offset=n_offset).copy()
+                for str_key, str_dtype, tpl_shape, n_offset in lst_spec
+            }
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+class DataEngineClient:
+    """
+    数据引擎的客户端, 在界面进程中使用
+
+    接口与 utilpolarswindow / WindowStatsIndex 的对应函数一致, 出错时抛出
+    DataEngineError. 超时或子进程退出后, 下一次请求会自动重启子进程,
+    也可以调用 restart() 手动重启. 交互请求和后台请求(bol_background=True)
+    各有一个子进程, 同一类请求按到达顺序串行执行, 可在后台线程中调用
+
+    Usage:
+        engine = DataEngineClient(lf, "timestamp", n_mb_memory_limit=4096)
+        dic_array = engine.fetch_window(["GTG_P_out"], 0.0, 3600.0, n_max_point=10000)
+        engine.close()
+
+    Attributes:
+        lf (pl.LazyFrame): 数据源, 随子进程启动参数序列化
+        str_name_col_timestamp (str): 时间戳列名称
+        str_time_unit (Optional[str]): 时间戳列的时间单位, 用于把积分和时长换算为秒
+        flt_timeout (float): 单次请求的超时(秒)
+    """
+
+    def __init__(self,
+        lf: pl.LazyFrame,
+        str_name_col_timestamp: str,
+        str_time_unit: Optional[str] = None,
+        n_mb_memory_limit: Optional[int] = 4096,
+        n_mb_result_limit: Optional[int] = 512,
+        flt_timeout: float = 60.0
+    ):
+        """
+        Args:
+            lf: 数据源
+            str_name_col_timestamp: 时间戳列名称
+            str_time_unit: 时间戳列为 Datetime/Duration 时的时间单位, 见 DatasetDescriptor.str_time_unit
+            n_mb_memory_limit: 每个子进程的地址空间上限(MB), 为None时不限制
+            n_mb_result_limit: 单次结果经共享内存传输的上限(MB), 为None时不限制
+            flt_timeout: 单次请求的超时(秒)
+        """
+        self.lf = lf
+        self.str_name_col_timestamp = str_name_col_timestamp
+        self.str_time_unit = str_time_unit
+        self.n_bytes_memory_limit = n_mb_memory_limit * 2**20 if n_mb_memory_limit else None
+        self.n_bytes_result_limit = n_mb_result_limit * 2**20 if n_mb_result_limit else None
+        self.flt_timeout = flt_timeout
+        # spawn 在各平台行为一致, 子进程不继承界面进程的Qt状态
+        self._ctx = mp.get_context('spawn')
+        self._channel_interactive = _EngineChannel(self, "interactive")
+        self._channel_background = _EngineChannel(self, "background")
+        pass
+
+    # 进程管理
+    def _get_channel(self,
+        bol_background: bool
+    ) -> _EngineChannel:
+        return self._channel_background if bol_background else self._channel_interactive
+
+    def start(self):
+        """启动交互和后台子进程, 已在运行时不做任何事"""
+        self._channel_interactive.start()
+        self._channel_background.start()
+        return
+
+    def is_alive(self) -> bool:
+        """交互子进程是否在运行"""
+        return self._channel_interactive.is_alive()
+
+    def close(self,
+        flt_timeout: float = 2.0
+    ):
+        """结束所有子进程, 先请求退出, 超时后强制终止"""
+        self._channel_interactive.close(flt_timeout)
+        self._channel_background.close(flt_timeout)
+        return
+
+    def restart(self):
+        """重启所有子进程, 丢弃其中已建立的统计索引"""
+        self._channel_interactive.restart()
+        self._channel_background.restart()
+        return
+
+    # 请求
+    def _request(self,
+        str_op: str,
+        bol_background: bool = False,
+        **kwargs
+    ) -> Tuple[Any, Dict[str, np.ndarray]]:
+        """
+        在对应通道上发送一条请求并等待结果, 见 _EngineChannel.request
+
+        Raises:
+            DataEngineError: 查询出错、超时或子进程退出
+        """
+        return self._get_channel(bol_background).request(str_op, kwargs)
+
+    def ping(self,
+        bol_background: bool = False
+    ) -> bool:
+        result, _ = self._request('ping', bol_background)
+        return result
+
+    def fetch_window(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        n_max_point: Optional[int] = None,
+        bol_background: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """
+        获取时间窗口内多列的数据, 见 get_window_data
+
+        Args:
+            bol_background: 在后台子进程中执行, 不占用交互请求的通道
+
+        Returns:
+            Dict: {列名: 数组}, 包含时间戳列
+        """
+        dic_object, dic_array = self._request(
+            'fetch_window', bol_background, lst_name_col=lst_name_col,
+            flt_start=flt_start, flt_end=flt_end, n_max_point=n_max_point)
+        dic_array.update(dic_object)
+        return dic_array
+
+    def get_window_min_max(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        bol_background: bool = False
+    ) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """见 get_window_min_max"""
+        result, _ = self._request(
+            'window_min_max', bol_background, lst_name_col=lst_name_col, flt_start=flt_start, flt_end=flt_end)
+        return result
+
+    def get_value_asof(self,
+        lst_name_col: List[str],
+        flt_timestamp: float,
+        bol_background: bool = False
+    ) -> Tuple[Optional[float], Dict[str, Optional[float]]]:
+        """见 get_value_asof"""
+        result, _ = self._request(
+            'value_asof', bol_background, lst_name_col=lst_name_col, flt_timestamp=flt_timestamp)
+        return result
+
+    def get_window_envelope(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        n_bucket: int = 2000,
+        bol_background: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """多列的窗口粗略包络, 见 WindowStatsIndex.get_envelope"""
+        _, dic_array = self._request(
+            'window_envelope', bol_background, lst_name_col=lst_name_col,
+            flt_start=flt_start, flt_end=flt_end, n_bucket=n_bucket)
+        return dic_array
+
+    def get_window_stats(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        flt_threshold: Optional[float] = None,
+        bol_background: bool = False
+    ) -> Dict[str, Dict[str, float]]:
+        """多列的窗口统计, 见 WindowStatsIndex.get_stats"""
+        result, _ = self._request(
+            'window_stats', bol_background, lst_name_col=lst_name_col,
+            flt_start=flt_start, flt_end=flt_end, flt_threshold=flt_threshold)
+        return result
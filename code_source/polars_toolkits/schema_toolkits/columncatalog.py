@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+列目录(column catalog)
+
+打开数据集时对所有列做一次流式扫描, 记录每列的类型和统计信息, 并保存为
+数据文件旁的 `<文件名>.colcatalog.json`. 数据文件未变化时直接读取该文件,
+界面据此显示列信息、隐藏常值/全空列、选择默认绘图方式, 不必再次读取数据.
+"""
+
+import json
+import math
+from dataclasses import dataclass, asdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import polars as pl
+
+from code_source.polars_toolkits.schema_toolkits.datasetdescriptor import DatasetDescriptor
+
+# 目录文件格式版本, 格式不兼容地变化时递增
+N_VERSION_CATALOG = 1
+# 目录文件后缀, 追加在数据文件名之后
+STR_SUFFIX_CATALOG = '.colcatalog.json'
+
+
+@dataclass(frozen=True)
+class ColumnStats:
+    """
+    单列的类型和统计信息
+
+    数值和布尔列才有 min/max/mean; 时间戳为该列首个/最后一个非空值对应的时间
+    """
+    str_name_col: str                       # 实际列名
+    str_dtype: str                          # polars 类型, 如 'Float64'
+    n_row: int                              # 总行数
+    n_null: int                             # 空值个数
+    flt_min: Optional[float] = None
+    flt_max: Optional[float] = None
+    flt_mean: Optional[float] = None
+    n_distinct_est: int = 0                 # 非空值的不同值个数(近似)
+    bol_boolean: bool = False               # 布尔列, 或只取 0/1 的数值列
+    ts_first_valid: Any = None              # 首个非空值的时间戳
+    ts_last_valid: Any = None               # 最后一个非空值的时间戳
+
+    @property
+    def bol_all_null(self) -> bool:
+        """整列为空"""
+        return self.n_null >= self.n_row
+
+    @property
+    def bol_constant(self) -> bool:
+        """非空值全部相同(不含全空列)"""
+        if self.bol_all_null:
+            return False
+        if self.flt_min is not None and self.flt_max is not None:
+            return self.flt_min == self.flt_max
+        return self.n_distinct_est <= 1
+
+    @property
+    def bol_trivial(self) -> bool:
+        """常值或全空, 绘图没有信息量"""
+        return self.bol_all_null or self.bol_constant
+
+
+def _to_float(
+    value: Any
+) -> Optional[float]:
+    """统计值 -> float, 空值和非有限值记为None"""
+    if value is None:
+        return None
+    flt_value = float(value)
+    return flt_value if math.isfinite(flt_value) else None
+
+
+def _ts_to_json(
+    ts: Any
+) -> Any:
+    """时间戳 -> JSON值, 日期时间转为ISO字符串"""
+    if isinstance(ts, (datetime, date)):
+        return ts.isoformat()
+    return ts
+
+
+def _ts_from_json(
+    value: Any,
+    str_dtype_timestamp: str
+) -> Any:
+    """JSON值 -> 时间戳, 按时间戳列的类型还原日期时间"""
+    if not isinstance(value, str):
+        return value
+    if str_dtype_timestamp.startswith('Datetime'):
+        return datetime.fromisoformat(value)
+    if str_dtype_timestamp.startswith('Date'):
+        return date.fromisoformat(value)
+    return value
+
+
+class ColumnCatalog:
+    """
+    数据集的列目录
+
+    Usage:
+        catalog = ColumnCatalog.load_or_build(lf, "data.parquet")
+        stats = catalog.get_stats("GTG_P_out")
+        lst_name_col = catalog.get_names_data(bol_hide_trivial=True)
+
+    Attributes:
+        str_name_col_timestamp (str): 时间戳列名称
+        str_dtype_timestamp (str): 时间戳列类型
+        lst_name_col (List[str]): 所有列名, 与数据的列顺序一致
+        dic_stats (Dict[str, ColumnStats]): 列名 -> 统计信息, 包含时间戳列
+        dic_source (Dict[str, int]): 数据文件的大小和修改时间, 用于判断目录是否过期
+    """
+
+    def __init__(self,
+        str_name_col_timestamp: str,
+        str_dtype_timestamp: str,
+        lst_name_col: List[str],
+        dic_stats: Dict[str, ColumnStats],
+        dic_source: Optional[Dict[str, int]] = None
+    ):
+        self.str_name_col_timestamp = str_name_col_timestamp
+        self.str_dtype_timestamp = str_dtype_timestamp
+        self.lst_name_col = lst_name_col
+        self.dic_stats = dic_stats
+        self.dic_source = dic_source or {}
+        pass
+
+    # ============================================================
+    # 建立
+    # ============================================================
+
+    @classmethod
+    def build(cls,
+        lf: pl.LazyFrame,
+        str_name_col_timestamp: Optional[str] = None,
+        descriptor: Optional[DatasetDescriptor] = None
+    ) -> 'ColumnCatalog':
+        """
+        对所有列做一次流式扫描建立目录
+
+        所有列的统计表达式放在同一个 select 中, 数据只读取一遍
+
+        Args:
+            lf: 数据源
+            str_name_col_timestamp: 时间戳列名称, 为None时取第一列; 给定 descriptor 时忽略
+            descriptor: 数据集描述, 为None时解析一次lf的schema
+        """
+        # 1.类型信息来自数据集描述
+        descriptor = descriptor or DatasetDescriptor.from_lazyframe(lf, str_name_col_timestamp)
+        lst_name_col = list(descriptor.tpl_name_col)
+        str_name_col_timestamp = descriptor.str_name_col_timestamp
+        expr_ts = pl.col(str_name_col_timestamp)
+        # 2.按列下标命名统计结果, 避免与原列名冲突
+        lst_expr = [pl.len().alias('n_row')]
+        for idx_col, str_name_col in enumerate(lst_name_col):
+            expr_col = pl.col(str_name_col)
+            expr_valid = expr_col.is_not_null()
+            lst_expr += [
+                expr_col.null_count().alias(f"{idx_col}_null"),
+                expr_col.drop_nulls().approx_n_unique().alias(f"{idx_col}_distinct"),
+                expr_ts.filter(expr_valid).min().alias(f"{idx_col}_ts_first"),
+                expr_ts.filter(expr_valid).max().alias(f"{idx_col}_ts_last"),
+            ]
+            if not descriptor.is_numeric(str_name_col):
+                continue
+            expr_num = expr_col.cast(pl.Float64)
+            lst_expr += [
+                expr_num.min().alias(f"{idx_col}_min"),
+                expr_num.max().alias(f"{idx_col}_max"),
+                expr_num.mean().alias(f"{idx_col}_mean"),
+                (expr_num.is_in([0.0, 1.0]) | expr_num.is_null()).all().alias(f"{idx_col}_bool"),
+            ]
+        # 3.一次流式扫描
+        dic_row = lf.select(lst_expr).collect(engine="streaming").row(0, named=True)
+        # 4.整理为每列的统计信息
+        n_row = int(dic_row['n_row'])
+        dic_stats: Dict[str, ColumnStats] = {}
+        for idx_col, str_name_col in enumerate(lst_name_col):
+            dtype = descriptor.dic_dtype[str_name_col]
+            dic_stats[str_name_col] = ColumnStats(
+                str_name_col=str_name_col,
+                str_dtype=str(dtype),
+                n_row=n_row,
+                n_null=int(dic_row[f"{idx_col}_null"]),
+                flt_min=_to_float(dic_row.get(f"{idx_col}_min")),
+                flt_max=_to_float(dic_row.get(f"{idx_col}_max")),
+                flt_mean=_to_float(dic_row.get(f"{idx_col}_mean")),
+                n_distinct_est=int(dic_row[f"{idx_col}_distinct"] or 0),
+                bol_boolean=dtype == pl.Boolean or bool(dic_row.get(f"{idx_col}_bool")),
+                ts_first_valid=dic_row[f"{idx_col}_ts_first"],
+                ts_last_valid=dic_row[f"{idx_col}_ts_last"],
+            )
+        return cls(
+            str_name_col_timestamp=str_name_col_timestamp,
+            str_dtype_timestamp=str(descriptor.dtype_timestamp),
+            lst_name_col=lst_name_col,
+            dic_stats=dic_stats
+        )
+
+    # ============================================================
+    # 目录文件
+    # ============================================================
+
+    @staticmethod
+    def get_path_catalog(
+        path_source: Union[str, Path]
+    ) -> Path:
+        """数据文件对应的目录文件路径"""
+        path_source = Path(path_source)
+        return path_source.with_name(path_source.name + STR_SUFFIX_CATALOG)
+
+    @staticmethod
+    def _get_dic_source(
+        path_source: Union[str, Path]
+    ) -> Dict[str, int]:
+        """数据文件的大小和修改时间"""
+        stat_source = Path(path_source).stat()
+        return {
+            'n_size': stat_source.st_size,
+            'n_mtime_ns': stat_source.st_mtime_ns,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """导出为可JSON序列化的字典"""
+        lst_col = []
+        for str_name_col in self.lst_name_col:
+            dic_col = asdict(self.dic_stats[str_name_col])
+            dic_col['ts_first_valid'] = _ts_to_json(dic_col['ts_first_valid'])
+            dic_col['ts_last_valid'] = _ts_to_json(dic_col['ts_last_valid'])
+            lst_col.append(dic_col)
+        return {
+            'n_version': N_VERSION_CATALOG,
+            'source': self.dic_source,
+            'str_name_col_timestamp': self.str_name_col_timestamp,
+            'str_dtype_timestamp': self.str_dtype_timestamp,
+            'lst_column': lst_col,
+        }
+
+    @classmethod
+    def from_dict(cls,
+        dic_catalog: Dict[str, Any]
+    ) -> 'ColumnCatalog':
+        """从字典重建目录
+
+        Raises:
+            ValueError: 版本号不匹配
+        """
+        n_version = dic_catalog.get('n_version')
+        if n_version != N_VERSION_CATALOG:
+            raise ValueError(f"不支持的列目录版本: {n_version}")
+        str_dtype_timestamp = dic_catalog['str_dtype_timestamp']
+        dic_stats: Dict[str, ColumnStats] = {}
+        for dic_col in dic_catalog['lst_column']:
+            dic_col = dict(dic_col)
+            dic_col['ts_first_valid'] = _ts_from_json(dic_col.get('ts_first_valid'), str_dtype_timestamp)
+            dic_col['ts_last_valid'] = _ts_from_json(dic_col.get('ts_last_valid'), str_dtype_timestamp)
+            dic_stats[dic_col['str_name_col']] = ColumnStats(**dic_col)
+        return cls(
+            str_name_col_timestamp=dic_catalog['str_name_col_timestamp'],
+            str_dtype_timestamp=str_dtype_timestamp,
+            lst_name_col=list(dic_stats.keys()),
+            dic_stats=dic_stats,
+            dic_source=dic_catalog.get('source')
+        )
+
+    def write(self,
+        path_catalog: Union[str, Path]
+    ):
+        """写入目录文件, 先写临时文件再替换, 避免留下不完整的文件"""
+        path_catalog = Path(path_catalog)
+        path_tmp = path_catalog.with_name(path_catalog.name + '.tmp')
+        with open(path_tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        path_tmp.replace(path_catalog)
+        return
+
+    @classmethod
+    def read(cls,
+        path_catalog: Union[str, Path]
+    ) -> 'ColumnCatalog':
+        """读取目录文件"""
+        with open(path_catalog, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def load_or_build(cls,
+        lf: pl.LazyFrame,
+        path_source: Union[str, Path],
+        str_name_col_timestamp: Optional[str] = None,
+        descriptor: Optional[DatasetDescriptor] = None
+    ) -> 'ColumnCatalog':
+        """
+        读取数据文件旁的目录文件; 不存在、已过期或损坏时重新扫描并写入
+
+        Args:
+            lf: 数据源
+            path_source: 数据文件路径
+            str_name_col_timestamp: 时间戳列名称, 为None时取第一列
+            descriptor: 数据集描述, 重新扫描时使用
+        """
+        if descriptor is not None:
+            str_name_col_timestamp = descriptor.str_name_col_timestamp
+        path_catalog = cls.get_path_catalog(path_source)
+        dic_source = cls._get_dic_source(path_source)
+        # 1.目录文件与数据文件匹配时直接使用
+        if path_catalog.exists():
+            try:
+                catalog = cls.read(path_catalog)
+                if (catalog.dic_source == dic_source
+                        and str_name_col_timestamp in (None, catalog.str_name_col_timestamp)):
+                    return catalog
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"列目录文件无法读取, 重新建立: {e}")
+        # 2.重新扫描
+        catalog = cls.build(lf, str_name_col_timestamp, descriptor)
+        catalog.dic_source = dic_source
+        # 3.数据目录不可写时只在内存中使用
+        try:
+            catalog.write(path_catalog)
+        except OSError as e:
+            print(f"列目录文件写入失败: {e}")
+        return catalog
+
+    # ============================================================
+    # 查询
+    # ============================================================
+
+    def get_stats(self,
+        str_name_col: str
+    ) -> Optional[ColumnStats]:
+        """列的统计信息, 列不存在时返回None"""
+        return self.dic_stats.get(str_name_col)
+
+    def get_names_data(self,
+        bol_hide_trivial: bool = False
+    ) -> List[str]:
+        """
+        数据列名(不含时间戳列)
+
+        Args:
+            bol_hide_trivial: 是否排除常值和全空列
+        """
+        return [
+            str_name_col for str_name_col in self.lst_name_col
+            if str_name_col != self.str_name_col_timestamp
+            and not (bol_hide_trivial and self.dic_stats[str_name_col].bol_trivial)
+        ]
+
+    def get_names_trivial(self) -> List[str]:
+        """常值和全空的数据列名"""
+        return [
+            str_name_col for str_name_col in self.get_names_data()
+            if self.dic_stats[str_name_col].bol_trivial
+        ]
+
+    def describe(self,
+        str_name_col: str
+    ) -> str:
+        """列统计信息的简短文字描述, 用于提示框"""
+        stats = self.get_stats(str_name_col)
+        if stats is None:
+            return str_name_col
+        lst_line = [f"{stats.str_name_col}  [{stats.str_dtype}]"]
+        if stats.bol_all_null:
+            lst_line.append("全部为空")
+            return "\n".join(lst_line)
+        lst_line.append(f"空值: {stats.n_null}/{stats.n_row}    不同值≈{stats.n_distinct_est}")
+        if stats.flt_min is not None:
+            lst_line.append(f"min={stats.flt_min:.6g}  max={stats.flt_max:.6g}  mean={stats.flt_mean:.6g}")
+        if stats.bol_constant:
+            lst_line.append("常值")
+        elif stats.bol_boolean:
+            lst_line.append("布尔/开关量")
+        lst_line.append(f"有效范围: {stats.ts_first_valid} ~ {stats.ts_last_valid}")
+        return "\n".join(lst_line)
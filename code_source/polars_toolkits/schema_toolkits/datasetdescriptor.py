@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+数据集描述
+
+对 LazyFrame 只解析一次 schema, 记录列名、类型和时间戳列的信息. 多文件或
+查询计划很长的 LazyFrame 每次 collect_schema 都要重新解析计划, 因此数据集
+接入时建立描述, 之后所有使用方都从描述读取; LazyFrame 变化时重新建立并递增版本号.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import polars as pl
+
+
+@dataclass(frozen=True)
+class DatasetDescriptor:
+    """
+    LazyFrame 的 schema 快照
+
+    Usage:
+        descriptor = DatasetDescriptor.from_lazyframe(lf)
+        lst_name_col = descriptor.lst_name_col_data
+        if descriptor.is_numeric("GTG_P_out"): ...
+        descriptor = descriptor.rebuild(lf_new)    # 数据源变化后
+
+    Attributes:
+        str_name_col_timestamp: 时间戳列名称
+        tpl_name_col: 所有列名, 与数据的列顺序一致
+        dic_dtype: 列名 -> polars 类型
+        str_time_unit: 时间戳列为 Datetime/Duration 时的时间单位('ns'/'us'/'ms'), 否则为None
+        str_time_zone: 时间戳列为带时区的 Datetime 时的时区, 否则为None
+        n_version: 版本号, 每次因数据源变化重建时递增
+    """
+    str_name_col_timestamp: str
+    tpl_name_col: Tuple[str, ...]
+    dic_dtype: Dict[str, pl.DataType] = field(compare=False)
+    str_time_unit: Optional[str] = None
+    str_time_zone: Optional[str] = None
+    n_version: int = 0
+
+    @classmethod
+    def from_lazyframe(cls,
+        lf: pl.LazyFrame,
+        str_name_col_timestamp: Optional[str] = None,
+        n_version: int = 0
+    ) -> 'DatasetDescriptor':
+        """
+        解析一次 schema 建立描述
+
+        Args:
+            lf: 数据源
+            str_name_col_timestamp: 时间戳列名称, 为None时取第一列
+            n_version: 版本号
+
+        Raises:
+            KeyError: 时间戳列不存在
+        """
+        schema = lf.collect_schema()
+        lst_name_col = schema.names()
+        str_name_col_timestamp = str_name_col_timestamp or lst_name_col[0]
+        if str_name_col_timestamp not in schema:
+            raise KeyError(f"时间戳列不存在: {str_name_col_timestamp}")
+        dtype_timestamp = schema[str_name_col_timestamp]
+        return cls(
+            str_name_col_timestamp=str_name_col_timestamp,
+            tpl_name_col=tuple(lst_name_col),
+            dic_dtype=dict(schema),
+            str_time_unit=getattr(dtype_timestamp, 'time_unit', None),
+            str_time_zone=getattr(dtype_timestamp, 'time_zone', None),
+            n_version=n_version
+        )
+
+    def rebuild(self,
+        lf: pl.LazyFrame
+    ) -> 'DatasetDescriptor':
+        """数据源变化后重新解析, 保留时间戳列并递增版本号"""
+        return self.from_lazyframe(lf, self.str_name_col_timestamp, self.n_version + 1)
+
+    @property
+    def lst_name_col_data(self) -> List[str]:
+        """除时间戳列外的所有列名"""
+        return [
+            str_name_col for str_name_col in self.tpl_name_col
+            if str_name_col != self.str_name_col_timestamp
+        ]
+
+    @property
+    def dtype_timestamp(self) -> pl.DataType:
+        return self.dic_dtype[self.str_name_col_timestamp]
+
+    @property
+    def bol_timestamp_temporal(self) -> bool:
+        """时间戳列为 Datetime/Date/Duration 等时间类型, 而非数值秒/小时"""
+        return self.dtype_timestamp.is_temporal()
+
+    def get_dtype(self,
+        str_name_col: str
+    ) -> Optional[pl.DataType]:
+        return self.dic_dtype.get(str_name_col)
+
+    def is_numeric(self,
+        str_name_col: str
+    ) -> bool:
+        """可以计算 min/max/mean 的类型(数值或布尔)"""
+        dtype = self.dic_dtype.get(str_name_col)
+        return dtype is not None and (dtype.is_numeric() or dtype == pl.Boolean)
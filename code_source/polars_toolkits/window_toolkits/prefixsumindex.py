@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+
+from typing import Dict, List, Optional, Tuple
+import threading
+import numpy as np
+import polars as pl
+
+# 时间戳列的时间单位 -> 秒, 数值时间戳按秒处理
+DIC_SECOND_PER_TIME_UNIT: Dict[Optional[str], float] = {
+    'ns': 1e-9,
+    'us': 1e-6,
+    'ms': 1e-3,
+    None: 1.0,
+}
+
+
+class ColumnPrefixSum:
+    """
+    单列数据的前缀和索引
+
+    预先计算累计和、累计平方和、累计梯形积分和有效点计数, 任意窗口的
+    均值/方差/积分只需二分查找定位窗口边界再做两次查表, 无需重新扫描;
+    最小/最大值由分块极值加两端不完整块的扫描得到
+
+    * 为减小大数值下平方和相减的抵消误差, 累计和与平方和基于减去列均值后的数据
+    * 空值不计入统计, 与其相邻的梯形段积分记为0
+    * 积分的时间按秒计, 即单位为 值×秒
+
+    Attributes:
+        arr_value (np.ndarray): 原始值, 空值为NaN
+        flt_shift (float): 计算前缀和时减去的偏移量(列均值)
+        arr_cumcount (np.ndarray): 有效点个数前缀和, 长度n+1
+        arr_cumsum (np.ndarray): 偏移后值的前缀和, 长度n+1
+        arr_cumsq (np.ndarray): 偏移后值平方的前缀和, 长度n+1
+        arr_cumtrapz (np.ndarray): 从第一个点起的累计梯形积分, 长度n
+        arr_block_min (np.ndarray): 每块的最小值
+        arr_block_max (np.ndarray): 每块的最大值
+    """
+    n_size_block: int = 1024
+
+    def __init__(self,
+        arr_ts: np.ndarray,
+        arr_value: np.ndarray,
+        flt_second_per_unit: float = 1.0
+    ):
+        """
+        Args:
+            arr_ts: 时间戳, 原始单位
+            arr_value: 值
+            flt_second_per_unit: 时间戳一个单位对应的秒数
+        """
+        self.arr_value = np.asarray(arr_value, dtype=np.float64)
+        # 1.有效点掩码和偏移量
+        arr_valid = np.isfinite(self.arr_value)
+        self.flt_shift = float(self.arr_value[arr_valid].mean()) if arr_valid.any() else 0.0
+        arr_shifted = np.where(arr_valid, self.arr_value - self.flt_shift, 0.0)
+        # 2.计数/和/平方和的前缀和
+        self.arr_cumcount = np.concatenate(([0], np.cumsum(arr_valid, dtype=np.int64)))
+        self.arr_cumsum = np.concatenate(([0.0], np.cumsum(arr_shifted)))
+        self.arr_cumsq = np.concatenate(([0.0], np.cumsum(arr_shifted * arr_shifted)))
+        # 3.累计梯形积分, 任一端点为空的段记为0
+        arr_area = np.where(
+            arr_valid[1:] & arr_valid[:-1],
+            0.5 * (self.arr_value[1:] + self.arr_value[:-1]) * (np.diff(arr_ts) * flt_second_per_unit),
+            0.0
+        ) if len(arr_ts) > 1 else np.empty(0)
+        self.arr_cumtrapz = np.concatenate(([0.0], np.cumsum(arr_area)))[:len(arr_ts)]
+        # 4.分块极值, fmin/fmax忽略NaN
+        n_block = -(-len(self.arr_value) // self.n_size_block)
+        arr_pad = np.full(n_block * self.n_size_block, np.nan)
+        arr_pad[:len(self.arr_value)] = self.arr_value
+        arr_block = arr_pad.reshape(n_block, self.n_size_block)
+        self.arr_block_min = np.fmin.reduce(arr_block, axis=1) if n_block else np.empty(0)
+        self.arr_block_max = np.fmax.reduce(arr_block, axis=1) if n_block else np.empty(0)
+        pass
+
+    def _calc_min_max(self,
+        idx_start: int,
+        idx_end: int
+    ) -> Tuple[float, float]:
+        """计算 [idx_start, idx_end) 内的最小值和最大值, 全为空时返回NaN
+        """
+        n_size = self.n_size_block
+        idx_block_start = -(-idx_start // n_size)
+        idx_block_end = idx_end // n_size
+        # 窗口不跨越完整块时直接扫描
+        if idx_block_start >= idx_block_end:
+            arr_part = self.arr_value[idx_start:idx_end]
+            return float(np.fmin.reduce(arr_part)), float(np.fmax.reduce(arr_part))
+        # 完整块查表, 两端不完整部分扫描
+        lst_arr_part = [
+            self.arr_value[idx_start:idx_block_start * n_size],
+            self.arr_value[idx_block_end * n_size:idx_end],
+        ]
+        flt_min = float(np.fmin.reduce(self.arr_block_min[idx_block_start:idx_block_end]))
+        flt_max = float(np.fmax.reduce(self.arr_block_max[idx_block_start:idx_block_end]))
+        for arr_part in lst_arr_part:
+            if len(arr_part):
+                flt_min = float(np.fmin(flt_min, np.fmin.reduce(arr_part)))
+                flt_max = float(np.fmax(flt_max, np.fmax.reduce(arr_part)))
+        return flt_min, flt_max
+
+    def query(self,
+        idx_start: int,
+        idx_end: int
+    ) -> Dict[str, float]:
+        """查询 [idx_start, idx_end) 内的统计量
+
+        Returns:
+            Dict: min/max/mean/std/integral, 积分单位为 值×秒;
+                窗口内无有效点时为NaN
+        """
+        dic_stats = {key: np.nan for key in ('min', 'max', 'mean', 'std', 'integral')}
+        if idx_end <= idx_start:
+            return dic_stats
+        n_valid = int(self.arr_cumcount[idx_end] - self.arr_cumcount[idx_start])
+        # 积分取窗口内首尾采样点之间的部分
+        dic_stats['integral'] = float(self.arr_cumtrapz[idx_end - 1] - self.arr_cumtrapz[idx_start])
+        if n_valid == 0:
+            return dic_stats
+        flt_sum = self.arr_cumsum[idx_end] - self.arr_cumsum[idx_start]
+        flt_sq = self.arr_cumsq[idx_end] - self.arr_cumsq[idx_start]
+        flt_mean_shifted = flt_sum / n_valid
+        dic_stats['mean'] = float(flt_mean_shifted + self.flt_shift)
+        dic_stats['std'] = float(np.sqrt(max(flt_sq / n_valid - flt_mean_shifted ** 2, 0.0)))
+        dic_stats['min'], dic_stats['max'] = self._calc_min_max(idx_start, idx_end)
+        return dic_stats
+
+
+class WindowStatsIndex:
+    """
+    LazyFrame多列的窗口统计索引
+
+    时间戳列只collect一次, 每列在第一次查询时collect并建立前缀和索引,
+    之后任意窗口的查询为 O(log n) 的二分查找加常数次查表
+
+    * prepare 可在后台线程调用, 建立索引期间包络查询改为只扫描窗口内数据
+
+    * 窗口边界和输出的时间戳使用时间戳列的原始单位(Datetime 为整数 ns/us/ms),
+      积分和超阈时长按 str_time_unit 换算为秒
+
+    Attributes:
+        lf (pl.LazyFrame): 数据源, 需按时间戳升序
+        str_name_col_timestamp (str): 时间戳列名称
+        flt_second_per_unit (float): 时间戳一个单位对应的秒数
+        arr_ts (Optional[np.ndarray]): 时间戳数组, 首次使用时加载
+        dic_prefixsum (Dict[str, ColumnPrefixSum]): 已建立索引的列
+    """
+
+    def __init__(self,
+        lf: pl.LazyFrame,
+        str_name_col_timestamp: str,
+        str_time_unit: Optional[str] = None
+    ):
+        """
+        Args:
+            lf: 数据源
+            str_name_col_timestamp: 时间戳列名称
+            str_time_unit: 时间戳列为 Datetime/Duration 时的时间单位, 见 DatasetDescriptor.str_time_unit
+        """
+        self.lf = lf
+        self.str_name_col_timestamp = str_name_col_timestamp
+        self.flt_second_per_unit = DIC_SECOND_PER_TIME_UNIT[str_time_unit]
+        self.arr_ts: Optional[np.ndarray] = None
+        self.dic_prefixsum: Dict[str, ColumnPrefixSum] = {}
+        # 后台线程和调用方可能同时建立索引, 同一列只collect一次
+        self._lock_prepare = threading.Lock()
+        pass
+
+    def invalidate(self):
+        """数据源变化后清空所有索引
+        """
+        self.arr_ts = None
+        self.dic_prefixsum.clear()
+        return
+
+    def _get_arr_ts(self) -> np.ndarray:
+        """获取时间戳数组, 原始单位, 与窗口边界直接比较
+        """
+        if self.arr_ts is None:
+            self.arr_ts = (
+                self.lf
+                .select(pl.col(self.str_name_col_timestamp).cast(pl.Float64))
+                .collect()
+                .to_series()
+                .to_numpy()
+            )
+        return self.arr_ts
+
+    def prepare(self,
+        lst_name_col: List[str]
+    ):
+        """为尚未建立索引的列一次性collect并建立索引
+        """
+        with self._lock_prepare:
+            arr_ts = self._get_arr_ts()
+            lst_name_col_new = [
+                str_name_col for str_name_col in dict.fromkeys(lst_name_col)
+                if str_name_col not in self.dic_prefixsum
+            ]
+            if not lst_name_col_new:
+                return
+            df_value = (
+                self.lf
+                .select([pl.col(str_name_col).cast(pl.Float64) for str_name_col in lst_name_col_new])
+                .collect()
+            )
+            for str_name_col in lst_name_col_new:
+                self.dic_prefixsum[str_name_col] = ColumnPrefixSum(
+                    arr_ts,
+                    df_value[str_name_col].fill_null(np.nan).to_numpy(),
+                    self.flt_second_per_unit
+                )
+        return
+
+    def is_prepared(self,
+        lst_name_col: List[str]
+    ) -> bool:
+        """时间戳和各列的索引是否都已建立, 此时查询不再collect整列
+        """
+        return self.arr_ts is not None and all(
+            str_name_col in self.dic_prefixsum for str_name_col in lst_name_col)
+
+    def get_idx_window(self,
+        flt_start: float,
+        flt_end: float
+    ) -> Tuple[int, int]:
+        """二分查找窗口 [flt_start, flt_end] 对应的下标区间 [idx_start, idx_end)
+        """
+        arr_ts = self._get_arr_ts()
+        idx_start = int(np.searchsorted(arr_ts, flt_start, side='left'))
+        idx_end = int(np.searchsorted(arr_ts, flt_end, side='right'))
+        return idx_start, idx_end
+
+    def get_stats(self,
+        str_name_col: str,
+        flt_start: float,
+        flt_end: float,
+        flt_threshold: Optional[float] = None
+    ) -> Dict[str, float]:
+        """查询单列在时间窗口内的统计量
+
+        Args:
+            str_name_col: 列名
+            flt_start: 窗口起点
+            flt_end: 窗口终点
+            flt_threshold: 阈值, 给定时额外计算超过阈值的时长
+        Returns:
+            Dict: min/max/mean/std/integral, 以及可选的time_above;
+                积分单位为 值×秒, 时长单位为秒
+        """
+        self.prepare([str_name_col])
+        prefixsum = self.dic_prefixsum[str_name_col]
+        idx_start, idx_end = self.get_idx_window(flt_start, flt_end)
+        dic_stats = prefixsum.query(idx_start, idx_end)
+        if flt_threshold is not None:
+            dic_stats['time_above'] = self._calc_time_above(
+                prefixsum.arr_value, idx_start, idx_end, flt_threshold)
+        return dic_stats
+
+    def get_envelope(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        n_bucket: int = 2000
+    ) -> Dict[str, np.ndarray]:
+        """多列在时间窗口内的粗略包络, 用于大窗口先行绘制的概略图
+
+        已建立索引时直接复用分块极值: 窗口覆盖的块按固定个数合并为不超过 n_bucket 个桶,
+        每个桶输出两个点(桶起点时刻, 最小值)和(桶终点时刻, 最大值), 只扫描两端桶中
+        不完整的块, 桶不超出窗口. 索引尚未建立时不在此处建立(会collect整列),
+        改为只查询窗口内的数据按行数分桶, 见 _query_envelope
+
+        Returns:
+            Dict: {列名: 数组}, 包含时间戳列, 各列长度相同
+        """
+        lst_name_col = list(dict.fromkeys(lst_name_col))
+        if n_bucket <= 0:
+            return self._get_envelope_empty(lst_name_col)
+        if not self.is_prepared(lst_name_col):
+            return self._query_envelope(lst_name_col, flt_start, flt_end, n_bucket)
+        arr_ts = self._get_arr_ts()
+        idx_start, idx_end = self.get_idx_window(flt_start, flt_end)
+        # 窗口内没有点时不能输出其所在块的极值
+        if idx_end <= idx_start:
+            return self._get_envelope_empty(lst_name_col)
+        n_size = ColumnPrefixSum.n_size_block
+        # 1.窗口覆盖的块, 以及每个桶合并的块数
+        idx_block_start = idx_start // n_size
+        idx_block_end = -(-idx_end // n_size)
+        n_block = idx_block_end - idx_block_start
+        n_block_bucket = -(-n_block // n_bucket)
+        arr_offset = np.arange(0, n_block, n_block_bucket)
+        # 2.桶的首尾行, 首尾两个桶截到窗口内
+        arr_idx_row_first = (idx_block_start + arr_offset) * n_size
+        arr_idx_row_last = np.append(arr_idx_row_first[1:], idx_end) - 1
+        arr_idx_row_first[0] = idx_start
+        dic_envelope = {
+            self.str_name_col_timestamp: np.column_stack(
+                (arr_ts[arr_idx_row_first], arr_ts[arr_idx_row_last])).ravel()
+        }
+        # 3.每列合并分块极值, 最小值在前最大值在后; 首尾桶含不完整的块, 重新计算
+        for str_name_col in lst_name_col:
+            prefixsum = self.dic_prefixsum[str_name_col]
+            arr_min = np.fmin.reduceat(prefixsum.arr_block_min[idx_block_start:idx_block_end], arr_offset)
+            arr_max = np.fmax.reduceat(prefixsum.arr_block_max[idx_block_start:idx_block_end], arr_offset)
+            for idx_bucket in {0, len(arr_offset) - 1}:
+                arr_min[idx_bucket], arr_max[idx_bucket] = prefixsum._calc_min_max(
+                    int(arr_idx_row_first[idx_bucket]), int(arr_idx_row_last[idx_bucket]) + 1)
+            dic_envelope[str_name_col] = np.column_stack((arr_min, arr_max)).ravel()
+        return dic_envelope
+
+    def _query_envelope(self,
+        lst_name_col: List[str],
+        flt_start: float,
+        flt_end: float,
+        n_bucket: int
+    ) -> Dict[str, np.ndarray]:
+        """索引尚未建立时的包络: 只collect窗口内的数据, 按行数均分为不超过 n_bucket 个桶
+
+        输出格式与 get_envelope 相同, 在一次lazy查询中完成
+        """
+        str_name_col_timestamp = self.str_name_col_timestamp
+        expr_ts = pl.col(str_name_col_timestamp).cast(pl.Float64)
+        lst_expr_agg = [
+            expr_ts.first().alias(f"{str_name_col_timestamp}__first"),
+            expr_ts.last().alias(f"{str_name_col_timestamp}__last"),
+        ]
+        for str_name_col in lst_name_col:
+            lst_expr_agg.append(pl.col(str_name_col).cast(pl.Float64).min().alias(f"{str_name_col}__min"))
+            lst_expr_agg.append(pl.col(str_name_col).cast(pl.Float64).max().alias(f"{str_name_col}__max"))
+        df_bucket = (
+            self.lf
+            .filter(
+                (pl.col(str_name_col_timestamp) >= flt_start) &
+                (pl.col(str_name_col_timestamp) <= flt_end)
+            )
+            .group_by(
+                (pl.int_range(pl.len(), dtype=pl.Int64) * n_bucket // pl.len()).alias("__bucket"),
+                maintain_order=True
+            )
+            .agg(lst_expr_agg)
+            .collect()
+        )
+        dic_envelope = {
+            str_name_col_timestamp: np.column_stack((
+                df_bucket[f"{str_name_col_timestamp}__first"].to_numpy(),
+                df_bucket[f"{str_name_col_timestamp}__last"].to_numpy(),
+            )).ravel()
+        }
+        for str_name_col in lst_name_col:
+            dic_envelope[str_name_col] = np.column_stack((
+                df_bucket[f"{str_name_col}__min"].fill_null(np.nan).to_numpy(),
+                df_bucket[f"{str_name_col}__max"].fill_null(np.nan).to_numpy(),
+            )).ravel()
+        return dic_envelope
+
+    def _get_envelope_empty(self,
+        lst_name_col: List[str]
+    ) -> Dict[str, np.ndarray]:
+        """窗口内没有点时的空包络"""
+        return {
+            str_name_col: np.empty(0)
+            for str_name_col in [self.str_name_col_timestamp, *lst_name_col]
+        }
+
+    def _calc_time_above(self,
+        arr_value: np.ndarray,
+        idx_start: int,
+        idx_end: int,
+        flt_threshold: float
+    ) -> float:
+        """计算窗口内值超过阈值的时长(秒)
+
+        阈值可任意变化, 无法预先累计, 因此只对窗口内的点做一次向量化扫描;
+        每个点的值保持到下一个点
+        """
+        if idx_end - idx_start < 2:
+            return 0.0
+        arr_dt = np.diff(self._get_arr_ts()[idx_start:idx_end])
+        arr_above = arr_value[idx_start:idx_end - 1] > flt_threshold
+        return float(arr_dt[arr_above].sum()) * self.flt_second_per_unit
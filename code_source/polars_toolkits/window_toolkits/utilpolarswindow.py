@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+from typing import Dict, List, Tuple, Optional
+import polars as pl
+
+def get_window_min_max(
+    lf : pl.LazyFrame,
+    str_name_col_timestamp: str,
+    lst_name_col: List[str],
+    flt_start: float,
+    flt_end: float
+) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+    """ 在一次lazy聚合中获取时间窗口内多列的最小值和最大值
+
+    直接在原始数据上计算, 不受降采样影响, 因此窗口内的峰值不会丢失
+
+    Args:
+        lf: 包含时间戳列的LazyFrame
+        str_name_col_timestamp: 时间戳列的名称
+        lst_name_col: 需要计算范围的列名列表
+        flt_start: 时间窗口起点
+        flt_end: 时间窗口终点
+    Returns:
+        Dict: {列名: (最小值, 最大值)}, 窗口内无数据的列值为 (None, None)
+    """
+    # 去重并保持顺序
+    lst_name_col = list(dict.fromkeys(lst_name_col))
+    if not lst_name_col:
+        return {}
+    # 每列生成min/max两个表达式, 一次collect全部完成
+    lst_expr_agg = []
+    for str_name_col in lst_name_col:
+        lst_expr_agg.append(pl.col(str_name_col).min().alias(f"{str_name_col}__min"))
+        lst_expr_agg.append(pl.col(str_name_col).max().alias(f"{str_name_col}__max"))
+    df_min_max = (
+        lf
+        .filter(
+            (pl.col(str_name_col_timestamp) >= flt_start) &
+            (pl.col(str_name_col_timestamp) <= flt_end)
+        )
+        .select(lst_expr_agg)
+        .collect()
+    )
+    # 提取结果
+    dic_row = df_min_max.row(0, named=True) if df_min_max.height else {}
+    return {
+        str_name_col: (
+            dic_row.get(f"{str_name_col}__min"),
+            dic_row.get(f"{str_name_col}__max")
+        )
+        for str_name_col in lst_name_col
+    }
+
+def get_value_asof(
+    lf : pl.LazyFrame,
+    str_name_col_timestamp: str,
+    lst_name_col: List[str],
+    flt_timestamp: float
+) -> Tuple[Optional[float], Dict[str, Optional[float]]]:
+    """ 获取不晚于指定时刻的最后一行原始数据中多列的值
+
+    Args:
+        lf: 包含时间戳列的LazyFrame, 需按时间戳升序
+        str_name_col_timestamp: 时间戳列的名称
+        lst_name_col: 需要取值的列名列表
+        flt_timestamp: 查询时刻
+    Returns:
+        Tuple: (实际命中的时间戳, {列名: 值}), 查询时刻之前无数据时时间戳为None, 值均为None
+    """
+    # 去重并保持顺序
+    lst_name_col = list(dict.fromkeys(lst_name_col))
+    df_row = (
+        lf
+        .filter(pl.col(str_name_col_timestamp) <= flt_timestamp)
+        .select([pl.col(str_name_col_timestamp)] + [pl.col(str_name_col) for str_name_col in lst_name_col])
+        .tail(1)
+        .collect()
+    )
+    # 提取结果
+    if not df_row.height:
+        return None, {str_name_col: None for str_name_col in lst_name_col}
+    dic_row = df_row.row(0, named=True)
+    return dic_row[str_name_col_timestamp], {
+        str_name_col: dic_row.get(str_name_col)
+        for str_name_col in lst_name_col
+    }
+
+def get_window_data(
+    lf : pl.LazyFrame,
+    str_name_col_timestamp: str,
+    lst_name_col: List[str],
+    flt_start: float,
+    flt_end: float,
+    n_max_point: Optional[int] = None
+) -> pl.DataFrame:
+    """ 获取时间窗口内多列的原始数据, 可按固定步长抽点降采样
+
+    Args:
+        lf: 包含时间戳列的LazyFrame
+        str_name_col_timestamp: 时间戳列的名称
+        lst_name_col: 需要取值的列名列表
+        flt_start: 时间窗口起点
+        flt_end: 时间窗口终点
+        n_max_point: 最多返回的行数, 为None时不降采样
+    Returns:
+        pl.DataFrame: 时间戳列在前, 之后为 lst_name_col 中的列
+    """
+    # 去重并保持顺序
+    lst_name_col = [
+        str_name_col for str_name_col in dict.fromkeys(lst_name_col)
+        if str_name_col != str_name_col_timestamp
+    ]
+    df_window = (
+        lf
+        .filter(
+            (pl.col(str_name_col_timestamp) >= flt_start) &
+            (pl.col(str_name_col_timestamp) <= flt_end)
+        )
+        .select([pl.col(str_name_col_timestamp)] + [pl.col(str_name_col) for str_name_col in lst_name_col])
+        .collect()
+    )
+    # 降采样
+    if n_max_point and len(df_window) > n_max_point:
+        df_window = df_window.gather_every(len(df_window) // n_max_point)
+    return df_window
@@ -4,11 +4,13 @@
 
 提供统一的组件注册和多语言更新机制
 """
+import weakref
 from abc import ABC, abstractmethod
 
 from typing import Dict, Any, Callable, Optional, List, Union
 from enum import Enum
 
+from PyQt6 import sip
 from PyQt6.QtWidgets import (
     QWidget, QGroupBox, QComboBox, QLineEdit, QLabel, QPushButton,
     QTextEdit, QPlainTextEdit, QTabWidget
@@ -32,6 +34,9 @@ class I18nRegistration():
     多语言注册信息数据类
     
     封装单个组件的多语言更新所需的全部信息
+    
+    只持有组件的弱引用, 注册信息不会让已关闭的组件常驻内存;
+    组件被回收或其C++对象已销毁后 bol_dead 为True
     """
     
     def __init__(self,
@@ -41,6 +46,7 @@ class I18nRegistration():
         text_disambiguation: Optional[str] = None,
         lst_args_format: Optional[List] = None,
         updater_custom: Optional[Callable[[Any, "I18nRegistration"], None]] = None,
+        func_on_collected: Optional[Callable[[weakref.ref], None]] = None,
         **kwargs
     ):
         """
@@ -51,18 +57,40 @@ class I18nRegistration():
             text_disambiguation: 翻译的唯一ID (传递给tr()方法的第二个参数)
             lst_args_format: 格式化参数列表, 用于text_main.format()
             updater_custom: 自定义更新函数 (widget, registration) -> None
+            func_on_collected: 组件被回收时的回调, 参数为弱引用
             **kwargs: 其他参数，例如:
                 - tab_widget: 标签页所属的QTabWidget
                 - tab_index: 标签页索引
                 - items_list: ComboBox的items翻译键列表
         """
-        self.widget = widget
+        # 不支持弱引用的对象(极少数非QObject)退化为强引用
+        self._ref_widget: Optional[Callable[[], Any]] = None
+        self._widget_strong: Any = None
+        if widget is not None:
+            try:
+                self._ref_widget = weakref.ref(widget, func_on_collected)
+            except TypeError:
+                self._widget_strong = widget
         self.type_update = type_update
         self.text_main = text_main
         self.text_disambiguation = text_disambiguation
         self.lst_args_format = lst_args_format or []
         self.updater_custom = updater_custom
         self.kwargs = kwargs
+    
+    @property
+    def widget(self) -> Any:
+        """组件引用, 已回收或C++对象已销毁时为None"""
+        widget = self._ref_widget() if self._ref_widget is not None else self._widget_strong
+        if isinstance(widget, sip.simplewrapper) and sip.isdeleted(widget):
+            return None
+        return widget
+    
+    @property
+    def bol_dead(self) -> bool:
+        """注册时给定了组件, 但组件已不存在"""
+        bol_has_widget = self._ref_widget is not None or self._widget_strong is not None
+        return bol_has_widget and self.widget is None
 
 
 class QT6I18nWidget(ABC):
@@ -184,6 +212,14 @@ class QT6I18nWidget(ABC):
             **kwargs: 其他参数
         
         """
+        # 组件被回收时自动取消注册; 回调只持有注册表所有者的弱引用
+        ref_self = weakref.ref(self)
+        
+        def on_collected(_ref: weakref.ref):
+            owner = ref_self()
+            if owner is not None:
+                owner._drop_registration_dead(key)
+        
         registration = I18nRegistration(
             widget=widget,
             type_update=type_update,
@@ -191,10 +227,18 @@ class QT6I18nWidget(ABC):
             text_disambiguation=text_disambiguation,
             lst_args_format=lst_args_format,
             updater_custom=updater_custom,
+            func_on_collected=on_collected,
             **kwargs
         )
         self._dic_i18n_registry[key] = registration
         return
+    
+    def _drop_registration_dead(self, key: str) -> None:
+        """组件已不存在时移除其注册; 同一个键已重新注册了存活的组件时保留"""
+        registration = self._dic_i18n_registry.get(key)
+        if registration is not None and registration.bol_dead:
+            del self._dic_i18n_registry[key]
+        return
         
     def unregister_i18n_widget(self, key: str) -> bool:
         """
@@ -213,12 +257,34 @@ class QT6I18nWidget(ABC):
             
     def refresh_all_registration(self) -> None:
         """
-        刷新所有注册的多语言组件
+        批量刷新所有注册的多语言组件
         
-        遍历所有注册的组件并更新其文本
+        1. 移除组件已销毁(C++对象已删除但Python对象仍在)的注册
+        2. 暂停涉及的顶层窗口的绘制更新, 避免每次setText都重绘一次
+        3. 更新所有文本后恢复绘制, 每个窗口只重绘一次
         """
-        for key, registration in self._dic_i18n_registry.items():
-            self._update_single_registration(registration)
+        # 1.清理失效的注册
+        for key in [key for key, reg in self._dic_i18n_registry.items() if reg.bol_dead]:
+            del self._dic_i18n_registry[key]
+        # 2.暂停顶层窗口的绘制更新, 只处理原本处于启用状态的窗口
+        lst_window_suspended: List[QWidget] = []
+        for registration in self._dic_i18n_registry.values():
+            widget = registration.widget
+            if not isinstance(widget, QWidget):
+                continue
+            window = widget.window()
+            if window.updatesEnabled() and window not in lst_window_suspended:
+                window.setUpdatesEnabled(False)
+                lst_window_suspended.append(window)
+        # 3.更新文本, 最后一定恢复绘制
+        try:
+            for registration in list(self._dic_i18n_registry.values()):
+                self._update_single_registration(registration)
+        finally:
+            for window in lst_window_suspended:
+                if not sip.isdeleted(window):
+                    window.setUpdatesEnabled(True)
+        return
             
     def _update_single_registration(self,
         registration: I18nRegistration
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from typing import Optional, List, Callable, Union
+from typing import Optional, List, Callable, Union, Dict
 from pathlib import Path
 from PyQt6.QtCore import QTranslator, QCoreApplication, QLocale
 from PyQt6.QtWidgets import QApplication
@@ -21,6 +21,9 @@ class UITranslationManager(AbstractLanguageManager):
     - ColNameManager: 使用字典映射管理数据列名的翻译
     
     两者都支持观察者模式，可以同时被语言切换动作触发。
+    
+    每种语言的翻译文件在第一次切换到它时加载, 之后缓存在 dic_translator 中;
+    切换语言只是卸下当前翻译器、装上缓存的翻译器, 不再读取磁盘。
     """
     
     def __init__(self,
@@ -36,7 +39,10 @@ class UITranslationManager(AbstractLanguageManager):
         super().__init__()
         
         self.app : QApplication = app or QCoreApplication.instance()
-        self.translator = QTranslator()
+        # 当前安装的翻译器, 源语言(中文)时为None
+        self.translator : Optional[QTranslator] = None
+        # 已加载的翻译器缓存: 语言代码 -> QTranslator
+        self.dic_translator : Dict[str, QTranslator] = {}
         
         # 翻译文件所在目录
         self.str_prefix_file_translation: str = 'pyqtcurveplotter_{}.qm'
@@ -64,58 +70,76 @@ class UITranslationManager(AbstractLanguageManager):
         """
         return self._load_language_translator(str_code_language)
     
+    def _get_translator(self,
+        str_code_language: Union[str, LanguageEnum]
+    ) -> Optional[QTranslator]:
+        """
+        获取指定语言的翻译器, 第一次使用时从磁盘加载并缓存
+        
+        Returns:
+            QTranslator: 翻译器, 文件不存在或加载失败时为None(不缓存, 以便文件补上后重试)
+        """
+        translator = self.dic_translator.get(str_code_language)
+        if translator is not None:
+            return translator
+        # 翻译文件路径
+        str_name_file_ts = self.str_prefix_file_translation.format(str_code_language)
+        path_file_ts = self.path_folder_translation / str_name_file_ts
+        if not path_file_ts.exists():
+            print(f"翻译文件不存在: {path_file_ts}")
+            return None
+        translator = QTranslator(self.app)
+        if not translator.load(str(path_file_ts)):
+            print(f"加载翻译文件失败: {path_file_ts}")
+            return None
+        self.dic_translator[str_code_language] = translator
+        return translator
+    
     def _load_language_translator (self,
         str_code_language: Union[str, LanguageEnum]
     ) -> bool:
         """
-        加载指定语言的翻译文件（内部方法，直接调用 switch_language
+        切换到指定语言的翻译器（内部方法，由 switch_language 调用）
+        
+        先取得(或加载)新翻译器, 成功后才卸下旧翻译器, 失败时当前语言不变;
+        源语言中文不需要翻译器, 只卸下当前翻译器
         
         Args:
-            language_code: 语言代码
+            str_code_language: 语言代码
             
         Returns:
-            bool: 是否成功加载翻译文件
+            bool: 是否切换成功
         """
-        # 保存当前语言状态，以便失败时恢复
-        str_code_language_old = self.str_code_language
-        translator_old = self.translator
-        
-        # 移除旧的翻译器
-        if self.translator:
-            self.app.removeTranslator(self.translator)
-        
-        # 创建新的翻译器
-        self.translator = QTranslator()
-        
-        # 翻译文件路径:
-        str_name_file_ts = self.str_prefix_file_translation.format(str_code_language)
-        path_file_ts = self.path_folder_translation / str_name_file_ts
-        
-        # 加载翻译文件
-        if path_file_ts.exists():
-            success = self.translator.load(str(path_file_ts))
-            if success:
-                # 成功加载：安装新翻译器并更新语言
-                self.app.installTranslator(self.translator)
-                self.str_code_language = str_code_language
-                self._current_language = str_code_language  # 同步父类属性
-                # 通知所有观察者语言已改变
-                self.notify_observers(str_code_language)
-                return True
-            else:
-                # 加载失败：恢复旧翻译器
-                print(f"加载翻译文件失败: {path_file_ts}")
-                self.translator = translator_old
-                if translator_old:
-                    self.app.installTranslator(translator_old)
+        # 语言代码可能是 LanguageEnum 或字符串, 统一为字符串
+        str_code_language = getattr(str_code_language, 'value', str_code_language)
+        str_code_language_old = getattr(self.str_code_language, 'value', self.str_code_language)
+        if str_code_language == str_code_language_old:
+            return True
+        # 1.取得新翻译器, 失败时保持当前语言
+        translator_new = None
+        if str_code_language != LanguageEnum.CN.value:
+            translator_new = self._get_translator(str_code_language)
+            if translator_new is None:
                 return False
-        else:
-            # 文件不存在：恢复旧翻译器
-            print(f"翻译文件不存在: {path_file_ts}")
-            self.translator = translator_old
-            if translator_old:
-                self.app.installTranslator(translator_old)
-            return False
+        # 2.卸下旧翻译器, 装上新翻译器
+        if self.translator is not None:
+            self.app.removeTranslator(self.translator)
+        if translator_new is not None:
+            self.app.installTranslator(translator_new)
+        self.translator = translator_new
+        # 3.更新语言并通知所有观察者
+        self.str_code_language = str_code_language
+        self._current_language = str_code_language  # 同步父类属性
+        self.notify_observers(str_code_language, str_code_language_old)
+        return True
+    
+    def preload_all(self) -> None:
+        """预先加载所有可用语言的翻译器, 之后的切换不再读取磁盘"""
+        for str_code_language in self.get_supported_languages():
+            str_code_language = getattr(str_code_language, 'value', str_code_language)
+            if str_code_language != LanguageEnum.CN.value:
+                self._get_translator(str_code_language)
+        return
     
     @override
     def get_language(self) -> str:
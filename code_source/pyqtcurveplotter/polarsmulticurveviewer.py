@@ -124,18 +124,27 @@ class PolarsMultiCurveViewer(QMainWindow):
         # 连接观察者：当列名语言改变时，刷新图表
         self.manager_colname.connect(self._on_colname_language_changed)
         
-    def _on_colname_language_changed(self, str_language: str):
+    def _on_colname_language_changed(self,
+        str_language: str,
+        str_language_old: Optional[str] = None
+    ):
         """
         列名语言改变时的回调函数
         
-        重新绘制所有图表以更新轴标签和图例
+        列名只影响标签, 不影响数据: 只更新图例文字、轴标签和侧边栏的显示列名,
+        曲线item及其数据保持不变, 不重新查询数据
         
         Args:
             str_language: 新的语言代码
+            str_language_old: 原语言代码
         """
-        # 刷新所有图表的轴标签和图例
-        if hasattr(self, 'update_all_plots'):
-            self.update_all_plots()
+        # 1.图例和轴标签
+        if hasattr(self, 'plots'):
+            self.relabel_all_plots()
+        # 2.侧边栏的显示列名
+        if hasattr(self, 'side_panel'):
+            self.side_panel.refresh_language_display()
+        return
     
     def _setup_language_synchronization(self):
         """
@@ -195,19 +204,6 @@ class PolarsMultiCurveViewer(QMainWindow):
         """
         return self.manager_colname.get_actual_name(str_name_col_display)
 
-    def _init_manager_colname(self,
-        dic_map_col_to_display_language: Optional[Dict[str, Dict[LanguageEnum, str]]],
-        str_language_current: LanguageEnum
-    ):
-        """
-        初始化ColNameManager
-        """
-        self.manager_colname = ColNameManager(
-            dic_map_col_to_display_language=dic_map_col_to_display_language,
-            str_language_current=str_language_current
-        )
-        return
-
     def _init_name_col_timestamp(self,
         lf : pl.LazyFrame,
         str_name_col_timestamp: Optional[str]
@@ -393,6 +389,38 @@ class PolarsMultiCurveViewer(QMainWindow):
         for plot_idx in range(3):
             self.update_plot(plot_idx)
     
+    def relabel_all_plots(self):
+        """只更新所有子图的图例文字和轴标签, 不重新查询和绘制数据"""
+        for plot_idx in range(len(self.plots)):
+            self.relabel_plot(plot_idx)
+        return
+    
+    def relabel_plot(self, plot_idx: int):
+        """
+        只更新单个子图的图例文字和轴标签
+        
+        曲线item保留原数据, 仅修改其名称; 图例中按item找到对应的标签改写文字
+        """
+        plot = self.plots[plot_idx]
+        # 1.曲线item的名称
+        dic_name_display_item: Dict[int, str] = {}
+        for curve_config in self.side_panel.get_plot_curves(plot_idx):
+            curve_item = curve_config.curve_item
+            if curve_item is None:
+                continue
+            str_curve_name_display = self.get_display_name(curve_config.curve_name)
+            curve_item.opts['name'] = str_curve_name_display
+            dic_name_display_item[id(curve_item)] = str_curve_name_display
+        # 2.图例文字
+        if plot.legend is not None:
+            for sample, label in plot.legend.items:
+                str_curve_name_display = dic_name_display_item.get(id(sample.item))
+                if str_curve_name_display is not None:
+                    label.setText(str_curve_name_display)
+        # 3.轴标签
+        self._relabel_axes(plot_idx, self.side_panel.get_plot_axes(plot_idx))
+        return
+    
     def update_plot(self, plot_idx: int):
         """更新单个子图"""
         plot = self.plots[plot_idx]
@@ -460,14 +488,20 @@ class PolarsMultiCurveViewer(QMainWindow):
         for axis_id, config in axis_configs.items():
             if axis_id in axis_manager.axes:
                 axis_manager.axes[axis_id] = config
-                # 更新轴标签（使用显示名称）
-                if config.axis_item:
-                    str_label_display = self.get_display_name(config.label)
-                    config.axis_item.setLabel(
-                        str_label_display,
-                        units=config.unit,
-                        color=config.color
-                    )
+        # 更新轴标签（使用显示名称）
+        self._relabel_axes(plot_idx, axis_configs)
+    
+    def _relabel_axes(self, plot_idx: int, axis_configs: Dict[str, AxisConfig]):
+        """按当前语言的显示名称更新子图的轴标签"""
+        axis_manager = self.axis_managers[plot_idx]
+        for axis_id, config in axis_configs.items():
+            if axis_id in axis_manager.axes and config.axis_item:
+                str_label_display = self.get_display_name(config.label)
+                config.axis_item.setLabel(
+                    str_label_display,
+                    units=config.unit,
+                    color=config.color
+                )
     
     def _plot_curve(
         self,
@@ -339,28 +339,16 @@ class SidePanel(QWidget, QT6I18nWidget):
         """
         自定义更新包含列名的下拉框
         
-        需要同时更新列名
+        实际列名保存在各项的 UserRole 中, 只改写显示文字, 不重建选项,
+        当前选择保持不变
         """
-        # 保存当前选择的实际列名
-        str_current_text = widget.currentText()
-        str_actual_name = self.func_get_actual_name(str_current_text)
-        
-        # 阻止信号
         widget.blockSignals(True)
-        widget.clear()
-        
-        # 添加所有列名（使用显示名称）
-        for str_name_col in self.lst_name_col:
-            str_display_name = self.func_get_display_name(str_name_col)
-            widget.addItem(str_display_name)
-        
-        # 恢复之前的选择
-        if str_actual_name:
-            str_new_display_name = self.func_get_display_name(str_actual_name)
-            idx = widget.findText(str_new_display_name)
-            if idx >= 0:
-                widget.setCurrentIndex(idx)
-        
+        for idx in range(widget.count()):
+            str_actual_name = widget.itemData(idx, Qt.ItemDataRole.UserRole)
+            if str_actual_name is None:
+                str_actual_name = self.func_get_actual_name(widget.itemText(idx))
+                widget.setItemData(idx, str_actual_name, Qt.ItemDataRole.UserRole)
+            widget.setItemText(idx, self.func_get_display_name(str_actual_name))
         widget.blockSignals(False)
         return
     
@@ -372,28 +360,17 @@ class SidePanel(QWidget, QT6I18nWidget):
         """
         自定义更新包含列名的列表框
         
-        需要同时更新列名
+        实际列名保存在各项的 UserRole 中, 只改写显示文字, 不重建列表项,
+        当前选择保持不变
         """
-        # 保存当前选择的实际列名
-        str_current_text = widget.currentText()
-        str_actual_name = self.func_get_actual_name(str_current_text)
-        
-        # 阻止信号
         widget.blockSignals(True)
-        widget.clear()
-        
-        # 添加所有列名（使用显示名称）
-        for str_name_col in self.lst_name_col:
-            str_display_name = self.func_get_display_name(str_name_col)
-            widget.addItem(str_display_name)
-        
-        # 恢复之前的选择
-        if str_actual_name:
-            str_new_display_name = self.func_get_display_name(str_actual_name)
-            idx = widget.findText(str_new_display_name)
-            if idx >= 0:
-                widget.setCurrentIndex(idx)
-        
+        for idx in range(widget.count()):
+            item = widget.item(idx)
+            str_actual_name = item.data(Qt.ItemDataRole.UserRole)
+            if str_actual_name is None:
+                str_actual_name = self.func_get_actual_name(item.text())
+                item.setData(Qt.ItemDataRole.UserRole, str_actual_name)
+            item.setText(self.func_get_display_name(str_actual_name))
         widget.blockSignals(False)
         return
 
@@ -435,9 +412,11 @@ class SidePanel(QWidget, QT6I18nWidget):
         )
         selector_curve_candidate = QComboBox()
         selector_curve_candidate.setObjectName(f"{self._str_name}_selector_curve_subplot_{idx_subplot}")
-        selector_curve_candidate.addItems(self.lst_name_col)
-        selector_curve_candidate.currentTextChanged.connect(
-            lambda str_name_col, idx_subplot=idx_subplot: self.add_curve(idx_subplot, str_name_col)
+        for str_name_col_actual in self.lst_name_col:
+            selector_curve_candidate.addItem(
+                self.func_get_display_name(str_name_col_actual), str_name_col_actual)
+        selector_curve_candidate.currentIndexChanged.connect(
+            lambda idx, idx_subplot=idx_subplot: self.add_curve(idx_subplot, selector_curve_candidate.itemData(idx))
         )
         ## 曲线选择器需要自定义更新（包含占位符和列名）
         self.register_i18n_widget(
@@ -468,10 +447,12 @@ class SidePanel(QWidget, QT6I18nWidget):
         # 添加所有的列名
         for str_name_col_actual in self.lst_name_col:
             str_name_col_display = self.func_get_display_name(str_name_col_actual)
-            selector_curve_candidate.addItem(str_name_col_display)
+            item = QListWidgetItem(str_name_col_display)
+            item.setData(Qt.ItemDataRole.UserRole, str_name_col_actual)
+            selector_curve_candidate.addItem(item)
         # 双击添加曲线
         selector_curve_candidate.itemDoubleClicked.connect(
-            lambda str_name_col, idx_subplot=idx_subplot : self.add_curve(idx_subplot, str_name_col)
+            lambda item, idx_subplot=idx_subplot : self.add_curve(idx_subplot, item.data(Qt.ItemDataRole.UserRole))
         )
         ## 曲线选择器需要自定义更新（包含占位符和列名）
         self.register_i18n_widget(
@@ -503,10 +484,12 @@ class SidePanel(QWidget, QT6I18nWidget):
         # 添加所有的列名
         for str_name_col_actual in self.lst_name_col:
             str_name_col_display = self.func_get_display_name(str_name_col_actual)
-            selector_curve_candidate.addItem(str_name_col_display)
+            item = QListWidgetItem(str_name_col_display)
+            item.setData(Qt.ItemDataRole.UserRole, str_name_col_actual)
+            selector_curve_candidate.addItem(item)
         # 双击添加曲线
         selector_curve_candidate.itemDoubleClicked.connect(
-            lambda str_name_col, idx_subplot=idx_subplot : self.add_curve(idx_subplot, str_name_col)
+            lambda item, idx_subplot=idx_subplot : self.add_curve(idx_subplot, item.data(Qt.ItemDataRole.UserRole))
         )
         ## 曲线选择器需要自定义更新（包含占位符和列名）
         self.register_i18n_widget(
@@ -934,13 +917,11 @@ class SidePanel(QWidget, QT6I18nWidget):
         """
         刷新所有显示的文字（在切换语言后调用）
         
-        使用AbstractI18nWidget的统一刷新机制
+        使用QT6I18nWidget的统一刷新机制; 显示名称不影响曲线数据,
+        因此不发射 sig_config_changed, 避免主窗口重新查询和绘制
         """
         # 调用基类的统一刷新方法
-        self.refresh_all_i18n()
-        
-        # 触发配置改变信号，让主窗口重新绘制
-        self.sig_config_changed.emit()
+        self.refresh_all_registration()
     
 
     def get_plot_axes(self, plot_idx: int) -> Dict[str, AxisConfig]: